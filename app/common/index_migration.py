@@ -0,0 +1,53 @@
+"""
+keyset(cursor) 페이지네이션용 복합 인덱스 적용
+
+create_all 은 이미 있는 테이블에 인덱스를 추가하지 않으므로, 기존 DB 에는 새 코드 배포 전에 실행합니다.
+여러 번 실행해도 안전합니다. (없는 인덱스만 생성)
+
+- ix_products_user_created (user_id, created_at, id)       : 즐겨찾기 목록
+- ix_friends_owner_created (owner_user_id, created_at, id) : 친구 목록
+- ix_wishlist_user_created (user_id, created_at, id)       : 위시리스트
+
+MySQL/MariaDB(InnoDB) 의 CREATE INDEX 는 online DDL 로 실행되어 읽기/쓰기를 막지 않습니다.
+
+사용법:
+    python -m app.worker pagination-index-migrate
+"""
+import logging
+from typing import List
+
+from sqlalchemy import Index, inspect
+from sqlalchemy.engine import Engine
+
+from app.domain.friend.models import Friend
+from app.domain.product.models import Product
+from app.domain.wishlist.models import WishlistItem
+
+logger = logging.getLogger(__name__)
+
+# (모델, 인덱스 이름)
+_PAGINATION_INDEXES = [
+    (Product, "ix_products_user_created"),
+    (Friend, "ix_friends_owner_created"),
+    (WishlistItem, "ix_wishlist_user_created"),
+]
+
+
+def _model_index(model, name: str) -> Index:
+    return next(index for index in model.__table__.indexes if index.name == name)
+
+
+class PaginationIndexMigration:
+    @staticmethod
+    def apply(engine: Engine) -> List[str]:
+        """생성한 인덱스 목록 반환 (이미 모두 있으면 빈 목록)"""
+        applied: List[str] = []
+        inspector = inspect(engine)
+        for model, name in _PAGINATION_INDEXES:
+            existing = {index["name"] for index in inspector.get_indexes(model.__tablename__)}
+            if name in existing:
+                continue
+            _model_index(model, name).create(bind=engine)
+            applied.append(name)
+        logger.info("pagination index migration applied: %s", applied or "nothing to do")
+        return applied
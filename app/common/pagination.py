@@ -0,0 +1,62 @@
+"""
+Keyset (cursor) pagination
+
+- 정렬 기준: (created_at DESC, id DESC). 같은 시각에 생성된 행도 id 로 순서가 고정됨
+- cursor 는 마지막 행의 (created_at, id) 를 base64 로 감싼 불투명 문자열
+- OFFSET 없이 (필터 컬럼, created_at, id) 복합 인덱스를 이어서 읽으므로 깊은 페이지도 일정한 비용
+- size + 1 개를 읽어 다음 페이지 유무를 판단 (별도 count 쿼리 없음)
+"""
+import base64
+import binascii
+from datetime import datetime
+from typing import Any, Callable, List, Optional, Tuple
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Query
+
+from app.core.exceptions import BadRequestException
+
+CursorKey = Tuple[datetime, int]
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> CursorKey:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, row_id = raw.split("|")
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise BadRequestException(message="Invalid cursor")
+
+
+def paginate_keyset(
+    query: Query,
+    created_at_column: Any,
+    id_column: Any,
+    cursor: Optional[str],
+    size: int,
+    key: Optional[Callable[[Any], CursorKey]] = None,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    (한 페이지 행 목록, 다음 페이지 cursor) 반환. 마지막 페이지면 cursor 는 None
+    key: 결과 행에서 (created_at, id) 를 꺼내는 함수 (기본값은 행의 created_at / id 속성)
+    """
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        query = query.filter(
+            or_(
+                created_at_column < created_at,
+                and_(created_at_column == created_at, id_column < row_id),
+            )
+        )
+    rows = query.order_by(created_at_column.desc(), id_column.desc()).limit(size + 1).all()
+    if len(rows) <= size:
+        return rows, None
+
+    rows = rows[:size]
+    last = key(rows[-1]) if key else (rows[-1].created_at, rows[-1].id)
+    return rows, encode_cursor(*last)
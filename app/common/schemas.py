@@ -42,6 +42,17 @@ class PageMeta(BaseModel):
         )
 
 
+class CursorMeta(BaseModel):
+    """Keyset (cursor) pagination metadata"""
+
+    size: int = Field(description="Items per page")
+    next_cursor: Optional[str] = Field(description="Cursor for the next page (null on the last page)")
+    has_next: bool = Field(description="Has next page")
+    total_items: Optional[int] = Field(
+        default=None, description="Total number of items (only when include_total=true)"
+    )
+
+
 class PagedResponse(BaseModel, Generic[T]):
     """Paginated response wrapper"""
 
@@ -51,6 +62,15 @@ class PagedResponse(BaseModel, Generic[T]):
     meta: PageMeta
 
 
+class CursorPagedResponse(BaseModel, Generic[T]):
+    """Keyset (cursor) paginated response wrapper"""
+
+    success: bool = True
+    message: str = "Success"
+    data: List[T]
+    meta: CursorMeta
+
+
 class BaseResponse(BaseModel, Generic[T]):
     """Standard API response wrapper"""
 
@@ -7,6 +7,8 @@ from app.core.exceptions import (
     UnauthorizedException,
     ForbiddenException,
     ConflictException,
+    TooManyRequestsException,
+    ServiceUnavailableException,
     InternalServerException,
 )
 
@@ -23,5 +25,7 @@ __all__ = [
     "UnauthorizedException",
     "ForbiddenException",
     "ConflictException",
+    "TooManyRequestsException",
+    "ServiceUnavailableException",
     "InternalServerException",
 ]
@@ -1,6 +1,7 @@
 """
 JWT 기반 인증 모듈
 """
+import hmac
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -8,7 +9,7 @@ import jwt
 from fastapi import Header
 
 from app.core.config import settings
-from app.core.exceptions import UnauthorizedException
+from app.core.exceptions import ForbiddenException, UnauthorizedException
 
 # JWT 설정
 JWT_SECRET_KEY = settings.JWT_SECRET_KEY
@@ -79,3 +80,14 @@ def get_current_user_id_optional(authorization: Optional[str] = Header(default=N
         return get_current_user_id(authorization)
     except UnauthorizedException:
         return None
+
+
+def require_admin(x_admin_key: Optional[str] = Header(default=None)) -> None:
+    """
+    운영용 API 인증 (X-Admin-Key 헤더를 ADMIN_API_KEY 와 비교)
+    ADMIN_API_KEY 가 비어 있으면 항상 거부
+    """
+    if not settings.ADMIN_API_KEY:
+        raise ForbiddenException(message="Admin API is disabled")
+    if x_admin_key is None or not hmac.compare_digest(x_admin_key, settings.ADMIN_API_KEY):
+        raise ForbiddenException(message="Invalid admin key")
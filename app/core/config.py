@@ -1,6 +1,10 @@
+from pathlib import Path
 from pydantic_settings import BaseSettings
 from functools import lru_cache
 
+# 프로젝트 루트 (실행 위치와 무관한 기본 경로 계산용)
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+
 
 class Settings(BaseSettings):
     # Database
@@ -13,6 +17,106 @@ class Settings(BaseSettings):
     APP_VERSION: str = "1.0.0"
     NAVER_CLIENT_ID: str = ""
     NAVER_CLIENT_SECRET: str = ""
+    NAVER_SEARCH_URL: str = "https://openapi.naver.com/v1/search/shop.json"
+
+    # 네이버 API 커넥션 풀 / 타임아웃 설정 (초)
+    NAVER_CONNECT_TIMEOUT: float = 3.0
+    NAVER_READ_TIMEOUT: float = 5.0
+    NAVER_POOL_TIMEOUT: float = 2.0
+    NAVER_MAX_CONNECTIONS: int = 200
+    NAVER_MAX_KEEPALIVE_CONNECTIONS: int = 50
+
+    # 네이버 API 호출 한도 (프로세스 단위 토큰 버킷 + 일일 예산)
+    NAVER_DAILY_BUDGET: int = 25000
+    NAVER_RATE_PER_SECOND: float = 10.0
+    NAVER_RATE_BURST: int = 10
+    NAVER_INTERACTIVE_MAX_WAIT_SECONDS: float = 1.0
+    NAVER_BACKGROUND_MAX_WAIT_SECONDS: float = 30.0
+
+    # 네이버 API 서킷 브레이커 / 헤지 요청
+    NAVER_BREAKER_FAILURE_RATIO: float = 0.5
+    NAVER_BREAKER_SLOW_CALL_SECONDS: float = 2.0
+    NAVER_BREAKER_OPEN_SECONDS: float = 30.0
+    NAVER_HEDGE_ENABLED: bool = False
+    NAVER_HEDGE_MIN_DELAY_SECONDS: float = 0.05
+
+    # 검색 결과 캐시 (TTL / stale-while-revalidate / 메모리 예산)
+    SEARCH_CACHE_TTL_SECONDS: float = 60.0
+    SEARCH_CACHE_STALE_SECONDS: float = 300.0
+    SEARCH_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    # 검색 결과 디스크 캐시 (SQLite, 같은 호스트의 워커끼리 공유 / 빈 값이면 사용 안 함)
+    # 기본값은 프로젝트 루트 기준 절대 경로 (워커마다 실행 위치가 달라도 같은 파일 사용)
+    SEARCH_DISK_CACHE_PATH: str = str(BASE_DIR / "var" / "search_cache.sqlite3")
+    SEARCH_DISK_CACHE_MAX_BYTES: int = 512 * 1024 * 1024
+    # 시작 시 인메모리 캐시로 미리 적재할 최대 항목 수
+    SEARCH_DISK_CACHE_WARM_LIMIT: int = 2000
+    # page N 응답 후 page N+1 선조회 (호출 예산 여유가 있을 때만)
+    SEARCH_PREFETCH_ENABLED: bool = False
+    # 검색 결과 상품 스냅샷 (즐겨찾기 저장 시 id 만으로 상품 정보를 채움)
+    SEARCH_SNAPSHOT_TTL_SECONDS: float = 1800.0
+    SEARCH_SNAPSHOT_MAX_BYTES: int = 32 * 1024 * 1024
+    # 많이 검색되는 검색어 추적 (Count-Min sketch 크기 / 상위 후보 수 / 빈도 반감기)
+    SEARCH_TOP_QUERIES_K: int = 200
+    SEARCH_TOP_QUERIES_SKETCH_WIDTH: int = 4096
+    SEARCH_TOP_QUERIES_SKETCH_DEPTH: int = 4
+    SEARCH_TOP_QUERIES_HALF_LIFE_SECONDS: float = 3600.0
+    # 검색어 자동완성 (메모리 접두사 색인, 후보 수 상한 / 정렬 배열 병합 단위 / 시작 시 적재할 인기 상품 수)
+    SUGGEST_MAX_TERMS: int = 100000
+    SUGGEST_MERGE_THRESHOLD: int = 512
+    SUGGEST_WARM_LIMIT: int = 20000
+    # 인기도 가중치 (검색 1회 / 즐겨찾기 1건)
+    SUGGEST_QUERY_WEIGHT: float = 1.0
+    SUGGEST_FAVORITE_WEIGHT: float = 3.0
+    # 검색 결과 유사 상품 묶기 (group=true, MinHash 서명 일치율 기준)
+    SEARCH_GROUP_MIN_SIMILARITY: float = 0.5
+    # 상위 검색어 캐시 미리 갱신 (fresh 기간이 WARM_AHEAD 이하로 남은 상위 N개를 주기적으로 갱신)
+    SEARCH_WARM_ENABLED: bool = False
+    SEARCH_WARM_TOP_N: int = 50
+    SEARCH_WARM_INTERVAL_SECONDS: float = 10.0
+    SEARCH_WARM_AHEAD_SECONDS: float = 15.0
+    # 감쇠 빈도가 이 값보다 작은 검색어는 미리 갱신하지 않음
+    SEARCH_WARM_MIN_COUNT: float = 5.0
+
+    # 몰별 최저가 조회 결과 캐시 (source_product_id 단위)
+    LOWEST_PRICE_CACHE_TTL_SECONDS: float = 600.0
+    LOWEST_PRICE_CACHE_MAX_BYTES: int = 16 * 1024 * 1024
+
+    # 즐겨찾기 상품 가격 갱신 워커 (python -m app.worker price-refresh)
+    PRICE_REFRESH_BATCH_SIZE: int = 200
+    PRICE_REFRESH_CONCURRENCY: int = 8
+    # 마지막 조회 후 이 시간이 지난 상품만 갱신
+    PRICE_REFRESH_STALE_SECONDS: float = 3600.0
+    # 갱신할 상품이 없을 때 다음 배치까지 대기
+    PRICE_REFRESH_INTERVAL_SECONDS: float = 60.0
+    # 상품 상세 refresh=stale: 마지막 조회 후 이 시간이 지났을 때만 네이버에서 다시 조회
+    PRODUCT_PRICE_FRESH_SECONDS: float = 600.0
+    # 상품 상세가 다시 조회를 기다리는 최대 시간 (넘으면 저장된 값 반환, 갱신은 백그라운드에서 계속)
+    PRODUCT_LIVE_REFRESH_WAIT_SECONDS: float = 0.3
+
+    # 저장 검색 워커 (python -m app.worker saved-search)
+    # 같은 검색어를 다시 실행하는 주기 / 배치당 검색어 수 / 동시 호출 수
+    SAVED_SEARCH_INTERVAL_SECONDS: float = 1800.0
+    SAVED_SEARCH_BATCH_SIZE: int = 100
+    SAVED_SEARCH_CONCURRENCY: int = 4
+    SAVED_SEARCH_MAX_PER_USER: int = 20
+    # 검색어별로 기억하는 최대 상품 수 / 변화 기록 보관 기간
+    SAVED_SEARCH_SNAPSHOT_MAX_ITEMS: int = 500
+    SAVED_SEARCH_DELTA_RETENTION_DAYS: int = 30
+
+    # 가격 하락 알림 인덱스를 DB 에서 다시 만드는 주기 (목표가 변경 반영 지연)
+    ALERT_INDEX_REFRESH_SECONDS: float = 300.0
+
+    # 가격 이력 (raw 관측값 보관 기간, 이후 일별 최소/최대로 다운샘플링)
+    PRICE_HISTORY_RAW_DAYS: int = 30
+    # 검색 결과 가격 관측값을 모아 기록하는 주기 / 버퍼 최대 상품 수
+    PRICE_HISTORY_FLUSH_SECONDS: float = 30.0
+    PRICE_HISTORY_BUFFER_MAX_KEYS: int = 50000
+
+    # 즐겨찾기 검색 색인을 메모리에 보관하는 최대 사용자 수 (LRU)
+    FAVORITE_SEARCH_INDEX_MAX_USERS: int = 1000
+
+    # 운영용 API 키 (X-Admin-Key 헤더, 빈 값이면 운영용 API 비활성화)
+    ADMIN_API_KEY: str = ""
 
     # JWT 설정 (실제 값은 .env에서 설정)
     JWT_SECRET_KEY: str = ""  # 필수: .env에서 설정
@@ -80,6 +80,30 @@ class ConflictException(BaseAPIException):
         )
 
 
+class TooManyRequestsException(BaseAPIException):
+    """Rate limit exceeded"""
+
+    def __init__(self, message: str = "Too many requests", detail: Any = None):
+        super().__init__(
+            status_code=429,
+            code="TOO_MANY_REQUESTS",
+            message=message,
+            detail=detail,
+        )
+
+
+class ServiceUnavailableException(BaseAPIException):
+    """Upstream service unavailable"""
+
+    def __init__(self, message: str = "Service unavailable", detail: Any = None):
+        super().__init__(
+            status_code=503,
+            code="SERVICE_UNAVAILABLE",
+            message=message,
+            detail=detail,
+        )
+
+
 class InternalServerException(BaseAPIException):
     """Internal server error"""
 
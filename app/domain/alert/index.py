@@ -0,0 +1,105 @@
+"""
+가격 하락 알림 인덱스
+
+상품(source, source_product_id)별로 목표가를 오름차순 배열로 유지합니다.
+가격이 previous -> price 로 내려가면 price <= 목표가 < previous 인 구독자만
+이분 탐색 두 번으로 잘라내므로 갱신 한 건의 매칭 비용은 O(log n + k) 입니다.
+
+    thresholds: [9000, 9500, 9900, 12000]   price=9400, previous=10000
+                       ^lo          ^hi      -> [9500, 9900]
+"""
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+ProductKey = Tuple[str, str]
+
+
+class Watcher(NamedTuple):
+    target_price: int
+    user_id: int
+    product_id: int
+    # 위시리스트 목표가면 위시리스트 항목 ID, 즐겨찾기 목표가면 None
+    wishlist_item_id: Optional[int]
+
+
+class _Thresholds:
+    __slots__ = ("prices", "watchers")
+
+    def __init__(self, watchers: List[Watcher]) -> None:
+        watchers.sort(key=lambda watcher: watcher.target_price)
+        self.watchers = watchers
+        self.prices = [watcher.target_price for watcher in watchers]
+
+
+class PriceAlertIndex:
+    def __init__(self) -> None:
+        self._by_product: Dict[ProductKey, _Thresholds] = {}
+        self.size = 0
+
+    @classmethod
+    def build(cls, rows: Iterable[Tuple[ProductKey, Watcher]]) -> "PriceAlertIndex":
+        """(상품 키, 구독자) 목록으로 인덱스 생성 (상품별 정렬 1회)"""
+        grouped: Dict[ProductKey, List[Watcher]] = defaultdict(list)
+        for key, watcher in rows:
+            grouped[key].append(watcher)
+        index = cls()
+        for key, watchers in grouped.items():
+            index._by_product[key] = _Thresholds(watchers)
+            index.size += len(watchers)
+        return index
+
+    def add(self, key: ProductKey, watcher: Watcher) -> None:
+        thresholds = self._by_product.get(key)
+        if thresholds is None:
+            self._by_product[key] = _Thresholds([watcher])
+        else:
+            position = bisect_right(thresholds.prices, watcher.target_price)
+            thresholds.watchers.insert(position, watcher)
+            thresholds.prices.insert(position, watcher.target_price)
+        self.size += 1
+
+    def remove(self, key: ProductKey, watcher: Watcher) -> bool:
+        thresholds = self._by_product.get(key)
+        if thresholds is None:
+            return False
+        # 같은 목표가 구간 안에서만 찾음
+        low = bisect_left(thresholds.prices, watcher.target_price)
+        high = bisect_right(thresholds.prices, watcher.target_price, low)
+        for position in range(low, high):
+            if thresholds.watchers[position] == watcher:
+                break
+        else:
+            return False
+        del thresholds.watchers[position]
+        del thresholds.prices[position]
+        if not thresholds.watchers:
+            del self._by_product[key]
+        self.size -= 1
+        return True
+
+    def match(self, key: ProductKey, previous_price: Optional[int], price: int) -> List[Watcher]:
+        """가격이 내려가며 목표가를 지난 구독자 (price <= 목표가 < previous_price)"""
+        thresholds = self._by_product.get(key)
+        if thresholds is None or previous_price is None or price >= previous_price:
+            return []
+        prices = thresholds.prices
+        low = bisect_left(prices, price)
+        high = bisect_left(prices, previous_price, low)
+        return thresholds.watchers[low:high]
+
+    def match_many(
+        self, updates: Iterable[Tuple[ProductKey, Optional[int], int]]
+    ) -> List[Tuple[ProductKey, Optional[int], int, Watcher]]:
+        """가격 갱신 목록 전체 매칭. (상품 키, 이전 가격, 새 가격, 구독자) 목록 반환"""
+        matched = []
+        for key, previous_price, price in updates:
+            for watcher in self.match(key, previous_price, price):
+                matched.append((key, previous_price, price, watcher))
+        return matched
+
+    def __len__(self) -> int:
+        return self.size
+
+    def stats(self) -> Dict[str, int]:
+        return {"products": len(self._by_product), "watchers": self.size}
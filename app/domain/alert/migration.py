@@ -0,0 +1,79 @@
+"""
+가격 하락 알림 스키마 적용 (products / wishlist_items 목표가 컬럼 + price_alert_events)
+
+새 코드 배포 전에 실행합니다. 여러 번 실행해도 안전합니다. (없는 것만 추가)
+
+1. products.target_price, wishlist_items.target_price 컬럼 추가 (NULL 허용, 잠금이 짧은 ADD COLUMN)
+2. price_alert_events 생성
+   product_id 는 ON DELETE CASCADE (즐겨찾기 삭제 시 알림 기록도 삭제),
+   wishlist_item_id 는 ON DELETE SET NULL (위시리스트에서 빼도 기록은 유지)
+3. (MySQL/MariaDB) 이미 있는 price_alert_events 의 외래 키에 ON DELETE 규칙이 없으면 다시 생성
+
+사용법:
+    python -m app.worker alert-migrate
+"""
+import logging
+from typing import Dict, List
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+
+from app.domain.alert.models import PriceAlertEvent
+
+logger = logging.getLogger(__name__)
+
+# 목표가 컬럼을 추가할 테이블
+_TARGET_PRICE_TABLES = ["products", "wishlist_items"]
+
+# price_alert_events 외래 키 컬럼 -> (참조 테이블, ON DELETE 규칙)
+_EVENT_FOREIGN_KEYS: Dict[str, tuple] = {
+    "product_id": ("products", "CASCADE"),
+    "wishlist_item_id": ("wishlist_items", "SET NULL"),
+}
+
+
+class AlertMigration:
+    @staticmethod
+    def apply(engine: Engine) -> List[str]:
+        """적용한 변경 목록 반환 (이미 적용되어 있으면 빈 목록)"""
+        applied: List[str] = []
+        inspector = inspect(engine)
+        with engine.begin() as conn:
+            for table in _TARGET_PRICE_TABLES:
+                columns = {column["name"] for column in inspector.get_columns(table)}
+                if "target_price" not in columns:
+                    conn.execute(text(f"ALTER TABLE {table} ADD COLUMN target_price INTEGER"))
+                    applied.append(f"{table}.target_price")
+
+        if not inspector.has_table(PriceAlertEvent.__tablename__):
+            PriceAlertEvent.__table__.create(bind=engine)
+            applied.append(PriceAlertEvent.__tablename__)
+        elif engine.dialect.name == "mysql":
+            applied += AlertMigration._fix_foreign_keys(engine)
+
+        logger.info("alert migration applied: %s", applied or "nothing to do")
+        return applied
+
+    @staticmethod
+    def _fix_foreign_keys(engine: Engine) -> List[str]:
+        """ON DELETE 규칙 없이 만들어진 외래 키를 다시 생성 (MySQL/MariaDB)"""
+        table = PriceAlertEvent.__tablename__
+        statements: List[str] = []
+        fixed: List[str] = []
+        for fk in inspect(engine).get_foreign_keys(table):
+            column = fk["constrained_columns"][0]
+            if column not in _EVENT_FOREIGN_KEYS:
+                continue
+            referred, rule = _EVENT_FOREIGN_KEYS[column]
+            if (fk.get("options") or {}).get("ondelete", "").upper() == rule:
+                continue
+            statements += [
+                f"DROP FOREIGN KEY {fk['name']}",
+                f"ADD CONSTRAINT {fk['name']} FOREIGN KEY ({column}) "
+                f"REFERENCES {referred} (id) ON DELETE {rule}",
+            ]
+            fixed.append(f"{table}.{column} ON DELETE {rule}")
+        if statements:
+            with engine.begin() as conn:
+                conn.execute(text(f"ALTER TABLE {table} " + ", ".join(statements)))
+        return fixed
@@ -0,0 +1,23 @@
+from datetime import datetime
+from sqlalchemy import Column, BigInteger, String, Integer, DateTime, ForeignKey
+from app.core.database import Base
+
+
+class PriceAlertEvent(Base):
+    """가격이 목표가 아래로 내려간 시점의 알림 기록"""
+
+    __tablename__ = "price_alert_events"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    user_id = Column(BigInteger, ForeignKey("users.id"), nullable=False, index=True)
+    # 즐겨찾기를 삭제하면 알림 기록도 삭제, 위시리스트에서만 빼면 기록은 남김
+    product_id = Column(
+        BigInteger, ForeignKey("products.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    wishlist_item_id = Column(BigInteger, ForeignKey("wishlist_items.id", ondelete="SET NULL"))
+    source = Column(String(20), nullable=False)
+    source_product_id = Column(String(64), nullable=False)
+    target_price = Column(Integer, nullable=False)
+    previous_price = Column(Integer)
+    price = Column(Integer, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
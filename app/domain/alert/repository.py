@@ -0,0 +1,71 @@
+from typing import Iterator, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.domain.alert.index import ProductKey, Watcher
+from app.domain.alert.models import PriceAlertEvent
+from app.domain.product.models import CatalogProduct, Product
+from app.domain.wishlist.models import WishlistItem
+
+
+class AlertRepository:
+    @staticmethod
+    def iter_watchers(
+        db: Session, chunk_size: int = 10000, catalog_product_id: Optional[int] = None
+    ) -> Iterator[Tuple[ProductKey, Watcher]]:
+        """
+        목표가가 설정된 즐겨찾기/위시리스트 항목 (필요한 컬럼만 청크 단위로 읽음)
+        catalog_product_id 를 주면 해당 상품 구독자만
+        """
+        favorites = (
+            db.query(
+                CatalogProduct.source,
+                CatalogProduct.source_product_id,
+                Product.target_price,
+                Product.user_id,
+                Product.id,
+            )
+            .join(CatalogProduct, Product.catalog_product_id == CatalogProduct.id)
+            .filter(Product.target_price.isnot(None))
+        )
+        if catalog_product_id is not None:
+            favorites = favorites.filter(Product.catalog_product_id == catalog_product_id)
+        favorites = favorites.yield_per(chunk_size)
+        for source, source_product_id, target_price, user_id, product_id in favorites:
+            yield (source, source_product_id), Watcher(target_price, user_id, product_id, None)
+
+        wishlist = (
+            db.query(
+                CatalogProduct.source,
+                CatalogProduct.source_product_id,
+                WishlistItem.target_price,
+                WishlistItem.user_id,
+                WishlistItem.product_id,
+                WishlistItem.id,
+            )
+            .join(Product, WishlistItem.product_id == Product.id)
+            .join(CatalogProduct, Product.catalog_product_id == CatalogProduct.id)
+            .filter(WishlistItem.target_price.isnot(None))
+        )
+        if catalog_product_id is not None:
+            wishlist = wishlist.filter(Product.catalog_product_id == catalog_product_id)
+        wishlist = wishlist.yield_per(chunk_size)
+        for source, source_product_id, target_price, user_id, product_id, item_id in wishlist:
+            yield (source, source_product_id), Watcher(target_price, user_id, product_id, item_id)
+
+    @staticmethod
+    def bulk_create_events(db: Session, events: List[dict]) -> None:
+        if not events:
+            return
+        db.bulk_insert_mappings(PriceAlertEvent, events)
+        db.commit()
+
+    @staticmethod
+    def list_by_user(db: Session, user_id: int, limit: int) -> List[PriceAlertEvent]:
+        return (
+            db.query(PriceAlertEvent)
+            .filter(PriceAlertEvent.user_id == user_id)
+            .order_by(PriceAlertEvent.created_at.desc(), PriceAlertEvent.id.desc())
+            .limit(limit)
+            .all()
+        )
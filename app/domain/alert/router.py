@@ -0,0 +1,27 @@
+from typing import List
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.common.schemas import BaseResponse
+from app.core.auth import get_current_user_id
+from app.core.database import get_db
+from app.domain.alert.schemas import PriceAlertEventResponse
+from app.domain.alert.service import AlertService
+
+router = APIRouter()
+
+
+@router.get(
+    "",
+    response_model=BaseResponse[List[PriceAlertEventResponse]],
+    summary="내 가격 알림 조회",
+    description="즐겨찾기/위시리스트 목표가 아래로 가격이 내려간 알림을 최신순으로 조회합니다.",
+)
+def list_my_alerts(
+    limit: int = Query(50, ge=1, le=200),
+    db: Session = Depends(get_db),
+    user_id: int = Depends(get_current_user_id),
+):
+    events = AlertService.list_my_events(db, user_id=user_id, limit=limit)
+    return BaseResponse.ok([PriceAlertEventResponse.model_validate(e) for e in events])
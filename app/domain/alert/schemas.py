@@ -0,0 +1,23 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class PriceAlertEventResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    product_id: int
+    wishlist_item_id: Optional[int] = None
+    source: str
+    source_product_id: str
+    target_price: int
+    previous_price: Optional[int] = None
+    price: int
+    created_at: datetime
+
+
+class TargetPriceUpdate(BaseModel):
+    # None 이면 알림 해제
+    target_price: Optional[int] = Field(default=None, ge=1)
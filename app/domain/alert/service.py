@@ -0,0 +1,59 @@
+"""
+가격 하락 알림
+
+- 가격 갱신 워커가 주기적으로 목표가 전체를 읽어 PriceAlertIndex 를 만들고
+  배치마다 (이전 가격, 새 가격) 으로 목표가를 지난 구독자만 찾아 알림을 기록합니다.
+- 알림 전달(푸시 등)은 price_alert_events 를 읽는 쪽에서 처리합니다.
+"""
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.domain.alert.index import PriceAlertIndex, ProductKey
+from app.domain.alert.models import PriceAlertEvent
+from app.domain.alert.repository import AlertRepository
+
+
+class AlertService:
+    @staticmethod
+    def build_index(db: Session) -> PriceAlertIndex:
+        return PriceAlertIndex.build(AlertRepository.iter_watchers(db))
+
+    @staticmethod
+    def build_product_index(db: Session, catalog_product_id: int) -> PriceAlertIndex:
+        """상품 하나의 구독자만 담은 인덱스 (상품 상세에서 가격을 바로 갱신한 경우)"""
+        return PriceAlertIndex.build(
+            AlertRepository.iter_watchers(db, catalog_product_id=catalog_product_id)
+        )
+
+    @staticmethod
+    def dispatch(
+        db: Session,
+        index: PriceAlertIndex,
+        updates: Iterable[Tuple[ProductKey, Optional[int], int]],
+    ) -> int:
+        """가격 갱신 목록으로 목표가를 지난 구독자를 찾아 알림 기록 (INSERT 1회)"""
+        now = datetime.utcnow()
+        events = [
+            {
+                "user_id": watcher.user_id,
+                "product_id": watcher.product_id,
+                "wishlist_item_id": watcher.wishlist_item_id,
+                "source": source,
+                "source_product_id": source_product_id,
+                "target_price": watcher.target_price,
+                "previous_price": previous_price,
+                "price": price,
+                "created_at": now,
+            }
+            for (source, source_product_id), previous_price, price, watcher in index.match_many(
+                updates
+            )
+        ]
+        AlertRepository.bulk_create_events(db, events)
+        return len(events)
+
+    @staticmethod
+    def list_my_events(db: Session, user_id: int, limit: int) -> List[PriceAlertEvent]:
+        return AlertRepository.list_by_user(db, user_id=user_id, limit=limit)
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, BigInteger, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, BigInteger, DateTime, ForeignKey, Index, UniqueConstraint
 from app.core.database import Base
 from app.domain.user.models import User  # noqa: F401  # ensure FK target is registered
 
@@ -15,4 +15,6 @@ class Friend(Base):
 
     __table_args__ = (
         UniqueConstraint("owner_user_id", "friend_user_id", name="uq_friends_owner_friend"),
+        # 친구 목록 keyset 페이지네이션 (owner_user_id, created_at DESC, id DESC)
+        Index("ix_friends_owner_created", "owner_user_id", "created_at", "id"),
     )
@@ -1,7 +1,8 @@
-﻿from typing import List, Optional
+﻿from typing import List, Optional, Tuple
 
 from sqlalchemy.orm import Session
 
+from app.common.pagination import paginate_keyset
 from app.domain.friend.models import Friend
 
 
@@ -51,6 +52,19 @@ class FriendRepository:
             .all()
         )
 
+    @staticmethod
+    # keyset 페이지 (ix_friends_owner_created)
+    def list_by_owner_page(
+        db: Session, owner_user_id: int, cursor: Optional[str], size: int
+    ) -> Tuple[List[Friend], Optional[str]]:
+        return paginate_keyset(
+            db.query(Friend).filter(Friend.owner_user_id == owner_user_id),
+            Friend.created_at,
+            Friend.id,
+            cursor,
+            size,
+        )
+
     @staticmethod
     # 친구 추가
     def create(db: Session, owner_user_id: int, friend_user_id: int) -> Friend:
@@ -1,9 +1,9 @@
-from typing import List
+from typing import Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
-from app.common.schemas import BaseResponse
+from app.common.schemas import BaseResponse, CursorMeta, CursorPagedResponse
 from app.core.database import get_db
 from app.core.auth import get_current_user_id
 from app.domain.friend.schemas import FriendCreate, FriendListResponse, FriendResponse
@@ -59,29 +59,51 @@ def remove_friend(
     "",
     response_model=BaseResponse[FriendListResponse],
     summary="친구 목록 조회",
-    description="내 친구 목록을 페이지네이션하여 조회합니다. 페이지당 10명씩 반환됩니다.",
+    description="내 친구 목록을 최근 추가 순으로 조회합니다. 페이지당 10명씩 반환되며, next_cursor 를 cursor 로 넘기면 다음 페이지를 조회합니다. 전체 인원(total_count)은 include_total=true 이거나 page 파라미터를 사용할 때만 계산합니다. page 파라미터는 이전 방식(OFFSET) 호환용입니다.",
 )
 def list_friends(
-    page: int = 1,
+    cursor: Optional[str] = Query(None, description="다음 페이지 cursor (첫 페이지는 생략)"),
+    page: Optional[int] = Query(None, ge=1, description="페이지 번호 (이전 방식)", deprecated=True),
+    include_total: bool = Query(False, description="전체 인원 포함 여부"),
     db: Session = Depends(get_db),
     user_id: int = Depends(get_current_user_id),
 ):
-    data = service.list_friends(db, owner_user_id=user_id, page=page, size=10)
+    if page is not None:
+        return BaseResponse.ok(service.list_friends(db, owner_user_id=user_id, page=page, size=10))
+    data = service.list_friends_page(
+        db, owner_user_id=user_id, cursor=cursor, size=10, include_total=include_total
+    )
     return BaseResponse.ok(data)
 
 
 @router.get(
     "/{friend_user_id}/wishlist",
-    response_model=BaseResponse[List[WishlistItemResponse]],
+    response_model=CursorPagedResponse[WishlistItemResponse],
     summary="친구 위시리스트 조회",
-    description="친구로 등록된 사용자의 위시리스트를 조회합니다. 친구 관계가 아니면 조회할 수 없습니다.",
+    description="친구로 등록된 사용자의 위시리스트를 조회합니다. 친구 관계가 아니면 조회할 수 없습니다. size 를 지정하면 cursor 페이지 단위로 반환합니다.",
 )
 def get_friend_wishlist(
     friend_user_id: int,
+    cursor: Optional[str] = Query(None, description="다음 페이지 cursor (첫 페이지는 생략)"),
+    size: Optional[int] = Query(None, ge=1, le=100, description="페이지 크기 (생략 시 전체)"),
+    include_total: bool = Query(False, description="전체 개수 포함 여부"),
     db: Session = Depends(get_db),
     user_id: int = Depends(get_current_user_id),
 ):
-    items = wishlist_service.list_friend_wishlist(
-        db, requester_id=user_id, friend_user_id=friend_user_id
+    items, next_cursor, total_items = wishlist_service.list_friend_wishlist(
+        db,
+        requester_id=user_id,
+        friend_user_id=friend_user_id,
+        cursor=cursor,
+        size=size,
+        include_total=include_total,
+    )
+    return CursorPagedResponse(
+        data=items,
+        meta=CursorMeta(
+            size=size or len(items),
+            next_cursor=next_cursor,
+            has_next=next_cursor is not None,
+            total_items=total_items,
+        ),
     )
-    return BaseResponse.ok(items)
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -19,6 +19,10 @@ class FriendResponse(BaseModel):
 
 class FriendListResponse(BaseModel):
     items: List[FriendResponse]
-    total_count: int
-    page: int
+    # 이전 방식(page) 응답은 항상, cursor 방식은 include_total=true 일 때만 채워짐
+    total_count: Optional[int] = None
+    # 첫 페이지는 1, cursor 로 넘긴 페이지는 null
+    page: Optional[int] = None
     size: int
+    next_cursor: Optional[str] = None
+    has_next: bool = False
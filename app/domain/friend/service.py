@@ -1,4 +1,4 @@
-﻿from typing import List
+﻿from typing import List, Optional
 
 from sqlalchemy.orm import Session
 
@@ -43,7 +43,35 @@ class FriendService:
 
         self.repository.delete(db, friend)
 
-    # 친구 목록 + total_count
+    # 친구 목록 keyset 페이지 (total_count 는 요청 시에만)
+    def list_friends_page(
+        self,
+        db: Session,
+        owner_user_id: int,
+        cursor: Optional[str],
+        size: int,
+        include_total: bool = False,
+    ) -> FriendListResponse:
+        friends, next_cursor = self.repository.list_by_owner_page(
+            db, owner_user_id=owner_user_id, cursor=cursor, size=size
+        )
+        # 전체 인원(COUNT)은 include_total=true 일 때만 계산
+        total_count = (
+            self.repository.count_by_owner(db, owner_user_id=owner_user_id)
+            if include_total
+            else None
+        )
+        return FriendListResponse(
+            items=[FriendResponse.model_validate(friend) for friend in friends],
+            total_count=total_count,
+            # 첫 페이지(cursor 없음)는 이전 응답과 같이 page=1
+            page=1 if cursor is None else None,
+            size=size,
+            next_cursor=next_cursor,
+            has_next=next_cursor is not None,
+        )
+
+    # 친구 목록 + total_count (이전 OFFSET 방식)
     def list_friends(
         self, db: Session, owner_user_id: int, page: int, size: int
     ) -> FriendListResponse:
@@ -54,5 +82,9 @@ class FriendService:
         )
         items = [FriendResponse.model_validate(friend) for friend in friends]
         return FriendListResponse(
-            items=items, total_count=total_count, page=page, size=size
+            items=items,
+            total_count=total_count,
+            page=page,
+            size=size,
+            has_next=page * size < total_count,
         )
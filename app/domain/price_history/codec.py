@@ -0,0 +1,42 @@
+"""
+하루치 가격 관측값 델타 인코딩
+
+(하루 시작 후 경과 초, 가격) 배열을 각각 첫 값 + 차분(delta) 으로 바꿔
+little-endian int32 배열 하나로 저장합니다. 디코딩은 np.cumsum 한 번입니다.
+
+    [t0, t1-t0, ..., tn-tn-1, p0, p1-p0, ..., pn-pn-1]
+"""
+from typing import Tuple
+
+import numpy as np
+
+_DTYPE = np.dtype("<i4")
+
+
+def encode(offsets: np.ndarray, prices: np.ndarray) -> bytes:
+    """(경과 초 배열, 가격 배열) -> bytes"""
+    if len(offsets) == 0:
+        return b""
+    packed = np.concatenate(
+        (
+            np.diff(offsets, prepend=0),
+            np.diff(prices, prepend=0),
+        )
+    )
+    return packed.astype(_DTYPE).tobytes()
+
+
+def decode(blob: bytes) -> Tuple[np.ndarray, np.ndarray]:
+    """bytes -> (경과 초 배열, 가격 배열), 둘 다 int64"""
+    if not blob:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+    packed = np.frombuffer(blob, dtype=_DTYPE).astype(np.int64)
+    half = len(packed) // 2
+    return np.cumsum(packed[:half]), np.cumsum(packed[half:])
+
+
+def append(blob: bytes, offset: int, price: int) -> bytes:
+    """관측값 하나 추가 (하루치 배열이 작아 재인코딩 비용은 무시할 수준)"""
+    offsets, prices = decode(blob)
+    return encode(np.append(offsets, offset), np.append(prices, price))
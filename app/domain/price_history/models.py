@@ -0,0 +1,33 @@
+from datetime import datetime
+from sqlalchemy import Column, BigInteger, String, Integer, Date, DateTime, LargeBinary, UniqueConstraint
+from app.core.database import Base
+
+# 하루치 관측값을 모두 보관 (델타 인코딩)
+RESOLUTION_RAW = "raw"
+# 오래된 날은 일별 최소/최대/시가/종가만 보관
+RESOLUTION_DAILY = "daily"
+
+
+class PriceHistoryDay(Base):
+    """상품(source, source_product_id)별 하루치 가격 이력. 가격이 바뀐 경우에만 관측값 추가"""
+
+    __tablename__ = "price_history_days"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    source = Column(String(20), nullable=False)
+    source_product_id = Column(String(64), nullable=False)
+    day = Column(Date, nullable=False)
+    resolution = Column(String(10), nullable=False, default=RESOLUTION_RAW)
+    # codec.encode 결과 (daily 로 다운샘플링되면 비움)
+    points = Column(LargeBinary)
+    point_count = Column(Integer, nullable=False, default=0)
+    open_price = Column(Integer, nullable=False)
+    close_price = Column(Integer, nullable=False)
+    min_price = Column(Integer, nullable=False)
+    max_price = Column(Integer, nullable=False)
+    last_observed_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        UniqueConstraint("source", "source_product_id", "day", name="uq_price_history_product_day"),
+    )
@@ -0,0 +1,119 @@
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from sqlalchemy import func, tuple_
+from sqlalchemy.orm import Session
+from app.domain.price_history.models import RESOLUTION_RAW, PriceHistoryDay
+from app.domain.product.models import CatalogProduct, Product
+
+ProductKey = Tuple[str, str]
+
+
+class PriceHistoryRepository:
+    """가격 이력 DB 작업"""
+
+    @staticmethod
+    def list_latest_days(db: Session, keys: Iterable[ProductKey]) -> Dict[ProductKey, PriceHistoryDay]:
+        """상품별 가장 최근 날짜의 이력 행 (쿼리 1회)"""
+        keys = list(keys)
+        if not keys:
+            return {}
+        latest = (
+            db.query(
+                PriceHistoryDay.source,
+                PriceHistoryDay.source_product_id,
+                func.max(PriceHistoryDay.day).label("day"),
+            )
+            .filter(tuple_(PriceHistoryDay.source, PriceHistoryDay.source_product_id).in_(keys))
+            .group_by(PriceHistoryDay.source, PriceHistoryDay.source_product_id)
+            .subquery()
+        )
+        rows = (
+            db.query(PriceHistoryDay)
+            .join(
+                latest,
+                (PriceHistoryDay.source == latest.c.source)
+                & (PriceHistoryDay.source_product_id == latest.c.source_product_id)
+                & (PriceHistoryDay.day == latest.c.day),
+            )
+            .all()
+        )
+        return {(row.source, row.source_product_id): row for row in rows}
+
+    @staticmethod
+    def list_range(
+        db: Session, source: str, source_product_id: str, start: date, end: date
+    ) -> List[PriceHistoryDay]:
+        return (
+            db.query(PriceHistoryDay)
+            .filter(
+                PriceHistoryDay.source == source,
+                PriceHistoryDay.source_product_id == source_product_id,
+                PriceHistoryDay.day >= start,
+                PriceHistoryDay.day <= end,
+            )
+            .order_by(PriceHistoryDay.day)
+            .all()
+        )
+
+    @staticmethod
+    def get_last_before(
+        db: Session, source: str, source_product_id: str, day: date
+    ) -> Optional[PriceHistoryDay]:
+        """day 이전의 마지막 이력 행 (구간 시작 시점 가격 계산용)"""
+        return (
+            db.query(PriceHistoryDay)
+            .filter(
+                PriceHistoryDay.source == source,
+                PriceHistoryDay.source_product_id == source_product_id,
+                PriceHistoryDay.day < day,
+            )
+            .order_by(PriceHistoryDay.day.desc())
+            .first()
+        )
+
+    @staticmethod
+    def get_all_time_low(db: Session, source: str, source_product_id: str) -> Optional[int]:
+        return (
+            db.query(func.min(PriceHistoryDay.min_price))
+            .filter(
+                PriceHistoryDay.source == source,
+                PriceHistoryDay.source_product_id == source_product_id,
+            )
+            .scalar()
+        )
+
+    @staticmethod
+    def list_raw_before(db: Session, before: date, limit: int) -> List[PriceHistoryDay]:
+        """다운샘플링 대상 (before 이전 날짜의 raw 행)"""
+        return (
+            db.query(PriceHistoryDay)
+            .filter(PriceHistoryDay.resolution == RESOLUTION_RAW, PriceHistoryDay.day < before)
+            .order_by(PriceHistoryDay.day)
+            .limit(limit)
+            .all()
+        )
+
+    @staticmethod
+    def filter_tracked(db: Session, keys: Iterable[ProductKey]) -> Set[ProductKey]:
+        """누군가 즐겨찾기한 상품만 남김 (쿼리 1회)"""
+        keys = list(keys)
+        if not keys:
+            return set()
+        favorited = db.query(Product.id).filter(Product.catalog_product_id == CatalogProduct.id)
+        rows = (
+            db.query(CatalogProduct.source, CatalogProduct.source_product_id)
+            .filter(
+                tuple_(CatalogProduct.source, CatalogProduct.source_product_id).in_(keys),
+                favorited.exists(),
+            )
+            .all()
+        )
+        return {(source, source_product_id) for source, source_product_id in rows}
+
+    @staticmethod
+    def add_all(db: Session, rows: List[PriceHistoryDay]) -> None:
+        db.add_all(rows)
+
+    @staticmethod
+    def commit(db: Session) -> None:
+        db.commit()
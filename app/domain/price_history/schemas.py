@@ -0,0 +1,40 @@
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class PricePoint(BaseModel):
+    observed_at: datetime
+    price: int
+    # raw 관측값은 price 와 같고, 일별로 다운샘플링된 날은 그날의 최소/최대
+    min_price: int
+    max_price: int
+
+
+class PriceStats(BaseModel):
+    min: int
+    max: int
+    # 시간 가중 평균 (가격이 다음 관측까지 유지된다고 가정)
+    avg: float
+    first: int
+    last: int
+    count: int
+
+
+class PriceHistoryResult(BaseModel):
+    product_id: int
+    source: str
+    source_product_id: str
+    start: datetime
+    end: datetime
+    points: List[PricePoint]
+    stats: Optional[PriceStats] = None
+    all_time_low: Optional[int] = None
+    is_all_time_low: bool = False
+
+
+class PriceHistoryResponse(BaseModel):
+    success: bool
+    message: str
+    data: PriceHistoryResult
@@ -0,0 +1,269 @@
+"""
+가격 이력 기록 / 조회
+
+- 관측값은 가격이 바뀐 경우에만 기록 (같은 가격이면 행을 쓰지 않음)
+- 하루치 관측값은 (source, source_product_id, day) 행 하나에 델타 인코딩하여 저장
+- PRICE_HISTORY_RAW_DAYS 보다 오래된 날은 일별 시가/종가/최소/최대만 남김
+- 구간 통계(최소/최대/시간 가중 평균)는 NumPy 배열 연산으로 계산
+- 날짜 경계는 다른 시각 컬럼과 같이 UTC 기준
+"""
+import asyncio
+import logging
+import threading
+from datetime import datetime, time, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.domain.price_history import codec
+from app.domain.price_history.models import RESOLUTION_DAILY, RESOLUTION_RAW, PriceHistoryDay
+from app.domain.price_history.repository import PriceHistoryRepository, ProductKey
+
+logger = logging.getLogger(__name__)
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def to_utc_naive(value: datetime) -> datetime:
+    """시간대가 있는 시각(예: ...Z, +09:00)을 DB 컬럼과 같은 naive UTC 로 변환 (naive 는 UTC 로 간주)"""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _to_seconds(value: datetime) -> int:
+    return int((to_utc_naive(value) - _EPOCH).total_seconds())
+
+
+def _from_seconds(seconds: int) -> datetime:
+    return _EPOCH + timedelta(seconds=int(seconds))
+
+
+class PriceObservationBuffer:
+    """
+    검색/갱신 중 본 가격을 모아두는 프로세스 내 버퍼
+    상품별 마지막 관측값만 유지하고 주기적으로 flush 하여 DB 에 기록
+    """
+
+    def __init__(self, max_keys: int) -> None:
+        self.max_keys = max_keys
+        self._observations: Dict[ProductKey, Tuple[int, datetime]] = {}
+        self._lock = threading.Lock()
+        self.dropped = 0
+
+    def add(self, source: str, source_product_id: str, price: int, observed_at: datetime) -> None:
+        if not price:
+            return
+        key = (source, source_product_id)
+        with self._lock:
+            if key not in self._observations and len(self._observations) >= self.max_keys:
+                self.dropped += 1
+                return
+            self._observations[key] = (price, observed_at)
+
+    def add_items(self, items: Iterable[Dict], observed_at: Optional[datetime] = None) -> None:
+        """parse_products 형식의 검색 결과 항목 추가"""
+        observed_at = observed_at or datetime.utcnow()
+        for item in items:
+            self.add(item["source"], item["source_product_id"], item["price"], observed_at)
+
+    def drain(self) -> Dict[ProductKey, Tuple[int, datetime]]:
+        with self._lock:
+            observations, self._observations = self._observations, {}
+            return observations
+
+    def __len__(self) -> int:
+        return len(self._observations)
+
+
+# 프로세스 전역 관측값 버퍼
+price_observations = PriceObservationBuffer(max_keys=settings.PRICE_HISTORY_BUFFER_MAX_KEYS)
+
+
+class PriceHistoryService:
+    @staticmethod
+    def record(db: Session, observations: Dict[ProductKey, Tuple[int, datetime]]) -> int:
+        """
+        관측값 기록 (기록한 상품 수 반환)
+        - 마지막 기록 가격과 같거나 마지막 기록보다 오래된 관측값은 건너뜀
+        - 같은 날의 raw 행이 있으면 관측값을 덧붙이고, 없으면 새 행 생성
+        """
+        latest = PriceHistoryRepository.list_latest_days(db, observations.keys())
+        new_rows: List[PriceHistoryDay] = []
+        written = 0
+        for (source, source_product_id), (price, observed_at) in observations.items():
+            row = latest.get((source, source_product_id))
+            if row is not None and (
+                row.close_price == price or observed_at <= row.last_observed_at
+            ):
+                continue
+
+            day = observed_at.date()
+            offset = _to_seconds(observed_at) - _to_seconds(datetime.combine(day, time()))
+            if row is not None and row.day == day and row.resolution == RESOLUTION_RAW:
+                row.points = codec.append(row.points, offset, price)
+                row.point_count += 1
+                row.close_price = price
+                row.min_price = min(row.min_price, price)
+                row.max_price = max(row.max_price, price)
+                row.last_observed_at = observed_at
+            else:
+                new_rows.append(
+                    PriceHistoryDay(
+                        source=source,
+                        source_product_id=source_product_id,
+                        day=day,
+                        resolution=RESOLUTION_RAW,
+                        points=codec.encode(np.array([offset]), np.array([price])),
+                        point_count=1,
+                        open_price=price,
+                        close_price=price,
+                        min_price=price,
+                        max_price=price,
+                        last_observed_at=observed_at,
+                    )
+                )
+            written += 1
+
+        if written:
+            PriceHistoryRepository.add_all(db, new_rows)
+            PriceHistoryRepository.commit(db)
+        return written
+
+    @staticmethod
+    def flush_observations(db: Session) -> int:
+        """버퍼의 관측값 중 누군가 즐겨찾기한 상품만 기록"""
+        observations = price_observations.drain()
+        if not observations:
+            return 0
+        tracked = PriceHistoryRepository.filter_tracked(db, observations.keys())
+        return PriceHistoryService.record(
+            db, {key: value for key, value in observations.items() if key in tracked}
+        )
+
+    @staticmethod
+    def flush_with_session() -> int:
+        db = SessionLocal()
+        try:
+            return PriceHistoryService.flush_observations(db)
+        finally:
+            db.close()
+
+    @staticmethod
+    async def flush_periodically(interval: float = settings.PRICE_HISTORY_FLUSH_SECONDS) -> None:
+        """API 프로세스용: interval 마다 버퍼를 스레드 풀에서 flush"""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await run_in_threadpool(PriceHistoryService.flush_with_session)
+            except Exception:
+                logger.warning("price history flush failed", exc_info=True)
+
+    @staticmethod
+    def downsample(
+        db: Session, raw_days: int = settings.PRICE_HISTORY_RAW_DAYS, batch_size: int = 1000
+    ) -> int:
+        """raw_days 보다 오래된 날의 관측값을 버리고 일별 시가/종가/최소/최대만 남김"""
+        before = datetime.utcnow().date() - timedelta(days=raw_days)
+        total = 0
+        while True:
+            rows = PriceHistoryRepository.list_raw_before(db, before=before, limit=batch_size)
+            for row in rows:
+                row.resolution = RESOLUTION_DAILY
+                row.points = None
+            PriceHistoryRepository.commit(db)
+            total += len(rows)
+            if len(rows) < batch_size:
+                return total
+
+    @staticmethod
+    def _row_arrays(row: PriceHistoryDay) -> Tuple[np.ndarray, ...]:
+        """이력 행 -> (시각(초), 가격, 최소, 최대) 배열. daily 행은 하루 시작 시각의 종가 1개"""
+        day_start = _to_seconds(datetime.combine(row.day, time()))
+        if row.resolution == RESOLUTION_RAW and row.points:
+            offsets, prices = codec.decode(row.points)
+            return day_start + offsets, prices, prices, prices
+        return (
+            np.array([day_start], dtype=np.int64),
+            np.array([row.close_price], dtype=np.int64),
+            np.array([row.min_price], dtype=np.int64),
+            np.array([row.max_price], dtype=np.int64),
+        )
+
+    @staticmethod
+    def get_series(
+        db: Session, source: str, source_product_id: str, start: datetime, end: datetime
+    ) -> Dict:
+        """
+        구간 [start, end] 의 가격 이력과 통계
+        - 구간 시작 시점의 가격(이전 마지막 관측값)을 첫 점으로 포함
+        - avg 는 가격이 다음 관측까지 유지된다고 보고 구간 내 시간 가중 평균
+        """
+        start, end = to_utc_naive(start), to_utc_naive(end)
+        start_s, end_s = _to_seconds(start), _to_seconds(end)
+        rows = PriceHistoryRepository.list_range(
+            db, source, source_product_id, start.date(), end.date()
+        )
+        arrays = [PriceHistoryService._row_arrays(row) for row in rows]
+        if arrays:
+            ts, prices, mins, maxs = (np.concatenate(parts) for parts in zip(*arrays))
+        else:
+            ts = prices = mins = maxs = np.empty(0, dtype=np.int64)
+
+        # 구간 시작 시점 가격: 같은 날 구간 이전 관측값, 없으면 이전 날 종가
+        before = ts < start_s
+        if before.any():
+            carry: Optional[int] = int(prices[before][-1])
+        else:
+            previous = PriceHistoryRepository.get_last_before(
+                db, source, source_product_id, start.date()
+            )
+            carry = previous.close_price if previous is not None else None
+
+        window = (ts >= start_s) & (ts <= end_s)
+        ts, prices, mins, maxs = ts[window], prices[window], mins[window], maxs[window]
+        if carry is not None and (len(ts) == 0 or ts[0] > start_s):
+            carry_arr = np.array([carry], dtype=np.int64)
+            ts = np.concatenate((np.array([start_s], dtype=np.int64), ts))
+            prices = np.concatenate((carry_arr, prices))
+            mins = np.concatenate((carry_arr, mins))
+            maxs = np.concatenate((carry_arr, maxs))
+
+        all_time_low = PriceHistoryRepository.get_all_time_low(db, source, source_product_id)
+        stats = None
+        if len(ts):
+            durations = np.diff(np.append(ts, end_s))
+            weight = int(durations.sum())
+            stats = {
+                "min": int(mins.min()),
+                "max": int(maxs.max()),
+                "avg": float((prices * durations).sum() / weight) if weight > 0 else float(prices.mean()),
+                "first": int(prices[0]),
+                "last": int(prices[-1]),
+                "count": int(len(ts)),
+            }
+
+        return {
+            "source": source,
+            "source_product_id": source_product_id,
+            "start": start,
+            "end": end,
+            "points": [
+                {
+                    "observed_at": _from_seconds(t),
+                    "price": int(p),
+                    "min_price": int(lo),
+                    "max_price": int(hi),
+                }
+                for t, p, lo, hi in zip(ts.tolist(), prices.tolist(), mins.tolist(), maxs.tolist())
+            ],
+            "stats": stats,
+            "all_time_low": all_time_low,
+            "is_all_time_low": (
+                stats is not None and all_time_low is not None and stats["last"] <= all_time_low
+            ),
+        }
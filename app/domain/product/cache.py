@@ -0,0 +1,185 @@
+"""
+TTL + LRU 인메모리 캐시
+
+- 키별 TTL (fresh 기간) + stale 허용 기간 (stale-while-revalidate)
+- 메모리 예산(바이트) 초과 시 가장 오래 사용되지 않은 항목부터 제거 (LRU)
+- 만료된 hot 항목은 즉시 반환하고, 키당 한 번만 백그라운드 갱신을 허용
+- stale 기간까지 지난 항목은 LRU 로 밀려날 때까지 남겨두어 장애 시 fallback(peek) 으로 사용
+- hit / stale hit / miss / eviction 카운터 제공
+"""
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Set, Tuple
+
+# get() 결과 상태
+CACHE_FRESH = "fresh"
+CACHE_STALE = "stale"
+CACHE_MISS = "miss"
+
+
+def estimate_size(value: Any) -> int:
+    """캐시 값의 대략적인 메모리 사용량 (바이트)"""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        for k, v in value.items():
+            size += estimate_size(k) + estimate_size(v)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            size += estimate_size(item)
+    return size
+
+
+class _CacheEntry:
+    __slots__ = ("value", "size", "fresh_until", "stale_until")
+
+    def __init__(self, value: Any, size: int, fresh_until: float, stale_until: float) -> None:
+        self.value = value
+        self.size = size
+        self.fresh_until = fresh_until
+        self.stale_until = stale_until
+
+
+class TTLCache:
+    def __init__(
+        self,
+        name: str,
+        ttl: float,
+        max_bytes: int,
+        stale_ttl: float = 0.0,
+    ) -> None:
+        self.name = name
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, _CacheEntry]" = OrderedDict()
+        self._refreshing: Set[Hashable] = set()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.fallback_hits = 0
+
+    def get(self, key: Hashable) -> Tuple[Optional[Any], str]:
+        """(값, 상태) 반환. 상태는 fresh | stale | miss"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None, CACHE_MISS
+
+            if now >= entry.stale_until:
+                # 만료 항목은 fallback 용으로 남겨둠 (메모리 예산 초과 시 LRU 로 제거)
+                self.expirations += 1
+                self.misses += 1
+                return None, CACHE_MISS
+
+            self._entries.move_to_end(key)
+            if now < entry.fresh_until:
+                self.hits += 1
+                return entry.value, CACHE_FRESH
+
+            self.stale_hits += 1
+            return entry.value, CACHE_STALE
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: Optional[float] = None,
+        stale_ttl: Optional[float] = None,
+    ) -> None:
+        """값 저장 (키별 TTL 지정 가능)"""
+        ttl = self.ttl if ttl is None else ttl
+        stale_ttl = self.stale_ttl if stale_ttl is None else stale_ttl
+        size = estimate_size(key) + estimate_size(value)
+        if size > self.max_bytes:
+            return
+
+        now = time.monotonic()
+        entry = _CacheEntry(value, size, now + ttl, now + ttl + stale_ttl)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes and self._entries:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+
+    def peek(self, key: Hashable) -> Optional[Any]:
+        """TTL 과 무관하게 남아 있는 값 반환 (업스트림 장애 시 fallback 용)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self.fallback_hits += 1
+            return entry.value
+
+    def is_fresh(self, key: Hashable) -> bool:
+        """카운터/LRU 순서에 영향 없이 fresh 항목 존재 여부 확인"""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and time.monotonic() < entry.fresh_until
+
+    def fresh_left(self, key: Hashable) -> float:
+        """카운터/LRU 순서에 영향 없이 fresh 기간이 남은 시간(초) 확인 (없거나 지났으면 0)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return 0.0
+            return max(0.0, entry.fresh_until - time.monotonic())
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def begin_refresh(self, key: Hashable) -> bool:
+        """백그라운드 갱신 시작 (이미 갱신 중인 키면 False)"""
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def end_refresh(self, key: Hashable) -> None:
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def _remove(self, key: Hashable) -> None:
+        # 락을 잡은 상태에서만 호출
+        entry = self._entries.pop(key)
+        self.current_bytes -= entry.size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.stale_hits + self.misses
+            return {
+                "name": self.name,
+                "entries": len(self._entries),
+                "current_bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "fallback_hits": self.fallback_hits,
+                "refreshing": len(self._refreshing),
+                "hit_ratio": (self.hits + self.stale_hits) / lookups if lookups else 0.0,
+            }
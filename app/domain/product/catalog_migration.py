@@ -0,0 +1,333 @@
+"""
+products(사용자별 상품 복사본) -> catalog_products(원본 상품) + products(사용자별 링크) 온라인 마이그레이션
+
+서비스를 멈추지 않도록 expand -> backfill -> 배포 -> backfill -> contract 순서로 진행합니다.
+반드시 새 코드 배포 전에 expand, backfill 을 먼저 실행해야 합니다.
+
+1. expand  : catalog_products 생성, products.catalog_product_id 추가,
+             (user_id, catalog_product_id) 유니크 키 생성 (배포 직후부터 새 코드의 중복 링크 방지),
+             기존 상품 정보 컬럼의 NOT NULL 해제 (새 코드는 링크 행에 상품 정보를 쓰지 않음),
+             기존 코드가 INSERT 하는 행을 즉시 원본 상품에 연결하는 트리거 생성 (dual-write)
+2. backfill: id 구간 단위로 catalog_products 채우고 products.catalog_product_id 연결
+             (배치마다 커밋하여 잠금 시간을 짧게 유지, 여러 번 실행해도 안전)
+3. 배포    : 새 코드 배포 후 backfill 을 한 번 더 실행하여 남은 행을 연결
+             (새 코드는 contract 전까지 catalog 를 outer join 으로 읽으므로 연결되지 않은 행도 조회됨)
+4. report  : 중복 저장량 / 가격 갱신 행 수 감소 확인, 중복 링크가 없는지 확인
+5. contract: 기존 코드가 모두 내려간 뒤, 연결되지 않은 행이 없을 때만 트리거 삭제,
+             catalog_product_id NOT NULL, 유니크 키 교체, products 의 상품 정보 컬럼 삭제
+
+expand / contract 의 DDL 은 MySQL/MariaDB 전용입니다. backfill / report 는 SQLite 에서도 동작합니다.
+(SQLite 개발 DB 는 expand 대신 새로 생성하는 것을 권장)
+
+사용법:
+    python -m app.worker catalog-migrate expand
+    python -m app.worker catalog-migrate backfill --batch-size 5000
+    python -m app.worker catalog-migrate report
+    python -m app.worker catalog-migrate contract
+"""
+import logging
+from typing import Dict, List, Set, Union
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from app.core.exceptions import ConflictException
+from app.domain.product.models import CatalogProduct
+
+logger = logging.getLogger(__name__)
+
+# products 에서 catalog_products 로 옮겨가는 상품 정보 컬럼
+CATALOG_COLUMNS = [
+    "source",
+    "source_product_id",
+    "title",
+    "image_url",
+    "link_url",
+    "mall_name",
+    "brand",
+    "maker",
+    "category1",
+    "category2",
+    "category3",
+    "category4",
+    "price",
+    "last_fetched_at",
+]
+
+# 저장량 비교에 사용하는 가변 길이 컬럼
+_TEXT_COLUMNS = [
+    "title",
+    "image_url",
+    "link_url",
+    "mall_name",
+    "brand",
+    "maker",
+    "category1",
+    "category2",
+    "category3",
+    "category4",
+]
+
+_LEGACY_INDEXES = ["uq_products_user_source", "ix_products_source_product", "ix_products_title"]
+
+# 사용자별 링크 유니크 키 (expand 에서 생성, NULL 인 미연결 행은 제약을 받지 않음)
+_LINK_UNIQUE = "uq_products_user_catalog"
+
+# expand ~ contract 사이 기존 코드가 만든 행을 원본 상품에 연결하는 트리거
+_LINK_TRIGGER = "trg_products_link_catalog"
+
+
+def _columns(engine: Engine, table: str) -> Set[str]:
+    return {column["name"] for column in inspect(engine).get_columns(table)}
+
+
+def _require_mysql(engine: Engine, step: str) -> None:
+    if engine.dialect.name != "mysql":
+        raise ConflictException(
+            message=f"catalog-migrate {step} 는 MySQL/MariaDB 에서만 실행할 수 있습니다",
+            detail={"dialect": engine.dialect.name},
+        )
+
+
+def _triggers(engine: Engine) -> Set[str]:
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text(
+                "SELECT trigger_name FROM information_schema.triggers "
+                "WHERE trigger_schema = DATABASE() AND event_object_table = 'products'"
+            )
+        ).all()
+    return {name for (name,) in rows}
+
+
+def _indexes(engine: Engine, table: str) -> Set[str]:
+    inspector = inspect(engine)
+    names = {index["name"] for index in inspector.get_indexes(table)}
+    names |= {constraint["name"] for constraint in inspector.get_unique_constraints(table)}
+    return names
+
+
+def _count_duplicate_links(conn: Union[Session, Connection]) -> int:
+    """같은 사용자가 같은 원본 상품에 링크를 두 개 이상 가진 (user_id, catalog_product_id) 수"""
+    return conn.execute(
+        text(
+            "SELECT COUNT(*) FROM ("
+            "SELECT user_id, catalog_product_id FROM products "
+            "WHERE catalog_product_id IS NOT NULL "
+            "GROUP BY user_id, catalog_product_id HAVING COUNT(*) > 1"
+            ") duplicates"
+        )
+    ).scalar()
+
+
+class CatalogMigration:
+    @staticmethod
+    def expand(engine: Engine) -> None:
+        _require_mysql(engine, "expand")
+        CatalogProduct.__table__.create(bind=engine, checkfirst=True)
+        columns = _columns(engine, "products")
+        with engine.begin() as conn:
+            if "catalog_product_id" not in columns:
+                conn.execute(
+                    text(
+                        "ALTER TABLE products "
+                        "ADD COLUMN catalog_product_id BIGINT NULL, "
+                        "ADD INDEX ix_products_catalog_product_id (catalog_product_id)"
+                    )
+                )
+            if "source" in columns:
+                conn.execute(
+                    text(
+                        "ALTER TABLE products "
+                        "MODIFY source VARCHAR(20) NULL, "
+                        "MODIFY source_product_id VARCHAR(64) NULL, "
+                        "MODIFY title VARCHAR(255) NULL"
+                    )
+                )
+        if _LINK_UNIQUE not in _indexes(engine, "products"):
+            # 새 코드의 insert_links(ON DUPLICATE KEY) / save_favorite 가 기대는 유니크 키
+            with engine.begin() as conn:
+                conn.execute(
+                    text(
+                        f"ALTER TABLE products ADD CONSTRAINT {_LINK_UNIQUE} "
+                        "UNIQUE (user_id, catalog_product_id)"
+                    )
+                )
+        if "source" in columns and _LINK_TRIGGER not in _triggers(engine):
+            # 기존 코드(상품 정보를 products 에 직접 쓰는 코드)의 INSERT 를 원본 상품에도 기록
+            names = ", ".join(CATALOG_COLUMNS)
+            values = ", ".join(f"NEW.{column}" for column in CATALOG_COLUMNS)
+            with engine.begin() as conn:
+                conn.execute(
+                    text(
+                        f"CREATE TRIGGER {_LINK_TRIGGER} BEFORE INSERT ON products "
+                        "FOR EACH ROW BEGIN "
+                        "IF NEW.catalog_product_id IS NULL AND NEW.source IS NOT NULL THEN "
+                        f"INSERT INTO catalog_products ({names}, created_at, updated_at) "
+                        f"VALUES ({values}, NEW.created_at, NEW.updated_at) "
+                        "ON DUPLICATE KEY UPDATE id = LAST_INSERT_ID(id); "
+                        "SET NEW.catalog_product_id = LAST_INSERT_ID(); "
+                        "END IF; "
+                        "END"
+                    )
+                )
+        logger.info("catalog migration expand done")
+
+    @staticmethod
+    def backfill(db: Session, batch_size: int = 5000) -> Dict[str, int]:
+        """id 구간 단위로 원본 상품 생성 + 링크 연결 (이미 연결된 행은 건너뜀)"""
+        if "source" not in _columns(db.get_bind(), "products"):
+            return {"batches": 0, "linked": 0}
+
+        max_id = db.execute(text("SELECT COALESCE(MAX(id), 0) FROM products")).scalar()
+        columns = ", ".join(CATALOG_COLUMNS)
+        selected = ", ".join(f"p.{column}" for column in CATALOG_COLUMNS)
+        if db.get_bind().dialect.name == "mysql":
+            on_duplicate = (
+                "ON DUPLICATE KEY UPDATE "
+                "price = IF(COALESCE(VALUES(last_fetched_at), '1970-01-01') "
+                "> COALESCE(catalog_products.last_fetched_at, '1970-01-01'), "
+                "VALUES(price), catalog_products.price), "
+                "last_fetched_at = GREATEST(COALESCE(VALUES(last_fetched_at), '1970-01-01'), "
+                "COALESCE(catalog_products.last_fetched_at, '1970-01-01'))"
+            )
+        else:
+            on_duplicate = (
+                "ON CONFLICT (source, source_product_id) DO UPDATE SET "
+                "price = CASE WHEN COALESCE(excluded.last_fetched_at, '1970-01-01') "
+                "> COALESCE(catalog_products.last_fetched_at, '1970-01-01') "
+                "THEN excluded.price ELSE catalog_products.price END, "
+                "last_fetched_at = MAX(COALESCE(excluded.last_fetched_at, '1970-01-01'), "
+                "COALESCE(catalog_products.last_fetched_at, '1970-01-01'))"
+            )
+        batches = linked = 0
+        lower = 0
+        while lower < max_id:
+            upper = lower + batch_size
+            params = {"lower": lower, "upper": upper}
+            # 같은 상품이 여러 사용자에게 있으면 가장 최근에 조회된 가격을 남김
+            db.execute(
+                text(
+                    f"INSERT INTO catalog_products ({columns}, created_at, updated_at) "
+                    f"SELECT {selected}, p.created_at, p.updated_at FROM products p "
+                    "WHERE p.id > :lower AND p.id <= :upper "
+                    "AND p.catalog_product_id IS NULL AND p.source IS NOT NULL "
+                    + on_duplicate
+                ),
+                params,
+            )
+            result = db.execute(
+                text(
+                    "UPDATE products SET catalog_product_id = ("
+                    "SELECT c.id FROM catalog_products c "
+                    "WHERE c.source = products.source "
+                    "AND c.source_product_id = products.source_product_id) "
+                    "WHERE id > :lower AND id <= :upper "
+                    "AND catalog_product_id IS NULL AND source IS NOT NULL"
+                ),
+                params,
+            )
+            db.commit()
+            batches += 1
+            linked += result.rowcount
+            lower = upper
+            logger.info("catalog backfill: id <= %s linked=%s", upper, linked)
+        return {"batches": batches, "linked": linked}
+
+    @staticmethod
+    def report(db: Session) -> Dict:
+        """
+        마이그레이션 전후 비교
+        - storage: 상품 정보 가변 길이 컬럼 바이트 합계 (사용자별 복사본 vs 원본 상품)
+        - refresh: 가격 갱신 한 주기에 UPDATE 하는 행 수 (사용자별 행 vs 원본 상품 행)
+        """
+        engine = db.get_bind()
+        legacy = "source" in _columns(engine, "products")
+        text_bytes = " + ".join(f"COALESCE(LENGTH({column}), 0)" for column in _TEXT_COLUMNS)
+
+        link_rows = db.execute(text("SELECT COUNT(*) FROM products")).scalar()
+        linked_rows = db.execute(
+            text("SELECT COUNT(*) FROM products WHERE catalog_product_id IS NOT NULL")
+        ).scalar()
+        catalog_rows, catalog_bytes = db.execute(
+            text(f"SELECT COUNT(*), COALESCE(SUM({text_bytes}), 0) FROM catalog_products")
+        ).one()
+        favorited_catalog_rows = db.execute(
+            text("SELECT COUNT(DISTINCT catalog_product_id) FROM products")
+        ).scalar()
+        duplicate_links = _count_duplicate_links(db)
+
+        report: Dict = {
+            "products_rows": link_rows,
+            "products_linked": linked_rows,
+            "products_pending": link_rows - linked_rows,
+            # 0 이 아니면 contract 의 유니크 키 생성이 실패하므로 먼저 정리해야 함
+            "duplicate_links": duplicate_links,
+            "catalog_rows": catalog_rows,
+            "duplication_factor": round(link_rows / favorited_catalog_rows, 2)
+            if favorited_catalog_rows
+            else None,
+            "refresh_rows_per_cycle": {
+                "per_user_copies": link_rows,
+                "catalog": favorited_catalog_rows,
+            },
+            "storage_bytes": {"catalog": int(catalog_bytes)},
+        }
+        if legacy:
+            report["storage_bytes"]["per_user_copies"] = int(
+                db.execute(text(f"SELECT COALESCE(SUM({text_bytes}), 0) FROM products")).scalar()
+            )
+
+        if engine.dialect.name == "mysql":
+            rows = db.execute(
+                text(
+                    "SELECT table_name, data_length + index_length FROM information_schema.tables "
+                    "WHERE table_schema = DATABASE() "
+                    "AND table_name IN ('products', 'catalog_products')"
+                )
+            ).all()
+            report["table_bytes"] = {name: int(size) for name, size in rows}
+        return report
+
+    @staticmethod
+    def contract(engine: Engine) -> None:
+        """연결되지 않은 행(backfill 을 먼저 다시 실행)이나 중복 링크가 남아 있으면 중단"""
+        _require_mysql(engine, "contract")
+        columns = _columns(engine, "products")
+        with engine.connect() as conn:
+            pending = conn.execute(
+                text("SELECT COUNT(*) FROM products WHERE catalog_product_id IS NULL")
+            ).scalar()
+            duplicates = _count_duplicate_links(conn)
+        if pending:
+            raise ConflictException(
+                message="catalog_product_id 가 연결되지 않은 상품이 남아 있습니다",
+                detail={"pending": pending},
+            )
+        if duplicates:
+            raise ConflictException(
+                message="같은 원본 상품에 대한 중복 링크가 남아 있습니다",
+                detail={"duplicate_links": duplicates},
+            )
+
+        indexes = _indexes(engine, "products")
+        foreign_keys = {fk["name"] for fk in inspect(engine).get_foreign_keys("products")}
+        statements: List[str] = ["MODIFY catalog_product_id BIGINT NOT NULL"]
+        if "fk_products_catalog_product" not in foreign_keys:
+            statements.append(
+                "ADD CONSTRAINT fk_products_catalog_product "
+                "FOREIGN KEY (catalog_product_id) REFERENCES catalog_products (id)"
+            )
+        if _LINK_UNIQUE not in indexes:
+            # expand 이전 버전으로 확장한 DB 용
+            statements.append(
+                f"ADD CONSTRAINT {_LINK_UNIQUE} UNIQUE (user_id, catalog_product_id)"
+            )
+        statements += [f"DROP INDEX {name}" for name in _LEGACY_INDEXES if name in indexes]
+        statements += [f"DROP COLUMN {name}" for name in CATALOG_COLUMNS if name in columns]
+        with engine.begin() as conn:
+            # 트리거가 참조하는 컬럼을 삭제하기 전에 제거
+            conn.execute(text(f"DROP TRIGGER IF EXISTS {_LINK_TRIGGER}"))
+            conn.execute(text("ALTER TABLE products " + ", ".join(statements)))
+        logger.info("catalog migration contract done")
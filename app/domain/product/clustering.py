@@ -0,0 +1,234 @@
+"""
+검색 결과 유사 상품 묶기 (MinHash + LSH)
+
+같은 상품이 판매처(몰)마다 조금씩 다른 상품명으로 여러 번 나오는 것을 한 그룹으로 묶습니다.
+
+- 특징: 정규화 상품명(괄호 홍보 문구/특수문자 제거) 토큰별 글자 3-gram + 브랜드/제조사
+- MinHash: 페이지 전체 shingle 해시를 한 배열로 모아 NUM_PERM 개 해시 함수를 numpy 로 한 번에 계산하고
+  항목별 구간 최솟값(np.minimum.reduceat)으로 서명 생성
+- LSH: 서명을 BANDS 개 밴드로 나누어 같은 밴드 값을 가진 항목 쌍만 후보로 비교
+  (rows=4, bands=16 이면 유사도 0.5 부근부터 후보가 됨)
+- 확인: 서명 일치율이 min_similarity 이상이고, 브랜드/제조사가 다르지 않으며,
+  상품명의 숫자(모델명, 용량, 세대)와 모델 코드가 같은 쌍만 같은 그룹으로 합침 (union-find)
+  한쪽 그룹 대표와도 비슷해야 합쳐서 비슷한 상품이 사슬처럼 이어지지 않게 함
+- 그룹 안은 최저가 순 (가격 0 은 맨 뒤), 그룹 순서는 그룹 첫 항목의 원래 검색 순위
+- 해시는 프로세스와 무관한 crc32, 토큰/항목 단위 특징은 lru_cache 로 재사용
+  (같은 검색 결과를 다시 묶거나 페이지마다 반복되는 단어는 다시 계산하지 않음)
+"""
+import re
+import zlib
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.domain.product.matching import title_tokens
+
+_DIGITS = re.compile(r"\d+")
+# 하이픈으로 이어진 영문/숫자 묶음 (모델 코드 후보)
+_CODE = re.compile(r"[a-z0-9]+(?:-[a-z0-9]+)*")
+
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+
+# 해시 계열 (a * h + b) mod 2^32 (a 는 홀수라 32비트 공간의 순열), 나머지 연산 없이 uint32 wrap-around
+_rng = np.random.default_rng(23)
+_A = _rng.integers(0, 1 << 32, size=(NUM_PERM, 1), dtype=np.uint32) | np.uint32(1)
+_B = _rng.integers(0, 1 << 32, size=(NUM_PERM, 1), dtype=np.uint32)
+# 밴드 값을 정수 하나로 합칠 때 쓰는 계수 (uint64 overflow 는 의도된 wrap-around)
+_BAND_MIX = _rng.integers(1, 1 << 62, size=(1, ROWS, 1), dtype=np.uint64)
+_BAND_SALT = np.uint64(0x9E3779B97F4A7C15)
+
+
+def _label(value: Optional[str]) -> str:
+    return " ".join(value.lower().split()) if value else ""
+
+
+def _hash(text: str) -> int:
+    # 내장 hash() 는 프로세스마다 값이 달라 워커마다 그룹이 달라질 수 있으므로 고정 해시 사용
+    return zlib.crc32(text.encode())
+
+
+@lru_cache(maxsize=65536)
+def _token_hashes(token: str, size: int = 3) -> Tuple[int, ...]:
+    # 토큰 안에서만 3-gram 을 만들어 단어 순서가 바뀌어도 같은 shingle
+    # ("이어폰", "블루투스" 처럼 페이지마다 반복되는 토큰은 캐시에서 바로 사용)
+    return tuple(
+        {_hash(token[i : i + size]) for i in range(max(1, len(token) - size + 1))}
+    )
+
+
+def _model_info(title: str, tokens: List[str]) -> Tuple[frozenset, Tuple[str, ...], str]:
+    """
+    (상품명의 숫자 집합, 숫자가 포함된 영문/숫자 코드, 띄어쓰기를 뺀 상품명)
+    "WH-1000XM5" -> 숫자 {1000, 5}, 코드 ("wh1000xm5",)
+    """
+    joined = "".join(tokens)
+    codes = tuple(
+        code.replace("-", "") for code in _CODE.findall(title.lower()) if _DIGITS.search(code)
+    )
+    return frozenset(_DIGITS.findall(joined)), codes, joined
+
+
+def _same_model(left: Tuple, right: Tuple) -> bool:
+    """숫자가 같고, 한쪽의 모델 코드가 다른 쪽 상품명(띄어쓰기 무시)에 모두 포함"""
+    if left[0] != right[0]:
+        return False
+    if left[1] == right[1]:
+        return True
+    return all(code in right[2] for code in left[1]) and all(code in left[2] for code in right[1])
+
+
+def _compatible(left: Tuple[str, str], right: Tuple[str, str]) -> bool:
+    """(브랜드, 제조사) 라벨이 둘 다 있는데 다르면 다른 상품"""
+    if left == right:
+        return True
+    return all(not a or not b or a == b for a, b in zip(left, right))
+
+
+@lru_cache(maxsize=16384)
+def _item_features(
+    title: str, brand: Optional[str], maker: Optional[str]
+) -> Tuple[Tuple[int, ...], Tuple[str, str], Tuple]:
+    # 캐시된 검색 결과를 다시 묶을 때는 상품명 토큰화/해시를 건너뜀
+    tokens = title_tokens(title)
+    hashes: List[int] = []
+    for token in tokens:
+        hashes.extend(_token_hashes(token))
+    label = (_label(brand), _label(maker))
+    for field, value in zip(("brand", "maker"), label):
+        if value:
+            hashes.append(_hash(f"\x00{field}:{value}"))
+    return tuple(hashes), label, _model_info(title, tokens)
+
+
+def features(
+    items: List[Dict],
+) -> Tuple[List[Tuple[int, ...]], List[Tuple[str, str]], List[Tuple]]:
+    """
+    항목별 (shingle 해시, (브랜드, 제조사) 라벨, 모델 정보)
+    shingle: 상품명 토큰별 글자 3-gram + 브랜드/제조사 (중복은 MinHash 결과에 영향 없음)
+    """
+    shingles: List[Tuple[int, ...]] = []
+    labels: List[Tuple[str, str]] = []
+    models: List[Tuple] = []
+    for index, item in enumerate(items):
+        hashes, label, model = _item_features(
+            item.get("title") or "", item.get("brand"), item.get("maker")
+        )
+        # 상품명이 비어 있으면 다른 항목과 겹치지 않는 shingle 하나
+        shingles.append(hashes or (_hash(f"\x00empty:{index}"),))
+        labels.append(label)
+        models.append(model)
+    return shingles, labels, models
+
+
+def signatures(shingles: List[Tuple[int, ...]]) -> np.ndarray:
+    """(NUM_PERM, 항목 수) MinHash 서명"""
+    offsets = np.cumsum([0] + [len(hashes) for hashes in shingles[:-1]])
+    values = np.fromiter(
+        (value for hashes in shingles for value in hashes), dtype=np.uint32
+    )
+    permuted = np.multiply(_A, values)
+    permuted += _B
+    return np.minimum.reduceat(permuted, offsets, axis=1)
+
+
+def _find(parents: List[int], index: int) -> int:
+    while parents[index] != index:
+        parents[index] = parents[parents[index]]
+        index = parents[index]
+    return index
+
+
+def cluster(items: List[Dict], min_similarity: float = 0.5) -> List[List[int]]:
+    """유사 상품 그룹 (항목 인덱스 목록, 그룹 안은 입력 순서)"""
+    count = len(items)
+    if count < 2:
+        return [[index] for index in range(count)]
+
+    shingles, labels, models = features(items)
+    signature = signatures(shingles)
+    # 밴드별 ROWS 개 값을 정수 하나로 합치고 밴드 번호를 섞어 한 배열에서 같은 값끼리 정렬
+    band_keys = (signature.reshape(BANDS, ROWS, count) * _BAND_MIX).sum(axis=1)
+    band_keys += np.arange(BANDS, dtype=np.uint64).reshape(BANDS, 1) * _BAND_SALT
+    flat = band_keys.ravel()
+    order = np.argsort(flat, kind="stable")
+    same = flat[order[1:]] == flat[order[:-1]]
+    if not same.any():
+        return [[index] for index in range(count)]
+
+    # 같은 값이 이어지는 구간(버킷)마다 첫 항목과 나머지 항목을 후보 쌍으로 만듦
+    # (버킷 안 모든 쌍 대신 별 모양으로 비교. 합치기는 전이되므로 다른 밴드에서 보완됨)
+    bucket = np.cumsum(np.concatenate(([False], ~same)))
+    starts = np.flatnonzero(np.concatenate(([True], ~same)))
+    members = order % count
+    first = members[starts[bucket]]
+    pairs = np.stack((np.minimum(first, members), np.maximum(first, members)), axis=1)
+    pairs = pairs[pairs[:, 0] != pairs[:, 1]]
+    pairs = np.unique(pairs[:, 0] * count + pairs[:, 1])
+    pairs = np.stack(np.divmod(pairs, count), axis=1)
+
+    # 후보 쌍의 서명 일치율을 한 번에 계산하고 기준을 넘는 쌍만 확인
+    agreement = np.count_nonzero(
+        signature[:, pairs[:, 0]] == signature[:, pairs[:, 1]], axis=0
+    )
+    required = min_similarity * NUM_PERM
+    passed = agreement >= required
+    # 일치율이 높은 쌍부터 합침
+    similar = pairs[passed][np.argsort(-agreement[passed], kind="stable")].tolist()
+
+    def close(a: int, b: int) -> bool:
+        return np.count_nonzero(signature[:, a] == signature[:, b]) >= required
+
+    # 두 그룹 중 한쪽 대표(첫 항목)와도 기준을 넘어야 합침
+    # (단일 연결로 비슷한 상품이 사슬처럼 이어져 한 그룹이 되는 것을 막음)
+    parents = list(range(count))
+    for left, right in similar:
+        root_left, root_right = _find(parents, left), _find(parents, right)
+        if root_left == root_right:
+            continue
+        if not (
+            _compatible(labels[left], labels[right])
+            and _compatible(labels[root_left], labels[root_right])
+            and _same_model(models[left], models[right])
+            and _same_model(models[root_left], models[root_right])
+        ):
+            continue
+        if not (
+            root_left == left
+            or root_right == right
+            or close(left, root_right)
+            or close(right, root_left)
+        ):
+            continue
+        parents[max(root_left, root_right)] = min(root_left, root_right)
+
+    groups: Dict[int, List[int]] = {}
+    for index in range(count):
+        groups.setdefault(_find(parents, index), []).append(index)
+    return list(groups.values())
+
+
+def group_items(items: List[Dict], min_similarity: float = 0.5) -> List[Dict]:
+    """
+    그룹 목록 (원래 검색 순위 순)
+    {"count", "min_price", "max_price", "items": [최저가 순 항목]}
+    """
+    groups = []
+    for members in cluster(items, min_similarity):
+        listings = sorted(
+            (items[index] for index in members),
+            key=lambda item: (item["price"] <= 0, item["price"]),
+        )
+        prices = [item["price"] for item in listings if item["price"] > 0]
+        groups.append(
+            {
+                "count": len(listings),
+                "min_price": min(prices) if prices else 0,
+                "max_price": max(prices) if prices else 0,
+                "items": listings,
+            }
+        )
+    return groups
@@ -0,0 +1,357 @@
+"""
+SQLite 기반 디스크 캐시 (검색 결과 L2)
+
+- 재시작/배포 후에도 남아 있어 직후의 네이버 호출 폭주와 느린 검색을 줄입니다.
+- WAL 모드 단일 파일이라 같은 호스트의 여러 uvicorn 워커가 함께 읽고 씁니다.
+- 만료 시각은 프로세스 간 공유를 위해 벽시계(time.time) 기준으로 저장합니다.
+- 크기 예산을 넘으면 만료가 가까운 항목부터 삭제(compaction)합니다.
+- 시작 시 유효한 항목을 인메모리 캐시(L1)로 미리 적재(warm)할 수 있습니다.
+- 디스크 오류는 요청 실패로 이어지지 않고 miss 로 처리합니다.
+- 읽기(get/peek/warm)는 블로킹 호출이므로 이벤트 루프에서는 스레드 풀로 호출합니다.
+- 쓰기(set)는 큐에 넣고 바로 반환하며, 전용 writer 스레드가 직렬화/INSERT/compaction 을 처리합니다.
+- decode 가 있으면 읽은 값을 인메모리 캐시(L1) 항목과 같은 타입으로 복원합니다. (JSON 왕복 보정)
+"""
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from app.domain.product import parser
+from app.domain.product.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# 완전히 만료된 항목도 장애 시 fallback 용으로 이 기간 동안은 보관
+FALLBACK_RETENTION_SECONDS = 24 * 60 * 60
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    fresh_until REAL NOT NULL,
+    stale_until REAL NOT NULL
+)
+"""
+
+
+class DiskCache:
+    def __init__(
+        self,
+        name: str,
+        path: str,
+        ttl: float,
+        max_bytes: int,
+        stale_ttl: float = 0.0,
+        compact_every: int = 200,
+        max_pending_writes: int = 1000,
+        decode: Optional[Callable[[Any], Any]] = None,
+    ) -> None:
+        self.name = name
+        self.path = path
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_bytes = max_bytes
+        self.compact_every = compact_every
+        self.decode = decode
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # close() 에서 모든 스레드의 연결을 닫기 위해 보관
+        self._connections: List[sqlite3.Connection] = []
+        self._queue: "queue.Queue[Optional[Tuple[Hashable, Any]]]" = queue.Queue(
+            maxsize=max_pending_writes
+        )
+        self._writer: Optional[threading.Thread] = None
+        self._writes_since_compact = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.dropped_writes = 0
+        self.compactions = 0
+        self.evictions = 0
+        self.errors = 0
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.path)
+
+    def _connect(self) -> sqlite3.Connection:
+        # sqlite3 연결은 스레드 간 공유하지 않음 (스레드별 연결)
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # 연결은 만든 스레드에서만 사용하고, 다른 스레드에서는 close() 만 호출
+            conn = sqlite3.connect(
+                self.path, timeout=1.0, isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(_SCHEMA)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_cache_entries_stale_until "
+                "ON cache_entries (stale_until)"
+            )
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    @staticmethod
+    def _encode_key(key: Hashable) -> str:
+        return json.dumps(list(key) if isinstance(key, tuple) else key, ensure_ascii=False)
+
+    @staticmethod
+    def _decode_key(raw: str) -> Hashable:
+        key = json.loads(raw)
+        return tuple(key) if isinstance(key, list) else key
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _loads(self, blob: bytes) -> Any:
+        value = parser.loads(blob)
+        return self.decode(value) if self.decode else value
+
+    def get(self, key: Hashable) -> Optional[Tuple[Any, float, float]]:
+        """
+        (값, fresh 남은 초, stale 포함 남은 초) 반환. 없거나 stale 기간까지 지났으면 None
+        fresh 남은 초가 0 이하이면 stale 상태
+        """
+        if not self.enabled:
+            return None
+        try:
+            row = self._connect().execute(
+                "SELECT value, fresh_until, stale_until FROM cache_entries WHERE key = ?",
+                (self._encode_key(key),),
+            ).fetchone()
+        except sqlite3.Error:
+            self._count("errors")
+            logger.warning("disk cache read failed: %s", self.path, exc_info=True)
+            return None
+
+        now = time.time()
+        if row is None or now >= row[2]:
+            self._count("misses")
+            return None
+        self._count("hits" if now < row[1] else "stale_hits")
+        return self._loads(row[0]), row[1] - now, row[2] - now
+
+    def peek(self, key: Hashable) -> Optional[Any]:
+        """TTL 과 무관하게 남아 있는 값 반환 (업스트림 장애 시 fallback 용)"""
+        if not self.enabled:
+            return None
+        try:
+            row = self._connect().execute(
+                "SELECT value FROM cache_entries WHERE key = ?", (self._encode_key(key),)
+            ).fetchone()
+        except sqlite3.Error:
+            self._count("errors")
+            return None
+        return self._loads(row[0]) if row is not None else None
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        쓰기 요청을 큐에 넣고 바로 반환 (이벤트 루프에서 호출해도 블로킹 없음)
+        큐가 가득 차면 버림 (디스크 캐시는 최선 노력)
+        """
+        if not self.enabled:
+            return
+        self._ensure_writer()
+        try:
+            self._queue.put_nowait((key, value))
+        except queue.Full:
+            self._count("dropped_writes")
+
+    def flush(self) -> None:
+        """대기 중인 쓰기가 모두 반영될 때까지 대기"""
+        if self._writer is not None:
+            self._queue.join()
+
+    def _ensure_writer(self) -> None:
+        with self._lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(
+                    target=self._write_loop, name=f"{self.name}-writer", daemon=True
+                )
+                self._writer.start()
+
+    def _write_loop(self) -> None:
+        while True:
+            task = self._queue.get()
+            try:
+                if task is None:
+                    return
+                self._write(*task)
+            except Exception:
+                self._count("errors")
+                logger.warning("disk cache write failed: %s", self.path, exc_info=True)
+            finally:
+                self._queue.task_done()
+
+    def _write(self, key: Hashable, value: Any) -> None:
+        """writer 스레드에서 실행 (직렬화 + INSERT, 필요하면 compaction)"""
+        blob = parser.dumps(value)
+        if len(blob) > self.max_bytes:
+            return
+        now = time.time()
+        try:
+            self._connect().execute(
+                "INSERT OR REPLACE INTO cache_entries "
+                "(key, value, size, fresh_until, stale_until) VALUES (?, ?, ?, ?, ?)",
+                (
+                    self._encode_key(key),
+                    blob,
+                    len(blob),
+                    now + self.ttl,
+                    now + self.ttl + self.stale_ttl,
+                ),
+            )
+        except sqlite3.Error:
+            self._count("errors")
+            logger.warning("disk cache write failed: %s", self.path, exc_info=True)
+            return
+
+        with self._lock:
+            self.writes += 1
+            self._writes_since_compact += 1
+            should_compact = self._writes_since_compact >= self.compact_every
+            if should_compact:
+                self._writes_since_compact = 0
+        if should_compact:
+            self.compact()
+
+    def compact(self) -> None:
+        """
+        오래 만료된 항목 삭제 후, 크기 예산을 넘으면 만료가 가까운 항목부터 삭제
+        (여러 워커가 동시에 실행해도 결과는 같음)
+        """
+        if not self.enabled:
+            return
+        now = time.time()
+        try:
+            conn = self._connect()
+            evicted = conn.execute(
+                "DELETE FROM cache_entries WHERE stale_until < ?",
+                (now - FALLBACK_RETENTION_SECONDS,),
+            ).rowcount
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM cache_entries").fetchone()[0]
+            if total > self.max_bytes:
+                # 예산의 90% 까지 줄여 compaction 이 연달아 일어나지 않도록 함
+                target = total - int(self.max_bytes * 0.9)
+                doomed = []
+                freed = 0
+                for key, size in conn.execute(
+                    "SELECT key, size FROM cache_entries ORDER BY stale_until"
+                ):
+                    if freed >= target:
+                        break
+                    doomed.append((key,))
+                    freed += size
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    conn.executemany("DELETE FROM cache_entries WHERE key = ?", doomed)
+                    conn.execute("COMMIT")
+                except sqlite3.Error:
+                    conn.execute("ROLLBACK")
+                    raise
+                evicted += len(doomed)
+            conn.execute("PRAGMA incremental_vacuum")
+        except sqlite3.Error:
+            self._count("errors")
+            logger.warning("disk cache compaction failed: %s", self.path, exc_info=True)
+            return
+        with self._lock:
+            self.compactions += 1
+            self.evictions += evicted
+
+    def warm(self, cache: TTLCache, limit: int) -> int:
+        """유효한 항목을 최근 저장 순으로 최대 limit 개 인메모리 캐시에 적재"""
+        if not self.enabled or limit <= 0:
+            return 0
+        now = time.time()
+        try:
+            rows = self._connect().execute(
+                "SELECT key, value, fresh_until, stale_until FROM cache_entries "
+                "WHERE stale_until > ? ORDER BY fresh_until DESC LIMIT ?",
+                (now, limit),
+            ).fetchall()
+        except sqlite3.Error:
+            self._count("errors")
+            logger.warning("disk cache warm-up failed: %s", self.path, exc_info=True)
+            return 0
+
+        # 오래된 항목부터 넣어 최근 항목이 LRU 에서 가장 늦게 밀려나도록 함
+        for raw_key, blob, fresh_until, stale_until in reversed(rows):
+            fresh_left = max(0.0, fresh_until - now)
+            cache.set(
+                self._decode_key(raw_key),
+                self._loads(blob),
+                ttl=fresh_left,
+                stale_ttl=stale_until - now - fresh_left,
+            )
+        return len(rows)
+
+    def clear(self) -> None:
+        if not self.enabled:
+            return
+        self.flush()
+        try:
+            self._connect().execute("DELETE FROM cache_entries")
+        except sqlite3.Error:
+            self._count("errors")
+
+    def close(self) -> None:
+        """대기 중인 쓰기를 반영하고 writer 스레드와 모든 스레드의 연결을 닫음"""
+        with self._lock:
+            writer, self._writer = self._writer, None
+        if writer is not None and writer.is_alive():
+            self._queue.put(None)
+            writer.join()
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        # 닫힌 연결은 각 스레드가 다음 사용 시 새로 만듦
+        self._local = threading.local()
+
+    def stats(self) -> Dict[str, Any]:
+        entries = current_bytes = None
+        if self.enabled:
+            try:
+                entries, current_bytes = self._connect().execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries"
+                ).fetchone()
+            except sqlite3.Error:
+                self._count("errors")
+        with self._lock:
+            lookups = self.hits + self.stale_hits + self.misses
+            return {
+                "name": self.name,
+                "enabled": self.enabled,
+                "path": self.path,
+                "entries": entries,
+                "current_bytes": current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "writes": self.writes,
+                "dropped_writes": self.dropped_writes,
+                "pending_writes": self._queue.qsize(),
+                "compactions": self.compactions,
+                "evictions": self.evictions,
+                "errors": self.errors,
+                "hit_ratio": (self.hits + self.stale_hits) / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,201 @@
+"""
+즐겨찾기 검색용 프로세스 내 n-gram 역색인 (사용자별)
+
+- 상품명/브랜드/제조사/카테고리를 소문자 토큰으로 나눈 뒤 글자 2-gram 으로 색인
+  (한글은 띄어쓰기가 일정하지 않아 형태소 대신 n-gram 사용, 1글자 토큰은 그대로 색인)
+- 검색어의 모든 n-gram 을 포함하는 상품만 후보 (AND), 가장 짧은 posting 부터 교집합
+- 점수: n-gram 별 idf x 필드 가중치 합 + 상품명에 검색어가 그대로 포함되면 가산점
+- 사용자별 색인은 첫 검색 시 DB 에서 생성하고 저장/삭제 시 갱신
+- 다른 프로세스의 변경은 (즐겨찾기 수, 최대 id) 시그니처가 달라지면 다시 생성하여 반영
+- 색인을 보관하는 사용자 수는 LRU 로 제한
+"""
+import math
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from app.domain.product.matching import title_tokens
+
+# (즐겨찾기 수, 최대 product id)
+IndexSignature = Tuple[int, int]
+
+# 필드별 가중치 (상품명 > 브랜드/제조사 > 카테고리)
+FIELD_WEIGHTS = {
+    "title": 3.0,
+    "brand": 2.0,
+    "maker": 2.0,
+    "category1": 1.0,
+    "category2": 1.0,
+    "category3": 1.0,
+    "category4": 1.0,
+}
+
+# 상품명에 정규화된 검색어가 그대로 포함될 때 가산점 (n-gram 점수 대비 배수)
+PHRASE_BONUS = 0.5
+
+
+def ngrams(text: Optional[str], n: int = 2) -> Set[str]:
+    grams: Set[str] = set()
+    for token in title_tokens(text):
+        if len(token) <= n:
+            grams.add(token)
+        else:
+            grams.update(token[i : i + n] for i in range(len(token) - n + 1))
+    return grams
+
+
+def search_fields(source: Any) -> Dict[str, Optional[str]]:
+    """색인할 필드 추출 (CatalogProduct, 같은 이름의 컬럼을 가진 조회 결과 행, 검색 결과 dict)"""
+    if isinstance(source, dict):
+        return {field: source.get(field) for field in FIELD_WEIGHTS}
+    return {field: getattr(source, field) for field in FIELD_WEIGHTS}
+
+
+class FavoriteSearchIndex:
+    """한 사용자의 즐겨찾기 역색인"""
+
+    def __init__(self, signature: IndexSignature) -> None:
+        self.signature = signature
+        # n-gram -> {product_id: 필드 가중치 합}
+        self._postings: Dict[str, Dict[int, float]] = {}
+        self._doc_grams: Dict[int, Set[str]] = {}
+        self._titles: Dict[int, str] = {}
+        # 동기 라우트는 스레드 풀에서 실행되므로 검색 중 갱신을 막음
+        self._lock = threading.RLock()
+
+    def add(self, product_id: int, fields: Dict[str, Optional[str]]) -> None:
+        with self._lock:
+            self.remove(product_id)
+            self._add(product_id, fields)
+
+    def _add(self, product_id: int, fields: Dict[str, Optional[str]]) -> None:
+        weights: Dict[str, float] = {}
+        for field, weight in FIELD_WEIGHTS.items():
+            for gram in ngrams(fields.get(field)):
+                weights[gram] = weights.get(gram, 0.0) + weight
+        for gram, weight in weights.items():
+            self._postings.setdefault(gram, {})[product_id] = weight
+        self._doc_grams[product_id] = set(weights)
+        self._titles[product_id] = " ".join(title_tokens(fields.get("title")))
+
+    def remove(self, product_id: int) -> None:
+        with self._lock:
+            for gram in self._doc_grams.pop(product_id, ()):
+                posting = self._postings[gram]
+                del posting[product_id]
+                if not posting:
+                    del self._postings[gram]
+            self._titles.pop(product_id, None)
+
+    def search(self, query: str) -> List[int]:
+        """점수 내림차순 (같으면 최근 저장 순) product id 목록"""
+        grams = ngrams(query)
+        if not grams:
+            return []
+        with self._lock:
+            return self._search(grams, " ".join(title_tokens(query)))
+
+    def _search(self, grams: Set[str], phrase: str) -> List[int]:
+        postings = [self._postings.get(gram) for gram in grams]
+        if any(posting is None for posting in postings):
+            return []
+        postings.sort(key=len)
+
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates.intersection_update(posting)
+            if not candidates:
+                return []
+
+        total = len(self._doc_grams)
+        scores: Dict[int, float] = {}
+        for posting in postings:
+            idf = math.log(1.0 + total / len(posting))
+            for product_id in candidates:
+                scores[product_id] = scores.get(product_id, 0.0) + posting[product_id] * idf
+        for product_id in candidates:
+            if phrase in self._titles[product_id]:
+                scores[product_id] *= 1.0 + PHRASE_BONUS
+        # id 는 저장 순서와 같으므로 동점이면 최근 저장한 상품 먼저
+        return sorted(candidates, key=lambda product_id: (-scores[product_id], -product_id))
+
+    def __len__(self) -> int:
+        return len(self._doc_grams)
+
+
+class FavoriteIndexRegistry:
+    """사용자별 색인 LRU 보관소"""
+
+    def __init__(self, max_users: int) -> None:
+        self.max_users = max_users
+        self._indexes: "OrderedDict[int, FavoriteSearchIndex]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.builds = 0
+        self.hits = 0
+        self.evictions = 0
+
+    def get(self, user_id: int, signature: IndexSignature) -> Optional[FavoriteSearchIndex]:
+        """시그니처가 같은 색인만 반환 (다르면 폐기하고 None)"""
+        with self._lock:
+            index = self._indexes.get(user_id)
+            if index is None:
+                return None
+            if index.signature != signature:
+                del self._indexes[user_id]
+                return None
+            self._indexes.move_to_end(user_id)
+            self.hits += 1
+            return index
+
+    def build(
+        self,
+        user_id: int,
+        signature: IndexSignature,
+        rows: Iterable[Tuple[int, Dict[str, Optional[str]]]],
+    ) -> FavoriteSearchIndex:
+        index = FavoriteSearchIndex(signature)
+        for product_id, fields in rows:
+            index.add(product_id, fields)
+        with self._lock:
+            self._indexes[user_id] = index
+            self._indexes.move_to_end(user_id)
+            self.builds += 1
+            while len(self._indexes) > self.max_users:
+                self._indexes.popitem(last=False)
+                self.evictions += 1
+        return index
+
+    def on_saved(self, user_id: int, product_id: int, fields: Dict[str, Optional[str]]) -> None:
+        """
+        이 프로세스에서 저장한 즐겨찾기 반영 (색인이 없으면 다음 검색 때 생성)
+        시그니처도 같이 갱신하므로, 그 사이 다른 프로세스의 변경이 있었다면 다음 검색에서 불일치로 재생성
+        """
+        with self._lock:
+            index = self._indexes.get(user_id)
+            if index is not None:
+                count, max_id = index.signature
+                index.add(product_id, fields)
+                index.signature = (count + 1, max(max_id, product_id))
+
+    def on_deleted(self, user_id: int, product_id: int) -> None:
+        with self._lock:
+            index = self._indexes.get(user_id)
+            if index is None:
+                return
+            count, max_id = index.signature
+            if product_id == max_id:
+                # 새 최대 id 를 알 수 없으므로 다음 검색 때 다시 생성
+                del self._indexes[user_id]
+                return
+            index.remove(product_id)
+            index.signature = (count - 1, max_id)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "users": len(self._indexes),
+                "documents": sum(len(index) for index in self._indexes.values()),
+                "builds": self.builds,
+                "hits": self.hits,
+                "evictions": self.evictions,
+            }
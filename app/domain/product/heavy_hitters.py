@@ -0,0 +1,147 @@
+"""
+검색어 heavy hitter (상위 K개) 추적
+
+- Count-Min sketch (depth x width 카운터) 로 모든 키의 빈도를 고정 메모리에서 근사
+  (추정값은 실제보다 작지 않고, 초과 오차는 전체 건수의 약 e/width 이내)
+- 추정값 상위 K개 후보만 dict + 최소 힙으로 보관 (힙은 지연 삭제, 크기가 커지면 재구성)
+- 시간 감쇠: 최근 값에 2^(경과/half_life) 가중치를 주는 forward decay
+  (조회 시 현재 가중치로 나누어 "half_life 마다 절반으로 줄어드는" 빈도로 환산)
+  가중치가 너무 커지면 모든 카운터를 한 번에 나누어 기준 시각을 옮김
+"""
+import heapq
+import random
+import threading
+import time
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+# 해시 계열 (a * h + b) mod p 에 쓰는 메르센 소수
+_PRIME = (1 << 61) - 1
+
+# 가중치가 이 값을 넘으면 카운터를 다시 스케일링 (float 정밀도 보호)
+_RESCALE_WEIGHT = float(1 << 40)
+
+# 오래 입력이 없을 때 float 범위를 넘지 않도록 지수 상한
+_MAX_EXPONENT = 1000.0
+
+
+class HeavyHitters:
+    def __init__(
+        self,
+        name: str,
+        k: int,
+        width: int,
+        depth: int,
+        half_life: float,
+        seed: int = 0,
+    ) -> None:
+        self.name = name
+        self.k = k
+        self.width = width
+        self.depth = depth
+        self.half_life = half_life
+        rng = random.Random(seed)
+        self._hashes = [
+            (rng.randrange(1, _PRIME), rng.randrange(0, _PRIME)) for _ in range(depth)
+        ]
+        self._counters: List[List[float]] = [[0.0] * width for _ in range(depth)]
+        # 후보 키 -> 추정값 (가중치가 곱해진 값)
+        self._top: Dict[Hashable, float] = {}
+        self._heap: List[Tuple[float, int, Hashable]] = []
+        self._sequence = 0
+        self._landmark = time.monotonic()
+        self._lock = threading.Lock()
+        self.total = 0.0
+        self.added = 0
+        self.replaced = 0
+        self.rescales = 0
+
+    def _weight(self, now: float) -> float:
+        return 2.0 ** min((now - self._landmark) / self.half_life, _MAX_EXPONENT)
+
+    def _slots(self, key: Hashable) -> List[int]:
+        h = hash(key) & _PRIME
+        return [((a * h + b) % _PRIME) % self.width for a, b in self._hashes]
+
+    def add(self, key: Hashable, count: float = 1.0) -> None:
+        now = time.monotonic()
+        with self._lock:
+            weight = self._weight(now)
+            if weight > _RESCALE_WEIGHT:
+                self._rescale(weight, now)
+                weight = 1.0
+            increment = count * weight
+            estimate = float("inf")
+            for row, slot in zip(self._counters, self._slots(key)):
+                row[slot] += increment
+                estimate = min(estimate, row[slot])
+            self.total += increment
+            self.added += 1
+            self._offer(key, estimate)
+
+    def _offer(self, key: Hashable, estimate: float) -> None:
+        # 락을 잡은 상태에서만 호출
+        if key not in self._top and len(self._top) >= self.k:
+            smallest = self._peek_min()
+            if estimate <= smallest[0]:
+                return
+            heapq.heappop(self._heap)
+            del self._top[smallest[2]]
+            self.replaced += 1
+        self._top[key] = estimate
+        self._sequence += 1
+        heapq.heappush(self._heap, (estimate, self._sequence, key))
+        if len(self._heap) > 4 * self.k:
+            self._rebuild_heap()
+
+    def _peek_min(self) -> Tuple[float, int, Hashable]:
+        # 추정값이 갱신되어 더 이상 맞지 않는 힙 항목은 버림
+        while True:
+            value, _, key = self._heap[0]
+            if self._top.get(key) == value:
+                return self._heap[0]
+            heapq.heappop(self._heap)
+
+    def _rebuild_heap(self) -> None:
+        self._heap = [
+            (value, sequence, key) for sequence, (key, value) in enumerate(self._top.items())
+        ]
+        heapq.heapify(self._heap)
+        self._sequence = len(self._heap)
+
+    def _rescale(self, weight: float, now: float) -> None:
+        for row in self._counters:
+            for slot in range(self.width):
+                row[slot] /= weight
+        self._top = {key: value / weight for key, value in self._top.items()}
+        self._rebuild_heap()
+        self.total /= weight
+        self._landmark = now
+        self.rescales += 1
+
+    def estimate(self, key: Hashable) -> float:
+        """감쇠가 반영된 빈도 추정값"""
+        with self._lock:
+            raw = min(row[slot] for row, slot in zip(self._counters, self._slots(key)))
+            return raw / self._weight(time.monotonic())
+
+    def top(self, n: Optional[int] = None) -> List[Tuple[Hashable, float]]:
+        """(키, 감쇠 빈도) 추정값 내림차순"""
+        with self._lock:
+            weight = self._weight(time.monotonic())
+            ranked = sorted(self._top.items(), key=lambda item: item[1], reverse=True)
+            return [(key, value / weight) for key, value in ranked[:n]]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "name": self.name,
+                "k": self.k,
+                "width": self.width,
+                "depth": self.depth,
+                "half_life": self.half_life,
+                "tracked": len(self._top),
+                "added": self.added,
+                "replaced": self.replaced,
+                "rescales": self.rescales,
+                "decayed_total": self.total / self._weight(time.monotonic()),
+            }
@@ -0,0 +1,77 @@
+"""
+상품명 정규화 / 동일 상품 판별
+
+네이버 검색 결과는 같은 상품이라도 판매처(몰)마다 상품명이 조금씩 다릅니다.
+괄호 안 홍보 문구와 특수문자를 제거한 토큰 집합으로 비교합니다.
+"""
+import re
+from typing import Dict, List, Optional, Set
+
+# [무료배송], (당일발송), 【정품】 등 괄호 안 홍보 문구
+_BRACKETED = re.compile(r"[\[\(\{<【].*?[\]\)\}>】]")
+_NON_WORD = re.compile(r"[^0-9a-z가-힣]+")
+_TAG = re.compile(r"</?b>")
+_HAS_DIGIT = re.compile(r"\d")
+
+# 검색 쿼리에 사용할 최대 토큰 수
+QUERY_MAX_TOKENS = 6
+
+
+def title_tokens(title: Optional[str]) -> List[str]:
+    """상품명을 소문자 토큰 목록으로 변환 (순서 유지)"""
+    if not title:
+        return []
+    text = _BRACKETED.sub(" ", _TAG.sub("", title).lower())
+    return [token for token in _NON_WORD.split(text) if token]
+
+
+def normalize_title(title: Optional[str]) -> str:
+    return " ".join(title_tokens(title))
+
+
+def build_search_query(title: str, brand: Optional[str] = None, maker: Optional[str] = None) -> str:
+    """저장된 상품으로 다시 검색할 때 사용할 정규화 쿼리 (브랜드 + 상품명 앞부분)"""
+    tokens = title_tokens(title)
+    prefix = [
+        word
+        for word in (normalize_title(brand), normalize_title(maker))
+        if word and word not in tokens
+    ][:1]
+    return " ".join(prefix + tokens[:QUERY_MAX_TOKENS])
+
+
+def _same_label(a: Optional[str], b: Optional[str]) -> bool:
+    # 한쪽이라도 비어 있으면 비교하지 않음
+    a, b = normalize_title(a), normalize_title(b)
+    return not a or not b or a == b
+
+
+def is_same_product(
+    title: str,
+    brand: Optional[str],
+    maker: Optional[str],
+    source_product_id: Optional[str],
+    item: Dict,
+    min_containment: float = 0.7,
+) -> bool:
+    """
+    검색 결과 항목(item, parse_product_item 형식)이 기준 상품과 같은 상품인지 판별
+    - productId 가 같으면 동일 상품
+    - 브랜드/제조사가 둘 다 있는데 다르면 다른 상품
+    - 숫자가 포함된 토큰(모델명, 용량 등)은 모두 포함되어야 함
+    - 기준 상품명 토큰의 min_containment 이상이 항목 상품명에 포함되어야 함
+    """
+    if source_product_id and item.get("source_product_id") == source_product_id:
+        return True
+    if not _same_label(brand, item.get("brand")) or not _same_label(maker, item.get("maker")):
+        return False
+
+    base: Set[str] = set(title_tokens(title))
+    if not base:
+        return False
+    other: Set[str] = set(title_tokens(item.get("title")))
+
+    model_tokens = {token for token in base if _HAS_DIGIT.search(token)}
+    if not model_tokens <= other:
+        return False
+    return len(base & other) / len(base) >= min_containment
@@ -1,13 +1,15 @@
 ﻿from datetime import datetime
-from sqlalchemy import Column, BigInteger, String, Text, Integer, DateTime, UniqueConstraint, ForeignKey
+from sqlalchemy import Column, BigInteger, String, Text, Integer, DateTime, UniqueConstraint, ForeignKey, Index
+from sqlalchemy.orm import relationship
 from app.core.database import Base
 
 
-class Product(Base):
-    __tablename__ = "products"
+class CatalogProduct(Base):
+    """원본 상품 (source, source_product_id) 당 1행. 사용자와 무관한 상품 정보와 최신 가격"""
+
+    __tablename__ = "catalog_products"
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
-    user_id = Column(BigInteger, ForeignKey("users.id"), nullable=False, index=True)
     source = Column(String(20), nullable=False)  # NAVER
     source_product_id = Column(String(64), nullable=False)
     title = Column(String(255), nullable=False, index=True)
@@ -21,10 +23,56 @@ class Product(Base):
     category3 = Column(String(120))
     category4 = Column(String(120))
     price = Column(Integer)
-    last_fetched_at = Column(DateTime)
+    last_fetched_at = Column(DateTime, index=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        UniqueConstraint("source", "source_product_id", name="uq_catalog_products_source"),
+    )
+
+
+def _catalog_field(name: str):
+    # 상품 정보는 catalog_products 에서 읽음 (기존 product.title 등 접근 코드 유지)
+    return property(lambda self: getattr(self.catalog, name) if self.catalog else None)
+
+
+class Product(Base):
+    """사용자별 즐겨찾기 (catalog_products 로의 얇은 링크)"""
+
+    __tablename__ = "products"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    user_id = Column(BigInteger, ForeignKey("users.id"), nullable=False, index=True)
+    # catalog-migrate contract 단계에서 NOT NULL 로 변경 (그 전에는 기존 행이 비어 있을 수 있음)
+    catalog_product_id = Column(
+        BigInteger, ForeignKey("catalog_products.id"), nullable=True, index=True
+    )
+    # 가격 하락 알림 목표가 (없으면 알림 없음)
+    target_price = Column(Integer)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # contract 전에는 연결되지 않은 행이 목록에서 조용히 빠지지 않도록 outer join
+    catalog = relationship(CatalogProduct, lazy="joined")
+
+    source = _catalog_field("source")
+    source_product_id = _catalog_field("source_product_id")
+    title = _catalog_field("title")
+    image_url = _catalog_field("image_url")
+    link_url = _catalog_field("link_url")
+    mall_name = _catalog_field("mall_name")
+    brand = _catalog_field("brand")
+    maker = _catalog_field("maker")
+    category1 = _catalog_field("category1")
+    category2 = _catalog_field("category2")
+    category3 = _catalog_field("category3")
+    category4 = _catalog_field("category4")
+    price = _catalog_field("price")
+    last_fetched_at = _catalog_field("last_fetched_at")
+
     __table_args__ = (
-        UniqueConstraint("user_id", "source", "source_product_id", name="uq_products_user_source"),
+        UniqueConstraint("user_id", "catalog_product_id", name="uq_products_user_catalog"),
+        # 즐겨찾기 목록 keyset 페이지네이션 (user_id, created_at DESC, id DESC)
+        Index("ix_products_user_created", "user_id", "created_at", "id"),
     )
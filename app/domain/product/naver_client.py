@@ -0,0 +1,152 @@
+"""
+네이버 쇼핑 검색 API 클라이언트
+
+- 프로세스 전역 커넥션 풀(keep-alive)을 공유하여 요청마다 TCP/TLS 연결을 새로 맺지 않습니다.
+- connect / read / pool 타임아웃을 분리하여 연결 지연과 응답 지연을 따로 제어합니다.
+- 비동기(API 라우터)와 동기(워커/스레드) 호출 경로를 모두 제공합니다.
+"""
+import threading
+from typing import Dict, Optional, TypeVar
+
+import httpx
+
+from app.core.config import settings
+from app.domain.product.parser import loads
+
+T = TypeVar("T")
+
+
+def _or_default(value: Optional[T], default: T) -> T:
+    return value if value is not None else default
+
+
+class NaverAPIError(Exception):
+    """네이버 API 호출 실패"""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        self.status_code = status_code
+        super().__init__(message)
+
+
+class NaverShoppingClient:
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        client_id: Optional[str] = None,
+        client_secret: Optional[str] = None,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        pool_timeout: Optional[float] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+    ) -> None:
+        # 0 / 빈 문자열도 명시한 값으로 사용 (None 일 때만 설정값)
+        self.base_url = _or_default(base_url, settings.NAVER_SEARCH_URL)
+        self.client_id = _or_default(client_id, settings.NAVER_CLIENT_ID)
+        self.client_secret = _or_default(client_secret, settings.NAVER_CLIENT_SECRET)
+        connect_timeout = _or_default(connect_timeout, settings.NAVER_CONNECT_TIMEOUT)
+        self.timeout = httpx.Timeout(
+            connect=connect_timeout,
+            read=_or_default(read_timeout, settings.NAVER_READ_TIMEOUT),
+            write=connect_timeout,
+            pool=_or_default(pool_timeout, settings.NAVER_POOL_TIMEOUT),
+        )
+        self.limits = httpx.Limits(
+            max_connections=_or_default(max_connections, settings.NAVER_MAX_CONNECTIONS),
+            max_keepalive_connections=_or_default(
+                max_keepalive_connections, settings.NAVER_MAX_KEEPALIVE_CONNECTIONS
+            ),
+        )
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._sync_client: Optional[httpx.Client] = None
+        self._lock = threading.Lock()
+
+    def _headers(self) -> Dict[str, str]:
+        return {
+            "X-Naver-Client-Id": self.client_id,
+            "X-Naver-Client-Secret": self.client_secret,
+        }
+
+    @staticmethod
+    def _params(query: str, display: int, start: int, sort: str) -> Dict:
+        return {
+            "query": query,
+            "display": min(display, 100),  # 최대 100개 제한
+            "start": start,
+            "sort": sort,
+        }
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        # 이벤트 루프 안에서 await 없이 생성하므로 별도 락이 필요 없음
+        if self._async_client is None or self._async_client.is_closed:
+            self._async_client = httpx.AsyncClient(
+                headers=self._headers(), timeout=self.timeout, limits=self.limits
+            )
+        return self._async_client
+
+    def _get_sync_client(self) -> httpx.Client:
+        with self._lock:
+            if self._sync_client is None or self._sync_client.is_closed:
+                self._sync_client = httpx.Client(
+                    headers=self._headers(), timeout=self.timeout, limits=self.limits
+                )
+            return self._sync_client
+
+    @staticmethod
+    def _handle_response(response: httpx.Response) -> Dict:
+        try:
+            response.raise_for_status()  # 4xx, 5xx 에러 시 예외 발생
+        except httpx.HTTPStatusError as e:
+            raise NaverAPIError(
+                f"네이버 API HTTP 에러: {e.response.status_code}",
+                status_code=e.response.status_code,
+            )
+        try:
+            return loads(response.content)
+        except ValueError:
+            # 점검 페이지(HTML) 등 JSON 이 아닌 200 응답 (orjson/json 디코드 에러 모두 ValueError)
+            raise NaverAPIError("네이버 API 응답 파싱 실패")
+
+    async def search(
+        self, query: str, display: int = 10, start: int = 1, sort: str = "sim"
+    ) -> Dict:
+        """네이버 쇼핑 API 검색 (비동기)"""
+        try:
+            response = await self._get_async_client().get(
+                self.base_url, params=self._params(query, display, start, sort)
+            )
+        except httpx.TimeoutException:
+            raise NaverAPIError("네이버 API 요청 시간 초과")
+        except httpx.HTTPError as e:
+            raise NaverAPIError(f"네이버 API 호출 실패: {str(e)}")
+        return self._handle_response(response)
+
+    def search_sync(
+        self, query: str, display: int = 10, start: int = 1, sort: str = "sim"
+    ) -> Dict:
+        """네이버 쇼핑 API 검색 (동기, 워커/스레드용)"""
+        try:
+            response = self._get_sync_client().get(
+                self.base_url, params=self._params(query, display, start, sort)
+            )
+        except httpx.TimeoutException:
+            raise NaverAPIError("네이버 API 요청 시간 초과")
+        except httpx.HTTPError as e:
+            raise NaverAPIError(f"네이버 API 호출 실패: {str(e)}")
+        return self._handle_response(response)
+
+    async def aclose(self) -> None:
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._sync_client is not None:
+                self._sync_client.close()
+                self._sync_client = None
+
+
+# 프로세스 전역 공유 클라이언트 (커넥션 풀 공유)
+naver_client = NaverShoppingClient()
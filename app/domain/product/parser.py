@@ -0,0 +1,132 @@
+"""
+네이버 쇼핑 검색 응답 파싱 / 직렬화 fast-path
+
+- JSON 디코딩/인코딩: orjson 이 설치되어 있으면 사용 (없으면 표준 json)
+- 태그 제거 + HTML 엔티티(&amp; 등) 변환을 정규식 한 번으로 처리
+- 타임스탬프는 응답(배치) 단위로 한 번만 생성
+- 검색 응답 payload 는 Pydantic 재검증 없이 바로 bytes 로 직렬화
+"""
+import html
+import json
+import re
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson 미설치 환경
+    orjson = None
+
+# <b>, </b> 등 모든 태그 또는 HTML 엔티티
+_TAG_OR_ENTITY = re.compile(r"<[^>]*>|&(?:#\d+|#[xX][0-9a-fA-F]+|[a-zA-Z]+);")
+
+# 검색 결과 항목 중 원본 상품(catalog_products) 컬럼으로 저장하는 필드
+CATALOG_FIELDS = (
+    "source",
+    "source_product_id",
+    "title",
+    "image_url",
+    "link_url",
+    "mall_name",
+    "brand",
+    "maker",
+    "category1",
+    "category2",
+    "category3",
+    "category4",
+    "price",
+    "last_fetched_at",
+)
+
+
+def _replace_tag_or_entity(match: re.Match) -> str:
+    token = match.group()
+    if token[0] == "<":
+        return ""
+    return html.unescape(token)
+
+
+def strip_tags(text: Optional[str]) -> str:
+    """태그 제거 + 엔티티 변환 (단일 패스)"""
+    if not text:
+        return ""
+    if "<" not in text and "&" not in text:
+        return text
+    return _TAG_OR_ENTITY.sub(_replace_tag_or_entity, text)
+
+
+def loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, default=_json_default).encode("utf-8")
+
+
+def restore_search_result(result: Dict) -> Dict:
+    """
+    JSON 왕복(디스크 캐시)으로 ISO 문자열이 된 last_fetched_at 을 datetime 으로 복원
+    (인메모리 캐시 항목과 같은 타입이어야 즐겨찾기 저장 등에서 그대로 사용할 수 있음)
+    """
+    for item in result.get("items", []):
+        item["last_fetched_at"] = _to_datetime(item.get("last_fetched_at"))
+    return result
+
+
+def catalog_fields(item: Dict) -> Dict:
+    """
+    검색 결과 항목(스냅샷) -> 원본 상품 컬럼 값
+    CATALOG_FIELDS 외의 키는 버리고, 문자열 last_fetched_at 은 datetime 으로 변환
+    """
+    row = {field: item.get(field) for field in CATALOG_FIELDS}
+    row["last_fetched_at"] = _to_datetime(row["last_fetched_at"])
+    return row
+
+
+def _to_datetime(value: Any) -> Optional[datetime]:
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return value
+
+
+def parse_item(item: Dict, fetched_at: datetime) -> Dict:
+    """응답 항목 하나를 ProductSearchItem 형식 dict 로 변환"""
+    get = item.get
+    lprice = get("lprice")
+    return {
+        "source": "NAVER",
+        "source_product_id": get("productId", ""),
+        "title": strip_tags(get("title", "")),
+        "image_url": get("image", ""),
+        "link_url": get("link", ""),
+        "mall_name": strip_tags(get("mallName", "")),
+        "brand": get("brand", ""),
+        "maker": get("maker", ""),
+        "category1": get("category1", ""),
+        "category2": get("category2", ""),
+        "category3": get("category3", ""),
+        "category4": get("category4", ""),
+        "price": int(lprice) if lprice else 0,  # lprice = 최저가
+        "last_fetched_at": fetched_at,
+    }
+
+
+def parse_items(raw_items: List[Dict], fetched_at: Optional[datetime] = None) -> List[Dict]:
+    """응답 항목 전체 변환 (타임스탬프 1회 생성)"""
+    fetched_at = fetched_at or datetime.utcnow()
+    return [parse_item(item, fetched_at) for item in raw_items]
+
+
+def build_search_payload(items: List[Dict], meta: Dict, message: str) -> bytes:
+    """검색 응답(ProductSearchResponse 형식)을 재검증 없이 직렬화"""
+    return dumps({"success": True, "message": message, "data": items, "meta": meta})
@@ -0,0 +1,89 @@
+"""
+다음 검색 페이지 선조회(prefetch) 지표
+
+page N 응답 후 page N+1 을 미리 캐시에 넣어 두고,
+선조회한 키가 실제로 조회되었는지(hit) / 조회 전에 만료되었는지(wasted)를 집계합니다.
+hit_ratio 가 낮으면 선조회가 호출 예산만 소모하고 있다는 의미입니다.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable
+
+# 선조회 건너뜀 사유
+SKIP_LAST_PAGE = "last_page"
+SKIP_CACHED = "cached"
+SKIP_IN_FLIGHT = "in_flight"
+SKIP_BUDGET = "budget"
+SKIP_CIRCUIT_OPEN = "circuit_open"
+
+
+class PrefetchTracker:
+    def __init__(self, name: str, max_tracked: int = 10000) -> None:
+        self.name = name
+        self.max_tracked = max_tracked
+        # 선조회 완료 키 -> 만료 시각 (monotonic)
+        self._pending: "OrderedDict[Hashable, float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.scheduled = 0
+        self.completed = 0
+        self.failed = 0
+        self.hits = 0
+        self.wasted = 0
+        self.skipped: Dict[str, int] = {
+            reason: 0
+            for reason in (
+                SKIP_LAST_PAGE,
+                SKIP_CACHED,
+                SKIP_IN_FLIGHT,
+                SKIP_BUDGET,
+                SKIP_CIRCUIT_OPEN,
+            )
+        }
+
+    def record_scheduled(self) -> None:
+        with self._lock:
+            self.scheduled += 1
+
+    def record_skipped(self, reason: str) -> None:
+        with self._lock:
+            self.skipped[reason] += 1
+
+    def record_failed(self) -> None:
+        with self._lock:
+            self.failed += 1
+
+    def record_completed(self, key: Hashable, ttl: float) -> None:
+        """선조회 결과가 캐시에 저장됨 (ttl 안에 조회되면 hit)"""
+        with self._lock:
+            self.completed += 1
+            self._pending.pop(key, None)
+            self._pending[key] = time.monotonic() + ttl
+            while len(self._pending) > self.max_tracked:
+                self._pending.popitem(last=False)
+                self.wasted += 1
+
+    def record_lookup(self, key: Hashable) -> None:
+        """사용자 조회 시 호출. 선조회한 키면 hit / wasted 로 집계"""
+        with self._lock:
+            expires_at = self._pending.pop(key, None)
+            if expires_at is None:
+                return
+            if time.monotonic() < expires_at:
+                self.hits += 1
+            else:
+                self.wasted += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "name": self.name,
+                "scheduled": self.scheduled,
+                "completed": self.completed,
+                "failed": self.failed,
+                "skipped": dict(self.skipped),
+                "hits": self.hits,
+                "wasted": self.wasted,
+                "pending": len(self._pending),
+                "hit_ratio": self.hits / self.completed if self.completed else 0.0,
+            }
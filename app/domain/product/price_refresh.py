@@ -0,0 +1,281 @@
+"""
+즐겨찾기 상품 가격 갱신 엔진 (API 프로세스와 분리된 워커에서 실행)
+
+- 즐겨찾기한 사용자가 있는 원본 상품(catalog_products)당 한 번만 조회
+- 가장 오래 갱신되지 않은 상품부터 배치 단위로 처리 (staleness 우선)
+- 네이버 호출은 세마포어로 동시성을 제한하고 price_refresh 우선순위로 호출 예산을 사용
+- 검색 캐시를 거치지 않고 항상 네이버에서 조회 (조회 실패는 캐시 값 대신 실패로 집계)
+- 배치 결과는 원본 상품 행을 UPDATE 한 번으로 반영하고 가격 이력에 기록
+- 알림 인덱스가 있으면 목표가 아래로 내려간 구독자에게 알림 기록
+- 상품 상세(refresh=stale)의 on-demand 갱신도 같은 방식으로 반영 (상품 단위로 병합)
+"""
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.exceptions import TooManyRequestsException
+from app.domain.alert.index import PriceAlertIndex
+from app.domain.alert.service import AlertService
+from app.domain.price_history.service import PriceHistoryService, price_observations
+from app.domain.product.matching import build_search_query
+from app.domain.product.models import Product
+from app.domain.product.rate_limiter import PRIORITY_INTERACTIVE, PRIORITY_PRICE_REFRESH
+from app.domain.product.repository import ProductRepository
+from app.domain.product.service import NAVER_MAX_DISPLAY, NaverShoppingService
+from app.domain.product.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# 네이버 쇼핑 검색으로 가격을 조회할 수 있는 출처
+REFRESHABLE_SOURCES = {"NAVER"}
+
+# 상품 상세 on-demand 갱신 병합 (catalog_product_id 단위)
+live_refresh_flight = SingleFlight(name="live_price_refresh")
+
+
+class LiveRefreshTarget(NamedTuple):
+    """on-demand 갱신 대상 (ORM 객체 대신 넘겨 이벤트 루프에서 지연 로딩이 일어나지 않도록 함)"""
+
+    catalog_product_id: int
+    source: str
+    source_product_id: str
+    title: str
+    brand: Optional[str]
+    maker: Optional[str]
+    price: Optional[int]
+
+
+class PriceRefreshService:
+    @staticmethod
+    async def fetch_price(
+        source: str,
+        source_product_id: str,
+        title: str,
+        brand: Optional[str],
+        maker: Optional[str],
+        priority: str = PRIORITY_PRICE_REFRESH,
+    ) -> Optional[int]:
+        """
+        상품의 현재 가격 조회 (검색 결과에서 같은 productId 의 lprice)
+        검색 결과에 상품이 없으면 None
+        캐시된(stale/fallback) 가격을 새로 조회한 가격으로 기록하지 않도록 항상 네이버에서 조회
+        """
+        if source not in REFRESHABLE_SOURCES:
+            return None
+        result = await NaverShoppingService.search_fresh(
+            query=build_search_query(title, brand, maker),
+            display=NAVER_MAX_DISPLAY,
+            sort="sim",
+            priority=priority,
+        )
+        for item in result["items"]:
+            if item["source_product_id"] == source_product_id:
+                return item["price"]
+        return None
+
+    @staticmethod
+    def is_stale(product: Product, fresh_seconds: float) -> bool:
+        if product.source not in REFRESHABLE_SOURCES:
+            return False
+        return product.last_fetched_at is None or (
+            datetime.utcnow() - product.last_fetched_at > timedelta(seconds=fresh_seconds)
+        )
+
+    @staticmethod
+    def live_target(product: Product) -> LiveRefreshTarget:
+        """상품을 로드한 세션의 스레드에서 호출"""
+        return LiveRefreshTarget(
+            product.catalog_product_id,
+            product.source,
+            product.source_product_id,
+            product.title,
+            product.brand,
+            product.maker,
+            product.price,
+        )
+
+    @staticmethod
+    def _apply_live_price(
+        catalog_product_id: int,
+        key: Tuple[str, str],
+        previous_price: Optional[int],
+        price: Optional[int],
+        fetched_at: datetime,
+    ) -> None:
+        """on-demand 조회 결과 반영 (요청 세션과 별도 세션, 백그라운드에서도 실행될 수 있음)"""
+        db = SessionLocal()
+        try:
+            ProductRepository.bulk_update_prices(db, {key: price}, fetched_at=fetched_at)
+            if price is None:
+                return
+            price_observations.add(key[0], key[1], price, fetched_at)
+            # 워커는 갱신된 가격을 이전 가격으로 보게 되므로 여기서 바로 알림 판정
+            if previous_price is not None and price < previous_price:
+                AlertService.dispatch(
+                    db,
+                    AlertService.build_product_index(db, catalog_product_id),
+                    [(key, previous_price, price)],
+                )
+        finally:
+            db.close()
+
+    @staticmethod
+    async def refresh_live(target: LiveRefreshTarget) -> Optional[int]:
+        """
+        상품 하나의 가격을 캐시를 거치지 않고 바로 다시 조회하여 반영 (같은 상품의 동시 요청은 1회로 병합)
+        호출자가 기다리다 포기해도 병합된 갱신은 끝까지 실행됨
+        """
+        key = (target.source, target.source_product_id)
+
+        async def refresh() -> Optional[int]:
+            price = await PriceRefreshService.fetch_price(
+                target.source,
+                target.source_product_id,
+                target.title,
+                target.brand,
+                target.maker,
+                priority=PRIORITY_INTERACTIVE,
+            )
+            await run_in_threadpool(
+                PriceRefreshService._apply_live_price,
+                target.catalog_product_id,
+                key,
+                target.price,
+                price,
+                datetime.utcnow(),
+            )
+            return price
+
+        return await live_refresh_flight.do_async(target.catalog_product_id, refresh)
+
+    @staticmethod
+    async def refresh_batch(
+        db: Session,
+        batch_size: int = settings.PRICE_REFRESH_BATCH_SIZE,
+        concurrency: int = settings.PRICE_REFRESH_CONCURRENCY,
+        stale_seconds: float = settings.PRICE_REFRESH_STALE_SECONDS,
+        alert_index: Optional[PriceAlertIndex] = None,
+    ) -> Dict:
+        """
+        가장 오래된 상품 batch_size 개의 가격을 갱신하고 처리 결과를 반환
+        - 조회 실패한 상품은 갱신하지 않아 다음 배치에서 다시 시도
+        - 호출 예산이 부족하면 남은 상품은 건너뜀
+        """
+        started_at = datetime.utcnow()
+        targets = ProductRepository.list_stalest_distinct(
+            db, stale_before=started_at - timedelta(seconds=stale_seconds), limit=batch_size
+        )
+        semaphore = asyncio.Semaphore(concurrency)
+        prices: Dict[Tuple[str, str], Optional[int]] = {}
+        previous_prices = {(target[0], target[1]): target[5] for target in targets}
+        failed = 0
+        budget_exhausted = False
+
+        async def refresh_one(
+            source, source_product_id, title, brand, maker, _price, _oldest
+        ) -> None:
+            nonlocal failed, budget_exhausted
+            async with semaphore:
+                if budget_exhausted:
+                    return
+                try:
+                    prices[(source, source_product_id)] = await PriceRefreshService.fetch_price(
+                        source, source_product_id, title, brand, maker
+                    )
+                except TooManyRequestsException:
+                    budget_exhausted = True
+                except Exception:
+                    failed += 1
+                    logger.warning(
+                        "price refresh failed: %s/%s", source, source_product_id, exc_info=True
+                    )
+
+        await asyncio.gather(*(refresh_one(*target) for target in targets))
+
+        # 상품을 찾지 못한 경우(None)도 조회 시각은 기록하여 대기열 맨 앞을 막지 않도록 함
+        fetched_at = datetime.utcnow()
+        rows_updated = ProductRepository.bulk_update_prices(db, prices, fetched_at=fetched_at)
+
+        # 갱신한 가격과 검색 중 본 다른 즐겨찾기 상품 가격을 함께 이력에 기록
+        for (source, source_product_id), price in prices.items():
+            if price is not None:
+                price_observations.add(source, source_product_id, price, fetched_at)
+        history_written = PriceHistoryService.flush_observations(db)
+
+        alerts = 0
+        if alert_index is not None:
+            alerts = AlertService.dispatch(
+                db,
+                alert_index,
+                (
+                    (key, previous_prices[key], price)
+                    for key, price in prices.items()
+                    if price is not None
+                ),
+            )
+        return {
+            "targets": len(targets),
+            "refreshed": sum(1 for price in prices.values() if price is not None),
+            "not_found": sum(1 for price in prices.values() if price is None),
+            "failed": failed,
+            "skipped": len(targets) - len(prices) - failed,
+            "budget_exhausted": budget_exhausted,
+            "rows_updated": rows_updated,
+            "history_written": history_written,
+            "alerts": alerts,
+        }
+
+    @staticmethod
+    async def run_forever(
+        batch_size: int = settings.PRICE_REFRESH_BATCH_SIZE,
+        concurrency: int = settings.PRICE_REFRESH_CONCURRENCY,
+        stale_seconds: float = settings.PRICE_REFRESH_STALE_SECONDS,
+        interval: float = settings.PRICE_REFRESH_INTERVAL_SECONDS,
+    ) -> None:
+        """
+        배치를 반복 실행
+        - 대상이 batch_size 만큼 남아 있으면 바로 다음 배치, 아니면 interval 만큼 대기
+        - 예산이 부족하면 interval 만큼 대기
+        - 하루에 한 번 가격 이력 다운샘플링
+        - ALERT_INDEX_REFRESH_SECONDS 마다 목표가 인덱스 재생성
+        """
+        last_downsampled_on = None
+        alert_index: Optional[PriceAlertIndex] = None
+        alert_index_built_at = 0.0
+        while True:
+            try:
+                db = SessionLocal()
+                try:
+                    if (
+                        alert_index is None
+                        or time.monotonic() - alert_index_built_at
+                        >= settings.ALERT_INDEX_REFRESH_SECONDS
+                    ):
+                        alert_index = AlertService.build_index(db)
+                        alert_index_built_at = time.monotonic()
+                        logger.info("price alert index built: %s", alert_index.stats())
+                    result = await PriceRefreshService.refresh_batch(
+                        db, batch_size, concurrency, stale_seconds, alert_index
+                    )
+                    # 하루에 한 번 오래된 가격 이력을 일별 최소/최대로 다운샘플링
+                    today = datetime.utcnow().date()
+                    if last_downsampled_on != today:
+                        result["history_downsampled"] = PriceHistoryService.downsample(db)
+                        last_downsampled_on = today
+                finally:
+                    db.close()
+            except Exception:
+                logger.exception("price refresh batch failed")
+                await asyncio.sleep(interval)
+                continue
+
+            logger.info("price refresh batch: %s", result)
+            if result["budget_exhausted"] or result["targets"] < batch_size:
+                await asyncio.sleep(interval)
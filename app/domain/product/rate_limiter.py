@@ -0,0 +1,197 @@
+"""
+네이버 API 호출 한도 스케줄러
+
+- 초당 버스트: 토큰 버킷 (rate_per_second 로 충전, burst 까지 누적)
+- 일일 예산: 한국 시간 자정 기준으로 초기화되는 호출 수 예산
+- 우선순위 클래스: interactive(사용자 검색) > price_refresh > saved_search > prefetch
+  낮은 우선순위는 버킷/일일 예산의 일정 몫(floor)을 남겨둔 상태에서만 호출할 수 있어
+  사용자 검색이 영향을 받기 전에 먼저 대기(queue)하거나 거절(shed)됩니다.
+"""
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional, Tuple
+
+from app.core.config import settings
+from app.core.exceptions import TooManyRequestsException
+
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_PRICE_REFRESH = "price_refresh"
+PRIORITY_SAVED_SEARCH = "saved_search"
+PRIORITY_PREFETCH = "prefetch"
+
+KST = timezone(timedelta(hours=9))
+
+
+class PriorityPolicy:
+    __slots__ = ("daily_floor_ratio", "token_floor_ratio", "max_wait")
+
+    def __init__(self, daily_floor_ratio: float, token_floor_ratio: float, max_wait: float) -> None:
+        # 일일 예산 잔여 비율이 daily_floor_ratio 이하이면 거절
+        self.daily_floor_ratio = daily_floor_ratio
+        # 버킷 토큰이 burst * token_floor_ratio 이상 남아 있을 때만 사용 (나머지는 대기)
+        self.token_floor_ratio = token_floor_ratio
+        # 토큰 대기 최대 시간 (초), 초과 시 거절
+        self.max_wait = max_wait
+
+
+DEFAULT_POLICIES: Dict[str, PriorityPolicy] = {
+    PRIORITY_INTERACTIVE: PriorityPolicy(0.0, 0.0, settings.NAVER_INTERACTIVE_MAX_WAIT_SECONDS),
+    PRIORITY_PRICE_REFRESH: PriorityPolicy(0.2, 0.5, settings.NAVER_BACKGROUND_MAX_WAIT_SECONDS),
+    PRIORITY_SAVED_SEARCH: PriorityPolicy(0.3, 0.5, settings.NAVER_BACKGROUND_MAX_WAIT_SECONDS),
+    # 선조회는 예산/버킷에 여유가 있을 때만, 대기 없이 즉시 포기
+    PRIORITY_PREFETCH: PriorityPolicy(0.5, 0.7, 0.0),
+}
+
+
+class NaverRateLimiter:
+    def __init__(
+        self,
+        daily_budget: int,
+        rate_per_second: float,
+        burst: int,
+        policies: Optional[Dict[str, PriorityPolicy]] = None,
+    ) -> None:
+        self.daily_budget = daily_budget
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.policies = policies or DEFAULT_POLICIES
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._day = self._today()
+        self._used_today = 0
+        self.granted: Dict[str, int] = {p: 0 for p in self.policies}
+        self.waited: Dict[str, int] = {p: 0 for p in self.policies}
+        self.shed: Dict[str, int] = {p: 0 for p in self.policies}
+        self.upstream_throttled = 0
+
+    @staticmethod
+    def _today() -> str:
+        return datetime.now(KST).strftime("%Y-%m-%d")
+
+    def _refill(self, now: float) -> None:
+        # 락을 잡은 상태에서만 호출
+        elapsed = now - self._updated_at
+        if elapsed > 0:
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate_per_second)
+            self._updated_at = now
+        today = self._today()
+        if today != self._day:
+            self._day = today
+            self._used_today = 0
+
+    def _try_take(self, priority: str) -> Tuple[bool, float]:
+        """
+        토큰 획득 시도
+        - (True, 0): 획득 성공
+        - (False, wait): wait 초 후 재시도 가능
+        - 일일 예산 부족 시 TooManyRequestsException
+        """
+        policy = self.policies[priority]
+        with self._lock:
+            self._refill(time.monotonic())
+
+            remaining = self.daily_budget - self._used_today
+            if remaining <= self.daily_budget * policy.daily_floor_ratio or remaining <= 0:
+                self.shed[priority] += 1
+                raise TooManyRequestsException(
+                    message="네이버 API 일일 호출 예산이 부족합니다",
+                    detail={"priority": priority, "remaining_daily": remaining},
+                )
+
+            token_floor = self.burst * policy.token_floor_ratio
+            if self._tokens - 1 >= token_floor:
+                self._tokens -= 1
+                self._used_today += 1
+                self.granted[priority] += 1
+                return True, 0.0
+
+            return False, (token_floor + 1 - self._tokens) / self.rate_per_second
+
+    def _deny(self, priority: str) -> TooManyRequestsException:
+        with self._lock:
+            self.shed[priority] += 1
+        return TooManyRequestsException(
+            message="네이버 API 호출이 많아 잠시 후 다시 시도해주세요",
+            detail={"priority": priority},
+        )
+
+    def try_acquire(self, priority: str = PRIORITY_INTERACTIVE) -> bool:
+        """대기 없이 토큰 획득 (실패 시 False, 예외 없음)"""
+        try:
+            acquired, _ = self._try_take(priority)
+        except TooManyRequestsException:
+            return False
+        return acquired
+
+    def acquire(self, priority: str = PRIORITY_INTERACTIVE) -> None:
+        """토큰 획득 (동기). 최대 대기 시간을 넘기면 TooManyRequestsException"""
+        deadline = time.monotonic() + self.policies[priority].max_wait
+        waited = False
+        while True:
+            acquired, wait = self._try_take(priority)
+            if acquired:
+                break
+            if time.monotonic() + wait > deadline:
+                raise self._deny(priority)
+            waited = True
+            time.sleep(wait)
+        if waited:
+            with self._lock:
+                self.waited[priority] += 1
+
+    async def acquire_async(self, priority: str = PRIORITY_INTERACTIVE) -> None:
+        """토큰 획득 (비동기). 최대 대기 시간을 넘기면 TooManyRequestsException"""
+        deadline = time.monotonic() + self.policies[priority].max_wait
+        waited = False
+        while True:
+            acquired, wait = self._try_take(priority)
+            if acquired:
+                break
+            if time.monotonic() + wait > deadline:
+                raise self._deny(priority)
+            waited = True
+            await asyncio.sleep(wait)
+        if waited:
+            with self._lock:
+                self.waited[priority] += 1
+
+    def on_upstream_throttled(self) -> None:
+        """네이버가 429 를 반환하면 버킷을 비워 잠시 호출을 늦춤"""
+        with self._lock:
+            self._tokens = 0.0
+            self._updated_at = time.monotonic()
+            self.upstream_throttled += 1
+
+    @property
+    def remaining_daily(self) -> int:
+        with self._lock:
+            self._refill(time.monotonic())
+            return max(0, self.daily_budget - self._used_today)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            self._refill(time.monotonic())
+            return {
+                "day": self._day,
+                "daily_budget": self.daily_budget,
+                "used_today": self._used_today,
+                "remaining_daily": max(0, self.daily_budget - self._used_today),
+                "tokens": round(self._tokens, 2),
+                "rate_per_second": self.rate_per_second,
+                "burst": self.burst,
+                "granted": dict(self.granted),
+                "waited": dict(self.waited),
+                "shed": dict(self.shed),
+                "upstream_throttled": self.upstream_throttled,
+            }
+
+
+# 프로세스 전역 네이버 API 호출 한도 스케줄러
+naver_rate_limiter = NaverRateLimiter(
+    daily_budget=settings.NAVER_DAILY_BUDGET,
+    rate_per_second=settings.NAVER_RATE_PER_SECOND,
+    burst=settings.NAVER_RATE_BURST,
+)
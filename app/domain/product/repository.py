@@ -1,6 +1,60 @@
-﻿from typing import List, Optional
+﻿from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import Table, case, func, tuple_
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from app.domain.product.models import Product
+from app.common.pagination import paginate_keyset
+from app.domain.product.models import CatalogProduct, Product
+from app.domain.wishlist.models import WishlistItem
+
+# 이미 있는 원본 상품에서 비어 있는 경우에만 채우는 컬럼 (가격은 갱신 워커만 변경)
+_CATALOG_FILL_COLUMNS = [
+    "image_url",
+    "link_url",
+    "mall_name",
+    "brand",
+    "maker",
+    "category1",
+    "category2",
+    "category3",
+    "category4",
+]
+
+
+def _upsert(
+    db: Session,
+    table: Table,
+    rows: List[Dict],
+    conflict_columns: List[str],
+    fill_columns: List[str],
+) -> None:
+    """
+    다건 INSERT 한 문장. 유니크 키가 충돌하면 fill_columns 중 비어 있는 값만 채움
+    MySQL/MariaDB 는 ON DUPLICATE KEY UPDATE, SQLite(테스트용)는 ON CONFLICT DO UPDATE/NOTHING
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == "sqlite":
+        stmt = sqlite_insert(table).values(rows)
+        if fill_columns:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=conflict_columns,
+                set_={
+                    column: func.coalesce(table.c[column], stmt.excluded[column])
+                    for column in fill_columns
+                },
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=conflict_columns)
+    else:
+        stmt = mysql_insert(table).values(rows)
+        updates = {
+            column: func.coalesce(table.c[column], stmt.inserted[column]) for column in fill_columns
+        }
+        # 채울 컬럼이 없으면 id = id 로 충돌 행을 그대로 둠
+        stmt = stmt.on_duplicate_key_update(**(updates or {"id": table.c.id}))
+    db.execute(stmt)
 
 
 class ProductRepository:
@@ -12,14 +66,172 @@ class ProductRepository:
     ) -> Optional[Product]:
         return (
             db.query(Product)
+            .join(Product.catalog)
             .filter(
                 Product.user_id == user_id,
-                Product.source == source,
-                Product.source_product_id == source_product_id,
+                CatalogProduct.source == source,
+                CatalogProduct.source_product_id == source_product_id,
             )
             .first()
         )
 
+    @staticmethod
+    def get_by_catalog_product_id(
+        db: Session, user_id: int, catalog_product_id: int
+    ) -> Optional[Product]:
+        return (
+            db.query(Product)
+            .filter(Product.user_id == user_id, Product.catalog_product_id == catalog_product_id)
+            .first()
+        )
+
+    @staticmethod
+    def get_catalog(db: Session, source: str, source_product_id: str) -> Optional[CatalogProduct]:
+        return (
+            db.query(CatalogProduct)
+            .filter(
+                CatalogProduct.source == source,
+                CatalogProduct.source_product_id == source_product_id,
+            )
+            .first()
+        )
+
+    @staticmethod
+    def get_or_create_catalog(db: Session, **fields) -> CatalogProduct:
+        """
+        원본 상품 조회 또는 생성 (commit 하지 않음)
+        동시에 같은 상품을 만들면 유니크 제약 위반 후 다시 조회
+        """
+        catalog = ProductRepository.get_catalog(db, fields["source"], fields["source_product_id"])
+        if catalog is not None:
+            return catalog
+        try:
+            with db.begin_nested():
+                catalog = CatalogProduct(**fields)
+                db.add(catalog)
+        except IntegrityError:
+            catalog = ProductRepository.get_catalog(
+                db, fields["source"], fields["source_product_id"]
+            )
+        return catalog
+
+    @staticmethod
+    def upsert_catalogs(db: Session, rows: List[Dict]) -> None:
+        """원본 상품 다건 upsert (commit 하지 않음)"""
+        _upsert(
+            db,
+            CatalogProduct.__table__,
+            rows,
+            conflict_columns=["source", "source_product_id"],
+            fill_columns=_CATALOG_FILL_COLUMNS,
+        )
+
+    @staticmethod
+    def map_catalog_ids(
+        db: Session, keys: Iterable[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], int]:
+        """(source, source_product_id) -> catalog id (없는 상품은 제외)"""
+        keys = list(set(keys))
+        if not keys:
+            return {}
+        found = (
+            db.query(CatalogProduct.source, CatalogProduct.source_product_id, CatalogProduct.id)
+            .filter(tuple_(CatalogProduct.source, CatalogProduct.source_product_id).in_(keys))
+            .all()
+        )
+        return {(source, source_product_id): id_ for source, source_product_id, id_ in found}
+
+    @staticmethod
+    def map_links(db: Session, user_id: int, catalog_product_ids: Iterable[int]) -> Dict[int, int]:
+        """사용자의 catalog id -> product id"""
+        ids = list(catalog_product_ids)
+        if not ids:
+            return {}
+        rows = (
+            db.query(Product.catalog_product_id, Product.id)
+            .filter(Product.user_id == user_id, Product.catalog_product_id.in_(ids))
+            .all()
+        )
+        return dict(rows)
+
+    @staticmethod
+    def map_favorite_status(
+        db: Session, user_id: int, keys: Iterable[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], Tuple[int, bool]]:
+        """
+        (source, source_product_id) -> (즐겨찾기 id, 위시리스트 여부)
+        검색 결과 한 페이지를 IN 쿼리 한 번으로 조회 (즐겨찾기하지 않은 상품은 제외)
+        """
+        keys = list(set(keys))
+        if not keys:
+            return {}
+        rows = (
+            db.query(
+                CatalogProduct.source,
+                CatalogProduct.source_product_id,
+                Product.id,
+                WishlistItem.id,
+            )
+            .select_from(Product)
+            .join(CatalogProduct, Product.catalog_product_id == CatalogProduct.id)
+            .outerjoin(
+                WishlistItem,
+                (WishlistItem.product_id == Product.id) & (WishlistItem.user_id == user_id),
+            )
+            .filter(
+                Product.user_id == user_id,
+                tuple_(CatalogProduct.source, CatalogProduct.source_product_id).in_(keys),
+            )
+            .all()
+        )
+        return {
+            (source, source_product_id): (product_id, wishlist_id is not None)
+            for source, source_product_id, product_id, wishlist_id in rows
+        }
+
+    @staticmethod
+    def insert_links(db: Session, user_id: int, catalog_product_ids: Iterable[int]) -> None:
+        """사용자 링크 다건 INSERT (이미 있으면 건너뜀, commit 하지 않음)"""
+        now = datetime.utcnow()
+        rows = [
+            {
+                "user_id": user_id,
+                "catalog_product_id": catalog_product_id,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for catalog_product_id in catalog_product_ids
+        ]
+        if rows:
+            _upsert(
+                db,
+                Product.__table__,
+                rows,
+                conflict_columns=["user_id", "catalog_product_id"],
+                fill_columns=[],
+            )
+
+    @staticmethod
+    def list_ids_for_user(db: Session, user_id: int, product_ids: List[int]) -> List[int]:
+        rows = (
+            db.query(Product.id)
+            .filter(Product.user_id == user_id, Product.id.in_(product_ids))
+            .all()
+        )
+        return [row.id for row in rows]
+
+    @staticmethod
+    def delete_many(db: Session, user_id: int, product_ids: List[int]) -> int:
+        if not product_ids:
+            return 0
+        deleted = (
+            db.query(Product)
+            .filter(Product.user_id == user_id, Product.id.in_(product_ids))
+            .delete(synchronize_session=False)
+        )
+        db.commit()
+        return deleted
+
     @staticmethod
     def get_product_by_id(db: Session, product_id: int) -> Optional[Product]:
         """상품 ID로 상세 정보 조회"""
@@ -50,6 +262,74 @@ class ProductRepository:
             .all()
         )
 
+    @staticmethod
+    def list_page(
+        db: Session, user_id: int, cursor: Optional[str], size: int
+    ) -> Tuple[List[Product], Optional[str]]:
+        """최근 저장 순 keyset 페이지 (ix_products_user_created)"""
+        return paginate_keyset(
+            db.query(Product).filter(Product.user_id == user_id),
+            Product.created_at,
+            Product.id,
+            cursor,
+            size,
+        )
+
+    @staticmethod
+    def get_index_signature(db: Session, user_id: int) -> Tuple[int, int]:
+        """즐겨찾기 검색 색인 유효성 확인용 (즐겨찾기 수, 최대 id)"""
+        count, max_id = (
+            db.query(func.count(Product.id), func.coalesce(func.max(Product.id), 0))
+            .filter(Product.user_id == user_id)
+            .one()
+        )
+        return int(count), int(max_id)
+
+    @staticmethod
+    def list_search_fields(db: Session, user_id: int) -> List[Tuple]:
+        """즐겨찾기 검색 색인 생성용 (product id, 상품명, 브랜드, 제조사, 카테고리1~4)"""
+        return (
+            db.query(
+                Product.id,
+                CatalogProduct.title,
+                CatalogProduct.brand,
+                CatalogProduct.maker,
+                CatalogProduct.category1,
+                CatalogProduct.category2,
+                CatalogProduct.category3,
+                CatalogProduct.category4,
+            )
+            .join(CatalogProduct, CatalogProduct.id == Product.catalog_product_id)
+            .filter(Product.user_id == user_id)
+            .all()
+        )
+
+    @staticmethod
+    def list_popular_catalogs(db: Session, limit: int) -> List[Tuple]:
+        """자동완성 후보용 (상품명, 브랜드, 제조사, 즐겨찾기 수) 즐겨찾기 수 내림차순"""
+        favorites = func.count(Product.id)
+        return (
+            db.query(CatalogProduct.title, CatalogProduct.brand, CatalogProduct.maker, favorites)
+            .join(Product, Product.catalog_product_id == CatalogProduct.id)
+            .group_by(CatalogProduct.id)
+            .order_by(favorites.desc())
+            .limit(limit)
+            .all()
+        )
+
+    @staticmethod
+    def list_by_ids_for_user(db: Session, user_id: int, product_ids: List[int]) -> List[Product]:
+        """주어진 id 순서대로 반환 (없는 id 는 제외)"""
+        if not product_ids:
+            return []
+        products = (
+            db.query(Product)
+            .filter(Product.user_id == user_id, Product.id.in_(product_ids))
+            .all()
+        )
+        by_id = {product.id: product for product in products}
+        return [by_id[product_id] for product_id in product_ids if product_id in by_id]
+
     @staticmethod
     def create(db: Session, **fields) -> Product:
         product = Product(**fields)
@@ -70,3 +350,70 @@ class ProductRepository:
     def delete(db: Session, product: Product) -> None:
         db.delete(product)
         db.commit()
+
+    @staticmethod
+    def list_stalest_distinct(
+        db: Session, stale_before: datetime, limit: int
+    ) -> List[
+        Tuple[str, str, str, Optional[str], Optional[str], Optional[int], Optional[datetime]]
+    ]:
+        """
+        가격 갱신 대상: 즐겨찾기한 사용자가 있는 원본 상품 중 가장 오래 갱신되지 않은 상품부터
+        반환 형식: (source, source_product_id, title, brand, maker, price, last_fetched_at)
+        """
+        fetched_at = CatalogProduct.last_fetched_at
+        favorited = db.query(Product.id).filter(Product.catalog_product_id == CatalogProduct.id)
+        return (
+            db.query(
+                CatalogProduct.source,
+                CatalogProduct.source_product_id,
+                CatalogProduct.title,
+                CatalogProduct.brand,
+                CatalogProduct.maker,
+                CatalogProduct.price,
+                fetched_at,
+            )
+            .filter(fetched_at.is_(None) | (fetched_at < stale_before), favorited.exists())
+            # 한 번도 갱신되지 않은 상품(NULL)이 가장 먼저
+            .order_by(fetched_at.isnot(None), fetched_at)
+            .limit(limit)
+            .all()
+        )
+
+    @staticmethod
+    def bulk_update_prices(
+        db: Session,
+        prices: Dict[Tuple[str, str], Optional[int]],
+        fetched_at: datetime,
+    ) -> int:
+        """
+        원본 상품 가격을 UPDATE 한 번으로 갱신 (즐겨찾기한 사용자 수와 무관하게 상품당 1행)
+        - prices: (source, source_product_id) -> 가격 (None 이면 가격은 유지하고 조회 시각만 기록)
+        """
+        if not prices:
+            return 0
+        key = tuple_(CatalogProduct.source, CatalogProduct.source_product_id)
+        found = [(k, price) for k, price in prices.items() if price is not None]
+        values = {
+            CatalogProduct.last_fetched_at: fetched_at,
+            CatalogProduct.updated_at: fetched_at,
+        }
+        if found:
+            values[CatalogProduct.price] = case(
+                *[
+                    (
+                        (CatalogProduct.source == source)
+                        & (CatalogProduct.source_product_id == source_product_id),
+                        price,
+                    )
+                    for (source, source_product_id), price in found
+                ],
+                else_=CatalogProduct.price,
+            )
+        updated = (
+            db.query(CatalogProduct)
+            .filter(key.in_(list(prices.keys())))
+            .update(values, synchronize_session=False)
+        )
+        db.commit()
+        return updated
@@ -0,0 +1,239 @@
+"""
+네이버 업스트림 장애/지연 대응
+
+- CircuitBreaker : 최근 호출의 실패율/지연 비율이 임계치를 넘으면 일정 시간 즉시 실패(OPEN),
+                   이후 제한된 수의 시험 호출(HALF_OPEN)로 복구 여부를 확인
+- LatencyTracker : 최근 성공 호출 지연을 기록하여 p95 기반 헤지 지연 계산
+- hedged()       : 첫 호출이 지연되면 두 번째 호출을 보내고 먼저 성공한 응답을 사용
+"""
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple, TypeVar
+
+from app.core.exceptions import ServiceUnavailableException
+
+T = TypeVar("T")
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(ServiceUnavailableException):
+    """서킷이 열려 있어 호출을 즉시 거절"""
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(
+            message="네이버 API 응답이 불안정하여 잠시 요청을 중단했습니다",
+            detail={"circuit": name, "retry_after": round(retry_after, 1)},
+        )
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        name: str,
+        window_size: int = 50,
+        min_calls: int = 10,
+        failure_ratio: float = 0.5,
+        slow_call_seconds: float = 2.0,
+        slow_call_ratio: float = 0.8,
+        open_seconds: float = 30.0,
+        half_open_max_calls: int = 3,
+    ) -> None:
+        self.name = name
+        self.window_size = window_size
+        self.min_calls = min_calls
+        self.failure_ratio = failure_ratio
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_ratio = slow_call_ratio
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = half_open_max_calls
+        self._lock = threading.Lock()
+        # (실패 여부, 지연 여부)
+        self._window: Deque[Tuple[bool, bool]] = deque(maxlen=window_size)
+        self._state = STATE_CLOSED
+        self._opened_at = 0.0
+        self._half_open_in_flight = 0
+        self._half_open_successes = 0
+        self.rejected = 0
+        self.opened_count = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._maybe_half_open(time.monotonic())
+            return self._state
+
+    def _maybe_half_open(self, now: float) -> None:
+        # 락을 잡은 상태에서만 호출
+        if self._state == STATE_OPEN and now - self._opened_at >= self.open_seconds:
+            self._state = STATE_HALF_OPEN
+            self._half_open_in_flight = 0
+            self._half_open_successes = 0
+
+    def _open(self, now: float) -> None:
+        self._state = STATE_OPEN
+        self._opened_at = now
+        self._window.clear()
+        self.opened_count += 1
+
+    def before_call(self) -> None:
+        """호출 전 확인. 서킷이 열려 있으면 CircuitOpenError"""
+        now = time.monotonic()
+        with self._lock:
+            self._maybe_half_open(now)
+            if self._state == STATE_OPEN:
+                self.rejected += 1
+                raise CircuitOpenError(self.name, self.open_seconds - (now - self._opened_at))
+            if self._state == STATE_HALF_OPEN:
+                if self._half_open_in_flight >= self.half_open_max_calls:
+                    self.rejected += 1
+                    raise CircuitOpenError(self.name, 0.0)
+                self._half_open_in_flight += 1
+
+    def record_success(self, latency: float) -> None:
+        self._record(failed=False, slow=latency >= self.slow_call_seconds)
+
+    def record_failure(self) -> None:
+        self._record(failed=True, slow=False)
+
+    def record_cancelled(self) -> None:
+        """결과 없이 취소된 호출 (HALF_OPEN 시험 호출 슬롯만 반환)"""
+        with self._lock:
+            if self._state == STATE_HALF_OPEN and self._half_open_in_flight > 0:
+                self._half_open_in_flight -= 1
+
+    def _record(self, failed: bool, slow: bool) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if self._state == STATE_HALF_OPEN:
+                self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+                if failed or slow:
+                    self._open(now)
+                    return
+                self._half_open_successes += 1
+                if self._half_open_successes >= self.half_open_max_calls:
+                    self._state = STATE_CLOSED
+                    self._window.clear()
+                return
+
+            if self._state == STATE_OPEN:
+                return
+
+            self._window.append((failed, slow))
+            calls = len(self._window)
+            if calls < self.min_calls:
+                return
+            failures = sum(1 for f, _ in self._window if f)
+            slows = sum(1 for _, s in self._window if s)
+            if failures / calls >= self.failure_ratio or slows / calls >= self.slow_call_ratio:
+                self._open(now)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            self._maybe_half_open(time.monotonic())
+            calls = len(self._window)
+            return {
+                "name": self.name,
+                "state": self._state,
+                "window_calls": calls,
+                "window_failures": sum(1 for f, _ in self._window if f),
+                "window_slow_calls": sum(1 for _, s in self._window if s),
+                "opened_count": self.opened_count,
+                "rejected": self.rejected,
+            }
+
+
+class LatencyTracker:
+    def __init__(self, size: int = 200, min_samples: int = 20) -> None:
+        self.min_samples = min_samples
+        self._samples: Deque[float] = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def observe(self, latency: float) -> None:
+        with self._lock:
+            self._samples.append(latency)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return None
+            ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(pct / 100.0 * len(ordered)))
+        return ordered[index]
+
+    def stats(self) -> Dict[str, Any]:
+        p50 = self.percentile(50)
+        p95 = self.percentile(95)
+        p99 = self.percentile(99)
+        return {
+            "samples": len(self._samples),
+            "p50_ms": round(p50 * 1000, 1) if p50 is not None else None,
+            "p95_ms": round(p95 * 1000, 1) if p95 is not None else None,
+            "p99_ms": round(p99 * 1000, 1) if p99 is not None else None,
+        }
+
+
+class HedgeStats:
+    def __init__(self) -> None:
+        self.hedged = 0
+        self.hedge_won = 0
+        self.skipped = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {"hedged": self.hedged, "hedge_won": self.hedge_won, "skipped": self.skipped}
+
+
+async def hedged(
+    call: Callable[[], Awaitable[T]],
+    delay: Optional[float],
+    can_hedge: Callable[[], bool],
+    hedge_stats: Optional[HedgeStats] = None,
+) -> T:
+    """
+    헤지 요청
+    - delay 안에 첫 호출이 끝나지 않으면 (can_hedge() 가 True 일 때) 두 번째 호출을 보냄
+    - 먼저 성공한 응답을 반환하고 나머지 호출은 취소
+    - 모두 실패하면 마지막 예외를 그대로 전달 (모두 취소되었으면 CancelledError)
+    """
+    first = asyncio.ensure_future(call())
+    if delay is None:
+        return await first
+
+    pending = {first}
+    try:
+        done, _ = await asyncio.wait(pending, timeout=delay)
+        if done:
+            return first.result()
+
+        if not can_hedge():
+            if hedge_stats:
+                hedge_stats.skipped += 1
+            return await first
+
+        second = asyncio.ensure_future(call())
+        pending.add(second)
+        if hedge_stats:
+            hedge_stats.hedged += 1
+
+        last_error: Optional[BaseException] = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                # 호출 내부에서 취소된 태스크는 exception() 이 CancelledError 를 던지므로 먼저 확인
+                if task.cancelled():
+                    last_error = asyncio.CancelledError()
+                    continue
+                error = task.exception()
+                if error is None:
+                    if task is second and hedge_stats:
+                        hedge_stats.hedge_won += 1
+                    return task.result()
+                last_error = error
+        raise last_error
+    finally:
+        for task in pending:
+            task.cancel()
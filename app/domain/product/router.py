@@ -1,16 +1,53 @@
+import asyncio
+import logging
 import math
-from typing import List
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional, Tuple, Union
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
+from app.common.schemas import BaseResponse
+from app.core.config import settings
 from app.core.database import get_db
-from app.core.auth import get_current_user_id
-from app.domain.product import schemas
-from app.domain.product.service import NaverShoppingService, ProductService
+from app.core.auth import get_current_user_id, get_current_user_id_optional, require_admin
+from app.core.exceptions import BaseAPIException
+from app.domain.alert.schemas import TargetPriceUpdate
+from app.domain.price_history.schemas import PriceHistoryResponse
+from app.domain.price_history.service import PriceHistoryService, to_utc_naive
+from app.domain.product import parser, schemas
+from app.domain.product.clustering import group_items
+from app.domain.product.price_refresh import (
+    LiveRefreshTarget,
+    PriceRefreshService,
+    live_refresh_flight,
+)
+from app.domain.product.service import (
+    LowestPriceService,
+    NaverShoppingService,
+    ProductService,
+    SuggestService,
+    favorite_search_indexes,
+    naver_circuit_breaker,
+    naver_hedge_stats,
+    naver_latency,
+    search_cache,
+    search_disk_cache,
+    search_flight,
+    search_prefetch,
+    search_snapshots,
+    search_suggestions,
+    search_top_queries,
+    search_warm,
+)
+from app.domain.product.rate_limiter import naver_rate_limiter
 from app.domain.product.repository import ProductRepository
 from app.domain.room.service import RoomService
 from app.domain.room.schemas import ProductRoomCreate, RoomResponse
 
+logger = logging.getLogger(__name__)
+
 # 상품 검색/상세/방 생성 API
 router = APIRouter(
     prefix="/api/v1/products",
@@ -20,53 +57,93 @@ router = APIRouter(
 
 @router.get(
     "/search",
-    response_model=schemas.ProductSearchResponse,
+    # OpenAPI 문서용. Response 를 직접 반환하므로 FastAPI 의 응답 검증/직렬화는 거치지 않음
+    response_model=Union[schemas.ProductSearchResponse, schemas.ProductSearchGroupedResponse],
     summary="상품 검색",
-    description="네이버 쇼핑 데이터를 검색시 실시간으로 조회하여 출력",
+    description=(
+        "네이버 쇼핑 데이터를 검색시 실시간으로 조회하여 출력. "
+        "deep=true 이면 여러 페이지를 동시에 조회하여 최대 1000개 결과를 NDJSON 스트림으로 반환. "
+        "group=true 이면 판매처만 다른 같은 상품을 묶어 최저가 순으로 반환. "
+        "annotate=true 이고 로그인한 경우 항목마다 is_favorited / favorite_id / in_wishlist 포함"
+    ),
 )
-# 네이버 쇼핑 검색 + DB 저장
-
-def search_products(
+# 네이버 쇼핑 검색 (비동기 - 외부 API 대기 중 워커 스레드를 점유하지 않음)
+async def search_products(
     query: str = Query(..., description="검색 키워드", min_length=1),
     page: int = Query(1, description="페이지 번호", ge=1),
     display: int = Query(10, description="페이지 크기", ge=1, le=100),
     sort: str = Query("sim", description="정렬 (sim|date|asc|dsc)"),
-    db: Session = Depends(get_db),
+    deep: bool = Query(False, description="다중 페이지 동시 조회 (NDJSON 스트림)"),
+    limit: int = Query(1000, description="deep 모드 최대 결과 수", ge=1, le=1000),
+    group: bool = Query(False, description="유사 상품 묶기 (페이지 안에서)"),
+    annotate: bool = Query(False, description="내 즐겨찾기/위시리스트 여부 표시 (로그인 시)"),
+    user_id: Optional[int] = Depends(get_current_user_id_optional),
 ):
     """
     상품 검색 및 출력 로직:
     - 외부 데이터 호출: 네이버 쇼핑 API를 통해 실시간 데이터를 수집합니다.
     - 데이터 파싱: 수집된 Raw 데이터를 서비스 규격에 맞는 형식으로 변환합니다.
     - 페이지네이션: `page`와 `display` 파라미터를 통해 페이징 처리를 지원합니다.
+    - deep 모드: `page`/`display` 대신 최대 `limit`개를 productId 중복 제거 후 도착 순서대로 스트리밍합니다.
+      각 줄은 {"type": "item", "data": {...}} 이며 마지막 줄은 {"type": "end", ...} 입니다.
+    - group 모드: 현재 페이지 결과를 MinHash/LSH 로 묶어 그룹 목록을 반환합니다.
+      각 그룹의 items 는 최저가 순이며 meta.group_count 에 그룹 수가 추가됩니다.
+    - annotate 모드: 로그인한 사용자의 즐겨찾기/위시리스트 여부를 페이지당 쿼리 1회로 표시합니다.
+      로그인하지 않았으면 표시하지 않습니다. DB 세션은 이 경우에만 스레드 풀에서 엽니다.
+    - 응답은 파싱 결과를 그대로 직렬화하므로 response_model 은 문서용이며 검증하지 않습니다.
     """
+    if deep:
+        return StreamingResponse(
+            _deep_search_lines(query=query, sort=sort, limit=limit),
+            media_type="application/x-ndjson",
+        )
+
     try:
         start = ((page - 1) * display) + 1
-        naver_result = NaverShoppingService.search_products(
+        NaverShoppingService.record_query(query=query, display=display, start=start, sort=sort)
+        search_result = await NaverShoppingService.search_cached(
             query=query,
             display=display,
             start=start,
             sort=sort,
         )
 
-        parsed_products = NaverShoppingService.parse_products(naver_result)
+        parsed_products = search_result["items"]
 
-        total_items = naver_result.get("total", 0)
+        total_items = search_result["total"]
+        if start == 1:
+            SuggestService.record_search(query, total_items)
         total_pages = math.ceil(total_items / display)
 
-        return {
-            "success": True,
-            "message": "상품 검색 성공",
-            "data": parsed_products,
-            "meta": {
-                "page": page,
-                "size": display,
-                "total_items": total_items,
-                "total_pages": total_pages,
-                "has_next": page < total_pages,
-                "has_prev": page > 1,
-            },
+        # 다음 페이지 선조회 (SEARCH_PREFETCH_ENABLED 일 때만, 응답을 기다리지 않음)
+        NaverShoppingService.schedule_prefetch(
+            query=query, display=display, start=start, sort=sort, total=total_items
+        )
+
+        meta = {
+            "page": page,
+            "size": display,
+            "total_items": total_items,
+            "total_pages": total_pages,
+            "has_next": page < total_pages,
+            "has_prev": page > 1,
         }
+        data: List[Dict[str, Any]] = parsed_products
+        if annotate and user_id is not None:
+            data = await run_in_threadpool(
+                ProductService().annotate_with_session, user_id, parsed_products
+            )
+        if group:
+            data = group_items(data, settings.SEARCH_GROUP_MIN_SIMILARITY)
+            meta["group_count"] = len(data)
+
+        # 파싱 결과가 이미 응답 스키마 형식이므로 재검증 없이 바로 직렬화
+        payload = parser.build_search_payload(data, meta=meta, message="상품 검색 성공")
+        return Response(content=payload, media_type="application/json")
 
+    except BaseAPIException:
+        # 호출 한도 초과(429) 등은 그대로 전달
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -74,21 +151,127 @@ def search_products(
         )
 
 
+async def _deep_search_lines(query: str, sort: str, limit: int) -> AsyncIterator[bytes]:
+    """deep 검색 결과를 NDJSON 줄 단위로 인코딩"""
+    failed_pages: List[int] = []
+    returned = 0
+    async for item in NaverShoppingService.deep_search(
+        query=query, sort=sort, limit=limit, failed_pages=failed_pages
+    ):
+        yield parser.dumps({"type": "item", "data": item}) + b"\n"
+        returned += 1
+    end = {"type": "end", "returned": returned, "failed_pages": sorted(failed_pages)}
+    yield parser.dumps(end) + b"\n"
+
+
+@router.get(
+    "/suggest",
+    response_model=BaseResponse[List[schemas.SearchSuggestion]],
+    summary="검색어 자동완성",
+    description="이전 검색어와 즐겨찾기 상품명 중 입력한 접두사로 시작하는(단어 시작 포함) 후보를 인기도 순으로 반환합니다. 한글은 자모 단위로 비교하여 입력 중인 글자도 일치합니다. 네이버 API 를 호출하지 않습니다.",
+)
+# 메모리 색인만 조회하므로 스레드 풀을 거치지 않도록 async
+async def suggest_queries(
+    q: str = Query(..., description="입력 중인 검색어", min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=20),
+):
+    return BaseResponse.ok(SuggestService.suggest(q, limit))
+
+
+@router.get(
+    "/search/stats",
+    response_model=BaseResponse[Dict[str, Any]],
+    summary="상품 검색 캐시/업스트림 지표 조회",
+    description="검색 캐시의 hit/miss/eviction 카운터와 메모리 사용량, 요청 병합으로 절약된 호출 수, 네이버 API 잔여 호출 예산, 서킷 브레이커 상태와 업스트림 지연, 다음 페이지 선조회/상위 검색어 미리 갱신 적중률, 즐겨찾기 검색 색인 현황, 검색 결과 스냅샷 사용량, 상품 상세 가격 갱신 병합 현황, 자동완성 색인 현황을 조회합니다. X-Admin-Key 헤더가 필요합니다.",
+    dependencies=[Depends(require_admin)],
+)
+# 검색 캐시 / 요청 병합 / 호출 한도 지표
+def get_search_stats():
+    return BaseResponse.ok(
+        {
+            "cache": search_cache.stats(),
+            "disk_cache": search_disk_cache.stats(),
+            "single_flight": search_flight.stats(),
+            "rate_limiter": naver_rate_limiter.stats(),
+            "circuit_breaker": naver_circuit_breaker.stats(),
+            "upstream_latency": naver_latency.stats(),
+            "hedge": naver_hedge_stats.stats(),
+            "prefetch": search_prefetch.stats(),
+            "warm": search_warm.stats(),
+            "favorite_index": favorite_search_indexes.stats(),
+            "snapshot": search_snapshots.stats(),
+            "live_price_refresh": live_refresh_flight.stats(),
+            "suggest": search_suggestions.stats(),
+        }
+    )
+
+
+@router.get(
+    "/search/top-queries",
+    response_model=BaseResponse[Dict[str, Any]],
+    summary="많이 검색되는 검색어 조회 (운영용)",
+    description="최근 검색 요청을 시간 감쇠(반감기 SEARCH_TOP_QUERIES_HALF_LIFE_SECONDS)한 빈도 추정값 상위 검색어와 캐시 남은 시간, 미리 갱신 적중률을 조회합니다. X-Admin-Key 헤더가 필요합니다.",
+    dependencies=[Depends(require_admin)],
+)
+# 상위 검색어 (Count-Min sketch 추정값)
+def get_top_search_queries(limit: int = Query(50, ge=1, le=settings.SEARCH_TOP_QUERIES_K)):
+    queries = []
+    for key, count in search_top_queries.top(limit):
+        query, start, display, sort = key
+        queries.append(
+            {
+                "query": query,
+                "start": start,
+                "display": display,
+                "sort": sort,
+                "count": round(count, 2),
+                "cache_fresh_seconds": round(search_cache.fresh_left(key), 1),
+            }
+        )
+    return BaseResponse.ok(
+        {
+            "queries": queries,
+            "tracker": search_top_queries.stats(),
+            "warm": search_warm.stats(),
+        }
+    )
+
+
 @router.get(
     "/favorites",
     response_model=schemas.ProductFavoriteListResponse,
     summary="즐겨찾기 상품 목록 조회",
-    description="즐겨찾기한 상품들의 목록을 페이징 처리하여 조회",
+    description="즐겨찾기한 상품들을 최근 저장 순으로 조회합니다. 응답의 meta.next_cursor 를 cursor 로 넘기면 다음 페이지를 조회합니다. 전체 개수는 include_total=true 일 때만 계산합니다. page 파라미터는 이전 방식(OFFSET) 호환용입니다.",
 )
 # 즐겨찾기 상품 목록 조회
 def list_favorite_products(
-    page: int = Query(1, description="페이지 번호", ge=1),
+    cursor: Optional[str] = Query(None, description="다음 페이지 cursor (첫 페이지는 생략)"),
+    page: Optional[int] = Query(
+        None, description="페이지 번호 (이전 방식)", ge=1, deprecated=True
+    ),
     size: int = Query(10, description="페이지 크기", ge=1, le=10),
+    include_total: bool = Query(False, description="전체 개수 포함 여부"),
     db: Session = Depends(get_db),
     user_id: int = Depends(get_current_user_id),
 ):
     """즐겨찾기한 상품들의 목록을 페이징 처리하여 조회합니다."""
     product_service = ProductService()
+    if page is None:
+        items, next_cursor, total_items = product_service.list_favorites_page(
+            db, user_id=user_id, cursor=cursor, size=size, include_total=include_total
+        )
+        return {
+            "success": True,
+            "message": "즐겨찾기 목록 조회 성공",
+            "data": items,
+            "meta": {
+                "size": size,
+                "next_cursor": next_cursor,
+                "has_next": next_cursor is not None,
+                "total_items": total_items,
+            },
+        }
+
     items, total_items = product_service.list_favorites(
         db, user_id=user_id, page=page, size=size
     )
@@ -109,15 +292,55 @@ def list_favorite_products(
     }
 
 
-@router.post("/favorites", response_model=schemas.ProductDetailResponse)
+@router.get(
+    "/favorites/search",
+    response_model=schemas.ProductFavoriteListResponse,
+    summary="즐겨찾기 상품 검색",
+    description="즐겨찾기한 상품을 상품명/브랜드/제조사/카테고리로 검색합니다. 띄어쓰기와 관계없이 부분 일치하며 관련도 순으로 정렬됩니다.",
+)
+# 즐겨찾기 상품 검색
+def search_favorite_products(
+    q: str = Query(..., min_length=1, max_length=100, description="검색어"),
+    page: int = Query(1, description="페이지 번호", ge=1),
+    size: int = Query(10, description="페이지 크기", ge=1, le=10),
+    db: Session = Depends(get_db),
+    user_id: int = Depends(get_current_user_id),
+):
+    product_service = ProductService()
+    items, total_items = product_service.search_favorites(
+        db, user_id=user_id, query=q, page=page, size=size
+    )
+    total_pages = math.ceil(total_items / size) if size > 0 else 0
+
+    return {
+        "success": True,
+        "message": "즐겨찾기 검색 성공",
+        "data": items,
+        "meta": {
+            "page": page,
+            "size": size,
+            "total_items": total_items,
+            "total_pages": total_pages,
+            "has_next": page < total_pages,
+            "has_prev": page > 1,
+        },
+    }
+
+
+@router.post(
+    "/favorites",
+    response_model=schemas.ProductDetailResponse,
+    summary="즐겨찾기 저장",
+    description="검색 결과의 상품을 source_product_id 만으로 저장합니다. 상품 정보와 가격은 서버가 검색에서 본 값으로 채웁니다. 검색한 지 오래되었다면 query(검색어)를 함께 보내면 다시 검색하여 찾습니다.",
+)
 # 검색 결과 중 원하는 상품만 저장
-def save_favorite_product(
+async def save_favorite_product(
     payload: schemas.ProductFavoriteCreate,
     db: Session = Depends(get_db),
     user_id: int = Depends(get_current_user_id),
 ):
     product_service = ProductService()
-    product = product_service.save_favorite(db, user_id=user_id, payload=payload)
+    product = await product_service.save_favorite_by_id(db, user_id=user_id, payload=payload)
     return {
         "success": True,
         "message": "상품 즐겨찾기 저장 성공",
@@ -125,6 +348,76 @@ def save_favorite_product(
     }
 
 
+@router.post(
+    "/favorites/bulk",
+    response_model=schemas.ProductFavoriteBulkSaveResponse,
+    summary="즐겨찾기 일괄 저장",
+    description="검색 결과 상품을 최대 100개까지 id 만으로 한 번에 저장합니다. 항목별로 새로 저장(created)했는지, 이미 있었는지(existing), 상품 정보를 찾지 못했는지(not_found) 반환합니다.",
+)
+# 즐겨찾기 일괄 저장
+async def save_favorite_products_bulk(
+    payload: schemas.ProductFavoriteBulkCreate,
+    db: Session = Depends(get_db),
+    user_id: int = Depends(get_current_user_id),
+):
+    product_service = ProductService()
+    results = await product_service.save_favorites_bulk_by_id(
+        db, user_id=user_id, items=payload.items
+    )
+    return {
+        "success": True,
+        "message": "상품 즐겨찾기 일괄 저장 성공",
+        "data": results,
+    }
+
+
+@router.post(
+    "/favorites/bulk-delete",
+    response_model=schemas.ProductFavoriteBulkDeleteResponse,
+    summary="즐겨찾기 일괄 삭제",
+    description="즐겨찾기를 최대 100개까지 한 번에 삭제합니다. 위시리스트에 담긴 상품(in_wishlist)과 없는 상품(not_found)은 건너뜁니다.",
+)
+# 즐겨찾기 일괄 삭제
+def delete_favorite_products_bulk(
+    payload: schemas.ProductFavoriteBulkDelete,
+    db: Session = Depends(get_db),
+    user_id: int = Depends(get_current_user_id),
+):
+    product_service = ProductService()
+    results = product_service.delete_favorites_bulk(
+        db, user_id=user_id, product_ids=payload.product_ids
+    )
+    return {
+        "success": True,
+        "message": "즐겨찾기 일괄 삭제 성공",
+        "data": results,
+    }
+
+
+@router.patch(
+    "/favorites/{product_id}/target-price",
+    response_model=schemas.ProductDetailResponse,
+    summary="즐겨찾기 목표가 설정",
+    description="가격이 목표가 아래로 내려가면 알림을 받습니다. target_price 를 null 로 보내면 알림을 해제합니다.",
+)
+# 즐겨찾기 상품 목표가 설정
+def update_favorite_target_price(
+    product_id: int,
+    payload: TargetPriceUpdate,
+    db: Session = Depends(get_db),
+    user_id: int = Depends(get_current_user_id),
+):
+    product_service = ProductService()
+    product = product_service.update_target_price(
+        db, user_id=user_id, product_id=product_id, target_price=payload.target_price
+    )
+    return {
+        "success": True,
+        "message": "목표가 설정 성공",
+        "data": product,
+    }
+
+
 @router.delete(
     "/favorites/{product_id}", response_model=schemas.ProductFavoriteDeleteResponse
 )
@@ -143,27 +436,145 @@ def delete_favorite_product(
     }
 
 
-@router.get("/{product_id}", response_model=schemas.ProductDetailResponse)
+@router.get(
+    "/{product_id}",
+    response_model=schemas.ProductDetailResponse,
+    summary="상품 상세 조회",
+    description="저장된 상품 정보를 조회합니다. refresh=stale 이면 마지막 가격 조회가 일정 시간보다 오래된 경우에만 네이버에서 가격을 다시 조회합니다. 네이버 응답이 늦으면 저장된 값을 바로 반환하고 갱신은 백그라운드에서 마칩니다.",
+)
 # 상품 상세 조회
-def get_product_detail(
+async def get_product_detail(
     product_id: int,
+    refresh: Optional[Literal["stale"]] = Query(
+        None, description="stale: 오래된 가격이면 다시 조회"
+    ),
     db: Session = Depends(get_db),
     user_id: int = Depends(get_current_user_id),
 ):
+    detail, target = await run_in_threadpool(
+        _load_product_detail, db, user_id, product_id, refresh == "stale"
+    )
+
+    if detail is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"상품을 찾을 수 없습니다 (ID: {product_id})",
+        )
+
+    message = "상품 상세 조회 성공"
+    if target is not None:
+        try:
+            await asyncio.wait_for(
+                PriceRefreshService.refresh_live(target),
+                timeout=settings.PRODUCT_LIVE_REFRESH_WAIT_SECONDS,
+            )
+            # 다른 세션에서 갱신한 가격을 다시 읽음
+            detail, _ = await run_in_threadpool(
+                _load_product_detail, db, user_id, product_id, False, True
+            )
+        except asyncio.TimeoutError:
+            message = "상품 상세 조회 성공 (가격 갱신 중)"
+        except Exception:
+            # 호출 예산 부족 / 서킷 오픈 등은 저장된 값으로 응답
+            logger.warning("live price refresh failed: %s", product_id, exc_info=True)
+
+    return {
+        "success": True,
+        "message": message,
+        "data": detail,
+    }
+
+
+def _load_product_detail(
+    db: Session,
+    user_id: int,
+    product_id: int,
+    refresh_stale: bool,
+    reload: bool = False,
+) -> Tuple[Optional[schemas.ProductDetail], Optional[LiveRefreshTarget]]:
+    """
+    상품 조회 + 응답 직렬화 + on-demand 갱신 대상 판단 (스레드 풀에서 실행)
+    ORM 속성 접근(지연 로딩)이 이벤트 루프를 막지 않도록 한 번에 처리
+    """
+    if reload:
+        db.expire_all()
     product = ProductRepository.get_product_by_id_for_user(
         db, user_id=user_id, product_id=product_id
     )
+    if product is None:
+        return None, None
+    target = (
+        PriceRefreshService.live_target(product)
+        if refresh_stale
+        and PriceRefreshService.is_stale(product, settings.PRODUCT_PRICE_FRESH_SECONDS)
+        else None
+    )
+    return schemas.ProductDetail.model_validate(product), target
+
 
+@router.get(
+    "/{product_id}/lowest-prices",
+    response_model=schemas.LowestPriceResponse,
+    summary="몰별 최저가 조회",
+    description="즐겨찾기한 상품과 같은 상품을 판매하는 몰별 최저가를 조회합니다. 결과는 같은 네이버 상품 단위로 캐시됩니다.",
+)
+# 즐겨찾기 상품의 몰별 최저가 조회
+async def get_lowest_prices(
+    product_id: int,
+    db: Session = Depends(get_db),
+    user_id: int = Depends(get_current_user_id),
+):
+    product = await run_in_threadpool(
+        ProductRepository.get_product_by_id_for_user, db, user_id, product_id
+    )
     if not product:
         raise HTTPException(
             status_code=404,
             detail=f"상품을 찾을 수 없습니다 (ID: {product_id})",
         )
 
+    data = await LowestPriceService.find_lowest_prices(product)
     return {
         "success": True,
-        "message": "상품 상세 조회 성공",
-        "data": product,
+        "message": "최저가 조회 성공",
+        "data": {"product_id": product.id, **data},
+    }
+
+
+@router.get(
+    "/{product_id}/price-history",
+    response_model=PriceHistoryResponse,
+    summary="가격 이력 조회",
+    description="즐겨찾기한 상품의 가격 이력과 구간 최소/최대/평균, 역대 최저가 여부를 조회합니다. 기본 구간은 최근 30일입니다.",
+)
+# 즐겨찾기 상품의 가격 이력
+def get_price_history(
+    product_id: int,
+    start: Optional[datetime] = Query(None, description="구간 시작 (UTC, 기본: end - 30일)"),
+    end: Optional[datetime] = Query(None, description="구간 끝 (UTC, 기본: 현재)"),
+    db: Session = Depends(get_db),
+    user_id: int = Depends(get_current_user_id),
+):
+    product = ProductRepository.get_product_by_id_for_user(db, user_id, product_id)
+    if not product:
+        raise HTTPException(
+            status_code=404,
+            detail=f"상품을 찾을 수 없습니다 (ID: {product_id})",
+        )
+
+    # 시간대가 붙은 값(...Z 등)은 naive UTC 로 맞춰 비교
+    end = to_utc_naive(end) if end else datetime.utcnow()
+    start = to_utc_naive(start) if start else end - timedelta(days=30)
+    if start >= end:
+        raise HTTPException(status_code=400, detail="start 는 end 보다 이전이어야 합니다")
+
+    data = PriceHistoryService.get_series(
+        db, product.source, product.source_product_id, start, end
+    )
+    return {
+        "success": True,
+        "message": "가격 이력 조회 성공",
+        "data": {"product_id": product.id, **data},
     }
 
 
@@ -1,7 +1,9 @@
 ﻿from datetime import datetime
-from typing import Optional, List
+from typing import Literal, Optional, List, Union
 from pydantic import BaseModel, Field
 
+from app.common.schemas import CursorMeta
+
 
 class ProductSearchItem(BaseModel):
     """Search result item"""
@@ -19,11 +21,22 @@ class ProductSearchItem(BaseModel):
     category2: Optional[str] = None
     category3: Optional[str] = None
     category4: Optional[str] = None
+    last_fetched_at: Optional[datetime] = None
+    # annotate=true 이고 로그인한 경우에만 포함
+    is_favorited: Optional[bool] = None
+    favorite_id: Optional[int] = None
+    in_wishlist: Optional[bool] = None
 
     class Config:
         from_attributes = True
 
 
+class SearchSuggestion(BaseModel):
+    text: str = Field(..., description="추천 검색어")
+    type: Literal["query", "product"] = Field(..., description="이전 검색어 / 즐겨찾기 상품명")
+    score: float = Field(..., description="인기도 (검색 횟수, 즐겨찾기 수 가중 합)")
+
+
 class ProductDetail(BaseModel):
     """Product detail"""
 
@@ -41,6 +54,7 @@ class ProductDetail(BaseModel):
     category3: Optional[str] = None
     category4: Optional[str] = None
     price: int
+    target_price: Optional[int] = None
     last_fetched_at: Optional[datetime] = None
     created_at: datetime
     updated_at: datetime
@@ -67,6 +81,28 @@ class ProductSearchResponse(BaseModel):
     meta: PaginationMeta
 
 
+class ProductSearchGroup(BaseModel):
+    """Near-duplicate listings of the same product (cheapest first)"""
+
+    count: int
+    min_price: int
+    max_price: int
+    items: List[ProductSearchItem]
+
+
+class GroupedPaginationMeta(PaginationMeta):
+    group_count: int
+
+
+class ProductSearchGroupedResponse(BaseModel):
+    """Product search response (group=true)"""
+
+    success: bool = True
+    message: str = "Success"
+    data: List[ProductSearchGroup]
+    meta: GroupedPaginationMeta
+
+
 class ProductDetailResponse(BaseModel):
     """Product detail response"""
 
@@ -76,21 +112,62 @@ class ProductDetailResponse(BaseModel):
 
 
 class ProductFavoriteCreate(BaseModel):
-    """Save a product as a favorite"""
+    """
+    Save a product as a favorite by id
+    Product fields and price are filled in by the server from recent search results.
+    Other fields sent by older clients (image_url, price, ...) are ignored.
+    """
 
     source: str = Field(default="NAVER", min_length=1, max_length=20)
     source_product_id: str = Field(..., min_length=1, max_length=64)
-    title: str = Field(..., min_length=1, max_length=255)
-    image_url: Optional[str] = Field(default=None, max_length=2000)
-    link_url: Optional[str] = Field(default=None, max_length=2000)
-    mall_name: Optional[str] = Field(default=None, max_length=120)
-    brand: Optional[str] = Field(default=None, max_length=120)
-    maker: Optional[str] = Field(default=None, max_length=120)
-    category1: Optional[str] = Field(default=None, max_length=120)
-    category2: Optional[str] = Field(default=None, max_length=120)
-    category3: Optional[str] = Field(default=None, max_length=120)
-    category4: Optional[str] = Field(default=None, max_length=120)
-    price: int = Field(..., ge=0)
+    query: Optional[str] = Field(
+        default=None,
+        max_length=100,
+        description="Search query the product was found with (used when the search snapshot expired)",
+    )
+    title: Optional[str] = Field(
+        default=None, max_length=255, description="Fallback search hint when query is omitted"
+    )
+
+
+class ProductFavoriteBulkCreate(BaseModel):
+    """Save up to 100 products as favorites at once"""
+
+    items: List[ProductFavoriteCreate] = Field(..., min_length=1, max_length=100)
+
+
+class ProductFavoriteBulkDelete(BaseModel):
+    """Delete up to 100 favorites at once"""
+
+    product_ids: List[int] = Field(..., min_length=1, max_length=100)
+
+
+class ProductFavoriteBulkSaveResult(BaseModel):
+    source: str
+    source_product_id: str
+    product_id: Optional[int] = None
+    status: str = Field(description="created | existing | not_found")
+
+
+class ProductFavoriteBulkDeleteResult(BaseModel):
+    product_id: int
+    status: str = Field(description="deleted | not_found | in_wishlist")
+
+
+class ProductFavoriteBulkSaveResponse(BaseModel):
+    """Bulk favorite save response"""
+
+    success: bool = True
+    message: str = "Success"
+    data: List[ProductFavoriteBulkSaveResult]
+
+
+class ProductFavoriteBulkDeleteResponse(BaseModel):
+    """Bulk favorite delete response"""
+
+    success: bool = True
+    message: str = "Success"
+    data: List[ProductFavoriteBulkDeleteResult]
 
 
 class ProductFavoriteListResponse(BaseModel):
@@ -99,7 +176,7 @@ class ProductFavoriteListResponse(BaseModel):
     success: bool = True
     message: str = "Success"
     data: List[ProductDetail]
-    meta: PaginationMeta
+    meta: Union[CursorMeta, PaginationMeta]
 
 
 class ProductFavoriteDeleteResponse(BaseModel):
@@ -108,3 +185,33 @@ class ProductFavoriteDeleteResponse(BaseModel):
     success: bool = True
     message: str = "Success"
     data: None = None
+
+
+class MallOffer(BaseModel):
+    """Cheapest offer of a single mall"""
+
+    mall_name: str
+    price: int
+    title: str
+    link_url: Optional[str] = None
+    source_product_id: str
+
+
+class LowestPriceResult(BaseModel):
+    """Lowest prices across malls for a saved product"""
+
+    product_id: int
+    source: str
+    source_product_id: str
+    query: str
+    lowest: Optional[MallOffer] = None
+    offers: List[MallOffer]
+    fetched_at: datetime
+
+
+class LowestPriceResponse(BaseModel):
+    """Lowest price response"""
+
+    success: bool = True
+    message: str = "Success"
+    data: LowestPriceResult
@@ -1,93 +1,719 @@
-﻿import os
+﻿import asyncio
+import logging
+import time
 from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
 
-import requests
-from dotenv import load_dotenv
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
-from app.core.exceptions import ConflictException, NotFoundException
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.exceptions import ConflictException, NotFoundException, TooManyRequestsException
+from app.domain.price_history.service import price_observations
+from app.domain.product import parser
+from app.domain.product.cache import CACHE_FRESH, CACHE_MISS, CACHE_STALE, TTLCache
+from app.domain.product.disk_cache import DiskCache
+from app.domain.product.favorite_index import (
+    FavoriteIndexRegistry,
+    FavoriteSearchIndex,
+    search_fields,
+)
+from app.domain.product.heavy_hitters import HeavyHitters
+from app.domain.product.matching import build_search_query, is_same_product
+from app.domain.product.naver_client import NaverAPIError, naver_client
+from app.domain.product.prefetch import (
+    SKIP_BUDGET,
+    SKIP_CACHED,
+    SKIP_CIRCUIT_OPEN,
+    SKIP_IN_FLIGHT,
+    SKIP_LAST_PAGE,
+    PrefetchTracker,
+)
+from app.domain.product.rate_limiter import (
+    PRIORITY_INTERACTIVE,
+    PRIORITY_PREFETCH,
+    naver_rate_limiter,
+)
+from app.domain.product.models import Product
 from app.domain.product.repository import ProductRepository
+from app.domain.product.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    HedgeStats,
+    LatencyTracker,
+    hedged,
+)
+from app.domain.product.single_flight import SingleFlight
+from app.domain.product.suggest import SUGGEST_PRODUCT, SUGGEST_QUERY, SuggestIndex
 from app.domain.wishlist.models import WishlistItem
 
-load_dotenv()
+logger = logging.getLogger(__name__)
 
-NAVER_CLIENT_ID = os.getenv("NAVER_CLIENT_ID")
-NAVER_CLIENT_SECRET = os.getenv("NAVER_CLIENT_SECRET")
-NAVER_SEARCH_URL = "https://openapi.naver.com/v1/search/shop.json"
+# 즐겨찾기 일괄 저장/삭제 항목별 결과
+BULK_CREATED = "created"
+BULK_EXISTING = "existing"
+BULK_DELETED = "deleted"
+BULK_NOT_FOUND = "not_found"
+BULK_IN_WISHLIST = "in_wishlist"
+
+# 네이버 쇼핑 검색 API 제약 (display 최대 100, start 최대 1000)
+NAVER_MAX_DISPLAY = 100
+NAVER_MAX_START = 1000
+
+# 검색 결과 캐시 (query, start, display, sort) -> {"items": [...], "total": int}
+search_cache = TTLCache(
+    name="search",
+    ttl=settings.SEARCH_CACHE_TTL_SECONDS,
+    stale_ttl=settings.SEARCH_CACHE_STALE_SECONDS,
+    max_bytes=settings.SEARCH_CACHE_MAX_BYTES,
+)
+
+# 검색 결과 디스크 캐시 (L2, 재시작 후에도 유지 / 워커 간 공유)
+search_disk_cache = DiskCache(
+    name="search_disk",
+    path=settings.SEARCH_DISK_CACHE_PATH,
+    ttl=settings.SEARCH_CACHE_TTL_SECONDS,
+    stale_ttl=settings.SEARCH_CACHE_STALE_SECONDS,
+    max_bytes=settings.SEARCH_DISK_CACHE_MAX_BYTES,
+    decode=parser.restore_search_result,
+)
+
+# 검색 결과 상품 스냅샷 (source, source_product_id) -> parse_products 항목
+# 즐겨찾기 저장 시 클라이언트가 보낸 값 대신 서버가 본 상품 정보/가격을 사용
+search_snapshots = TTLCache(
+    name="search_snapshot",
+    ttl=settings.SEARCH_SNAPSHOT_TTL_SECONDS,
+    max_bytes=settings.SEARCH_SNAPSHOT_MAX_BYTES,
+)
+
+# 몰별 최저가 조회 결과 캐시 (source, source_product_id) -> 결과 dict
+lowest_price_cache = TTLCache(
+    name="lowest_price",
+    ttl=settings.LOWEST_PRICE_CACHE_TTL_SECONDS,
+    max_bytes=settings.LOWEST_PRICE_CACHE_MAX_BYTES,
+)
+
+# 사용자별 즐겨찾기 검색 n-gram 색인
+favorite_search_indexes = FavoriteIndexRegistry(
+    max_users=settings.FAVORITE_SEARCH_INDEX_MAX_USERS
+)
+
+# 다음 페이지 선조회 hit / wasted 집계
+search_prefetch = PrefetchTracker(name="search")
+
+# 많이 검색되는 검색 캐시 키 (query, start, display, sort) 상위 K개 (시간 감쇠)
+search_top_queries = HeavyHitters(
+    name="search_queries",
+    k=settings.SEARCH_TOP_QUERIES_K,
+    width=settings.SEARCH_TOP_QUERIES_SKETCH_WIDTH,
+    depth=settings.SEARCH_TOP_QUERIES_SKETCH_DEPTH,
+    half_life=settings.SEARCH_TOP_QUERIES_HALF_LIFE_SECONDS,
+)
+
+# 검색어 자동완성 접두사 색인 (검색어 + 즐겨찾기 상품명)
+search_suggestions = SuggestIndex(
+    max_terms=settings.SUGGEST_MAX_TERMS,
+    merge_threshold=settings.SUGGEST_MERGE_THRESHOLD,
+)
+
+# 상위 검색어 캐시 미리 갱신 hit / wasted 집계
+search_warm = PrefetchTracker(name="warm")
+
+# 동일 검색 동시 요청 병합 (업스트림 호출 1회로 공유)
+search_flight = SingleFlight(name="search")
+
+# 네이버 업스트림 서킷 브레이커 / 지연 추적 (헤지 지연 계산용)
+naver_circuit_breaker = CircuitBreaker(
+    name="naver",
+    failure_ratio=settings.NAVER_BREAKER_FAILURE_RATIO,
+    slow_call_seconds=settings.NAVER_BREAKER_SLOW_CALL_SECONDS,
+    open_seconds=settings.NAVER_BREAKER_OPEN_SECONDS,
+)
+naver_latency = LatencyTracker()
+naver_hedge_stats = HedgeStats()
+
+# 백그라운드 태스크 참조 유지 (GC 방지)
+_background_tasks: Set[asyncio.Task] = set()
+
+
+def _spawn_background(coro) -> asyncio.Task:
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
 
 
 class NaverShoppingService:
     # 네이버 쇼핑 검색 API 호출 및 결과 파싱
 
+    @staticmethod
+    def _on_upstream_error(error: NaverAPIError) -> None:
+        """
+        업스트림 에러 처리
+        - 타임아웃/연결 실패/5xx 는 서킷 브레이커 실패로 기록
+        - 네이버 429 응답은 500 대신 429 로 변환하고 호출 속도를 늦춤
+        """
+        if error.status_code is None or error.status_code >= 500:
+            naver_circuit_breaker.record_failure()
+        else:
+            # 4xx 는 업스트림이 살아 있다는 의미
+            naver_circuit_breaker.record_success(0.0)
+
+        if error.status_code == 429:
+            naver_rate_limiter.on_upstream_throttled()
+            raise TooManyRequestsException(
+                message="네이버 API 호출 한도를 초과했습니다", detail=str(error)
+            ) from error
+
+    @staticmethod
+    def _hedge_delay() -> float | None:
+        """p95 기반 헤지 지연 (표본이 부족하면 None - 헤지하지 않음)"""
+        p95 = naver_latency.percentile(95)
+        if p95 is None:
+            return None
+        return max(settings.NAVER_HEDGE_MIN_DELAY_SECONDS, p95)
+
     @staticmethod
     def search_products(
         query: str,
         display: int = 10,
         start: int = 1,
         sort: str = "sim",
+        priority: str = PRIORITY_INTERACTIVE,
     ) -> Dict:
-        """네이버 쇼핑 API로 상품 검색"""
-        # 외부 API 호출
-        headers = {
-            "X-Naver-Client-Id": NAVER_CLIENT_ID,
-            "X-Naver-Client-Secret": NAVER_CLIENT_SECRET,
-        }
+        """네이버 쇼핑 API로 상품 검색 (동기, 워커/스레드용)"""
 
-        params = {
-            "query": query,
-            "display": min(display, 100),  # 최대 100개 제한
-            "start": start,
-            "sort": sort,
-        }
+        def fetch() -> Dict:
+            naver_circuit_breaker.before_call()
+            try:
+                naver_rate_limiter.acquire(priority)
+            except BaseException:
+                naver_circuit_breaker.record_cancelled()
+                raise
+
+            started = time.monotonic()
+            try:
+                result = naver_client.search_sync(
+                    query=query, display=display, start=start, sort=sort
+                )
+            except NaverAPIError as e:
+                NaverShoppingService._on_upstream_error(e)
+                raise
+            except BaseException:
+                naver_circuit_breaker.record_cancelled()
+                raise
+            latency = time.monotonic() - started
+            naver_circuit_breaker.record_success(latency)
+            naver_latency.observe(latency)
+            return result
+
+        # 공유 커넥션 풀을 사용하는 외부 API 호출 (동시 동일 요청은 병합)
+        key = NaverShoppingService.search_cache_key(query, display, start, sort)
+        return search_flight.do(key, fetch)
+
+    @staticmethod
+    async def search_products_async(
+        query: str,
+        display: int = 10,
+        start: int = 1,
+        sort: str = "sim",
+        priority: str = PRIORITY_INTERACTIVE,
+    ) -> Dict:
+        """
+        네이버 쇼핑 API로 상품 검색 (비동기)
+        - 서킷이 열려 있으면 호출/예산 소모 없이 즉시 실패
+        - NAVER_HEDGE_ENABLED 이면 사용자 검색은 p95 지연 후 헤지 요청
+        """
+        naver_circuit_breaker.before_call()
+        try:
+            await naver_rate_limiter.acquire_async(priority)
+        except BaseException:
+            naver_circuit_breaker.record_cancelled()
+            raise
 
+        async def timed_call() -> Dict:
+            call_started = time.monotonic()
+            result = await naver_client.search(
+                query=query, display=display, start=start, sort=sort
+            )
+            naver_latency.observe(time.monotonic() - call_started)
+            return result
+
+        started = time.monotonic()
         try:
-            response = requests.get(
-                NAVER_SEARCH_URL,
-                headers=headers,
-                params=params,
-                timeout=10,  # 10초 타임아웃
+            if settings.NAVER_HEDGE_ENABLED and priority == PRIORITY_INTERACTIVE:
+                result = await hedged(
+                    timed_call,
+                    delay=NaverShoppingService._hedge_delay(),
+                    # 헤지 요청도 호출 예산을 사용하므로 대기 없이 토큰이 있을 때만
+                    can_hedge=lambda: naver_rate_limiter.try_acquire(priority),
+                    hedge_stats=naver_hedge_stats,
+                )
+            else:
+                result = await timed_call()
+        except NaverAPIError as e:
+            NaverShoppingService._on_upstream_error(e)
+            raise
+        except BaseException:
+            naver_circuit_breaker.record_cancelled()
+            raise
+        naver_circuit_breaker.record_success(time.monotonic() - started)
+        return result
+
+    @staticmethod
+    def search_cache_key(query: str, display: int, start: int, sort: str) -> Tuple:
+        """검색 캐시 키 (공백/대소문자 정규화)"""
+        return (" ".join(query.split()).lower(), start, min(display, 100), sort)
+
+    @staticmethod
+    async def _fetch_and_cache(
+        key: Tuple,
+        query: str,
+        display: int,
+        start: int,
+        sort: str,
+        priority: str = PRIORITY_INTERACTIVE,
+    ) -> Dict:
+        async def fetch() -> Dict:
+            naver_result = await NaverShoppingService.search_products_async(
+                query=query, display=display, start=start, sort=sort, priority=priority
             )
-            response.raise_for_status()  # 4xx, 5xx 에러 시 예외 발생
-            return response.json()
+            result = {
+                "items": NaverShoppingService.parse_products(naver_result),
+                "total": naver_result.get("total", 0),
+            }
+            search_cache.set(key, result)
+            # 디스크 쓰기는 writer 스레드가 처리 (기다리지 않음)
+            search_disk_cache.set(key, result)
+            NaverShoppingService.remember_snapshots(result["items"])
+            # 가격 이력용 관측값 (주기적으로 즐겨찾기 상품만 기록)
+            price_observations.add_items(result["items"])
+            return result
 
-        except requests.exceptions.Timeout:
-            raise Exception("네이버 API 요청 시간 초과")
-        except requests.exceptions.HTTPError as e:
-            raise Exception(f"네이버 API HTTP 에러: {e.response.status_code}")
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"네이버 API 호출 실패: {str(e)}")
+        # 같은 키의 동시 요청은 첫 호출 결과(예외 포함)를 공유
+        return await search_flight.do_async(key, fetch)
+
+    @staticmethod
+    async def _refresh_in_background(
+        key: Tuple, query: str, display: int, start: int, sort: str
+    ) -> None:
+        try:
+            # 사용자는 이미 stale 값을 받았으므로 선조회와 같이 예산에 여유가 있을 때만 갱신
+            await NaverShoppingService._fetch_and_cache(
+                key, query, display, start, sort, priority=PRIORITY_PREFETCH
+            )
+        except Exception:
+            # 갱신 실패(예산 부족 포함) 시 stale 값을 계속 사용 (stale 기간이 지나면 자연 만료)
+            logger.warning("search cache refresh failed: %s", key, exc_info=True)
+        finally:
+            search_cache.end_refresh(key)
+
+    @staticmethod
+    def remember_snapshots(items: List[Dict]) -> None:
+        for item in items:
+            search_snapshots.set((item["source"], item["source_product_id"]), item)
+
+    @staticmethod
+    def get_snapshot(source: str, source_product_id: str) -> Optional[Dict]:
+        snapshot, _ = search_snapshots.get((source, source_product_id))
+        return snapshot
+
+    @staticmethod
+    async def lookup_snapshots(hints: Dict[Tuple[str, str], str]) -> Dict[Tuple[str, str], Dict]:
+        """
+        스냅샷이 만료된 상품을 검색어 힌트로 다시 검색하여 찾기
+        같은 검색어는 한 번만 검색하고, 실패한 검색은 건너뜀
+        """
+        by_query: Dict[str, List[Tuple[str, str]]] = {}
+        for key, query in hints.items():
+            if key[0] == "NAVER" and query:
+                by_query.setdefault(query, []).append(key)
+        queries = list(by_query)
+        results = await asyncio.gather(
+            *(
+                NaverShoppingService.search_cached(query=query, display=NAVER_MAX_DISPLAY)
+                for query in queries
+            ),
+            return_exceptions=True,
+        )
+
+        found: Dict[Tuple[str, str], Dict] = {}
+        for query, result in zip(queries, results):
+            if isinstance(result, BaseException):
+                logger.warning("snapshot lookup failed: %s", query, exc_info=result)
+                continue
+            items = {item["source_product_id"]: item for item in result["items"]}
+            for key in by_query[query]:
+                item = items.get(key[1])
+                if item is not None:
+                    found[key] = item
+        NaverShoppingService.remember_snapshots(list(found.values()))
+        return found
+
+    @staticmethod
+    async def _load_from_disk(key: Tuple) -> Tuple[Dict | None, str]:
+        """디스크 캐시(L2)를 스레드 풀에서 조회 후 남은 TTL 로 인메모리 캐시(L1)에 적재"""
+        found = await run_in_threadpool(search_disk_cache.get, key)
+        if found is None:
+            return None, CACHE_MISS
+        value, fresh_left, stale_left = found
+        fresh_left = max(0.0, fresh_left)
+        NaverShoppingService.remember_snapshots(value["items"])
+        search_cache.set(key, value, ttl=fresh_left, stale_ttl=stale_left - fresh_left)
+        return value, CACHE_FRESH if fresh_left > 0 else CACHE_STALE
+
+    @staticmethod
+    async def search_fresh(
+        query: str,
+        display: int = 10,
+        start: int = 1,
+        sort: str = "sim",
+        priority: str = PRIORITY_INTERACTIVE,
+    ) -> Dict:
+        """
+        캐시를 읽지 않고 네이버에서 바로 조회 (가격 갱신용, 결과는 캐시에 저장)
+        - stale 값 반환 / 장애 시 만료된 캐시 fallback 이 없어 실패는 그대로 전달
+        - 같은 키로 진행 중인 업스트림 호출이 있으면 그 결과를 공유
+        """
+        key = NaverShoppingService.search_cache_key(query, display, start, sort)
+        return await NaverShoppingService._fetch_and_cache(
+            key, query, display, start, sort, priority=priority
+        )
+
+    @staticmethod
+    async def search_cached(
+        query: str,
+        display: int = 10,
+        start: int = 1,
+        sort: str = "sim",
+        priority: str = PRIORITY_INTERACTIVE,
+    ) -> Dict:
+        """
+        캐시를 거치는 검색 (파싱된 결과 반환)
+        - fresh: 캐시 값 반환
+        - stale: 캐시 값을 즉시 반환하고 백그라운드에서 한 번만 갱신 (prefetch 우선순위)
+        - miss : 디스크 캐시(L2) 확인 후 없으면 네이버 호출, 양쪽 캐시에 저장
+                 (업스트림 장애 시 만료된 캐시로 fallback)
+        """
+        key = NaverShoppingService.search_cache_key(query, display, start, sort)
+        search_prefetch.record_lookup(key)
+        search_warm.record_lookup(key)
+        cached, state = search_cache.get(key)
+        if state == CACHE_MISS:
+            cached, state = await NaverShoppingService._load_from_disk(key)
+        if state == CACHE_FRESH:
+            return cached
+        if state == CACHE_STALE:
+            if search_cache.begin_refresh(key):
+                _spawn_background(
+                    NaverShoppingService._refresh_in_background(
+                        key, query, display, start, sort
+                    )
+                )
+            return cached
+        try:
+            return await NaverShoppingService._fetch_and_cache(
+                key, query, display, start, sort, priority=priority
+            )
+        except (CircuitOpenError, NaverAPIError):
+            # 업스트림 장애 시 만료된 캐시라도 남아 있으면 그 값으로 응답
+            fallback = search_cache.peek(key)
+            if fallback is None:
+                fallback = await run_in_threadpool(search_disk_cache.peek, key)
+            if fallback is not None:
+                return fallback
+            raise
+
+    @staticmethod
+    def schedule_prefetch(query: str, display: int, start: int, sort: str, total: int) -> None:
+        """
+        page N 응답 후 같은 query/sort 의 page N+1 을 백그라운드로 캐시에 미리 저장
+        - SEARCH_PREFETCH_ENABLED 일 때만 동작
+        - 마지막 페이지이거나 이미 캐시/조회 중이면 건너뜀
+        - prefetch 우선순위로 호출하여 예산이 빠듯하면 대기 없이 포기
+        """
+        if not settings.SEARCH_PREFETCH_ENABLED:
+            return
+        next_start = start + display
+        if next_start > min(total, NAVER_MAX_START):
+            search_prefetch.record_skipped(SKIP_LAST_PAGE)
+            return
+        key = NaverShoppingService.search_cache_key(query, display, next_start, sort)
+        if search_cache.is_fresh(key):
+            search_prefetch.record_skipped(SKIP_CACHED)
+            return
+        # stale 갱신과 같은 가드를 사용하여 키당 백그라운드 호출은 1개만
+        if not search_cache.begin_refresh(key):
+            search_prefetch.record_skipped(SKIP_IN_FLIGHT)
+            return
+        search_prefetch.record_scheduled()
+        _spawn_background(
+            NaverShoppingService._prefetch(key, query, display, next_start, sort)
+        )
+
+    @staticmethod
+    async def _prefetch(
+        key: Tuple,
+        query: str,
+        display: int,
+        start: int,
+        sort: str,
+        tracker: PrefetchTracker = search_prefetch,
+    ) -> None:
+        try:
+            await NaverShoppingService._fetch_and_cache(
+                key, query, display, start, sort, priority=PRIORITY_PREFETCH
+            )
+        except TooManyRequestsException:
+            tracker.record_skipped(SKIP_BUDGET)
+        except CircuitOpenError:
+            tracker.record_skipped(SKIP_CIRCUIT_OPEN)
+        except Exception:
+            tracker.record_failed()
+            logger.warning("search %s failed: %s", tracker.name, key, exc_info=True)
+        else:
+            tracker.record_completed(key, search_cache.ttl)
+        finally:
+            search_cache.end_refresh(key)
+
+    @staticmethod
+    def record_query(query: str, display: int, start: int, sort: str) -> None:
+        """사용자 검색 요청의 캐시 키를 상위 검색어 추적에 반영"""
+        search_top_queries.add(NaverShoppingService.search_cache_key(query, display, start, sort))
+
+    @staticmethod
+    async def warm_top_queries(
+        top_n: int = settings.SEARCH_WARM_TOP_N,
+        ahead: float = settings.SEARCH_WARM_AHEAD_SECONDS,
+        min_count: float = settings.SEARCH_WARM_MIN_COUNT,
+    ) -> int:
+        """
+        상위 검색어 중 캐시 fresh 기간이 ahead 초 이하로 남은 키를 만료 전에 다시 조회
+        - prefetch 우선순위로 호출하여 예산이 빠듯하면 대기 없이 포기
+        - stale 갱신/선조회와 같은 가드를 사용하여 키당 백그라운드 호출은 1개만
+        갱신을 시작한 키 수 반환
+        """
+        refreshes = []
+        for key, count in search_top_queries.top(top_n):
+            if count < min_count:
+                break
+            if search_cache.fresh_left(key) > ahead:
+                search_warm.record_skipped(SKIP_CACHED)
+                continue
+            if not search_cache.begin_refresh(key):
+                search_warm.record_skipped(SKIP_IN_FLIGHT)
+                continue
+            search_warm.record_scheduled()
+            query, start, display, sort = key
+            refreshes.append(
+                NaverShoppingService._prefetch(
+                    key, query, display, start, sort, tracker=search_warm
+                )
+            )
+        await asyncio.gather(*refreshes)
+        return len(refreshes)
+
+    @staticmethod
+    async def warm_periodically(interval: float = settings.SEARCH_WARM_INTERVAL_SECONDS) -> None:
+        """API 프로세스용: interval 마다 상위 검색어 캐시 미리 갱신"""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await NaverShoppingService.warm_top_queries()
+            except Exception:
+                logger.warning("search cache warm-up failed", exc_info=True)
+
+    @staticmethod
+    async def deep_search(
+        query: str,
+        sort: str = "sim",
+        limit: int = NAVER_MAX_START,
+        failed_pages: List[int] | None = None,
+    ) -> AsyncIterator[Dict]:
+        """
+        여러 페이지(display=100)를 동시에 조회하여 도착 순서대로 반환
+        - 첫 페이지의 total 로 나머지 페이지 수를 정하고 나머지는 동시에 조회
+          (결과보다 먼 페이지는 호출하지 않음, 첫 페이지가 실패하면 limit 까지 조회)
+        - productId 기준 중복 제거, 최대 limit 개
+        - 실패한 페이지는 건너뛰고 시작 위치(start)를 failed_pages 에 기록
+        """
+        starts = list(range(1, min(limit, NAVER_MAX_START) + 1, NAVER_MAX_DISPLAY))
+
+        async def fetch_page(start: int) -> Tuple[int, Dict | None]:
+            try:
+                return start, await NaverShoppingService.search_cached(
+                    query=query, display=NAVER_MAX_DISPLAY, start=start, sort=sort
+                )
+            except Exception:
+                logger.warning("deep search page failed: %s start=%s", query, start, exc_info=True)
+                return start, None
+
+        first = await fetch_page(starts[0])
+        if first[1] is not None:
+            starts = [start for start in starts if start <= first[1]["total"]]
+
+        tasks = [asyncio.ensure_future(fetch_page(start)) for start in starts[1:]]
+
+        async def pages() -> AsyncIterator[Tuple[int, Dict | None]]:
+            yield first
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+
+        seen: Set[str] = set()
+        emitted = 0
+        try:
+            async for start, result in pages():
+                if result is None:
+                    if failed_pages is not None:
+                        failed_pages.append(start)
+                    continue
+                for item in result["items"]:
+                    product_id = item["source_product_id"]
+                    if product_id in seen:
+                        continue
+                    seen.add(product_id)
+                    yield item
+                    emitted += 1
+                    if emitted >= limit:
+                        return
+        finally:
+            for task in tasks:
+                task.cancel()
 
     @staticmethod
     def clean_html_tags(text: str) -> str:
-        """HTML 태그 제거 (<b>, </b> 등)"""
-        return text.replace("<b>", "").replace("</b>", "")
+        """HTML 태그 제거 (<b>, </b> 등) 및 엔티티(&amp; 등) 변환"""
+        return parser.strip_tags(text)
 
     @staticmethod
-    def parse_product_item(item: Dict) -> Dict:
+    def parse_product_item(item: Dict, fetched_at: Optional[datetime] = None) -> Dict:
         """응답 필드를 Product 스키마로 변환"""
-        return {
-            "source": "NAVER",
-            "source_product_id": item.get("productId", ""),
-            "title": NaverShoppingService.clean_html_tags(item.get("title", "")),
-            "image_url": item.get("image", ""),
-            "link_url": item.get("link", ""),
-            "mall_name": item.get("mallName", ""),
-            "brand": item.get("brand", ""),
-            "maker": item.get("maker", ""),
-            "category1": item.get("category1", ""),
-            "category2": item.get("category2", ""),
-            "category3": item.get("category3", ""),
-            "category4": item.get("category4", ""),
-            "price": int(item.get("lprice", 0)),  # lprice = 최저가
-            "last_fetched_at": datetime.utcnow(),
-        }
+        return parser.parse_item(item, fetched_at or datetime.utcnow())
 
     @staticmethod
     def parse_products(naver_response: Dict) -> List[Dict]:
-        """네이버 API 전체 응답 파싱"""
-        items = naver_response.get("items", [])
-        return [NaverShoppingService.parse_product_item(item) for item in items]
+        """네이버 API 전체 응답 파싱 (응답 단위로 타임스탬프 1회 생성)"""
+        return parser.parse_items(naver_response.get("items", []))
+
+
+class LowestPriceService:
+    # 저장된 상품의 몰별 최저가 조회
+
+    @staticmethod
+    def _collect_offers(product: Product, search_results: List[Dict]) -> List[Dict]:
+        """같은 상품으로 판별된 항목 중 몰별 최저가만 남김 (가격 오름차순)"""
+        best_by_mall: Dict[str, Dict] = {}
+        for result in search_results:
+            for item in result["items"]:
+                if item["price"] <= 0:
+                    continue
+                if not is_same_product(
+                    title=product.title,
+                    brand=product.brand,
+                    maker=product.maker,
+                    source_product_id=product.source_product_id,
+                    item=item,
+                ):
+                    continue
+                mall_name = item["mall_name"] or "UNKNOWN"
+                current = best_by_mall.get(mall_name)
+                if current is None or item["price"] < current["price"]:
+                    best_by_mall[mall_name] = {
+                        "mall_name": mall_name,
+                        "price": item["price"],
+                        "title": item["title"],
+                        "link_url": item["link_url"],
+                        "source_product_id": item["source_product_id"],
+                    }
+        return sorted(best_by_mall.values(), key=lambda offer: offer["price"])
+
+    @staticmethod
+    async def find_lowest_prices(product: Product) -> Dict:
+        """
+        저장된 상품의 몰별 최저가
+        - 정규화한 상품명/브랜드로 sort=asc, sort=sim 검색을 동시에 수행
+        - 결과는 source_product_id 단위로 캐시하여 반복 조회 시 네이버를 호출하지 않음
+        """
+        key = (product.source, product.source_product_id)
+        cached, state = lowest_price_cache.get(key)
+        if state == CACHE_FRESH:
+            return cached
+
+        query = build_search_query(product.title, product.brand, product.maker)
+        results = await asyncio.gather(
+            NaverShoppingService.search_cached(query=query, display=NAVER_MAX_DISPLAY, sort="asc"),
+            NaverShoppingService.search_cached(query=query, display=NAVER_MAX_DISPLAY, sort="sim"),
+            return_exceptions=True,
+        )
+        succeeded = [r for r in results if not isinstance(r, BaseException)]
+        if not succeeded:
+            raise results[0]
+
+        offers = LowestPriceService._collect_offers(product, succeeded)
+        data = {
+            "source": product.source,
+            "source_product_id": product.source_product_id,
+            "query": query,
+            "lowest": offers[0] if offers else None,
+            "offers": offers,
+            "fetched_at": datetime.utcnow(),
+        }
+        # 한쪽 검색이 실패한 불완전한 결과는 캐시하지 않음
+        if len(succeeded) == len(results):
+            lowest_price_cache.set(key, data)
+        return data
+
+
+class SuggestService:
+    @staticmethod
+    def record_search(query: str, total: int) -> None:
+        """결과가 있었던 검색어만 자동완성 후보로 추가"""
+        if total > 0:
+            search_suggestions.add(query, settings.SUGGEST_QUERY_WEIGHT, SUGGEST_QUERY)
+
+    @staticmethod
+    def record_favorite(title: str, brand: Optional[str], maker: Optional[str]) -> None:
+        search_suggestions.add(
+            build_search_query(title, brand, maker),
+            settings.SUGGEST_FAVORITE_WEIGHT,
+            SUGGEST_PRODUCT,
+        )
+
+    @staticmethod
+    def suggest(prefix: str, limit: int) -> List[Dict]:
+        return [
+            {"text": text, "type": kind, "score": score}
+            for text, score, kind in search_suggestions.suggest(prefix, limit)
+        ]
+
+    @staticmethod
+    def load_popular_favorites(db: Session, limit: int = settings.SUGGEST_WARM_LIMIT) -> int:
+        """즐겨찾기 수가 많은 원본 상품을 자동완성 후보로 적재 (API 시작 시)"""
+        rows = ProductRepository.list_popular_catalogs(db, limit=limit)
+        search_suggestions.add_many(
+            [
+                (
+                    build_search_query(title, brand, maker),
+                    favorites * settings.SUGGEST_FAVORITE_WEIGHT,
+                    SUGGEST_PRODUCT,
+                )
+                for title, brand, maker, favorites in rows
+            ]
+        )
+        return len(rows)
+
+    @staticmethod
+    def load_with_session() -> int:
+        """적재 실패 시에도 API 는 시작 (이후 검색/저장으로 후보가 채워짐)"""
+        db = SessionLocal()
+        try:
+            return SuggestService.load_popular_favorites(db)
+        except Exception:
+            logger.warning("suggestion warm-up failed", exc_info=True)
+            return 0
+        finally:
+            db.close()
 
 
 class ProductService:
@@ -104,36 +730,251 @@ class ProductService:
         )
         return items, total_items
 
-    def save_favorite(self, db: Session, user_id: int, payload) -> "Product":
-        # 이미 존재하면 기존 상품 반환 (get or create 패턴)
-        existing = self.product_repository.get_by_source_product_id(
+    def list_favorites_page(
+        self,
+        db: Session,
+        user_id: int,
+        cursor: Optional[str],
+        size: int,
+        include_total: bool = False,
+    ) -> Tuple[List["Product"], Optional[str], Optional[int]]:
+        """(목록, 다음 cursor, 전체 개수). 전체 개수는 include_total 일 때만 조회"""
+        items, next_cursor = self.product_repository.list_page(
+            db, user_id=user_id, cursor=cursor, size=size
+        )
+        total_items = (
+            self.product_repository.count_all(db, user_id=user_id) if include_total else None
+        )
+        return items, next_cursor, total_items
+
+    def _favorite_index(self, db: Session, user_id: int) -> FavoriteSearchIndex:
+        signature = self.product_repository.get_index_signature(db, user_id=user_id)
+        index = favorite_search_indexes.get(user_id, signature)
+        if index is None:
+            rows = self.product_repository.list_search_fields(db, user_id=user_id)
+            index = favorite_search_indexes.build(
+                user_id,
+                signature,
+                ((row.id, search_fields(row)) for row in rows),
+            )
+        return index
+
+    def search_favorites(
+        self, db: Session, user_id: int, query: str, page: int, size: int
+    ) -> Tuple[List["Product"], int]:
+        """즐겨찾기 상품명/브랜드/제조사/카테고리 검색 (관련도 순)"""
+        product_ids = self._favorite_index(db, user_id).search(query)
+        offset = (page - 1) * size
+        items = self.product_repository.list_by_ids_for_user(
+            db, user_id=user_id, product_ids=product_ids[offset : offset + size]
+        )
+        return items, len(product_ids)
+
+    def annotate_favorites(self, db: Session, user_id: int, items: List[Dict]) -> List[Dict]:
+        """
+        검색 결과 항목에 is_favorited / favorite_id / in_wishlist 추가
+        캐시된 검색 결과를 공유하므로 항목을 복사하여 반환
+        """
+        keys = [(item["source"], item["source_product_id"]) for item in items]
+        status = self.product_repository.map_favorite_status(db, user_id=user_id, keys=keys)
+        annotated = []
+        for item, key in zip(items, keys):
+            favorite_id, in_wishlist = status.get(key, (None, False))
+            annotated.append(
+                {
+                    **item,
+                    "is_favorited": favorite_id is not None,
+                    "favorite_id": favorite_id,
+                    "in_wishlist": in_wishlist,
+                }
+            )
+        return annotated
+
+    def annotate_with_session(self, user_id: int, items: List[Dict]) -> List[Dict]:
+        """검색 요청은 DB 세션 없이 처리하므로 annotate 일 때만 세션을 열어 표시 (스레드 풀에서 호출)"""
+        db = SessionLocal()
+        try:
+            return self.annotate_favorites(db, user_id, items)
+        finally:
+            db.close()
+
+    async def resolve_snapshots(
+        self, db: Session, hints: Dict[Tuple[str, str], Optional[str]]
+    ) -> Dict[Tuple[str, str], Dict]:
+        """
+        저장할 상품의 서버 측 상품 정보 찾기
+        스냅샷 -> (없으면) 원본 상품이 이미 있으면 생략 -> (없으면) 검색어 힌트로 다시 검색
+        """
+        snapshots: Dict[Tuple[str, str], Dict] = {}
+        missing: List[Tuple[str, str]] = []
+        for key in hints:
+            snapshot = NaverShoppingService.get_snapshot(*key)
+            if snapshot is not None:
+                snapshots[key] = snapshot
+            else:
+                missing.append(key)
+        if missing:
+            known = await run_in_threadpool(self.product_repository.map_catalog_ids, db, missing)
+            snapshots.update(
+                await NaverShoppingService.lookup_snapshots(
+                    {key: hints[key] for key in missing if key not in known}
+                )
+            )
+        return snapshots
+
+    async def save_favorite_by_id(self, db: Session, user_id: int, payload) -> "Product":
+        """id 만으로 즐겨찾기 저장 (상품 정보/가격은 서버가 검색에서 본 값 사용)"""
+        key = (payload.source, payload.source_product_id)
+        snapshots = await self.resolve_snapshots(db, {key: payload.query or payload.title})
+        return await run_in_threadpool(
+            self.save_favorite, db, user_id, key[0], key[1], snapshots.get(key)
+        )
+
+    async def save_favorites_bulk_by_id(
+        self, db: Session, user_id: int, items: List
+    ) -> List[Dict]:
+        hints = {
+            (item.source, item.source_product_id): item.query or item.title for item in items
+        }
+        snapshots = await self.resolve_snapshots(db, hints)
+        return await run_in_threadpool(
+            self.save_favorites_bulk,
             db,
-            user_id=user_id,
-            source=payload.source,
-            source_product_id=payload.source_product_id,
+            user_id,
+            [(item.source, item.source_product_id) for item in items],
+            snapshots,
+        )
+
+    def save_favorite(
+        self,
+        db: Session,
+        user_id: int,
+        source: str,
+        source_product_id: str,
+        snapshot: Optional[Dict] = None,
+    ) -> "Product":
+        # 원본 상품은 모든 사용자가 공유하고, 사용자별로는 링크 행만 생성
+        if snapshot is not None:
+            catalog = self.product_repository.get_or_create_catalog(
+                db, **parser.catalog_fields(snapshot)
+            )
+        else:
+            catalog = self.product_repository.get_catalog(db, source, source_product_id)
+            if catalog is None:
+                raise NotFoundException(
+                    message="Product not found in recent search results. Search again and retry"
+                )
+
+        # 이미 존재하면 기존 상품 반환 (get or create 패턴)
+        existing = self.product_repository.get_by_catalog_product_id(
+            db, user_id=user_id, catalog_product_id=catalog.id
         )
         if existing:
             return existing  # 기존 상품 반환
 
-        fields = {
-            "user_id": user_id,
-            "source": payload.source,
-            "source_product_id": payload.source_product_id,
-            "title": payload.title,
-            "image_url": payload.image_url,
-            "link_url": payload.link_url,
-            "mall_name": payload.mall_name,
-            "brand": payload.brand,
-            "maker": payload.maker,
-            "category1": payload.category1,
-            "category2": payload.category2,
-            "category3": payload.category3,
-            "category4": payload.category4,
-            "price": payload.price,
-            "last_fetched_at": datetime.utcnow(),
-        }
+        product = self.product_repository.create(
+            db, user_id=user_id, catalog_product_id=catalog.id
+        )
+        favorite_search_indexes.on_saved(user_id, product.id, search_fields(catalog))
+        SuggestService.record_favorite(catalog.title, catalog.brand, catalog.maker)
+        return product
+
+    def save_favorites_bulk(
+        self,
+        db: Session,
+        user_id: int,
+        keys: List[Tuple[str, str]],
+        snapshots: Dict[Tuple[str, str], Dict],
+    ) -> List[Dict]:
+        """
+        여러 상품을 한 번에 즐겨찾기 저장 (항목별 결과 반환)
+        원본 상품 upsert 1문장 + 사용자 링크 INSERT 1문장, commit 1회
+        스냅샷도 원본 상품도 없는 상품은 not_found
+        """
+        now = datetime.utcnow()
+        if snapshots:
+            self.product_repository.upsert_catalogs(
+                db,
+                [
+                    {**parser.catalog_fields(snapshot), "created_at": now, "updated_at": now}
+                    for snapshot in snapshots.values()
+                ],
+            )
+        catalog_ids = self.product_repository.map_catalog_ids(db, keys)
+        existing = self.product_repository.map_links(db, user_id, catalog_ids.values())
+        new_ids = set(catalog_ids.values()) - set(existing)
+        self.product_repository.insert_links(db, user_id, new_ids)
+        links = {**existing, **self.product_repository.map_links(db, user_id, new_ids)}
+        db.commit()
 
-        return self.product_repository.create(db, **fields)
+        results: List[Dict] = []
+        seen: Set[int] = set()
+        for source, source_product_id in keys:
+            catalog_id = catalog_ids.get((source, source_product_id))
+            if catalog_id is None:
+                product_id, status = None, BULK_NOT_FOUND
+            else:
+                product_id = links[catalog_id]
+                created = catalog_id in new_ids and catalog_id not in seen
+                seen.add(catalog_id)
+                status = BULK_CREATED if created else BULK_EXISTING
+                snapshot = snapshots.get((source, source_product_id))
+                if created and snapshot is not None:
+                    favorite_search_indexes.on_saved(user_id, product_id, search_fields(snapshot))
+                    SuggestService.record_favorite(
+                        snapshot["title"], snapshot["brand"], snapshot["maker"]
+                    )
+            results.append(
+                {
+                    "source": source,
+                    "source_product_id": source_product_id,
+                    "product_id": product_id,
+                    "status": status,
+                }
+            )
+        return results
+
+    def delete_favorites_bulk(
+        self, db: Session, user_id: int, product_ids: List[int]
+    ) -> List[Dict]:
+        """
+        여러 즐겨찾기 삭제 (항목별 결과 반환)
+        소유 확인 / 위시리스트 사용 여부 / 삭제를 각각 쿼리 1회로 처리
+        """
+        owned = set(self.product_repository.list_ids_for_user(db, user_id, product_ids))
+        in_wishlist: Set[int] = set()
+        if owned:
+            rows = (
+                db.query(WishlistItem.product_id)
+                .filter(WishlistItem.product_id.in_(owned))
+                .distinct()
+                .all()
+            )
+            in_wishlist = {row.product_id for row in rows}
+        deletable = sorted(owned - in_wishlist)
+        self.product_repository.delete_many(db, user_id, deletable)
+
+        results: List[Dict] = []
+        for product_id in dict.fromkeys(product_ids):
+            if product_id not in owned:
+                status = BULK_NOT_FOUND
+            elif product_id in in_wishlist:
+                status = BULK_IN_WISHLIST
+            else:
+                status = BULK_DELETED
+                favorite_search_indexes.on_deleted(user_id, product_id)
+            results.append({"product_id": product_id, "status": status})
+        return results
+
+    def update_target_price(
+        self, db: Session, user_id: int, product_id: int, target_price: int | None
+    ) -> "Product":
+        product = self.product_repository.get_product_by_id_for_user(
+            db, user_id=user_id, product_id=product_id
+        )
+        if not product:
+            raise NotFoundException(message="Product not found")
+        return self.product_repository.update(db, product, target_price=target_price)
 
     def delete_favorite(self, db: Session, user_id: int, product_id: int) -> None:
         product = self.product_repository.get_product_by_id_for_user(
@@ -151,3 +992,4 @@ class ProductService:
             raise ConflictException(message="Product is used in wishlist")
 
         self.product_repository.delete(db, product)
+        favorite_search_indexes.on_deleted(user_id, product_id)
@@ -0,0 +1,103 @@
+"""
+Single-flight 요청 병합
+
+같은 키로 동시에 들어온 호출 중 첫 번째 호출만 실제로 실행하고,
+나머지 호출은 그 결과(예외 포함)를 그대로 공유합니다.
+
+- do()       : 동기 경로 (스레드 풀에서 실행되는 라우트/워커)
+- do_async() : 비동기 경로 (이벤트 루프)
+"""
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class _SyncCall:
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._lock = threading.Lock()
+        self._sync_calls: Dict[Hashable, _SyncCall] = {}
+        self._async_calls: Dict[Tuple[int, Hashable], asyncio.Task] = {}
+        self.executions = 0
+        self.shared = 0
+        self.errors = 0
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """동기 호출 병합"""
+        with self._lock:
+            call = self._sync_calls.get(key)
+            if call is not None:
+                self.shared += 1
+                leader = False
+            else:
+                call = _SyncCall()
+                self._sync_calls[key] = call
+                self.executions += 1
+                leader = True
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            with self._lock:
+                self.errors += 1
+            raise
+        finally:
+            with self._lock:
+                self._sync_calls.pop(key, None)
+            call.event.set()
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """비동기 호출 병합"""
+        # Task 는 이벤트 루프에 묶이므로 루프별로 키를 구분
+        loop_key = (id(asyncio.get_running_loop()), key)
+        with self._lock:
+            task = self._async_calls.get(loop_key)
+            if task is not None:
+                self.shared += 1
+            else:
+                # 선행 호출자가 취소되어도 공유 호출은 계속 진행되도록 별도 Task 로 실행
+                task = asyncio.ensure_future(fn())
+                self._async_calls[loop_key] = task
+                self.executions += 1
+                task.add_done_callback(lambda t: self._finish_async(loop_key, t))
+
+        return await asyncio.shield(task)
+
+    def _finish_async(self, loop_key: Tuple[int, Hashable], task: asyncio.Task) -> None:
+        with self._lock:
+            if self._async_calls.get(loop_key) is task:
+                del self._async_calls[loop_key]
+            # exception() 조회로 "exception was never retrieved" 경고도 방지
+            if not task.cancelled() and task.exception() is not None:
+                self.errors += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.executions + self.shared
+            return {
+                "name": self.name,
+                "in_flight": len(self._sync_calls) + len(self._async_calls),
+                "executions": self.executions,
+                "shared": self.shared,  # 병합되어 절약된 업스트림 호출 수
+                "errors": self.errors,
+                "saved_ratio": self.shared / total if total else 0.0,
+            }
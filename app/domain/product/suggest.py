@@ -0,0 +1,258 @@
+"""
+검색어 자동완성용 프로세스 내 접두사 색인
+
+- 검색 결과가 있었던 검색어와 즐겨찾기 상품명(브랜드 + 상품명 앞부분)을 후보로 사용
+- 한글은 자모 단위로 분해하여 비교 (입력 중인 "삼서" 가 "삼성" 과, "달" 이 "닭" 과 접두사로 일치)
+  겹받침/이중모음도 나누어 입력 순서와 같게 맞춤
+- 후보의 각 단어 시작 위치(최대 WORD_STARTS 개)를 키로 하는 정렬 배열 + bisect 로 접두사 범위 조회
+- 새 후보는 정렬된 대기 목록에 넣고(조회도 bisect), 일정 크기가 되면 별도 스레드에서 정렬 배열과
+  병합하여 교체 (전체 재정렬 없음, 병합 중에도 조회/추가는 락을 오래 잡지 않음)
+- 범위 안에서 인기도(검색 횟수 / 즐겨찾기 수) 상위 limit 개 반환
+  범위가 넓은 접두사는 병합 때 상위 후보를 미리 계산해 두어 짧은 입력도 범위 전체를 훑지 않음
+  (인기도만 바뀐 경우에도 refresh_seconds 마다 다시 계산)
+- 후보 수는 max_terms 로 제한 (넘으면 인기도 낮은 후보부터 제거)
+"""
+import heapq
+import threading
+import time
+from bisect import bisect_left, insort
+from typing import Any, Dict, List, Optional, Tuple
+
+# 후보 종류
+SUGGEST_QUERY = "query"
+SUGGEST_PRODUCT = "product"
+
+# 후보 하나당 키로 만드는 단어 시작 위치 수 ("삼성 무선 청소기" -> 삼성.., 무선.., 청소기)
+WORD_STARTS = 4
+
+# 접두사 범위가 이보다 넓으면 병합 때 상위 후보를 미리 계산 (짧은 입력 "ㅅ", 인기 브랜드 등)
+HOT_MIN_RANGE = 256
+# 미리 계산하는 상위 후보 수 (조회 limit 최대값)
+HOT_LIMIT = 20
+
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONGSEONG = " ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ"
+# 겹받침 / 이중모음을 입력 순서대로 분해
+_COMPOUND = {
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ",
+    "ㄽ": "ㄹㅅ", "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+}
+
+
+def _build_jamo_table() -> Dict[int, str]:
+    def split(jamo: str) -> str:
+        return _COMPOUND.get(jamo, jamo)
+
+    table = {ord(jamo): parts for jamo, parts in _COMPOUND.items()}
+    for code in range(11172):
+        lead, rest = divmod(code, 588)
+        vowel, tail = divmod(rest, 28)
+        table[0xAC00 + code] = (
+            _CHOSEONG[lead] + split(_JUNGSEONG[vowel]) + (split(_JONGSEONG[tail]) if tail else "")
+        )
+    return table
+
+
+_JAMO_TABLE = _build_jamo_table()
+
+
+def normalize_query(text: str) -> str:
+    """검색 캐시 키와 같은 정규화 (공백/대소문자)"""
+    return " ".join(text.split()).lower()
+
+
+def to_jamo(text: str) -> str:
+    """한글 음절을 자모로 분해 (그 외 문자는 그대로)"""
+    return text.translate(_JAMO_TABLE)
+
+
+def _keys(term: str) -> List[str]:
+    keys = [to_jamo(term)]
+    words = term.split(" ")
+    offset = 0
+    for word in words[:-1][: WORD_STARTS - 1]:
+        offset += len(word) + 1
+        keys.append(to_jamo(term[offset:]))
+    return keys
+
+
+class SuggestIndex:
+    def __init__(
+        self, max_terms: int, merge_threshold: int, refresh_seconds: float = 60.0
+    ) -> None:
+        self.max_terms = max_terms
+        self.merge_threshold = merge_threshold
+        self.refresh_seconds = refresh_seconds
+        # 후보 -> (인기도, 종류)
+        self._terms: Dict[str, Tuple[float, str]] = {}
+        # 정렬된 (자모 키, 후보) 병렬 배열
+        self._sorted_keys: List[str] = []
+        self._sorted_terms: List[str] = []
+        # 아직 병합되지 않은 (자모 키, 후보) 정렬 목록 / 병합 중인 목록
+        self._pending: List[Tuple[str, str]] = []
+        self._merging: List[Tuple[str, str]] = []
+        self._merge_running = False
+        self._merged_at = time.monotonic()
+        self._dirty = False
+        # 넓은 접두사 -> 병합 시점 인기도 상위 후보
+        self._hot: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+        self.merges = 0
+        self.rebuilds = 0
+        self.lookups = 0
+        self.hot_hits = 0
+
+    def add(self, term: str, weight: float = 1.0, kind: str = SUGGEST_QUERY) -> None:
+        """후보 추가 또는 인기도 가산 (검색어와 상품명이 같으면 검색어로 표시)"""
+        term = normalize_query(term)
+        if not term:
+            return
+        with self._lock:
+            if self._add(term, weight, kind):
+                for entry in ((key, term) for key in _keys(term)):
+                    insort(self._pending, entry)
+            if len(self._pending) >= max(self.merge_threshold, len(self._sorted_keys) // 8) or (
+                self._dirty and time.monotonic() - self._merged_at >= self.refresh_seconds
+            ):
+                self._start_merge()
+
+    def add_many(self, terms: List[Tuple[str, float, str]]) -> None:
+        """(후보, 인기도, 종류) 목록을 한 번에 추가하고 병합이 끝날 때까지 대기 (시작 시 적재용)"""
+        with self._lock:
+            for term, weight, kind in terms:
+                term = normalize_query(term)
+                if term and self._add(term, weight, kind):
+                    self._pending.extend((key, term) for key in _keys(term))
+            self._pending.sort()
+            merge = self._start_merge()
+        if merge is not None:
+            merge.join()
+
+    def _add(self, term: str, weight: float, kind: str) -> bool:
+        # 락을 잡은 상태에서만 호출. 새 후보면 True
+        self._dirty = True
+        current = self._terms.get(term)
+        if current is None:
+            self._terms[term] = (weight, kind)
+            return True
+        score, current_kind = current
+        self._terms[term] = (
+            score + weight,
+            SUGGEST_QUERY if SUGGEST_QUERY in (kind, current_kind) else current_kind,
+        )
+        return False
+
+    def _start_merge(self) -> Optional[threading.Thread]:
+        # 락을 잡은 상태에서만 호출. 병합은 락 밖(별도 스레드)에서 실행하여 조회를 막지 않음
+        if self._merge_running:
+            return None
+        self._merge_running = True
+        self._dirty = False
+        self._merging, self._pending = self._pending, []
+        merge = threading.Thread(target=self._merge, name="suggest-merge", daemon=True)
+        merge.start()
+        return merge
+
+    def _merge(self) -> None:
+        try:
+            with self._lock:
+                rebuild = len(self._terms) > self.max_terms
+                if rebuild:
+                    # 인기도 하위 후보를 정리하여 max_terms 의 90% 까지 줄이고 전체 재정렬
+                    kept = heapq.nlargest(
+                        int(self.max_terms * 0.9), self._terms.items(), key=lambda item: item[1][0]
+                    )
+                    self._terms = dict(kept)
+                    terms = list(self._terms)
+                sorted_keys, sorted_terms = self._sorted_keys, self._sorted_terms
+                merging = self._merging
+
+            if rebuild:
+                entries = sorted((key, term) for term in terms for key in _keys(term))
+            else:
+                entries = list(heapq.merge(zip(sorted_keys, sorted_terms), merging))
+            keys = [key for key, _ in entries]
+            values = [term for _, term in entries]
+            hot = self._build_hot(keys, values)
+
+            with self._lock:
+                self._sorted_keys, self._sorted_terms = keys, values
+                self._merging = []
+                self._hot = hot
+                self._merged_at = time.monotonic()
+                if rebuild:
+                    self.rebuilds += 1
+                else:
+                    self.merges += 1
+        finally:
+            with self._lock:
+                self._merge_running = False
+
+    def _build_hot(self, keys: List[str], values: List[str]) -> Dict[str, List[str]]:
+        """
+        범위가 HOT_MIN_RANGE 이상인 접두사별 상위 HOT_LIMIT 후보
+        길이 1 접두사부터 넓은 범위 안에서만 한 글자씩 늘려가며 나눔
+        """
+        def score(term: str) -> float:
+            found = self._terms.get(term)
+            return found[0] if found else 0.0
+
+        hot: Dict[str, List[str]] = {}
+        ranges = [(0, len(keys))]
+        length = 1
+        while ranges:
+            wide = []
+            for low, high in ranges:
+                while low < high:
+                    if len(keys[low]) < length:
+                        low += 1
+                        continue
+                    prefix = keys[low][:length]
+                    end = bisect_left(keys, prefix + "\uffff", low, high)
+                    if end - low >= HOT_MIN_RANGE:
+                        hot[prefix] = heapq.nlargest(HOT_LIMIT, set(values[low:end]), key=score)
+                        wide.append((low, end))
+                    low = end
+            ranges = wide
+            length += 1
+        return hot
+
+    def suggest(self, prefix: str, limit: int = 10) -> List[Tuple[str, float, str]]:
+        """(후보, 인기도, 종류) 인기도 내림차순"""
+        key = to_jamo(normalize_query(prefix))
+        if not key:
+            return []
+        end = key + "\uffff"
+        with self._lock:
+            self.lookups += 1
+            hot = self._hot.get(key)
+            if hot is not None:
+                self.hot_hits += 1
+                candidates = set(hot)
+            else:
+                low = bisect_left(self._sorted_keys, key)
+                high = bisect_left(self._sorted_keys, end, low)
+                candidates = set(self._sorted_terms[low:high])
+            for entries in (self._merging, self._pending):
+                low = bisect_left(entries, (key,))
+                high = bisect_left(entries, (end,), low)
+                candidates.update(term for _, term in entries[low:high])
+            # 재정렬 중에는 정리된 후보가 배열에 남아 있을 수 있음
+            scored = [(term, self._terms[term]) for term in candidates if term in self._terms]
+            top = heapq.nlargest(limit, scored, key=lambda item: (item[1][0], item[0]))
+            return [(term, score, kind) for term, (score, kind) in top]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "terms": len(self._terms),
+                "keys": len(self._sorted_keys),
+                "pending": len(self._pending) + len(self._merging),
+                "merges": self.merges,
+                "rebuilds": self.rebuilds,
+                "lookups": self.lookups,
+                "hot_prefixes": len(self._hot),
+                "hot_hits": self.hot_hits,
+            }
@@ -1,6 +1,7 @@
 import secrets
-from typing import List, Optional
+from typing import Dict, List, Optional
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.domain.room.models import Room, RoomParticipant
@@ -89,15 +90,14 @@ class RoomRepository:
         )
 
     @staticmethod
-    def list_by_source_product(db: Session, source: str, source_product_id: str) -> List[Room]:
-        """같은 원본 상품(source + source_product_id)의 OPEN 상태 PRODUCT_LADDER 방 목록 조회"""
+    def list_by_catalog_product(db: Session, catalog_product_id: int) -> List[Room]:
+        """같은 원본 상품(catalog_products)의 OPEN 상태 PRODUCT_LADDER 방 목록 조회"""
         from app.domain.product.models import Product
         return (
             db.query(Room)
             .join(Product, Room.product_id == Product.id)
             .filter(
-                Product.source == source,
-                Product.source_product_id == source_product_id,
+                Product.catalog_product_id == catalog_product_id,
                 Room.status == "OPEN",
                 Room.room_type == "PRODUCT_LADDER",
             )
@@ -231,6 +231,22 @@ class RoomParticipantRepository:
             .count()
         )
 
+    @staticmethod
+    def count_joined_by_rooms(db: Session, room_ids: List[int]) -> Dict[int, int]:
+        """방 목록의 JOINED 참여자 수 (GROUP BY room_id 한 번, 참여자가 없는 방은 제외)"""
+        if not room_ids:
+            return {}
+        rows = (
+            db.query(RoomParticipant.room_id, func.count(RoomParticipant.id))
+            .filter(
+                RoomParticipant.room_id.in_(room_ids),
+                RoomParticipant.state == "JOINED",
+            )
+            .group_by(RoomParticipant.room_id)
+            .all()
+        )
+        return dict(rows)
+
     @staticmethod
     def count_ready(db: Session, room_id: int) -> int:
         return (
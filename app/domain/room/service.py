@@ -221,16 +221,20 @@ class RoomService:
 
         return response
 
-    def _to_room_response(self, db: Session, room: Room) -> RoomResponse:
-        """Room 객체를 RoomResponse로 변환 (참여자 수 포함)"""
-        response = RoomResponse.model_validate(room)
-        response.current_participant_count = self.participant_repository.count_joined(db, room.id)
-        return response
+    def _to_room_responses(self, db: Session, rooms: List[Room]) -> List[RoomResponse]:
+        """Room 목록을 RoomResponse로 변환 (참여자 수는 방 개수와 관계없이 쿼리 1회)"""
+        counts = self.participant_repository.count_joined_by_rooms(db, [room.id for room in rooms])
+        responses = []
+        for room in rooms:
+            response = RoomResponse.model_validate(room)
+            response.current_participant_count = counts.get(room.id, 0)
+            responses.append(response)
+        return responses
 
     def list_my_rooms(self, db: Session, user_id: int) -> List[RoomResponse]:
         """내가 만든 방 목록 (WISHLIST_GIFT + PRODUCT_LADDER 모두 포함)"""
         rooms = self.room_repository.list_by_owner(db, user_id)
-        return [self._to_room_response(db, room) for room in rooms]
+        return self._to_room_responses(db, rooms)
 
     def list_friend_rooms(self, db: Session, user_id: int) -> List[RoomResponse]:
         """친구들의 OPEN 상태 방 목록"""
@@ -242,12 +246,12 @@ class RoomService:
             return []
 
         rooms = self.room_repository.list_open_rooms_for_friend(db, friend_user_ids)
-        return [self._to_room_response(db, room) for room in rooms]
+        return self._to_room_responses(db, rooms)
 
     def list_participating_rooms(self, db: Session, user_id: int) -> List[RoomResponse]:
         """내가 참여 중인 방 목록 (내가 만든 방 제외)"""
         rooms = self.participant_repository.list_rooms_by_participant(db, user_id)
-        return [self._to_room_response(db, room) for room in rooms]
+        return self._to_room_responses(db, rooms)
 
     def list_rooms_by_friend(self, db: Session, user_id: int, friend_user_id: int) -> List[RoomResponse]:
         """특정 친구의 OPEN 상태 방 목록"""
@@ -259,25 +263,25 @@ class RoomService:
             raise ForbiddenException(message="Not a friend")
 
         rooms = self.room_repository.list_by_friend(db, friend_user_id)
-        return [self._to_room_response(db, room) for room in rooms]
+        return self._to_room_responses(db, rooms)
 
     def list_rooms_by_product(self, db: Session, product_id: int) -> List[RoomResponse]:
         """특정 상품의 OPEN 상태 PRODUCT_LADDER 방 목록"""
         rooms = self.room_repository.list_by_product(db, product_id)
-        return [self._to_room_response(db, room) for room in rooms]
+        return self._to_room_responses(db, rooms)
 
     def list_rooms_by_source_product(self, db: Session, product_id: int) -> List[RoomResponse]:
         """같은 네이버 상품(source_product_id)의 모든 OPEN 상태 PRODUCT_LADDER 방 목록"""
         from app.domain.product.models import Product
 
-        # product_id로 source, source_product_id 조회
+        # product_id로 원본 상품(catalog_product_id) 조회
         product = db.query(Product).filter(Product.id == product_id).first()
         if not product:
             return []
 
-        # source_product_id로 방 검색
-        rooms = self.room_repository.list_by_source_product(db, product.source, product.source_product_id)
-        return [self._to_room_response(db, room) for room in rooms]
+        # 같은 원본 상품을 즐겨찾기한 모든 사용자의 방 검색
+        rooms = self.room_repository.list_by_catalog_product(db, product.catalog_product_id)
+        return self._to_room_responses(db, rooms)
 
     def join_room(self, db: Session, user_id: int, room_id: int) -> ParticipantResponse:
         """방 입장 - 비관적 락으로 동시성 제어"""
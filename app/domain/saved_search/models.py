@@ -0,0 +1,69 @@
+from datetime import datetime
+from sqlalchemy import Column, BigInteger, String, Text, Integer, DateTime, ForeignKey, Index, LargeBinary, UniqueConstraint
+from app.core.database import Base
+
+# 직전 스냅샷에 없던 상품
+DELTA_NEW = "new"
+# 직전 스냅샷보다 가격이 내려간 상품
+DELTA_CHEAPER = "cheaper"
+
+
+class SavedSearch(Base):
+    """사용자가 등록한 저장 검색 (검색어 + 정렬)"""
+
+    __tablename__ = "saved_searches"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    user_id = Column(BigInteger, ForeignKey("users.id"), nullable=False, index=True)
+    query = Column(String(100), nullable=False)
+    # 공백/대소문자 정규화한 검색어 (같은 검색은 사용자가 달라도 한 번만 실행)
+    query_key = Column(String(100), nullable=False)
+    sort = Column(String(10), nullable=False, default="sim")
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        UniqueConstraint("user_id", "query_key", "sort", name="uq_saved_searches_user_query"),
+        Index("ix_saved_searches_query", "query_key", "sort"),
+    )
+
+
+class SavedSearchState(Base):
+    """(검색어, 정렬)별 마지막 실행 결과 스냅샷 {productId: lprice}"""
+
+    __tablename__ = "saved_search_states"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    query_key = Column(String(100), nullable=False)
+    sort = Column(String(10), nullable=False)
+    # parser.dumps({productId: lprice})
+    snapshot = Column(LargeBinary, nullable=False)
+    checked_at = Column(DateTime, nullable=False, index=True)
+
+    __table_args__ = (
+        UniqueConstraint("query_key", "sort", name="uq_saved_search_states_query"),
+    )
+
+
+class SavedSearchDelta(Base):
+    """직전 스냅샷 대비 새로 나타났거나 가격이 내려간 상품 (저장 검색을 공유하는 사용자 모두가 조회)"""
+
+    __tablename__ = "saved_search_deltas"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    query_key = Column(String(100), nullable=False)
+    sort = Column(String(10), nullable=False)
+    kind = Column(String(10), nullable=False)  # new | cheaper
+    source = Column(String(20), nullable=False)
+    source_product_id = Column(String(64), nullable=False)
+    title = Column(String(255), nullable=False)
+    image_url = Column(Text)
+    link_url = Column(Text)
+    mall_name = Column(String(120))
+    price = Column(Integer, nullable=False)
+    previous_price = Column(Integer)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
+
+    __table_args__ = (
+        # 저장 검색별 keyset 페이지네이션 (query_key, sort, created_at DESC, id DESC)
+        Index("ix_saved_search_deltas_query_created", "query_key", "sort", "created_at", "id"),
+    )
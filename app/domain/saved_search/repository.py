@@ -0,0 +1,162 @@
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import Session
+
+from app.common.pagination import paginate_keyset
+from app.domain.saved_search.models import SavedSearch, SavedSearchDelta, SavedSearchState
+
+# (정규화한 검색어, 정렬)
+QueryKey = Tuple[str, str]
+
+
+class SavedSearchRepository:
+    @staticmethod
+    def get_for_user(db: Session, user_id: int, saved_search_id: int) -> Optional[SavedSearch]:
+        return (
+            db.query(SavedSearch)
+            .filter(SavedSearch.id == saved_search_id, SavedSearch.user_id == user_id)
+            .first()
+        )
+
+    @staticmethod
+    def get_by_query(db: Session, user_id: int, query_key: str, sort: str) -> Optional[SavedSearch]:
+        return (
+            db.query(SavedSearch)
+            .filter(
+                SavedSearch.user_id == user_id,
+                SavedSearch.query_key == query_key,
+                SavedSearch.sort == sort,
+            )
+            .first()
+        )
+
+    @staticmethod
+    def list_by_user(db: Session, user_id: int) -> List[SavedSearch]:
+        return (
+            db.query(SavedSearch)
+            .filter(SavedSearch.user_id == user_id)
+            .order_by(SavedSearch.created_at.desc(), SavedSearch.id.desc())
+            .all()
+        )
+
+    @staticmethod
+    def count_by_user(db: Session, user_id: int) -> int:
+        return db.query(SavedSearch).filter(SavedSearch.user_id == user_id).count()
+
+    @staticmethod
+    def create(db: Session, **fields) -> SavedSearch:
+        saved_search = SavedSearch(**fields)
+        db.add(saved_search)
+        db.commit()
+        db.refresh(saved_search)
+        return saved_search
+
+    @staticmethod
+    def delete(db: Session, saved_search: SavedSearch) -> None:
+        db.delete(saved_search)
+        db.commit()
+
+    @staticmethod
+    def list_due_queries(
+        db: Session, checked_before: datetime, limit: int
+    ) -> List[Tuple[str, str, str]]:
+        """
+        실행할 (query_key, sort, 대표 검색어) 목록. 한 번도 실행하지 않은 검색어, 오래 실행하지 않은 순
+        여러 사용자가 저장한 같은 검색어는 한 행으로 묶음
+        """
+        checked_at = func.min(SavedSearchState.checked_at)
+        return (
+            db.query(SavedSearch.query_key, SavedSearch.sort, func.min(SavedSearch.query))
+            .outerjoin(
+                SavedSearchState,
+                and_(
+                    SavedSearchState.query_key == SavedSearch.query_key,
+                    SavedSearchState.sort == SavedSearch.sort,
+                ),
+            )
+            .filter(
+                or_(
+                    SavedSearchState.id.is_(None),
+                    SavedSearchState.checked_at < checked_before,
+                )
+            )
+            .group_by(SavedSearch.query_key, SavedSearch.sort)
+            .order_by(checked_at.is_(None).desc(), checked_at.asc())
+            .limit(limit)
+            .all()
+        )
+
+    @staticmethod
+    def get_states(db: Session, keys: List[QueryKey]) -> Dict[QueryKey, SavedSearchState]:
+        if not keys:
+            return {}
+        rows = (
+            db.query(SavedSearchState)
+            .filter(
+                or_(
+                    *(
+                        and_(SavedSearchState.query_key == query_key, SavedSearchState.sort == sort)
+                        for query_key, sort in keys
+                    )
+                )
+            )
+            .all()
+        )
+        return {(row.query_key, row.sort): row for row in rows}
+
+    @staticmethod
+    def add_states(db: Session, states: List[SavedSearchState]) -> None:
+        db.add_all(states)
+
+    @staticmethod
+    def bulk_create_deltas(db: Session, deltas: List[dict]) -> None:
+        if deltas:
+            db.bulk_insert_mappings(SavedSearchDelta, deltas)
+
+    @staticmethod
+    def commit(db: Session) -> None:
+        db.commit()
+
+    @staticmethod
+    def list_deltas_page(
+        db: Session, saved_search: SavedSearch, cursor: Optional[str], size: int
+    ) -> Tuple[List[SavedSearchDelta], Optional[str]]:
+        """저장 검색 등록 이후의 변화만 최신순으로 (ix_saved_search_deltas_query_created)"""
+        return paginate_keyset(
+            db.query(SavedSearchDelta).filter(
+                SavedSearchDelta.query_key == saved_search.query_key,
+                SavedSearchDelta.sort == saved_search.sort,
+                SavedSearchDelta.created_at >= saved_search.created_at,
+            ),
+            SavedSearchDelta.created_at,
+            SavedSearchDelta.id,
+            cursor,
+            size,
+        )
+
+    @staticmethod
+    def delete_deltas_before(db: Session, before: datetime) -> int:
+        deleted = (
+            db.query(SavedSearchDelta)
+            .filter(SavedSearchDelta.created_at < before)
+            .delete(synchronize_session=False)
+        )
+        db.commit()
+        return deleted
+
+    @staticmethod
+    def delete_orphan_states(db: Session) -> int:
+        """더 이상 아무도 저장하지 않은 검색어의 스냅샷 삭제"""
+        saved = (
+            db.query(SavedSearch.id)
+            .filter(
+                SavedSearch.query_key == SavedSearchState.query_key,
+                SavedSearch.sort == SavedSearchState.sort,
+            )
+            .exists()
+        )
+        deleted = db.query(SavedSearchState).filter(~saved).delete(synchronize_session=False)
+        db.commit()
+        return deleted
@@ -0,0 +1,82 @@
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.common.schemas import BaseResponse, CursorMeta, CursorPagedResponse
+from app.core.auth import get_current_user_id
+from app.core.database import get_db
+from app.domain.saved_search.schemas import (
+    SavedSearchCreate,
+    SavedSearchDeltaResponse,
+    SavedSearchResponse,
+)
+from app.domain.saved_search.service import SavedSearchService
+
+router = APIRouter()
+
+
+@router.post(
+    "",
+    response_model=BaseResponse[SavedSearchResponse],
+    summary="검색 저장",
+    description="검색어와 정렬을 저장하면 주기적으로 다시 검색하여 새로 나온 상품과 가격이 내려간 상품을 기록합니다.",
+)
+def create_saved_search(
+    payload: SavedSearchCreate,
+    db: Session = Depends(get_db),
+    user_id: int = Depends(get_current_user_id),
+):
+    saved_search = SavedSearchService.create(
+        db, user_id=user_id, query=payload.query, sort=payload.sort
+    )
+    return BaseResponse.ok(SavedSearchResponse.model_validate(saved_search))
+
+
+@router.get(
+    "",
+    response_model=BaseResponse[List[SavedSearchResponse]],
+    summary="내 저장 검색 목록",
+)
+def list_saved_searches(
+    db: Session = Depends(get_db),
+    user_id: int = Depends(get_current_user_id),
+):
+    saved_searches = SavedSearchService.list_mine(db, user_id=user_id)
+    return BaseResponse.ok([SavedSearchResponse.model_validate(s) for s in saved_searches])
+
+
+@router.delete(
+    "/{saved_search_id}",
+    response_model=BaseResponse[None],
+    summary="저장 검색 삭제",
+)
+def delete_saved_search(
+    saved_search_id: int,
+    db: Session = Depends(get_db),
+    user_id: int = Depends(get_current_user_id),
+):
+    SavedSearchService.delete(db, user_id=user_id, saved_search_id=saved_search_id)
+    return BaseResponse.ok(None, message="Saved search removed")
+
+
+@router.get(
+    "/{saved_search_id}/deltas",
+    response_model=CursorPagedResponse[SavedSearchDeltaResponse],
+    summary="저장 검색 변화 조회",
+    description="저장한 이후 새로 나타난 상품(new)과 가격이 내려간 상품(cheaper)을 최신순으로 조회합니다. meta.next_cursor 를 cursor 로 넘기면 다음 페이지를 조회합니다.",
+)
+def list_saved_search_deltas(
+    saved_search_id: int,
+    cursor: Optional[str] = Query(None, description="다음 페이지 cursor (첫 페이지는 생략)"),
+    size: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    user_id: int = Depends(get_current_user_id),
+):
+    deltas, next_cursor = SavedSearchService.list_deltas(
+        db, user_id=user_id, saved_search_id=saved_search_id, cursor=cursor, size=size
+    )
+    return CursorPagedResponse(
+        data=[SavedSearchDeltaResponse.model_validate(delta) for delta in deltas],
+        meta=CursorMeta(size=size, next_cursor=next_cursor, has_next=next_cursor is not None),
+    )
@@ -0,0 +1,34 @@
+from datetime import datetime
+from typing import Literal, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class SavedSearchCreate(BaseModel):
+    query: str = Field(..., min_length=1, max_length=100)
+    sort: Literal["sim", "date", "asc", "dsc"] = "sim"
+
+
+class SavedSearchResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    query: str
+    sort: str
+    created_at: datetime
+
+
+class SavedSearchDeltaResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    kind: str = Field(description="new | cheaper")
+    source: str
+    source_product_id: str
+    title: str
+    image_url: Optional[str] = None
+    link_url: Optional[str] = None
+    mall_name: Optional[str] = None
+    price: int
+    previous_price: Optional[int] = None
+    created_at: datetime
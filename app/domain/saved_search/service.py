@@ -0,0 +1,250 @@
+"""
+저장 검색
+
+- 사용자는 검색어 + 정렬을 저장하고, 워커가 주기적으로 다시 검색합니다.
+- 같은 (정규화 검색어, 정렬)은 저장한 사용자 수와 관계없이 주기당 한 번만 검색합니다.
+- 캐시를 거치지 않고 항상 네이버에서 조회 (조회 실패는 캐시 값 대신 실패로 집계하고 스냅샷 유지)
+- 직전 스냅샷 {productId: lprice} 과 비교하여 새로 나타났거나 가격이 내려간 상품만 기록합니다.
+  (첫 실행은 스냅샷만 남기고 기록하지 않음)
+- 사용자는 저장한 이후의 변화 기록만 조회합니다.
+"""
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.exceptions import (
+    BadRequestException,
+    ConflictException,
+    NotFoundException,
+    TooManyRequestsException,
+)
+from app.domain.product import parser
+from app.domain.product.rate_limiter import PRIORITY_SAVED_SEARCH
+from app.domain.product.service import NAVER_MAX_DISPLAY, NaverShoppingService
+from app.domain.saved_search.models import (
+    DELTA_CHEAPER,
+    DELTA_NEW,
+    SavedSearch,
+    SavedSearchDelta,
+    SavedSearchState,
+)
+from app.domain.saved_search.repository import QueryKey, SavedSearchRepository
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_query(query: str) -> str:
+    """검색 캐시 키와 같은 정규화 (공백/대소문자)"""
+    return NaverShoppingService.search_cache_key(query, NAVER_MAX_DISPLAY, 1, "sim")[0]
+
+
+def diff_snapshot(
+    previous: Dict[str, int], items: List[Dict]
+) -> List[Tuple[str, Dict, Optional[int]]]:
+    """(kind, 검색 결과 항목, 이전 가격) 목록. 새 상품 또는 이전보다 싼 상품만"""
+    changes: List[Tuple[str, Dict, Optional[int]]] = []
+    seen = set()
+    for item in items:
+        product_id, price = item["source_product_id"], item["price"]
+        if not price or product_id in seen:
+            continue
+        seen.add(product_id)
+        previous_price = previous.get(product_id)
+        if previous_price is None:
+            changes.append((DELTA_NEW, item, None))
+        elif price < previous_price:
+            changes.append((DELTA_CHEAPER, item, previous_price))
+    return changes
+
+
+def merge_snapshot(previous: Dict[str, int], items: List[Dict], max_items: int) -> Dict[str, int]:
+    """
+    이번 결과 + 이번에 보이지 않은 이전 상품 (max_items 까지)
+    잠시 순위 밖으로 밀려났다 돌아온 상품을 새 상품으로 다시 기록하지 않기 위함
+    """
+    snapshot = {item["source_product_id"]: item["price"] for item in items if item["price"]}
+    for product_id, price in previous.items():
+        if len(snapshot) >= max_items:
+            break
+        snapshot.setdefault(product_id, price)
+    return snapshot
+
+
+class SavedSearchService:
+    @staticmethod
+    def create(db: Session, user_id: int, query: str, sort: str) -> SavedSearch:
+        query = " ".join(query.split())
+        query_key = normalize_query(query)
+        if not query_key:
+            raise BadRequestException(message="Query is empty")
+        if SavedSearchRepository.get_by_query(db, user_id, query_key, sort):
+            raise ConflictException(message="Search already saved")
+        if SavedSearchRepository.count_by_user(db, user_id) >= settings.SAVED_SEARCH_MAX_PER_USER:
+            raise BadRequestException(
+                message=f"Up to {settings.SAVED_SEARCH_MAX_PER_USER} searches can be saved"
+            )
+        return SavedSearchRepository.create(
+            db, user_id=user_id, query=query, query_key=query_key, sort=sort
+        )
+
+    @staticmethod
+    def list_mine(db: Session, user_id: int) -> List[SavedSearch]:
+        return SavedSearchRepository.list_by_user(db, user_id)
+
+    @staticmethod
+    def delete(db: Session, user_id: int, saved_search_id: int) -> None:
+        saved_search = SavedSearchRepository.get_for_user(db, user_id, saved_search_id)
+        if not saved_search:
+            raise NotFoundException(message="Saved search not found")
+        SavedSearchRepository.delete(db, saved_search)
+
+    @staticmethod
+    def list_deltas(
+        db: Session, user_id: int, saved_search_id: int, cursor: Optional[str], size: int
+    ) -> Tuple[List[SavedSearchDelta], Optional[str]]:
+        saved_search = SavedSearchRepository.get_for_user(db, user_id, saved_search_id)
+        if not saved_search:
+            raise NotFoundException(message="Saved search not found")
+        return SavedSearchRepository.list_deltas_page(db, saved_search, cursor, size)
+
+    @staticmethod
+    async def run_batch(
+        db: Session,
+        batch_size: int = settings.SAVED_SEARCH_BATCH_SIZE,
+        concurrency: int = settings.SAVED_SEARCH_CONCURRENCY,
+        interval: float = settings.SAVED_SEARCH_INTERVAL_SECONDS,
+    ) -> Dict:
+        """
+        실행할 때가 된 검색어를 batch_size 개까지 다시 검색하고 변화 기록
+        - 검색 실패한 검색어는 스냅샷을 갱신하지 않아 다음 배치에서 다시 시도
+        - 호출 예산이 부족하면 남은 검색어는 건너뜀
+        """
+        now = datetime.utcnow()
+        due = SavedSearchRepository.list_due_queries(
+            db, checked_before=now - timedelta(seconds=interval), limit=batch_size
+        )
+        states = SavedSearchRepository.get_states(db, [(key, sort) for key, sort, _ in due])
+        semaphore = asyncio.Semaphore(concurrency)
+        results: Dict[QueryKey, List[Dict]] = {}
+        failed = 0
+        budget_exhausted = False
+
+        async def run_one(query_key: str, sort: str, query: str) -> None:
+            nonlocal failed, budget_exhausted
+            async with semaphore:
+                if budget_exhausted:
+                    return
+                try:
+                    # 캐시(stale/fallback)의 오래된 결과를 새로 확인한 결과로 기록하지 않도록 항상 업스트림 조회
+                    result = await NaverShoppingService.search_fresh(
+                        query=query,
+                        display=NAVER_MAX_DISPLAY,
+                        sort=sort,
+                        priority=PRIORITY_SAVED_SEARCH,
+                    )
+                    results[(query_key, sort)] = result["items"]
+                except TooManyRequestsException:
+                    budget_exhausted = True
+                except Exception:
+                    failed += 1
+                    logger.warning("saved search failed: %s (%s)", query, sort, exc_info=True)
+
+        await asyncio.gather(*(run_one(*row) for row in due))
+
+        deltas: List[dict] = []
+        new_states: List[SavedSearchState] = []
+        for (query_key, sort), items in results.items():
+            state = states.get((query_key, sort))
+            previous: Dict[str, int] = parser.loads(state.snapshot) if state else {}
+            if state is not None:
+                deltas.extend(
+                    {
+                        "query_key": query_key,
+                        "sort": sort,
+                        "kind": kind,
+                        "source": item["source"],
+                        "source_product_id": item["source_product_id"],
+                        "title": item["title"][:255],
+                        "image_url": item["image_url"],
+                        "link_url": item["link_url"],
+                        "mall_name": item["mall_name"],
+                        "price": item["price"],
+                        "previous_price": previous_price,
+                        "created_at": now,
+                    }
+                    for kind, item, previous_price in diff_snapshot(previous, items)
+                )
+            snapshot = parser.dumps(
+                merge_snapshot(previous, items, settings.SAVED_SEARCH_SNAPSHOT_MAX_ITEMS)
+            )
+            if state is None:
+                new_states.append(
+                    SavedSearchState(
+                        query_key=query_key, sort=sort, snapshot=snapshot, checked_at=now
+                    )
+                )
+            else:
+                state.snapshot = snapshot
+                state.checked_at = now
+
+        SavedSearchRepository.add_states(db, new_states)
+        SavedSearchRepository.bulk_create_deltas(db, deltas)
+        SavedSearchRepository.commit(db)
+        return {
+            "queries": len(due),
+            "searched": len(results),
+            "failed": failed,
+            "skipped": len(due) - len(results) - failed,
+            "budget_exhausted": budget_exhausted,
+            "deltas": len(deltas),
+        }
+
+    @staticmethod
+    def prune(
+        db: Session, retention_days: int = settings.SAVED_SEARCH_DELTA_RETENTION_DAYS
+    ) -> Dict:
+        """보관 기간이 지난 변화 기록과 아무도 저장하지 않은 검색어 스냅샷 삭제"""
+        return {
+            "deltas": SavedSearchRepository.delete_deltas_before(
+                db, before=datetime.utcnow() - timedelta(days=retention_days)
+            ),
+            "states": SavedSearchRepository.delete_orphan_states(db),
+        }
+
+    @staticmethod
+    async def run_forever(
+        batch_size: int = settings.SAVED_SEARCH_BATCH_SIZE,
+        concurrency: int = settings.SAVED_SEARCH_CONCURRENCY,
+        interval: float = settings.SAVED_SEARCH_INTERVAL_SECONDS,
+        idle_seconds: float = settings.PRICE_REFRESH_INTERVAL_SECONDS,
+    ) -> None:
+        """
+        배치를 반복 실행
+        - 실행할 검색어가 batch_size 만큼 남아 있으면 바로 다음 배치, 아니면 idle_seconds 만큼 대기
+        - 하루에 한 번 오래된 변화 기록 정리
+        """
+        last_pruned_on = None
+        while True:
+            try:
+                db = SessionLocal()
+                try:
+                    result = await SavedSearchService.run_batch(db, batch_size, concurrency, interval)
+                    today = datetime.utcnow().date()
+                    if last_pruned_on != today:
+                        result["pruned"] = SavedSearchService.prune(db)
+                        last_pruned_on = today
+                finally:
+                    db.close()
+            except Exception:
+                logger.exception("saved search batch failed")
+                await asyncio.sleep(idle_seconds)
+                continue
+
+            logger.info("saved search batch: %s", result)
+            if result["budget_exhausted"] or result["queries"] < batch_size:
+                await asyncio.sleep(idle_seconds)
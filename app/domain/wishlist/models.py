@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, BigInteger, String, Integer, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, BigInteger, String, Integer, DateTime, ForeignKey, Index, UniqueConstraint
 from app.core.database import Base
 
 
@@ -11,8 +11,12 @@ class WishlistItem(Base):
     product_id = Column(BigInteger, ForeignKey("products.id"), nullable=False, index=True)
     memo = Column(String(255))
     priority = Column(Integer)
+    # 가격 하락 알림 목표가 (없으면 알림 없음)
+    target_price = Column(Integer)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
 
     __table_args__ = (
         UniqueConstraint("user_id", "product_id", name="uq_wishlist_user_product"),
+        # 위시리스트 keyset 페이지네이션 (user_id, created_at DESC, id DESC)
+        Index("ix_wishlist_user_created", "user_id", "created_at", "id"),
     )
@@ -2,6 +2,7 @@ from typing import List, Optional, Tuple
 
 from sqlalchemy.orm import Session
 
+from app.common.pagination import paginate_keyset
 from app.domain.product.models import Product
 from app.domain.product.models import Product
 from app.domain.wishlist.models import WishlistItem
@@ -30,18 +31,56 @@ class WishlistRepository:
             .all()
         )
 
+    @staticmethod
+    def list_items_with_product_page(
+        db: Session, user_id: int, cursor: Optional[str], size: int
+    ) -> Tuple[List[Tuple[WishlistItem, Product]], Optional[str]]:
+        """최근 추가 순 keyset 페이지 (ix_wishlist_user_created)"""
+        return paginate_keyset(
+            db.query(WishlistItem, Product)
+            .join(Product, WishlistItem.product_id == Product.id)
+            .filter(WishlistItem.user_id == user_id),
+            WishlistItem.created_at,
+            WishlistItem.id,
+            cursor,
+            size,
+            key=lambda row: (row[0].created_at, row[0].id),
+        )
+
+    @staticmethod
+    def count_by_user(db: Session, user_id: int) -> int:
+        return db.query(WishlistItem).filter(WishlistItem.user_id == user_id).count()
+
     @staticmethod
     def create(
-        db: Session, user_id: int, product_id: int, memo: str | None, priority: int | None
+        db: Session,
+        user_id: int,
+        product_id: int,
+        memo: str | None,
+        priority: int | None,
+        target_price: int | None = None,
     ) -> WishlistItem:
         item = WishlistItem(
-            user_id=user_id, product_id=product_id, memo=memo, priority=priority
+            user_id=user_id,
+            product_id=product_id,
+            memo=memo,
+            priority=priority,
+            target_price=target_price,
         )
         db.add(item)
         db.commit()
         db.refresh(item)
         return item
 
+    @staticmethod
+    def update_target_price(
+        db: Session, item: WishlistItem, target_price: int | None
+    ) -> WishlistItem:
+        item.target_price = target_price
+        db.commit()
+        db.refresh(item)
+        return item
+
     @staticmethod
     def delete(db: Session, item: WishlistItem) -> None:
         db.delete(item)
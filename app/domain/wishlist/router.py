@@ -1,11 +1,12 @@
-from typing import List
+from typing import Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
-from app.common.schemas import BaseResponse
+from app.common.schemas import BaseResponse, CursorMeta, CursorPagedResponse
 from app.core.database import get_db
 from app.core.auth import get_current_user_id
+from app.domain.alert.schemas import TargetPriceUpdate
 from app.domain.wishlist.schemas import WishlistCreate, WishlistItemResponse
 from app.domain.wishlist.service import WishlistService
 
@@ -15,16 +16,29 @@ service = WishlistService()
 
 @router.get(
     "",
-    response_model=BaseResponse[List[WishlistItemResponse]],
+    response_model=CursorPagedResponse[WishlistItemResponse],
     summary="내 위시리스트 조회",
-    description="로그인한 사용자의 위시리스트 전체 목록을 조회합니다.",
+    description="로그인한 사용자의 위시리스트를 최근 추가 순으로 조회합니다. size 를 지정하면 페이지 단위로 반환하며 meta.next_cursor 를 cursor 로 넘기면 다음 페이지를 조회합니다. size 를 생략하면 전체 목록을 반환합니다.",
 )
 def list_my_wishlist(
+    cursor: Optional[str] = Query(None, description="다음 페이지 cursor (첫 페이지는 생략)"),
+    size: Optional[int] = Query(None, ge=1, le=100, description="페이지 크기 (생략 시 전체)"),
+    include_total: bool = Query(False, description="전체 개수 포함 여부"),
     db: Session = Depends(get_db),
     user_id: int = Depends(get_current_user_id),
 ):
-    items = service.list_my_wishlist(db, user_id=user_id)
-    return BaseResponse.ok(items)
+    items, next_cursor, total_items = service.list_my_wishlist(
+        db, user_id=user_id, cursor=cursor, size=size, include_total=include_total
+    )
+    return CursorPagedResponse(
+        data=items,
+        meta=CursorMeta(
+            size=size or len(items),
+            next_cursor=next_cursor,
+            has_next=next_cursor is not None,
+            total_items=total_items,
+        ),
+    )
 
 
 @router.post(
@@ -42,6 +56,24 @@ def add_to_wishlist(
     return BaseResponse.ok(item)
 
 
+@router.patch(
+    "/{product_id}/target-price",
+    response_model=BaseResponse[WishlistItemResponse],
+    summary="위시리스트 목표가 설정",
+    description="가격이 목표가 아래로 내려가면 알림을 받습니다. target_price 를 null 로 보내면 알림을 해제합니다.",
+)
+def update_wishlist_target_price(
+    product_id: int,
+    payload: TargetPriceUpdate,
+    db: Session = Depends(get_db),
+    user_id: int = Depends(get_current_user_id),
+):
+    item = service.update_target_price(
+        db, user_id=user_id, product_id=product_id, target_price=payload.target_price
+    )
+    return BaseResponse.ok(item)
+
+
 @router.delete(
     "/{product_id}",
     response_model=BaseResponse[None],
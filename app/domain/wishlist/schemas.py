@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class WishlistProductResponse(BaseModel):
@@ -29,6 +29,7 @@ class WishlistItemResponse(BaseModel):
     product_id: int
     memo: Optional[str] = None
     priority: Optional[int] = None
+    target_price: Optional[int] = None
     created_at: datetime
     product: Optional[WishlistProductResponse] = None
 
@@ -41,3 +42,4 @@ class WishlistCreate(BaseModel):
     product_id: int
     memo: Optional[str] = None
     priority: Optional[int] = None
+    target_price: Optional[int] = Field(default=None, ge=1)
@@ -1,4 +1,4 @@
-﻿from typing import List
+﻿from typing import List, Optional, Tuple
 
 from sqlalchemy.orm import Session
 
@@ -23,33 +23,61 @@ class WishlistService:
         self.friend_repository = friend_repository or FriendRepository()
 
     def list_friend_wishlist(
-        self, db: Session, requester_id: int, friend_user_id: int
-    ) -> List[WishlistItemResponse]:
+        self,
+        db: Session,
+        requester_id: int,
+        friend_user_id: int,
+        cursor: Optional[str] = None,
+        size: Optional[int] = None,
+        include_total: bool = False,
+    ) -> Tuple[List[WishlistItemResponse], Optional[str], Optional[int]]:
         relation = self.friend_repository.get_by_owner_and_friend(
             db, owner_user_id=requester_id, friend_user_id=friend_user_id
         )
         if not relation:
             raise ForbiddenException(message="Not a friend")
 
-        rows = self.wishlist_repository.list_items_with_product(
-            db, user_id=friend_user_id
-        )
+        return self._list_items(db, friend_user_id, cursor, size, include_total)
 
-        items: List[WishlistItemResponse] = []
-        for wishlist_item, product in rows:
-            item = WishlistItemResponse.model_validate(wishlist_item)
-            item.product = WishlistProductResponse.model_validate(product)
-            items.append(item)
-        return items
+    def list_my_wishlist(
+        self,
+        db: Session,
+        user_id: int,
+        cursor: Optional[str] = None,
+        size: Optional[int] = None,
+        include_total: bool = False,
+    ) -> Tuple[List[WishlistItemResponse], Optional[str], Optional[int]]:
+        return self._list_items(db, user_id, cursor, size, include_total)
+
+    def _list_items(
+        self,
+        db: Session,
+        user_id: int,
+        cursor: Optional[str],
+        size: Optional[int],
+        include_total: bool,
+    ) -> Tuple[List[WishlistItemResponse], Optional[str], Optional[int]]:
+        """
+        (목록, 다음 cursor, 전체 개수)
+        size 가 없으면 이전처럼 전체 목록, 전체 개수는 include_total 일 때만 조회
+        """
+        if size is None:
+            rows = self.wishlist_repository.list_items_with_product(db, user_id=user_id)
+            next_cursor = None
+        else:
+            rows, next_cursor = self.wishlist_repository.list_items_with_product_page(
+                db, user_id=user_id, cursor=cursor, size=size
+            )
+        total_items = (
+            self.wishlist_repository.count_by_user(db, user_id=user_id) if include_total else None
+        )
 
-    def list_my_wishlist(self, db: Session, user_id: int) -> List[WishlistItemResponse]:
-        rows = self.wishlist_repository.list_items_with_product(db, user_id=user_id)
         items: List[WishlistItemResponse] = []
         for wishlist_item, product in rows:
             item = WishlistItemResponse.model_validate(wishlist_item)
             item.product = WishlistProductResponse.model_validate(product)
             items.append(item)
-        return items
+        return items, next_cursor, total_items
 
     def add_to_wishlist(
         self, db: Session, user_id: int, payload: WishlistCreate
@@ -74,11 +102,24 @@ class WishlistService:
             product_id=payload.product_id,
             memo=payload.memo,
             priority=payload.priority,
+            target_price=payload.target_price,
         )
         response = WishlistItemResponse.model_validate(item)
         response.product = WishlistProductResponse.model_validate(product)
         return response
 
+    def update_target_price(
+        self, db: Session, user_id: int, product_id: int, target_price: int | None
+    ) -> WishlistItemResponse:
+        item = self.wishlist_repository.get_by_user_and_product(
+            db, user_id=user_id, product_id=product_id
+        )
+        if not item:
+            raise NotFoundException(message="Wishlist item not found")
+
+        item = self.wishlist_repository.update_target_price(db, item, target_price)
+        return WishlistItemResponse.model_validate(item)
+
     def remove_from_wishlist(self, db: Session, user_id: int, product_id: int) -> None:
         item = self.wishlist_repository.get_by_user_and_product(
             db, user_id=user_id, product_id=product_id
@@ -1,7 +1,10 @@
+import asyncio
+from contextlib import asynccontextmanager
 from itertools import product
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.concurrency import run_in_threadpool
 
 from app.core.config import settings
 from app.core.exceptions import BaseAPIException, api_exception_handler
@@ -10,6 +13,42 @@ from app.domain.friend.router import router as friend_router
 from app.domain.wishlist.router import router as wishlist_router
 from app.domain.room.router import router as room_router
 from app.domain.product.router import router as product_router
+from app.domain.alert.router import router as alert_router
+from app.domain.saved_search.router import router as saved_search_router
+from app.domain.price_history.service import PriceHistoryService
+from app.domain.product.naver_client import naver_client
+from app.domain.product.service import (
+    NaverShoppingService,
+    SuggestService,
+    search_cache,
+    search_disk_cache,
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 디스크 캐시에 남아 있는 검색 결과를 인메모리 캐시로 미리 적재
+    await run_in_threadpool(
+        search_disk_cache.warm, search_cache, settings.SEARCH_DISK_CACHE_WARM_LIMIT
+    )
+    # 즐겨찾기가 많은 상품명을 자동완성 후보로 적재
+    await run_in_threadpool(SuggestService.load_with_session)
+    # 검색 중 본 즐겨찾기 상품 가격을 주기적으로 가격 이력에 기록
+    history_flush = asyncio.create_task(PriceHistoryService.flush_periodically())
+    # 많이 검색되는 검색어의 캐시를 만료 전에 미리 갱신
+    search_warm = None
+    if settings.SEARCH_WARM_ENABLED:
+        search_warm = asyncio.create_task(NaverShoppingService.warm_periodically())
+    yield
+    history_flush.cancel()
+    if search_warm is not None:
+        search_warm.cancel()
+    await run_in_threadpool(PriceHistoryService.flush_with_session)
+    # 종료 시 네이버 API 커넥션 풀 정리
+    await naver_client.aclose()
+    # 대기 중인 디스크 캐시 쓰기 반영 후 연결 정리
+    await run_in_threadpool(search_disk_cache.close)
+
 
 def create_app() -> FastAPI:
     app = FastAPI(
@@ -17,6 +56,7 @@ def create_app() -> FastAPI:
         version=settings.APP_VERSION,
         docs_url="/docs" if settings.DEBUG else None,
         redoc_url="/redoc" if settings.DEBUG else None,
+        lifespan=lifespan,
     )
 
     # CORS middleware
@@ -42,6 +82,10 @@ def create_app() -> FastAPI:
     app.include_router(wishlist_router, prefix="/api/v1/wishlist", tags=["Wishlist"])
     app.include_router(room_router, prefix="/api/v1/rooms", tags=["Rooms"])
     app.include_router(product_router)
+    app.include_router(alert_router, prefix="/api/v1/alerts", tags=["Alerts"])
+    app.include_router(
+        saved_search_router, prefix="/api/v1/saved-searches", tags=["Saved Searches"]
+    )
     return app
 
 
@@ -0,0 +1,172 @@
+"""
+백그라운드 워커 진입점 (API 프로세스와 별도로 실행)
+
+사용법:
+    python -m app.worker price-refresh            # 즐겨찾기 상품 가격 갱신 (계속 실행)
+    python -m app.worker price-refresh --once     # 배치 1회 실행 후 종료
+    python -m app.worker price-history-downsample # 오래된 가격 이력 일별 최소/최대로 축소
+    python -m app.worker catalog-migrate {expand,backfill,report,contract}
+    python -m app.worker alert-migrate            # 목표가 컬럼 / price_alert_events 생성
+    python -m app.worker pagination-index-migrate # 목록 cursor 페이지네이션용 복합 인덱스 생성
+    python -m app.worker saved-search             # 저장 검색 변화 기록 (계속 실행)
+    python -m app.worker saved-search --once      # 배치 1회 실행 후 종료
+"""
+import argparse
+import asyncio
+import json
+import logging
+
+from app.common.index_migration import PaginationIndexMigration
+from app.core.config import settings
+from app.core.database import SessionLocal, engine
+from app.domain.alert.migration import AlertMigration
+from app.domain.alert.service import AlertService
+from app.domain.price_history.service import PriceHistoryService
+from app.domain.product.catalog_migration import CatalogMigration
+from app.domain.product.naver_client import naver_client
+from app.domain.product.price_refresh import PriceRefreshService
+from app.domain.saved_search.service import SavedSearchService
+
+logger = logging.getLogger("app.worker")
+
+
+async def price_refresh(args: argparse.Namespace) -> None:
+    try:
+        if args.once:
+            db = SessionLocal()
+            try:
+                result = await PriceRefreshService.refresh_batch(
+                    db,
+                    args.batch_size,
+                    args.concurrency,
+                    args.stale_seconds,
+                    AlertService.build_index(db),
+                )
+            finally:
+                db.close()
+            logger.info("price refresh batch: %s", result)
+        else:
+            await PriceRefreshService.run_forever(
+                args.batch_size, args.concurrency, args.stale_seconds, args.interval
+            )
+    finally:
+        await naver_client.aclose()
+
+
+async def price_history_downsample(args: argparse.Namespace) -> None:
+    db = SessionLocal()
+    try:
+        downsampled = PriceHistoryService.downsample(db, raw_days=args.raw_days)
+    finally:
+        db.close()
+    logger.info("price history downsampled: %s days", downsampled)
+
+
+async def catalog_migrate(args: argparse.Namespace) -> None:
+    if args.step == "expand":
+        CatalogMigration.expand(engine)
+    elif args.step == "contract":
+        CatalogMigration.contract(engine)
+    else:
+        db = SessionLocal()
+        try:
+            if args.step == "backfill":
+                result = CatalogMigration.backfill(db, batch_size=args.batch_size)
+            else:
+                result = CatalogMigration.report(db)
+        finally:
+            db.close()
+        logger.info(
+            "catalog migration %s: %s", args.step, json.dumps(result, ensure_ascii=False, indent=2)
+        )
+
+
+async def alert_migrate(args: argparse.Namespace) -> None:
+    AlertMigration.apply(engine)
+
+
+async def pagination_index_migrate(args: argparse.Namespace) -> None:
+    PaginationIndexMigration.apply(engine)
+
+
+async def saved_search(args: argparse.Namespace) -> None:
+    try:
+        if args.once:
+            db = SessionLocal()
+            try:
+                result = await SavedSearchService.run_batch(
+                    db, args.batch_size, args.concurrency, args.interval
+                )
+            finally:
+                db.close()
+            logger.info("saved search batch: %s", result)
+        else:
+            await SavedSearchService.run_forever(
+                args.batch_size, args.concurrency, args.interval
+            )
+    finally:
+        await naver_client.aclose()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="dopamine 백그라운드 워커")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    refresh = commands.add_parser("price-refresh", help="즐겨찾기 상품 가격 갱신")
+    refresh.add_argument("--once", action="store_true", help="배치 1회 실행 후 종료")
+    refresh.add_argument("--batch-size", type=int, default=settings.PRICE_REFRESH_BATCH_SIZE)
+    refresh.add_argument("--concurrency", type=int, default=settings.PRICE_REFRESH_CONCURRENCY)
+    refresh.add_argument(
+        "--stale-seconds", type=float, default=settings.PRICE_REFRESH_STALE_SECONDS
+    )
+    refresh.add_argument("--interval", type=float, default=settings.PRICE_REFRESH_INTERVAL_SECONDS)
+    refresh.set_defaults(handler=price_refresh)
+
+    downsample = commands.add_parser(
+        "price-history-downsample", help="오래된 가격 이력을 일별 최소/최대로 축소"
+    )
+    downsample.add_argument("--raw-days", type=int, default=settings.PRICE_HISTORY_RAW_DAYS)
+    downsample.set_defaults(handler=price_history_downsample)
+
+    migrate = commands.add_parser(
+        "catalog-migrate", help="사용자별 상품 복사본을 공유 원본 상품(catalog)으로 이전"
+    )
+    migrate.add_argument("step", choices=["expand", "backfill", "report", "contract"])
+    migrate.add_argument("--batch-size", type=int, default=5000)
+    migrate.set_defaults(handler=catalog_migrate)
+
+    alert = commands.add_parser(
+        "alert-migrate", help="목표가 컬럼 / 가격 하락 알림 테이블 생성 (재실행 안전)"
+    )
+    alert.set_defaults(handler=alert_migrate)
+
+    index = commands.add_parser(
+        "pagination-index-migrate",
+        help="즐겨찾기/친구/위시리스트 목록 복합 인덱스 생성 (재실행 안전)",
+    )
+    index.set_defaults(handler=pagination_index_migrate)
+
+    watch = commands.add_parser("saved-search", help="저장 검색 재검색 및 변화 기록")
+    watch.add_argument("--once", action="store_true", help="배치 1회 실행 후 종료")
+    watch.add_argument("--batch-size", type=int, default=settings.SAVED_SEARCH_BATCH_SIZE)
+    watch.add_argument("--concurrency", type=int, default=settings.SAVED_SEARCH_CONCURRENCY)
+    watch.add_argument(
+        "--interval",
+        type=float,
+        default=settings.SAVED_SEARCH_INTERVAL_SECONDS,
+        help="같은 검색어를 다시 검색하는 최소 간격(초)",
+    )
+    watch.set_defaults(handler=saved_search)
+    return parser
+
+
+def main() -> None:
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+    args = build_parser().parse_args()
+    asyncio.run(args.handler(args))
+
+
+if __name__ == "__main__":
+    main()
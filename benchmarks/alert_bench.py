@@ -0,0 +1,100 @@
+"""
+가격 하락 알림 매칭 벤치마크 (합성 구독자 집단)
+
+- scan : 가격 갱신마다 전체 목표가 목록을 훑는 방식
+- index: 상품별 정렬된 목표가 배열에서 이분 탐색 (PriceAlertIndex)
+
+상품 수 / 구독자 수 / 한 주기의 가격 갱신 수를 바꿔 가며
+인덱스 생성 시간과 주기당 매칭 시간, 갱신당 µs 를 출력합니다.
+인기 상품에 구독자가 몰리는 분포를 흉내 내기 위해 일부 구독자는 파레토 분포로 상품을 고릅니다.
+
+사용법:
+    python -m benchmarks.alert_bench --products 20000 --alerts 500000 --updates 5000
+"""
+import argparse
+import random
+import time
+from typing import List, Tuple
+
+from app.domain.alert.index import PriceAlertIndex, ProductKey, Watcher
+
+
+def synthesize(
+    products: int, alerts: int, seed: int
+) -> Tuple[List[Tuple[ProductKey, Watcher]], List[int]]:
+    rng = random.Random(seed)
+    base_prices = [rng.randint(5, 500) * 1000 for _ in range(products)]
+    rows = []
+    for i in range(alerts):
+        # 30% 는 파레토 분포로 일부 인기 상품에 몰리고 나머지는 고르게 분포
+        if rng.random() < 0.3:
+            product = (int(rng.paretovariate(1.2)) * 7919) % products
+        else:
+            product = rng.randrange(products)
+        target = int(base_prices[product] * rng.uniform(0.6, 0.99)) // 100 * 100
+        rows.append((("NAVER", str(product)), Watcher(target, i, i, None)))
+    return rows, base_prices
+
+
+def synthesize_updates(
+    base_prices: List[int], count: int, seed: int
+) -> List[Tuple[ProductKey, int, int]]:
+    rng = random.Random(seed + 1)
+    updates = []
+    for product in rng.sample(range(len(base_prices)), min(count, len(base_prices))):
+        previous = base_prices[product]
+        # 대부분은 소폭 변동, 일부는 큰 폭 하락
+        change = rng.uniform(0.6, 0.95) if rng.random() < 0.1 else rng.uniform(0.97, 1.03)
+        updates.append((("NAVER", str(product)), previous, int(previous * change)))
+    return updates
+
+
+def scan_match(rows, updates) -> int:
+    by_key = {}
+    for key, previous, price in updates:
+        by_key[key] = (previous, price)
+    matched = 0
+    for key, watcher in rows:
+        update = by_key.get(key)
+        if update is not None and update[1] <= watcher.target_price < update[0]:
+            matched += 1
+    return matched
+
+
+def run(args: argparse.Namespace) -> None:
+    rows, base_prices = synthesize(args.products, args.alerts, args.seed)
+    updates = synthesize_updates(base_prices, args.updates, args.seed)
+    print(f"products={args.products} alerts={args.alerts} updates/cycle={len(updates)}")
+
+    started = time.perf_counter()
+    index = PriceAlertIndex.build(rows)
+    build = time.perf_counter() - started
+    print(f"index build  {build * 1000:9.1f}ms  {index.stats()}")
+
+    started = time.perf_counter()
+    for _ in range(args.cycles):
+        indexed = len(index.match_many(updates))
+    indexed_elapsed = (time.perf_counter() - started) / args.cycles
+
+    started = time.perf_counter()
+    for _ in range(args.cycles):
+        scanned = scan_match(rows, updates)
+    scan_elapsed = (time.perf_counter() - started) / args.cycles
+
+    assert indexed == scanned, (indexed, scanned)
+    for name, elapsed in (("scan", scan_elapsed), ("index", indexed_elapsed)):
+        print(
+            f"{name:<6} per_cycle={elapsed * 1000:9.2f}ms "
+            f"per_update={elapsed * 1e6 / len(updates):8.2f}µs matched={indexed}"
+        )
+    print(f"speedup x{scan_elapsed / indexed_elapsed:.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="가격 하락 알림 매칭 벤치마크")
+    parser.add_argument("--products", type=int, default=20000)
+    parser.add_argument("--alerts", type=int, default=500000)
+    parser.add_argument("--updates", type=int, default=5000)
+    parser.add_argument("--cycles", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=13)
+    run(parser.parse_args())
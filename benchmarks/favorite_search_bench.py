@@ -0,0 +1,104 @@
+"""
+즐겨찾기 검색 색인 벤치마크 (합성 즐겨찾기)
+
+사용자 한 명의 즐겨찾기 N 개로 n-gram 색인을 만들고
+색인 생성 시간과 검색어별 지연(p50/p99)을 출력합니다.
+
+사용법:
+    python -m benchmarks.favorite_search_bench --favorites 10000 --queries 2000
+"""
+import argparse
+import random
+import statistics
+import time
+from typing import Dict, List, Optional, Tuple
+
+from app.domain.product.favorite_index import FavoriteIndexRegistry
+
+BRANDS = ["삼성전자", "LG전자", "애플", "나이키", "아디다스", "다이슨", "필립스", "쿠쿠", "로지텍", "소니"]
+NOUNS = [
+    "무선청소기", "블루투스 이어폰", "게이밍 마우스", "기계식 키보드", "러닝화", "전기밥솥",
+    "노트북 파우치", "공기청정기", "에어프라이어", "스마트워치", "보조배터리", "모니터암",
+]
+MODIFIERS = ["정품", "2024년형", "화이트", "블랙", "대용량", "초경량", "프리미엄", "미니", "무소음", "PRO"]
+CATEGORIES = ["디지털/가전", "패션잡화", "생활/건강", "스포츠/레저", "주방용품"]
+
+
+def synthesize(count: int, seed: int) -> List[Tuple[int, Dict[str, Optional[str]]]]:
+    rng = random.Random(seed)
+    rows = []
+    for product_id in range(1, count + 1):
+        brand = rng.choice(BRANDS)
+        title = " ".join(
+            [brand, rng.choice(NOUNS)] + rng.sample(MODIFIERS, 2) + [f"{rng.randint(100, 9999)}"]
+        )
+        rows.append(
+            (
+                product_id,
+                {
+                    "title": title,
+                    "brand": brand,
+                    "maker": brand,
+                    "category1": rng.choice(CATEGORIES),
+                    "category2": None,
+                    "category3": None,
+                    "category4": None,
+                },
+            )
+        )
+    return rows
+
+
+def synthesize_queries(count: int, seed: int) -> List[str]:
+    rng = random.Random(seed + 1)
+    queries = []
+    for _ in range(count):
+        kind = rng.random()
+        if kind < 0.4:
+            queries.append(rng.choice(NOUNS).replace(" ", ""))  # 띄어쓰기 없이 입력
+        elif kind < 0.7:
+            queries.append(f"{rng.choice(BRANDS)} {rng.choice(NOUNS).split()[0][:2]}")
+        elif kind < 0.9:
+            queries.append(rng.choice(MODIFIERS))
+        else:
+            queries.append(rng.choice(NOUNS)[1:4])  # 단어 중간 부분 일치
+    return queries
+
+
+def run(args: argparse.Namespace) -> None:
+    rows = synthesize(args.favorites, args.seed)
+    queries = synthesize_queries(args.queries, args.seed)
+    registry = FavoriteIndexRegistry(max_users=1)
+
+    started = time.perf_counter()
+    index = registry.build(1, (len(rows), len(rows)), rows)
+    build = time.perf_counter() - started
+    print(f"favorites={args.favorites} build={build * 1000:.1f}ms")
+
+    latencies = []
+    matched = []
+    for query in queries:
+        started = time.perf_counter()
+        result = index.search(query)
+        page = result[: args.size]
+        latencies.append(time.perf_counter() - started)
+        matched.append(len(result))
+        assert len(page) <= args.size
+
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(
+        f"queries={len(queries)} "
+        f"p50={statistics.median(latencies) * 1000:.2f}ms "
+        f"p99={p99 * 1000:.2f}ms max={latencies[-1] * 1000:.2f}ms "
+        f"avg_matched={statistics.mean(matched):.0f}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="즐겨찾기 검색 색인 벤치마크")
+    parser.add_argument("--favorites", type=int, default=10000)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--size", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=15)
+    run(parser.parse_args())
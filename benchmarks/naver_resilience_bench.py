@@ -0,0 +1,121 @@
+"""
+서킷 브레이커 / 헤지 요청 벤치마크 (지연 주입 로컬 스텁 서버 대상)
+
+1. hedge  : 일부 요청에 꼬리 지연을 주입하고 헤지 off/on 의 p50/p99 비교
+2. breaker: 스텁이 500 을 반환할 때 서킷이 열린 뒤 요청이 즉시 실패하는지 확인
+
+사용법:
+    python -m benchmarks.naver_resilience_bench --requests 1000 --latency-ms 50 \\
+        --tail-ratio 0.05 --tail-latency-ms 2000
+"""
+import argparse
+import asyncio
+import time
+from typing import List
+
+from app.domain.product.naver_client import NaverAPIError, NaverShoppingClient
+from app.domain.product.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    HedgeStats,
+    LatencyTracker,
+    hedged,
+)
+from benchmarks.naver_search_bench import percentile
+from benchmarks.naver_stub import NaverStubServer
+
+
+async def run_hedge(client: NaverShoppingClient, total: int, concurrency: int, enabled: bool) -> None:
+    tracker = LatencyTracker()
+    hedge_stats = HedgeStats()
+    latencies: List[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def timed_call(i: int):
+        started = time.perf_counter()
+        result = await client.search(query=f"q{i}", display=10)
+        tracker.observe(time.perf_counter() - started)
+        return result
+
+    async def one(i: int) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            if enabled:
+                await hedged(
+                    lambda: timed_call(i),
+                    delay=tracker.percentile(95),
+                    can_hedge=lambda: True,
+                    hedge_stats=hedge_stats,
+                )
+            else:
+                await timed_call(i)
+            latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(one(i) for i in range(total)))
+    name = "hedge-on" if enabled else "hedge-off"
+    print(
+        f"{name:<10} p50={percentile(latencies, 50) * 1000:8.1f}ms "
+        f"p99={percentile(latencies, 99) * 1000:8.1f}ms "
+        f"max={max(latencies) * 1000:8.1f}ms {hedge_stats.stats()}"
+    )
+
+
+async def run_breaker(client: NaverShoppingClient, stub: NaverStubServer, total: int) -> None:
+    breaker = CircuitBreaker(name="bench", min_calls=10, open_seconds=60)
+    stub.status_code = 500
+    upstream_before = stub.request_count
+    failed_fast = 0
+    started = time.perf_counter()
+    for i in range(total):
+        try:
+            breaker.before_call()
+        except CircuitOpenError:
+            failed_fast += 1
+            continue
+        try:
+            await client.search(query=f"q{i}", display=10)
+            breaker.record_success(0.0)
+        except NaverAPIError:
+            breaker.record_failure()
+    elapsed = time.perf_counter() - started
+    stub.status_code = 200
+    print(
+        f"breaker    requests={total} upstream_calls={stub.request_count - upstream_before} "
+        f"failed_fast={failed_fast} elapsed={elapsed * 1000:.1f}ms state={breaker.state}"
+    )
+
+
+async def main(args: argparse.Namespace) -> None:
+    stub = NaverStubServer(
+        port=args.port,
+        latency_ms=args.latency_ms,
+        tail_ratio=args.tail_ratio,
+        tail_latency_ms=args.tail_latency_ms,
+    )
+    await stub.start()
+    client = NaverShoppingClient(
+        base_url=stub.url,
+        client_id="bench",
+        client_secret="bench",
+        read_timeout=max(5.0, args.tail_latency_ms / 1000 * 2),
+    )
+    print(
+        f"stub latency={args.latency_ms}ms tail={args.tail_ratio}@{args.tail_latency_ms}ms "
+        f"requests={args.requests} concurrency={args.concurrency}"
+    )
+    await run_hedge(client, args.requests, args.concurrency, enabled=False)
+    await run_hedge(client, args.requests, args.concurrency, enabled=True)
+    await run_breaker(client, stub, 200)
+    await client.aclose()
+    await stub.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="서킷 브레이커 / 헤지 요청 벤치마크")
+    parser.add_argument("--port", type=int, default=18081)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--tail-ratio", type=float, default=0.05)
+    parser.add_argument("--tail-latency-ms", type=float, default=2000.0)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,121 @@
+"""
+네이버 검색 호출 방식 비교 벤치마크 (로컬 스텁 서버 대상)
+
+- before: 동기 라우트 방식. 워커 스레드 풀(anyio 기본 40개)에서 요청마다 새 연결을 맺음
+- after : 비동기 라우트 방식. 공유 keep-alive 커넥션 풀(NaverShoppingClient) 사용
+
+각 시나리오에서 동시 클라이언트 수만큼 요청을 한꺼번에 보내고
+요청별 지연(대기 포함) p50/p99 와 처리량(req/s)을 출력합니다.
+
+사용법:
+    python -m benchmarks.naver_search_bench --requests 2000 --concurrency 500 --latency-ms 200
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, List
+
+import httpx
+
+from app.domain.product.naver_client import NaverShoppingClient
+from benchmarks.naver_stub import NaverStubServer
+
+# anyio 기본 스레드 리미터 값 (FastAPI 동기 라우트가 사용하는 풀 크기)
+THREADPOOL_SIZE = 40
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def report(name: str, latencies: List[float], elapsed: float) -> None:
+    print(
+        f"{name:<8} n={len(latencies):<6} "
+        f"p50={percentile(latencies, 50) * 1000:8.1f}ms "
+        f"p99={percentile(latencies, 99) * 1000:8.1f}ms "
+        f"mean={statistics.mean(latencies) * 1000:8.1f}ms "
+        f"throughput={len(latencies) / elapsed:8.1f} req/s"
+    )
+
+
+async def run_scenario(
+    total: int, concurrency: int, call: Callable[[int], Awaitable[None]]
+) -> tuple[List[float], float]:
+    latencies: List[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i: int) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            await call(i)
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(total)))
+    return latencies, time.perf_counter() - started
+
+
+async def main(args: argparse.Namespace) -> None:
+    stub = NaverStubServer(
+        port=args.port,
+        latency_ms=args.latency_ms,
+        tail_ratio=args.tail_ratio,
+        tail_latency_ms=args.tail_latency_ms,
+    )
+    await stub.start()
+    loop = asyncio.get_running_loop()
+
+    # before: 스레드 풀 + 요청마다 새 연결 (기존 requests.get 방식과 동일한 연결 패턴)
+    executor = ThreadPoolExecutor(max_workers=THREADPOOL_SIZE)
+
+    def blocking_call(i: int) -> None:
+        response = httpx.get(
+            stub.url,
+            params={"query": f"q{i % 50}", "display": 10, "start": 1, "sort": "sim"},
+            timeout=10,
+        )
+        response.raise_for_status()
+        response.json()
+
+    async def before(i: int) -> None:
+        await loop.run_in_executor(executor, blocking_call, i)
+
+    # after: 공유 커넥션 풀 비동기 클라이언트
+    client = NaverShoppingClient(
+        base_url=stub.url,
+        client_id="bench",
+        client_secret="bench",
+        max_connections=args.concurrency,
+        max_keepalive_connections=args.concurrency,
+    )
+
+    async def after(i: int) -> None:
+        await client.search(query=f"q{i % 50}", display=10, start=1, sort="sim")
+
+    print(
+        f"stub latency={args.latency_ms}ms tail={args.tail_ratio}@{args.tail_latency_ms}ms "
+        f"requests={args.requests} concurrency={args.concurrency}"
+    )
+    latencies, elapsed = await run_scenario(args.requests, args.concurrency, before)
+    report("before", latencies, elapsed)
+    latencies, elapsed = await run_scenario(args.requests, args.concurrency, after)
+    report("after", latencies, elapsed)
+
+    executor.shutdown(wait=True)
+    await client.aclose()
+    await stub.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="네이버 검색 호출 방식 벤치마크")
+    parser.add_argument("--port", type=int, default=18080)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument("--latency-ms", type=float, default=200.0)
+    parser.add_argument("--tail-ratio", type=float, default=0.0)
+    parser.add_argument("--tail-latency-ms", type=float, default=0.0)
+    asyncio.run(main(parser.parse_args()))
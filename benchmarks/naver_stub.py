@@ -0,0 +1,147 @@
+"""
+네이버 쇼핑 검색 API 로컬 스텁 서버 (벤치마크용)
+
+- HTTP/1.1 keep-alive 를 지원하는 최소 구현 (표준 라이브러리만 사용)
+- 응답 지연을 주입할 수 있음: 기본 지연 + 확률적 꼬리 지연(tail latency)
+
+사용법:
+    python -m benchmarks.naver_stub --port 18080 --latency-ms 200
+    # .env: NAVER_SEARCH_URL=http://127.0.0.1:18080/v1/search/shop.json
+"""
+import argparse
+import asyncio
+import json
+import random
+from http import HTTPStatus
+from typing import Optional
+from urllib.parse import parse_qs, urlsplit
+
+
+def build_payload(query: str, start: int, display: int) -> bytes:
+    items = []
+    for i in range(start, start + display):
+        items.append(
+            {
+                "title": f"<b>{query}</b> 상품 {i}",
+                "link": f"https://search.shopping.naver.com/catalog/{9000000 + i}",
+                "image": f"https://shopping-phinf.pstatic.net/main_{9000000 + i}.jpg",
+                "lprice": str(10000 + (i * 37) % 50000),
+                "hprice": "",
+                "mallName": f"몰{i % 17}",
+                "productId": str(9000000 + i),
+                "productType": "1",
+                "brand": "브랜드",
+                "maker": "제조사",
+                "category1": "디지털/가전",
+                "category2": "음향가전",
+                "category3": "이어폰",
+                "category4": "",
+            }
+        )
+    body = {
+        "lastBuildDate": "Mon, 01 Jan 2024 00:00:00 +0900",
+        "total": 1000,
+        "start": start,
+        "display": display,
+        "items": items,
+    }
+    return json.dumps(body, ensure_ascii=False).encode("utf-8")
+
+
+class NaverStubServer:
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 18080,
+        latency_ms: float = 200.0,
+        tail_ratio: float = 0.0,
+        tail_latency_ms: float = 0.0,
+        status_code: int = 200,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.latency_ms = latency_ms
+        self.tail_ratio = tail_ratio
+        self.tail_latency_ms = tail_latency_ms
+        self.status_code = status_code
+        self.request_count = 0
+        self._server: Optional[asyncio.base_events.Server] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/v1/search/shop.json"
+
+    def _delay(self) -> float:
+        delay = self.latency_ms
+        if self.tail_ratio and random.random() < self.tail_ratio:
+            delay = self.tail_latency_ms
+        return delay / 1000.0
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                # 헤더는 읽고 버림
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+
+                self.request_count += 1
+                target = request_line.split(b" ")[1].decode()
+                qs = parse_qs(urlsplit(target).query)
+                query = qs.get("query", [""])[0]
+                start = int(qs.get("start", ["1"])[0])
+                display = int(qs.get("display", ["10"])[0])
+
+                await asyncio.sleep(self._delay())
+
+                if self.status_code == 200:
+                    body = build_payload(query, start, display)
+                else:
+                    body = b'{"errorMessage": "stub error"}'
+                writer.write(
+                    f"HTTP/1.1 {self.status_code} {HTTPStatus(self.status_code).phrase}\r\n"
+                    f"Content-Type: application/json;charset=utf-8\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    f"Connection: keep-alive\r\n\r\n".encode()
+                    + body
+                )
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(
+            self._handle, self.host, self.port, backlog=4096
+        )
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+
+async def _main(args: argparse.Namespace) -> None:
+    server = NaverStubServer(
+        port=args.port,
+        latency_ms=args.latency_ms,
+        tail_ratio=args.tail_ratio,
+        tail_latency_ms=args.tail_latency_ms,
+        status_code=args.status_code,
+    )
+    await server.start()
+    print(f"naver stub listening on {server.url}")
+    await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="네이버 쇼핑 검색 API 스텁 서버")
+    parser.add_argument("--port", type=int, default=18080)
+    parser.add_argument("--latency-ms", type=float, default=200.0)
+    parser.add_argument("--tail-ratio", type=float, default=0.0)
+    parser.add_argument("--tail-latency-ms", type=float, default=0.0)
+    parser.add_argument("--status-code", type=int, default=200)
+    asyncio.run(_main(parser.parse_args()))
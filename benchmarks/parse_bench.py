@@ -0,0 +1,103 @@
+"""
+네이버 검색 응답 파싱 마이크로 벤치마크
+
+응답 bytes 를 받아 /search 응답 bytes 를 만들기까지의 CPU 비용을 항목당 µs 로 비교합니다.
+
+- legacy: response.json() + str.replace 2회 + 항목마다 utcnow() + Pydantic 재검증/직렬화
+- fast  : parser.loads (orjson) + 단일 패스 태그/엔티티 제거 + 배치당 타임스탬프 1회 + 직접 직렬화
+
+fixtures/ 의 응답은 네이버 쇼핑 검색 API 응답 형식의 샘플입니다.
+실제 API 응답을 저장한 파일도 --payload 로 넘겨 측정할 수 있습니다.
+
+사용법:
+    python -m benchmarks.parse_bench --repeat 2000
+    python -m benchmarks.parse_bench --payload recorded.json --repeat 500
+"""
+import argparse
+import json
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from app.domain.product import parser, schemas
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures"
+
+META = {
+    "page": 1,
+    "size": 100,
+    "total_items": 1000,
+    "total_pages": 10,
+    "has_next": True,
+    "has_prev": False,
+}
+
+
+def legacy_pipeline(raw: bytes) -> bytes:
+    data = json.loads(raw)
+    items = []
+    for item in data.get("items", []):
+        items.append(
+            {
+                "source": "NAVER",
+                "source_product_id": item.get("productId", ""),
+                "title": item.get("title", "").replace("<b>", "").replace("</b>", ""),
+                "image_url": item.get("image", ""),
+                "link_url": item.get("link", ""),
+                "mall_name": item.get("mallName", ""),
+                "brand": item.get("brand", ""),
+                "maker": item.get("maker", ""),
+                "category1": item.get("category1", ""),
+                "category2": item.get("category2", ""),
+                "category3": item.get("category3", ""),
+                "category4": item.get("category4", ""),
+                "price": int(item.get("lprice", 0)),
+                "last_fetched_at": datetime.utcnow(),
+            }
+        )
+    response = schemas.ProductSearchResponse(
+        success=True, message="상품 검색 성공", data=items, meta=META
+    )
+    return response.model_dump_json().encode("utf-8")
+
+
+def fast_pipeline(raw: bytes) -> bytes:
+    data = parser.loads(raw)
+    items = parser.parse_items(data.get("items", []))
+    return parser.build_search_payload(items, META, "상품 검색 성공")
+
+
+def measure(pipeline: Callable[[bytes], bytes], raw: bytes, repeat: int) -> float:
+    # 워밍업 후 측정 (초/호출)
+    for _ in range(min(repeat, 50)):
+        pipeline(raw)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        pipeline(raw)
+    return (time.perf_counter() - started) / repeat
+
+
+def run(payloads: List[Path], repeat: int) -> None:
+    print(f"json backend: {'orjson' if parser.orjson is not None else 'json (stdlib)'}")
+    for path in payloads:
+        raw = path.read_bytes()
+        count = len(json.loads(raw).get("items", []))
+        results: Dict[str, float] = {
+            "legacy": measure(legacy_pipeline, raw, repeat),
+            "fast": measure(fast_pipeline, raw, repeat),
+        }
+        for name, seconds in results.items():
+            print(
+                f"{path.name:<32} {name:<7} items={count:<4} "
+                f"per_call={seconds * 1e6:9.1f}µs per_item={seconds * 1e6 / max(count, 1):7.2f}µs"
+            )
+        print(f"{'':<32} speedup x{results['legacy'] / results['fast']:.2f}")
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="네이버 검색 응답 파싱 벤치마크")
+    arg_parser.add_argument("--payload", type=Path, action="append")
+    arg_parser.add_argument("--repeat", type=int, default=2000)
+    args = arg_parser.parse_args()
+    run(args.payload or sorted(FIXTURE_DIR.glob("*.json")), args.repeat)
@@ -0,0 +1,100 @@
+"""
+검색 결과 유사 상품 묶기(group=true) 마이크로 벤치마크
+
+파싱된 한 페이지(최대 100개)를 묶는 데 걸리는 시간을 p50/p99 로 측정합니다.
+
+- cold: 토큰/항목 특징 캐시를 모두 비운 상태 (프로세스 시작 직후)
+- new : 항목 캐시만 비운 상태 (처음 보는 페이지, 자주 나오는 단어의 3-gram 해시는 캐시에 있음)
+- warm: 같은 페이지를 다시 묶는 경우 (캐시된 검색 결과)
+
+fixtures/naver_shop_duplicates100.json 은 같은 상품이 몰마다 다른 상품명으로 나오는
+네이버 쇼핑 검색 API 응답 형식의 샘플입니다 (모델명만 다른 상품 포함).
+naver_shop_display10/100.json 은 적은 단어를 섞어 만든 파싱용 샘플이라 그룹 수보다 시간만 참고합니다.
+실제 API 응답을 저장한 파일도 --payload 로 넘겨 측정할 수 있습니다.
+
+사용법:
+    python -m benchmarks.search_group_bench --repeat 1000
+    python -m benchmarks.search_group_bench --payload recorded.json --show
+"""
+import argparse
+import statistics
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from app.domain.product import clustering, parser
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures"
+
+
+def clear_caches() -> None:
+    clustering._item_features.cache_clear()
+    clustering._token_hashes.cache_clear()
+
+
+def clear_item_cache() -> None:
+    clustering._item_features.cache_clear()
+
+
+def measure(run: Callable[[], object], repeat: int, before: Callable[[], None]) -> List[float]:
+    # 호출별 소요 시간 (µs)
+    samples = []
+    for _ in range(repeat):
+        before()
+        started = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - started) * 1e6)
+    return samples
+
+
+def percentile(samples: List[float], q: float) -> float:
+    return statistics.quantiles(samples, n=100)[int(q) - 1] if len(samples) > 1 else samples[0]
+
+
+def show(groups: List[Dict]) -> None:
+    for group in groups:
+        if group["count"] < 2:
+            continue
+        print(f"  [{group['count']}] {group['min_price']:,} ~ {group['max_price']:,}")
+        for item in group["items"]:
+            print(f"      {item['price']:>9,}  {item['mall_name'] or '-':<10} {item['title']}")
+
+
+def run(payloads: List[Path], repeat: int, min_similarity: float, show_groups: bool) -> None:
+    for path in payloads:
+        items = parser.parse_items(parser.loads(path.read_bytes()).get("items", []))
+        groups = clustering.group_items(items, min_similarity)
+        print(
+            f"{path.name:<32} items={len(items):<4} groups={len(groups):<4} "
+            f"grouped_items={sum(group['count'] for group in groups if group['count'] > 1)}"
+        )
+        for name, before in (
+            ("cold", clear_caches),
+            ("new", clear_item_cache),
+            ("warm", lambda: None),
+        ):
+            samples = measure(
+                lambda: clustering.group_items(items, min_similarity), repeat, before
+            )
+            print(
+                f"{'':<32} {name:<5} p50={percentile(samples, 50):8.1f}µs "
+                f"p99={percentile(samples, 99):8.1f}µs"
+            )
+        if show_groups:
+            show(groups)
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="검색 결과 유사 상품 묶기 벤치마크")
+    arg_parser.add_argument("--payload", type=Path, action="append")
+    arg_parser.add_argument("--repeat", type=int, default=1000)
+    # SEARCH_GROUP_MIN_SIMILARITY 기본값
+    arg_parser.add_argument("--min-similarity", type=float, default=0.5)
+    arg_parser.add_argument("--show", action="store_true", help="2개 이상 묶인 그룹 출력")
+    args = arg_parser.parse_args()
+    run(
+        args.payload or sorted(FIXTURE_DIR.glob("*.json")),
+        args.repeat,
+        args.min_similarity,
+        args.show,
+    )
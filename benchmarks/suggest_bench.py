@@ -0,0 +1,90 @@
+"""
+검색어 자동완성 접두사 색인 벤치마크 (합성 후보)
+
+후보 N 개로 색인을 만들고, 검색어를 한 글자(자모)씩 입력하는 순서대로
+접두사 조회 지연(p50/p99)과 증분 추가(병합 포함) 비용을 출력합니다.
+
+사용법:
+    python -m benchmarks.suggest_bench --terms 100000 --typed 2000
+"""
+import argparse
+import random
+import statistics
+import time
+from typing import List, Tuple
+
+from app.domain.product.suggest import SUGGEST_PRODUCT, SUGGEST_QUERY, SuggestIndex, to_jamo
+from benchmarks.favorite_search_bench import BRANDS, MODIFIERS, NOUNS
+
+
+def synthesize(count: int, seed: int) -> List[Tuple[str, float, str]]:
+    rng = random.Random(seed)
+    terms = []
+    for _ in range(count):
+        words = [rng.choice(BRANDS), rng.choice(NOUNS)] + rng.sample(MODIFIERS, rng.randint(0, 2))
+        if rng.random() < 0.5:
+            words.append(str(rng.randint(100, 9999)))
+        kind = SUGGEST_QUERY if rng.random() < 0.5 else SUGGEST_PRODUCT
+        terms.append((" ".join(words), rng.paretovariate(1.2), kind))
+    return terms
+
+
+def keystrokes(text: str) -> List[str]:
+    """입력 중 화면에 보이는 문자열 (마지막 글자는 자모 단위로 늘어남)"""
+    typed = []
+    for end in range(1, len(text) + 1):
+        head, last = text[: end - 1], text[end - 1]
+        jamo = to_jamo(last)
+        for size in range(1, len(jamo)):
+            typed.append(head + jamo[:size])
+        typed.append(text[:end])
+    return typed
+
+
+def run(args: argparse.Namespace) -> None:
+    terms = synthesize(args.terms, args.seed)
+    index = SuggestIndex(max_terms=args.terms * 2, merge_threshold=args.merge_threshold)
+
+    started = time.perf_counter()
+    index.add_many(terms)
+    build = time.perf_counter() - started
+    print(f"terms={args.terms} build={build * 1000:.1f}ms stats={index.stats()}")
+
+    rng = random.Random(args.seed + 1)
+    typed = []
+    for _ in range(args.typed):
+        typed.extend(keystrokes(rng.choice(terms)[0]))
+    latencies = []
+    for prefix in typed:
+        started = time.perf_counter()
+        index.suggest(prefix, args.limit)
+        latencies.append(time.perf_counter() - started)
+
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(
+        f"lookups={len(latencies)} "
+        f"p50={statistics.median(latencies) * 1e6:.0f}us "
+        f"p99={p99 * 1e6:.0f}us max={latencies[-1] * 1000:.2f}ms"
+    )
+
+    extra = synthesize(args.adds, args.seed + 2)
+    started = time.perf_counter()
+    for term, weight, kind in extra:
+        index.add(term + " 신상", weight, kind)
+    added = time.perf_counter() - started
+    print(
+        f"adds={args.adds} avg={added / args.adds * 1e6:.0f}us (병합 포함) "
+        f"merges={index.stats()['merges']}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="검색어 자동완성 색인 벤치마크")
+    parser.add_argument("--terms", type=int, default=100000)
+    parser.add_argument("--typed", type=int, default=2000)
+    parser.add_argument("--adds", type=int, default=5000)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--merge-threshold", type=int, default=512)
+    parser.add_argument("--seed", type=int, default=22)
+    run(parser.parse_args())
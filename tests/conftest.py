@@ -0,0 +1,163 @@
+"""
+테스트 공통 설정
+
+- 앱 import 전에 환경변수로 SQLite 파일 DB / 디스크 캐시 경로를 지정
+- 테스트마다 테이블을 새로 만들고 인메모리 캐시를 비움
+- 네이버 API 는 naver_client 를 스텁으로 바꿔 호출하지 않음
+"""
+import os
+import tempfile
+
+_TMP_DIR = tempfile.mkdtemp(prefix="dopamine-test-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_TMP_DIR, 'test.db')}"
+os.environ["SEARCH_DISK_CACHE_PATH"] = os.path.join(_TMP_DIR, "search_cache.sqlite3")
+os.environ["DEBUG"] = "false"
+os.environ.setdefault("JWT_SECRET_KEY", "test-secret")
+
+from typing import Dict, List  # noqa: E402
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import BigInteger, event  # noqa: E402
+from sqlalchemy.ext.compiler import compiles  # noqa: E402
+
+from app.core.database import Base, SessionLocal, engine  # noqa: E402
+
+
+@compiles(BigInteger, "sqlite")
+def _sqlite_bigint(type_, compiler, **kw):
+    # SQLite 는 INTEGER PRIMARY KEY 만 자동 증가
+    return "INTEGER"
+
+
+@event.listens_for(engine, "connect")
+def _sqlite_foreign_keys(dbapi_connection, connection_record):
+    # MySQL/MariaDB 와 같이 외래 키 제약을 검사
+    dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+
+import app.main  # noqa: E402,F401  (모든 모델 등록)
+from app.domain.product import service as product_service  # noqa: E402
+from app.domain.product.favorite_index import FavoriteIndexRegistry  # noqa: E402
+from app.domain.product.rate_limiter import NaverRateLimiter  # noqa: E402
+from app.domain.product.resilience import CircuitBreaker  # noqa: E402
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture(autouse=True)
+def reset_state(monkeypatch):
+    # 서킷 브레이커 / 호출 한도는 테스트마다 새로
+    monkeypatch.setattr(product_service, "naver_circuit_breaker", CircuitBreaker(name="naver"))
+    monkeypatch.setattr(
+        product_service,
+        "naver_rate_limiter",
+        NaverRateLimiter(daily_budget=100000, rate_per_second=1000, burst=1000),
+    )
+    # DB 를 새로 만들면 id 가 겹치므로 즐겨찾기 검색 색인도 새로
+    monkeypatch.setattr(
+        product_service, "favorite_search_indexes", FavoriteIndexRegistry(max_users=100)
+    )
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    for cache in (
+        product_service.search_cache,
+        product_service.search_snapshots,
+        product_service.lowest_price_cache,
+    ):
+        cache.clear()
+    product_service.search_disk_cache.clear()
+    product_service.price_observations.drain()
+    yield
+    product_service.search_disk_cache.clear()
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def client():
+    with TestClient(app.main.app) as test_client:
+        yield test_client
+
+
+def naver_item(product_id: str, price: int = 10000, title: str = "테스트 상품") -> Dict:
+    return {
+        "title": f"<b>{title}</b> {product_id}",
+        "link": f"https://example.com/{product_id}",
+        "image": f"https://example.com/{product_id}.jpg",
+        "lprice": str(price),
+        "mallName": "테스트몰",
+        "productId": product_id,
+        "brand": "브랜드",
+        "maker": "제조사",
+        "category1": "디지털/가전",
+        "category2": "",
+        "category3": "",
+        "category4": "",
+    }
+
+
+class StubNaverClient:
+    """naver_client.search 대체 (호출 횟수 기록, 응답/예외 지정)"""
+
+    def __init__(self, items: List[Dict] | None = None) -> None:
+        self.items = items if items is not None else [naver_item("1001")]
+        # None 이면 len(items)
+        self.total: int | None = None
+        self.error: Exception | None = None
+        # 특정 시작 위치(start)만 실패시킬 때
+        self.page_errors: Dict[int, Exception] = {}
+        self.calls = 0
+        self.starts: List[int] = []
+
+    async def search(self, query: str, display: int = 10, start: int = 1, sort: str = "sim"):
+        self.calls += 1
+        self.starts.append(start)
+        error = self.page_errors.get(start, self.error)
+        if error is not None:
+            raise error
+        total = len(self.items) if self.total is None else self.total
+        return {"total": total, "items": self.items[start - 1 : start - 1 + display]}
+
+
+@pytest.fixture
+def naver(monkeypatch):
+    stub = StubNaverClient()
+    monkeypatch.setattr(product_service.naver_client, "search", stub.search)
+    return stub
+
+
+@pytest.fixture
+def user(db):
+    from app.domain.user.models import User
+
+    row = User(email="tester@example.com", password_hash="x", nickname="tester")
+    db.add(row)
+    db.commit()
+    return row.id
+
+
+def create_favorite(db, user_id: int, product_id: str = "1001", price: int = 10000, **fields):
+    """원본 상품 + 사용자 즐겨찾기 링크 생성 (product 반환)"""
+    from app.domain.product.repository import ProductRepository
+
+    catalog = ProductRepository.get_or_create_catalog(
+        db,
+        source="NAVER",
+        source_product_id=product_id,
+        title=fields.pop("title", "테스트 상품"),
+        price=price,
+        **fields,
+    )
+    db.commit()
+    return ProductRepository.create(db, user_id=user_id, catalog_product_id=catalog.id)
@@ -0,0 +1,162 @@
+from datetime import datetime
+
+from sqlalchemy import create_engine, inspect, text
+
+from app.domain.alert.index import PriceAlertIndex, Watcher
+from app.domain.alert.migration import AlertMigration
+from app.domain.alert.models import PriceAlertEvent
+from app.domain.alert.service import AlertService
+from app.domain.wishlist.models import WishlistItem
+from tests.conftest import create_favorite
+
+
+def _event(user_id: int, product_id: int, wishlist_item_id=None) -> PriceAlertEvent:
+    return PriceAlertEvent(
+        user_id=user_id,
+        product_id=product_id,
+        wishlist_item_id=wishlist_item_id,
+        source="NAVER",
+        source_product_id="1001",
+        target_price=9000,
+        previous_price=10000,
+        price=8000,
+        created_at=datetime.utcnow(),
+    )
+
+
+def test_delete_favorite_with_alert_events(client, db, user):
+    product = create_favorite(db, user)
+    db.add(_event(user, product.id))
+    db.commit()
+
+    response = client.delete(
+        f"/api/v1/products/favorites/{product.id}", headers={"Authorization": str(user)}
+    )
+
+    assert response.status_code == 200
+    assert db.query(PriceAlertEvent).count() == 0
+
+
+def test_bulk_delete_favorites_with_alert_events(client, db, user):
+    product = create_favorite(db, user)
+    db.add(_event(user, product.id))
+    db.commit()
+
+    response = client.post(
+        "/api/v1/products/favorites/bulk-delete",
+        json={"product_ids": [product.id]},
+        headers={"Authorization": str(user)},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["data"][0]["status"] == "deleted"
+    assert db.query(PriceAlertEvent).count() == 0
+
+
+def test_remove_wishlist_item_keeps_alert_events(client, db, user):
+    product = create_favorite(db, user)
+    item = WishlistItem(user_id=user, product_id=product.id)
+    db.add(item)
+    db.commit()
+    db.add(_event(user, product.id, wishlist_item_id=item.id))
+    db.commit()
+
+    response = client.delete(
+        f"/api/v1/wishlist/{product.id}", headers={"Authorization": str(user)}
+    )
+
+    assert response.status_code == 200
+    event = db.query(PriceAlertEvent).one()
+    assert event.wishlist_item_id is None
+
+
+def test_alert_migration_is_idempotent(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE users (id INTEGER PRIMARY KEY)"))
+        conn.execute(text("CREATE TABLE products (id INTEGER PRIMARY KEY, user_id INTEGER)"))
+        conn.execute(text("CREATE TABLE wishlist_items (id INTEGER PRIMARY KEY)"))
+
+    assert AlertMigration.apply(engine) == [
+        "products.target_price",
+        "wishlist_items.target_price",
+        "price_alert_events",
+    ]
+    assert AlertMigration.apply(engine) == []
+
+    inspector = inspect(engine)
+    assert "target_price" in {c["name"] for c in inspector.get_columns("products")}
+    rules = {
+        fk["constrained_columns"][0]: fk["options"].get("ondelete")
+        for fk in inspector.get_foreign_keys("price_alert_events")
+    }
+    assert rules["product_id"] == "CASCADE"
+    assert rules["wishlist_item_id"] == "SET NULL"
+
+
+KEY = ("NAVER", "1001")
+
+
+def _watcher(target_price: int, user_id: int = 1) -> Watcher:
+    return Watcher(target_price, user_id, user_id, None)
+
+
+def _targets(watchers):
+    return [watcher.target_price for watcher in watchers]
+
+
+def test_match_fires_only_when_price_crosses_target():
+    index = PriceAlertIndex.build([(KEY, _watcher(price)) for price in (9000, 9500, 9900, 12000)])
+
+    assert _targets(index.match(KEY, 10000, 9400)) == [9500, 9900]
+    # 목표가와 같은 가격까지 내려오면 알림, 이미 목표가였던 경우는 다시 알리지 않음
+    assert _targets(index.match(KEY, 9600, 9500)) == [9500]
+    assert index.match(KEY, 9500, 9500) == []
+    assert index.match(KEY, 9500, 9400) == []
+    # 가격 유지/상승, 이전 가격 없음, 모르는 상품
+    assert index.match(KEY, 9400, 9400) == []
+    assert index.match(KEY, 9400, 13000) == []
+    assert index.match(KEY, None, 1000) == []
+    assert index.match(("NAVER", "9999"), 10000, 1000) == []
+
+
+def test_match_many_after_target_change_and_remove():
+    index = PriceAlertIndex.build(
+        [(KEY, _watcher(9000, user_id=1)), (KEY, _watcher(9000, user_id=2))]
+    )
+    other = ("NAVER", "1002")
+    index.add(other, _watcher(5000, user_id=1))
+
+    # 목표가 변경 = 이전 구독 제거 후 새 목표가로 추가
+    assert index.remove(KEY, _watcher(9000, user_id=1))
+    index.add(KEY, _watcher(8000, user_id=1))
+    assert not index.remove(KEY, _watcher(7000, user_id=1))
+    assert len(index) == 3
+
+    matched = index.match_many([(KEY, 10000, 8500), (other, 6000, 5000), (KEY, 8500, 8500)])
+    assert [(key, price, watcher.user_id) for key, _, price, watcher in matched] == [
+        (KEY, 8500, 2),
+        (other, 5000, 1),
+    ]
+
+    assert index.remove(other, _watcher(5000, user_id=1))
+    assert index.match_many([(other, 6000, 1000)]) == []
+    assert index.stats() == {"products": 1, "watchers": 2}
+
+
+def test_alerts_follow_target_price_update_and_delete(client, db, user):
+    product = create_favorite(db, user)
+    headers = {"Authorization": str(user)}
+    url = f"/api/v1/products/favorites/{product.id}/target-price"
+
+    assert client.patch(url, json={"target_price": 9000}, headers=headers).status_code == 200
+    assert AlertService.dispatch(db, AlertService.build_index(db), [(KEY, 10000, 9000)]) == 1
+
+    client.patch(url, json={"target_price": 8000}, headers=headers)
+    index = AlertService.build_index(db)
+    assert AlertService.dispatch(db, index, [(KEY, 10000, 8500)]) == 0
+    assert AlertService.dispatch(db, index, [(KEY, 8500, 8000)]) == 1
+
+    client.delete(f"/api/v1/products/favorites/{product.id}", headers=headers)
+    assert len(AlertService.build_index(db)) == 0
+    assert db.query(PriceAlertEvent).count() == 0
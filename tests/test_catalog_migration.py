@@ -0,0 +1,125 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app.core.exceptions import ConflictException
+from app.domain.product.catalog_migration import CatalogMigration
+from app.domain.product.models import CatalogProduct, Product
+from app.domain.product.repository import ProductRepository
+from tests.conftest import create_favorite
+
+_LEGACY_PRODUCTS = """
+CREATE TABLE products (
+    id INTEGER PRIMARY KEY,
+    user_id INTEGER NOT NULL,
+    catalog_product_id INTEGER,
+    source VARCHAR(20),
+    source_product_id VARCHAR(64),
+    title VARCHAR(255),
+    image_url TEXT,
+    link_url TEXT,
+    mall_name VARCHAR(120),
+    brand VARCHAR(120),
+    maker VARCHAR(120),
+    category1 VARCHAR(120),
+    category2 VARCHAR(120),
+    category3 VARCHAR(120),
+    category4 VARCHAR(120),
+    price INTEGER,
+    last_fetched_at DATETIME,
+    created_at DATETIME NOT NULL,
+    updated_at DATETIME NOT NULL
+)
+"""
+
+
+@pytest.fixture
+def legacy_engine(tmp_path):
+    # expand 직후 상태의 기존 products 테이블 (상품 정보 컬럼 + 빈 catalog_product_id)
+    legacy = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with legacy.begin() as conn:
+        conn.execute(text(_LEGACY_PRODUCTS))
+    CatalogProduct.__table__.create(bind=legacy)
+    yield legacy
+    legacy.dispose()
+
+
+def _insert_legacy(conn, id_, user_id, product_id, price, fetched_at):
+    now = datetime(2024, 1, 1)
+    conn.execute(
+        text(
+            "INSERT INTO products (id, user_id, source, source_product_id, title, price, "
+            "last_fetched_at, created_at, updated_at) "
+            "VALUES (:id, :user_id, 'NAVER', :product_id, '상품', :price, :fetched_at, :now, :now)"
+        ),
+        {
+            "id": id_,
+            "user_id": user_id,
+            "product_id": product_id,
+            "price": price,
+            "fetched_at": fetched_at,
+            "now": now,
+        },
+    )
+
+
+def test_backfill_runs_on_sqlite(legacy_engine):
+    with legacy_engine.begin() as conn:
+        _insert_legacy(conn, 1, 1, "1001", 10000, datetime(2024, 1, 1))
+        _insert_legacy(conn, 2, 2, "1001", 9000, datetime(2024, 1, 2))
+        _insert_legacy(conn, 3, 2, "2002", 5000, None)
+
+    with Session(legacy_engine) as session:
+        assert CatalogMigration.backfill(session, batch_size=2) == {"batches": 2, "linked": 3}
+        # 재실행 안전
+        assert CatalogMigration.backfill(session, batch_size=2)["linked"] == 0
+
+        catalogs = dict(
+            session.execute(text("SELECT source_product_id, price FROM catalog_products")).all()
+        )
+        # 같은 상품은 가장 최근에 조회된 가격을 남김
+        assert catalogs == {"1001": 9000, "2002": 5000}
+        pending = session.execute(
+            text("SELECT COUNT(*) FROM products WHERE catalog_product_id IS NULL")
+        ).scalar()
+        assert pending == 0
+        report = CatalogMigration.report(session)
+        assert report["duplication_factor"] == 1.5
+        assert report["duplicate_links"] == 0
+
+
+def test_report_counts_duplicate_links(legacy_engine):
+    with legacy_engine.begin() as conn:
+        _insert_legacy(conn, 1, 1, "1001", 10000, None)
+        _insert_legacy(conn, 2, 1, "1001", 10000, None)
+        _insert_legacy(conn, 3, 2, "1001", 10000, None)
+
+    with Session(legacy_engine) as session:
+        CatalogMigration.backfill(session)
+
+        # 같은 사용자의 같은 원본 상품 링크 2개 -> (user_id, catalog_product_id) 1쌍
+        assert CatalogMigration.report(session)["duplicate_links"] == 1
+
+
+def test_expand_and_contract_require_mysql(legacy_engine):
+    with pytest.raises(ConflictException):
+        CatalogMigration.expand(legacy_engine)
+    with pytest.raises(ConflictException):
+        CatalogMigration.contract(legacy_engine)
+
+
+def test_unlinked_rows_stay_visible_before_contract(db, user):
+    linked_id = create_favorite(db, user, product_id="1001").id
+    unlinked = Product(user_id=user)
+    db.add(unlinked)
+    db.commit()
+    unlinked_id = unlinked.id
+    db.expunge_all()
+
+    rows = ProductRepository.list_paginated(db, user_id=user, offset=0, limit=10)
+
+    assert {row.id for row in rows} == {linked_id, unlinked_id}
+    orphan = next(row for row in rows if row.id == unlinked_id)
+    assert orphan.catalog is None and orphan.title is None
@@ -0,0 +1,59 @@
+from app.domain.product.clustering import cluster, group_items
+
+
+def _item(title: str, price: int = 10000, brand: str = "소니", maker: str = "소니"):
+    return {"title": title, "price": price, "brand": brand, "maker": maker}
+
+
+def test_same_product_from_different_malls_is_grouped():
+    items = [
+        _item("소니 WH-1000XM5 노이즈캔슬링 무선 헤드폰", 400000),
+        _item("[정품] 소니 WH1000XM5 노이즈캔슬링 무선 헤드폰 블랙", 380000),
+        _item("삼성 갤럭시 버즈2 프로", 200000, brand="삼성", maker="삼성"),
+        _item("소니 WH-1000XM5 노이즈캔슬링 무선 헤드폰 (무료배송)", 0),
+    ]
+
+    assert cluster(items) == [[0, 1, 3], [2]]
+
+
+def test_different_model_number_is_not_grouped():
+    items = [
+        _item("소니 WH-1000XM5 노이즈캔슬링 무선 헤드폰"),
+        _item("소니 WH-1000XM4 노이즈캔슬링 무선 헤드폰"),
+    ]
+
+    assert cluster(items) == [[0], [1]]
+
+
+def test_different_brand_is_not_grouped():
+    items = [
+        _item("노이즈캔슬링 무선 헤드폰 블루투스", brand="소니", maker=""),
+        _item("노이즈캔슬링 무선 헤드폰 블루투스", brand="보스", maker=""),
+    ]
+
+    assert cluster(items) == [[0], [1]]
+
+
+def test_group_items_sorted_by_lowest_price_in_search_order():
+    items = [
+        _item("삼성 갤럭시 버즈2 프로", 200000, brand="삼성", maker="삼성"),
+        _item("소니 WH-1000XM5 노이즈캔슬링 무선 헤드폰", 400000),
+        _item("소니 WH-1000XM5 노이즈캔슬링 무선 헤드폰 (무료배송)", 0),
+        _item("[정품] 소니 WH1000XM5 노이즈캔슬링 무선 헤드폰 블랙", 380000),
+    ]
+
+    groups = group_items(items)
+
+    assert [group["count"] for group in groups] == [1, 3]
+    headphones = groups[1]
+    # 가격 0 은 맨 뒤, 최저/최고가는 0 을 제외
+    assert [item["price"] for item in headphones["items"]] == [380000, 400000, 0]
+    assert (headphones["min_price"], headphones["max_price"]) == (380000, 400000)
+
+
+def test_small_inputs_and_stable_result():
+    assert cluster([]) == []
+    assert cluster([_item("소니 헤드폰")]) == [[0]]
+
+    items = [_item(f"상품 {number} 모델 A{number}") for number in range(50)]
+    assert cluster(items) == cluster(list(items))
@@ -0,0 +1,136 @@
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+import pytest
+
+from app.core.config import Settings
+from app.domain.product import parser
+from app.domain.product.cache import CACHE_FRESH
+from app.domain.product.disk_cache import DiskCache
+from app.domain.product.service import NaverShoppingService, search_cache, search_disk_cache
+
+
+@pytest.fixture
+def disk_cache(tmp_path):
+    cache = DiskCache(
+        name="test_disk",
+        path=str(tmp_path / "cache.sqlite3"),
+        ttl=60,
+        stale_ttl=60,
+        max_bytes=1024 * 1024,
+        decode=parser.restore_search_result,
+    )
+    yield cache
+    cache.close()
+
+
+def _result(product_id: str = "1001") -> dict:
+    return {
+        "items": [
+            {"source_product_id": product_id, "price": 1000, "last_fetched_at": datetime.utcnow()}
+        ],
+        "total": 1,
+    }
+
+
+def test_set_is_written_by_writer_thread(disk_cache, monkeypatch):
+    writer_threads = []
+    write = disk_cache._write
+
+    def record_thread(key, value):
+        writer_threads.append(threading.current_thread())
+        write(key, value)
+
+    monkeypatch.setattr(disk_cache, "_write", record_thread)
+    disk_cache.set(("q", 1, 10, "sim"), _result())
+    disk_cache.flush()
+
+    assert writer_threads and writer_threads[0] is not threading.current_thread()
+    assert disk_cache.stats()["writes"] == 1
+
+
+def test_decoded_values_match_memory_types(disk_cache):
+    original = _result()
+    disk_cache.set(("q", 1, 10, "sim"), original)
+    disk_cache.flush()
+
+    value, fresh_left, _ = disk_cache.get(("q", 1, 10, "sim"))
+    assert value == original
+    assert isinstance(value["items"][0]["last_fetched_at"], datetime)
+    assert isinstance(disk_cache.peek(("q", 1, 10, "sim"))["items"][0]["last_fetched_at"], datetime)
+    assert fresh_left > 0
+
+
+def test_compaction_runs_in_background(tmp_path):
+    blob_size = len(parser.dumps(_result()))
+    cache = DiskCache(
+        name="test_disk",
+        path=str(tmp_path / "cache.sqlite3"),
+        ttl=60,
+        max_bytes=blob_size * 3,
+        compact_every=2,
+    )
+    try:
+        for i in range(6):
+            cache.set(("q", i), _result())
+        cache.flush()
+        stats = cache.stats()
+    finally:
+        cache.close()
+
+    assert stats["compactions"] == 3
+    assert stats["evictions"] > 0
+    assert stats["current_bytes"] <= cache.max_bytes
+
+
+def test_close_closes_every_thread_connection(disk_cache):
+    connections = []
+
+    def read():
+        disk_cache.get("missing")
+        connections.append(disk_cache._local.conn)
+
+    threads = [threading.Thread(target=read) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    disk_cache.set("key", _result())
+    disk_cache.flush()
+
+    disk_cache.close()
+
+    assert disk_cache.stats()["entries"] == 1  # 닫은 뒤에도 새 연결로 다시 사용 가능
+    for conn in connections:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+
+def test_default_path_is_absolute():
+    assert os.path.isabs(Settings.model_fields["SEARCH_DISK_CACHE_PATH"].default)
+
+
+@pytest.mark.anyio
+async def test_search_reads_disk_cache_off_event_loop(naver, monkeypatch):
+    await NaverShoppingService.search_cached(query="이어폰")
+    search_disk_cache.flush()
+    search_cache.clear()
+
+    loop_thread = threading.current_thread()
+    read_threads = []
+    get = search_disk_cache.get
+
+    def record_thread(key):
+        read_threads.append(threading.current_thread())
+        return get(key)
+
+    monkeypatch.setattr(search_disk_cache, "get", record_thread)
+    result = await NaverShoppingService.search_cached(query="이어폰")
+
+    assert naver.calls == 1
+    assert read_threads and read_threads[0] is not loop_thread
+    assert isinstance(result["items"][0]["last_fetched_at"], datetime)
+    key = NaverShoppingService.search_cache_key("이어폰", 10, 1, "sim")
+    assert search_cache.get(key)[1] == CACHE_FRESH
@@ -0,0 +1,94 @@
+from app.domain.product import service as product_service
+from app.domain.product.favorite_index import FavoriteIndexRegistry, FavoriteSearchIndex, ngrams
+from tests.conftest import create_favorite, naver_item
+
+
+def _fields(title: str, brand: str = "", category1: str = ""):
+    return {"title": title, "brand": brand, "category1": category1}
+
+
+def test_ngrams_split_tokens_into_bigrams():
+    assert ngrams("무선이어폰 A") == {"무선", "선이", "이어", "어폰", "a"}
+    assert ngrams("") == set()
+
+
+def test_full_title_match_ranks_ahead_of_partial_match():
+    index = FavoriteSearchIndex(signature=(0, 0))
+    index.add(1, _fields("무선 이어폰"))
+    index.add(2, _fields("이어폰 무선 충전 케이스"))
+    index.add(3, _fields("유선 이어폰"))
+    index.add(4, _fields("블루투스 스피커", category1="무선 이어폰"))
+
+    # 같은 n-gram 점수면 최근 저장(2) 이 먼저지만 상품명 전체 일치(1) 가산점이 우선
+    assert index.search("무선 이어폰") == [1, 2, 4]
+    assert index.search("이어폰 케이스") == [2]
+    assert index.search("헤드폰") == []
+
+    index.remove(1)
+    assert index.search("무선 이어폰") == [2, 4]
+
+
+def test_registry_drops_index_when_signature_changes():
+    registry = FavoriteIndexRegistry(max_users=1)
+    registry.build(1, (1, 10), [(10, _fields("무선 이어폰"))])
+
+    registry.on_saved(1, 11, _fields("유선 이어폰"))
+    index = registry.get(1, (2, 11))
+    assert index is not None and index.search("이어폰") == [11, 10]
+
+    registry.on_deleted(1, 10)
+    assert registry.get(1, (1, 11)) is index
+    # 최대 id 를 지우면 다음 검색 때 다시 생성
+    registry.on_deleted(1, 11)
+    assert registry.get(1, (0, 0)) is None
+
+    registry.build(1, (0, 0), [])
+    registry.build(2, (0, 0), [])
+    assert registry.get(1, (0, 0)) is None
+    assert registry.stats()["evictions"] == 1
+
+
+def _search(client, user, query: str):
+    response = client.get(
+        "/api/v1/products/favorites/search",
+        params={"q": query},
+        headers={"Authorization": str(user)},
+    )
+    assert response.status_code == 200
+    return [item["title"] for item in response.json()["data"]]
+
+
+def test_favorite_search_reflects_save_bulk_save_and_delete(client, db, naver, user):
+    headers = {"Authorization": str(user)}
+    create_favorite(db, user, "1001", title="무선 이어폰")
+    assert _search(client, user, "이어폰") == ["무선 이어폰"]
+
+    # 다른 프로세스에서 저장한 경우: 시그니처가 달라져 다시 생성
+    create_favorite(db, user, "1002", title="유선 이어폰")
+    assert _search(client, user, "이어폰") == ["유선 이어폰", "무선 이어폰"]
+    builds = product_service.favorite_search_indexes.builds
+
+    naver.items = [
+        naver_item("2001", title="노이즈캔슬링 이어폰"),
+        naver_item("2002", title="이어폰 케이스"),
+    ]
+    client.get("/api/v1/products/search", params={"query": "이어폰"})
+    saved = client.post(
+        "/api/v1/products/favorites",
+        json={"source": "NAVER", "source_product_id": "2001"},
+        headers=headers,
+    )
+    bulk = client.post(
+        "/api/v1/products/favorites/bulk",
+        json={"items": [{"source": "NAVER", "source_product_id": "2002"}]},
+        headers=headers,
+    )
+    assert bulk.json()["data"][0]["status"] == "created"
+    assert _search(client, user, "이어폰 케이스") == ["이어폰 케이스 2002"]
+    assert _search(client, user, "노이즈") == ["노이즈캔슬링 이어폰 2001"]
+
+    client.delete(f"/api/v1/products/favorites/{saved.json()['data']['id']}", headers=headers)
+    assert _search(client, user, "노이즈") == []
+    assert len(_search(client, user, "이어폰")) == 3
+    # 이 프로세스의 저장/삭제는 색인을 그대로 갱신
+    assert product_service.favorite_search_indexes.builds == builds
@@ -0,0 +1,85 @@
+import random
+from collections import Counter
+
+import pytest
+
+from app.core.config import settings
+from app.domain.product import heavy_hitters as heavy_hitters_module
+from app.domain.product.heavy_hitters import HeavyHitters
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(heavy_hitters_module, "time", fake)
+    return fake
+
+
+def _tracker(k: int = 5, width: int = 1024, half_life: float = 3600.0) -> HeavyHitters:
+    return HeavyHitters(name="test", k=k, width=width, depth=4, half_life=half_life)
+
+
+def test_top_k_matches_exact_counts(clock):
+    rng = random.Random(1)
+    # 상위 5개는 뚜렷하게 많이, 나머지 500개는 드물게
+    stream = [f"hot-{n}" for n in range(5) for _ in range(200 - n * 20)]
+    stream += [f"cold-{rng.randrange(500)}" for _ in range(2000)]
+    rng.shuffle(stream)
+    tracker = _tracker()
+    for key in stream:
+        tracker.add(key)
+
+    exact = Counter(stream)
+    assert [key for key, _ in tracker.top()] == [key for key, _ in exact.most_common(5)]
+    for key, count in exact.items():
+        # 추정값은 실제보다 작지 않고 초과 오차는 e/width * 전체 이내
+        assert count <= tracker.estimate(key) <= count + 2.72 / 1024 * len(stream)
+    assert tracker.stats()["tracked"] == 5
+
+
+def test_recent_burst_outranks_old_total(clock):
+    tracker = _tracker(half_life=60.0)
+    tracker.add("old", 100)
+    clock.now += 600
+    tracker.add("recent", 10)
+
+    top = tracker.top()
+    assert [key for key, _ in top] == ["recent", "old"]
+    # 10 반감기가 지나 1/1024 로 감쇠
+    assert top[1][1] == pytest.approx(100 / 1024)
+    assert tracker.estimate("recent") == pytest.approx(10)
+
+
+def test_rescale_keeps_decayed_counts(clock):
+    tracker = _tracker(half_life=1.0)
+    tracker.add("old", 2.0**45)
+    clock.now += 41
+    tracker.add("new", 1.0)
+
+    stats = tracker.stats()
+    assert stats["rescales"] == 1
+    assert tracker.estimate("old") == pytest.approx(2.0**4)
+    assert tracker.estimate("new") == pytest.approx(1.0)
+    assert stats["decayed_total"] == pytest.approx(2.0**4 + 1)
+
+    clock.now += 5
+    tracker.add("new", 1.0)
+    assert [key for key, _ in tracker.top()] == ["new", "old"]
+    assert tracker.estimate("old") == pytest.approx(0.5)
+
+
+def test_search_stats_requires_admin_key(client, monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_API_KEY", "admin-key")
+
+    assert client.get("/api/v1/products/search/stats").status_code == 403
+    response = client.get("/api/v1/products/search/stats", headers={"X-Admin-Key": "admin-key"})
+    assert response.status_code == 200
+    assert "cache" in response.json()["data"]
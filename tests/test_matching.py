@@ -0,0 +1,84 @@
+from types import SimpleNamespace
+
+from app.domain.product.matching import (
+    build_search_query,
+    is_same_product,
+    normalize_title,
+    title_tokens,
+)
+from app.domain.product.service import LowestPriceService
+
+TITLE = "소니 WH-1000XM5 노이즈캔슬링 무선 헤드폰"
+
+
+def _same(item_title: str, brand="소니", maker="소니", **item) -> bool:
+    return is_same_product(
+        title=TITLE,
+        brand="소니",
+        maker="소니",
+        source_product_id="1001",
+        item={"title": item_title, "brand": brand, "maker": maker, **item},
+    )
+
+
+def test_title_tokens_drop_promotion_and_tags():
+    assert title_tokens("[무료배송] <b>소니</b> WH-1000XM5 (당일발송)") == ["소니", "wh", "1000xm5"]
+    assert title_tokens(None) == []
+
+
+def test_same_product_across_malls():
+    assert _same("[정품] 소니 WH-1000XM5 노이즈캔슬링 무선 헤드폰 블랙")
+    # 브랜드가 비어 있으면 브랜드는 비교하지 않음
+    assert _same("소니 WH-1000XM5 노이즈캔슬링 헤드폰", brand="", maker="")
+    # productId 가 같으면 상품명과 관계없이 동일
+    assert _same("전혀 다른 이름", brand="보스", source_product_id="1001")
+
+
+def test_different_model_number_is_not_same_product():
+    assert not _same("소니 WH-1000XM4 노이즈캔슬링 무선 헤드폰")
+    assert not _same("소니 WH-1000XM5S 노이즈캔슬링 무선 헤드폰")
+    assert not _same("소니 노이즈캔슬링 무선 헤드폰")
+
+
+def test_different_brand_or_few_common_tokens_is_not_same_product():
+    assert not _same(TITLE, brand="보스")
+    assert not _same(TITLE, maker="보스")
+    assert not _same("소니 WH-1000XM5 케이스")
+
+
+def test_build_search_query_adds_brand_once():
+    assert build_search_query("WH-1000XM5 헤드폰", brand="소니") == "소니 wh 1000xm5 헤드폰"
+    assert build_search_query(TITLE, brand="소니", maker="소니") == normalize_title(TITLE)
+
+
+def test_lowest_price_offers_exclude_other_models():
+    product = SimpleNamespace(title=TITLE, brand="소니", maker="소니", source_product_id="1001")
+
+    def offer(product_id: str, title: str, price: int, mall_name: str):
+        return {
+            "source_product_id": product_id,
+            "title": title,
+            "price": price,
+            "mall_name": mall_name,
+            "brand": "소니",
+            "maker": "소니",
+            "link_url": f"https://example.com/{product_id}",
+        }
+
+    results = [
+        {
+            "items": [
+                offer("2001", "소니 WH-1000XM4 노이즈캔슬링 무선 헤드폰", 250000, "A몰"),
+                offer("2002", TITLE + " 블랙", 390000, "A몰"),
+                offer("2003", TITLE, 380000, "A몰"),
+                offer("2004", TITLE, 400000, "B몰"),
+            ]
+        }
+    ]
+
+    offers = LowestPriceService._collect_offers(product, results)
+
+    assert [(offer["mall_name"], offer["source_product_id"]) for offer in offers] == [
+        ("A몰", "2003"),
+        ("B몰", "2004"),
+    ]
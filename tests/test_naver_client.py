@@ -0,0 +1,58 @@
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.domain.product.naver_client import NaverAPIError, NaverShoppingClient
+
+
+def _client(response: httpx.Response) -> NaverShoppingClient:
+    client = NaverShoppingClient(base_url="https://naver.test/search")
+    client._sync_client = httpx.Client(transport=httpx.MockTransport(lambda request: response))
+    return client
+
+
+def test_search_returns_decoded_json():
+    client = _client(httpx.Response(200, json={"total": 1, "items": [{"productId": "1"}]}))
+
+    assert client.search_sync("이어폰") == {"total": 1, "items": [{"productId": "1"}]}
+
+
+@pytest.mark.parametrize("content", [b"<html>maintenance</html>", b"", b'{"total": 1,'])
+def test_malformed_body_raises_naver_api_error(content):
+    client = _client(httpx.Response(200, content=content))
+
+    with pytest.raises(NaverAPIError) as error:
+        client.search_sync("이어폰")
+    # 상태 코드 없음 = 서킷 브레이커 실패로 기록되는 업스트림 장애
+    assert error.value.status_code is None
+
+
+def test_http_error_keeps_status_code():
+    client = _client(httpx.Response(429, json={"errorCode": "012"}))
+
+    with pytest.raises(NaverAPIError) as error:
+        client.search_sync("이어폰")
+    assert error.value.status_code == 429
+
+
+def test_explicit_zero_and_empty_values_are_not_replaced_by_settings():
+    client = NaverShoppingClient(
+        client_id="",
+        client_secret="",
+        connect_timeout=0,
+        read_timeout=0,
+        pool_timeout=0,
+        max_keepalive_connections=0,
+    )
+
+    assert (client.client_id, client.client_secret) == ("", "")
+    assert (client.timeout.connect, client.timeout.read, client.timeout.pool) == (0, 0, 0)
+    assert client.limits.max_keepalive_connections == 0
+
+
+def test_none_falls_back_to_settings():
+    client = NaverShoppingClient()
+
+    assert client.base_url == settings.NAVER_SEARCH_URL
+    assert client.timeout.read == settings.NAVER_READ_TIMEOUT
+    assert client.limits.max_connections == settings.NAVER_MAX_CONNECTIONS
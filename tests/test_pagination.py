@@ -0,0 +1,73 @@
+from sqlalchemy import inspect, text
+
+from app.common.index_migration import PaginationIndexMigration
+from app.core.database import engine
+from app.domain.friend.models import Friend
+from app.domain.user.models import User
+from tests.conftest import create_favorite
+
+_INDEXES = {
+    "products": "ix_products_user_created",
+    "friends": "ix_friends_owner_created",
+    "wishlist_items": "ix_wishlist_user_created",
+}
+
+
+def _index_names(table):
+    return {index["name"] for index in inspect(engine).get_indexes(table)}
+
+
+def test_index_migration_creates_missing_indexes():
+    # 인덱스 추가 전 기존 DB
+    with engine.begin() as conn:
+        for name in _INDEXES.values():
+            conn.execute(text(f"DROP INDEX {name}"))
+    # 풀에 남은 SQLite 연결의 캐시된 DDL 문이 이전 스키마를 보지 않도록 새 연결 사용
+    engine.dispose()
+
+    assert sorted(PaginationIndexMigration.apply(engine)) == sorted(_INDEXES.values())
+    for table, name in _INDEXES.items():
+        assert name in _index_names(table)
+    # 재실행 안전
+    assert PaginationIndexMigration.apply(engine) == []
+
+
+def test_friend_list_counts_only_when_requested(client, db, user):
+    for index in range(12):
+        friend = User(email=f"friend{index}@example.com", password_hash="x", nickname=f"friend{index}")
+        db.add(friend)
+        db.flush()
+        db.add(Friend(owner_user_id=user, friend_user_id=friend.id))
+    db.commit()
+    headers = {"Authorization": str(user)}
+
+    first = client.get("/api/v1/friends", headers=headers).json()["data"]
+    # 전체 인원은 요청할 때만 계산
+    assert (first["total_count"], first["page"], first["size"]) == (None, 1, 10)
+    assert len(first["items"]) == 10 and first["has_next"]
+
+    second = client.get(
+        "/api/v1/friends", params={"cursor": first["next_cursor"]}, headers=headers
+    ).json()["data"]
+    assert (second["total_count"], second["page"], second["has_next"]) == (None, None, False)
+    assert len(second["items"]) == 2
+
+    with_total = client.get(
+        "/api/v1/friends", params={"include_total": "true"}, headers=headers
+    ).json()["data"]
+    assert with_total["total_count"] == 12
+    legacy = client.get("/api/v1/friends", params={"page": 2}, headers=headers).json()["data"]
+    assert (legacy["total_count"], legacy["page"], len(legacy["items"])) == (12, 2, 2)
+
+
+def test_wishlist_without_size_keeps_list_data(client, db, user):
+    product = create_favorite(db, user)
+    headers = {"Authorization": str(user)}
+    client.post("/api/v1/wishlist", json={"product_id": product.id}, headers=headers)
+
+    body = client.get("/api/v1/wishlist", headers=headers).json()
+
+    # 이전 응답(data 배열)은 그대로, meta 만 추가
+    assert body["success"] is True
+    assert [item["product_id"] for item in body["data"]] == [product.id]
+    assert body["meta"]["has_next"] is False
@@ -0,0 +1,27 @@
+from datetime import datetime
+
+from app.domain.product import parser
+
+
+def test_strip_tags_removes_tags_and_converts_entities():
+    assert parser.strip_tags("<b>소니</b> 헤드폰 &amp; 케이스") == "소니 헤드폰 & 케이스"
+    assert parser.strip_tags("Levi&#39;s") == "Levi's"
+    assert parser.strip_tags("Levi&#x27;s &quot;501&quot;") == 'Levi\'s "501"'
+
+
+def test_strip_tags_leaves_bare_ampersand_and_unknown_entity():
+    assert parser.strip_tags("M&M 초콜릿 & 사탕") == "M&M 초콜릿 & 사탕"
+    assert parser.strip_tags("AT&T &nosuch;") == "AT&T &nosuch;"
+    # 한 번만 변환 (&amp;lt; -> &lt;)
+    assert parser.strip_tags("&amp;lt;b&amp;gt;") == "&lt;b&gt;"
+    assert parser.strip_tags("") == ""
+    assert parser.strip_tags(None) == ""
+
+
+def test_dumps_and_loads_round_trip():
+    value = {"title": "소니 헤드폰", "price": 10000, "items": [1, 2]}
+
+    assert parser.loads(parser.dumps(value)) == value
+    assert parser.loads(parser.dumps({"at": datetime(2024, 1, 1)})) == {
+        "at": "2024-01-01T00:00:00"
+    }
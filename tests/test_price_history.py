@@ -0,0 +1,137 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from app.domain.price_history import codec
+from app.domain.price_history.models import RESOLUTION_DAILY, RESOLUTION_RAW, PriceHistoryDay
+from app.domain.price_history.service import (
+    PriceHistoryService,
+    PriceObservationBuffer,
+    price_observations,
+    to_utc_naive,
+)
+from tests.conftest import create_favorite
+
+KEY = ("NAVER", "1001")
+DAY = datetime(2024, 1, 10)
+
+
+def _record(db, price: int, observed_at: datetime) -> int:
+    return PriceHistoryService.record(db, {KEY: (price, observed_at)})
+
+
+def test_codec_round_trip():
+    offsets = np.array([0, 60, 3600, 86399])
+    prices = np.array([10000, 9000, 12000, 500])
+
+    decoded_offsets, decoded_prices = codec.decode(codec.encode(offsets, prices))
+    assert decoded_offsets.tolist() == offsets.tolist()
+    assert decoded_prices.tolist() == prices.tolist()
+
+    appended = codec.decode(codec.append(codec.encode(offsets, prices), 86400, 700))
+    assert appended[0].tolist()[-1] == 86400 and appended[1].tolist()[-1] == 700
+
+    assert codec.encode(np.array([]), np.array([])) == b""
+    assert [part.tolist() for part in codec.decode(b"")] == [[], []]
+
+
+def test_record_skips_same_price_and_older_observation(db):
+    assert _record(db, 100, DAY) == 1
+    assert _record(db, 100, DAY + timedelta(hours=1)) == 0
+    assert _record(db, 50, DAY - timedelta(hours=1)) == 0
+    assert _record(db, 50, DAY + timedelta(hours=12)) == 1
+
+    row = db.query(PriceHistoryDay).one()
+    assert (row.point_count, row.open_price, row.close_price) == (2, 100, 50)
+    assert (row.min_price, row.max_price) == (50, 100)
+    assert [part.tolist() for part in codec.decode(row.points)] == [[0, 43200], [100, 50]]
+
+
+def test_observation_buffer_keeps_last_value_and_limits_keys():
+    buffer = PriceObservationBuffer(max_keys=1)
+    buffer.add("NAVER", "1", 100, DAY)
+    buffer.add("NAVER", "1", 90, DAY + timedelta(minutes=1))
+    buffer.add("NAVER", "2", 100, DAY)
+    buffer.add("NAVER", "3", 0, DAY)
+
+    assert buffer.drain() == {("NAVER", "1"): (90, DAY + timedelta(minutes=1))}
+    assert buffer.dropped == 1
+    assert len(buffer) == 0
+
+
+def test_flush_records_only_favorited_products(db, user):
+    create_favorite(db, user, "1001")
+    price_observations.add("NAVER", "1001", 9000, DAY)
+    price_observations.add("NAVER", "9999", 9000, DAY)
+
+    assert PriceHistoryService.flush_observations(db) == 1
+    assert [row.source_product_id for row in db.query(PriceHistoryDay).all()] == ["1001"]
+    assert len(price_observations) == 0
+
+
+def test_downsample_keeps_daily_summary_of_old_days(db):
+    today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    old = today - timedelta(days=40)
+    _record(db, 100, old)
+    _record(db, 80, old + timedelta(hours=1))
+    _record(db, 70, today)
+
+    assert PriceHistoryService.downsample(db, raw_days=30) == 1
+
+    rows = {row.day: row for row in db.query(PriceHistoryDay).all()}
+    summary = rows[old.date()]
+    assert (summary.resolution, summary.points) == (RESOLUTION_DAILY, None)
+    assert (summary.open_price, summary.close_price, summary.min_price) == (100, 80, 80)
+    assert rows[today.date()].resolution == RESOLUTION_RAW
+    assert PriceHistoryService.downsample(db, raw_days=30) == 0
+
+
+def test_get_series_min_max_time_weighted_avg(db):
+    _record(db, 40, DAY - timedelta(days=3))
+    _record(db, 100, DAY)
+    _record(db, 50, DAY + timedelta(hours=12))
+
+    series = PriceHistoryService.get_series(db, *KEY, DAY, DAY + timedelta(days=1))
+    assert [point["price"] for point in series["points"]] == [100, 50]
+    assert series["stats"] == {
+        "min": 50,
+        "max": 100,
+        "avg": 75.0,
+        "first": 100,
+        "last": 50,
+        "count": 2,
+    }
+    assert (series["all_time_low"], series["is_all_time_low"]) == (40, False)
+
+    # 구간 시작 시점 가격(06시 = 100)을 첫 점으로 포함
+    carried = PriceHistoryService.get_series(
+        db, *KEY, DAY + timedelta(hours=6), DAY + timedelta(days=1)
+    )
+    assert [point["price"] for point in carried["points"]] == [100, 50]
+    assert carried["stats"]["avg"] == pytest.approx((100 * 6 + 50 * 12) / 18)
+
+
+def test_get_series_accepts_timezone_aware_bounds(db):
+    _record(db, 100, DAY)
+    start = datetime(2024, 1, 10, 9, tzinfo=timezone(timedelta(hours=9)))
+
+    assert to_utc_naive(start) == DAY
+    series = PriceHistoryService.get_series(db, *KEY, start, start + timedelta(hours=1))
+    assert series["points"][0]["observed_at"] == DAY
+
+
+def test_price_history_api_with_utc_suffix(client, db, user):
+    product = create_favorite(db, user, "1001")
+    headers = {"Authorization": str(user)}
+    url = f"/api/v1/products/{product.id}/price-history"
+
+    response = client.get(url, params={"start": "2024-01-01T00:00:00Z"}, headers=headers)
+    assert response.status_code == 200
+
+    reversed_range = client.get(
+        url,
+        params={"start": "2024-01-02T00:00:00Z", "end": "2024-01-01T00:00:00+00:00"},
+        headers=headers,
+    )
+    assert reversed_range.status_code == 400
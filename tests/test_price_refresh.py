@@ -0,0 +1,114 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.domain.product.naver_client import NaverAPIError
+from app.domain.product.models import CatalogProduct
+from app.domain.product.matching import build_search_query
+from app.domain.product.price_refresh import PriceRefreshService
+from app.domain.product.router import _load_product_detail
+from app.domain.product.service import NAVER_MAX_DISPLAY, NaverShoppingService, search_cache
+from tests.conftest import create_favorite, naver_item
+
+
+def _cache_stale_price(product, price: int, ttl: float = 0) -> None:
+    """갱신 대상 상품의 검색 결과를 캐시에 넣어 둠 (기본은 만료된 항목)"""
+    key = NaverShoppingService.search_cache_key(
+        build_search_query(product.title, product.brand, product.maker),
+        NAVER_MAX_DISPLAY,
+        1,
+        "sim",
+    )
+    item = {
+        "source": "NAVER",
+        "source_product_id": product.source_product_id,
+        "price": price,
+        "last_fetched_at": datetime.utcnow() - timedelta(hours=1),
+    }
+    search_cache.set(key, {"items": [item], "total": 1}, ttl=ttl, stale_ttl=3600)
+
+
+@pytest.mark.anyio
+async def test_refresh_batch_reads_upstream_not_cache(db, user, naver):
+    product = create_favorite(db, user, "1001", price=10000)
+    _cache_stale_price(product, 7000)
+    naver.items = [naver_item("1001", price=9000)]
+
+    result = await PriceRefreshService.refresh_batch(db, stale_seconds=0)
+
+    assert naver.calls == 1
+    assert result["refreshed"] == 1
+    catalog = db.get(CatalogProduct, product.catalog_product_id)
+    db.refresh(catalog)
+    assert catalog.price == 9000
+
+
+@pytest.mark.anyio
+async def test_refresh_batch_counts_upstream_outage_as_failed(db, user, naver):
+    product = create_favorite(db, user, "1001", price=10000)
+    _cache_stale_price(product, 7000)
+    naver.error = NaverAPIError("upstream down", status_code=503)
+
+    result = await PriceRefreshService.refresh_batch(db, stale_seconds=0)
+
+    assert result["refreshed"] == 0
+    assert result["failed"] == 1
+    catalog = db.get(CatalogProduct, product.catalog_product_id)
+    db.refresh(catalog)
+    # 캐시의 오래된 가격을 새로 조회한 가격으로 기록하지 않음
+    assert catalog.price == 10000
+    assert catalog.last_fetched_at is None
+
+
+def test_product_detail_refresh_reads_upstream_not_cache(client, db, user, naver):
+    product = create_favorite(db, user, "1001", price=10000)
+    # 캐시에 남은 값이 fresh 여도 상품 상세 갱신은 네이버에서 조회
+    _cache_stale_price(product, 7000, ttl=600)
+    naver.items = [naver_item("1001", price=9000)]
+
+    response = client.get(
+        f"/api/v1/products/{product.id}",
+        params={"refresh": "stale"},
+        headers={"Authorization": str(user)},
+    )
+
+    assert response.status_code == 200
+    assert naver.calls == 1
+    assert response.json()["data"]["price"] == 9000
+
+
+def test_product_detail_checks_staleness_off_event_loop(client, db, user, naver, monkeypatch):
+    product = create_favorite(db, user, "1001", price=10000)
+    is_stale = PriceRefreshService.is_stale
+    threads = []
+
+    def recording_is_stale(target, fresh_seconds):
+        try:
+            asyncio.get_running_loop()
+            threads.append("event_loop")
+        except RuntimeError:
+            threads.append("threadpool")
+        return is_stale(target, fresh_seconds)
+
+    monkeypatch.setattr(PriceRefreshService, "is_stale", staticmethod(recording_is_stale))
+
+    response = client.get(
+        f"/api/v1/products/{product.id}",
+        params={"refresh": "stale"},
+        headers={"Authorization": str(user)},
+    )
+
+    assert response.status_code == 200
+    assert threads == ["threadpool"]
+
+
+def test_load_product_detail_returns_serialized_detail(db, user):
+    product = create_favorite(db, user, "1001", price=10000)
+
+    detail, target = _load_product_detail(db, user, product.id, refresh_stale=True)
+
+    assert detail.price == 10000 and detail.source_product_id == "1001"
+    # 한 번도 조회하지 않은 상품은 갱신 대상
+    assert target.catalog_product_id == product.catalog_product_id
+    assert target.price == 10000
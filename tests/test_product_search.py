@@ -0,0 +1,152 @@
+import json
+
+import pytest
+
+from app.domain.product import service as product_service
+from app.domain.product.naver_client import NaverAPIError
+from tests.conftest import naver_item
+
+
+def test_search_without_annotate_does_not_open_db_session(client, naver, monkeypatch):
+    def no_session():
+        raise AssertionError("DB session opened for a plain search")
+
+    monkeypatch.setattr(product_service, "SessionLocal", no_session)
+
+    response = client.get("/api/v1/products/search", params={"query": "이어폰"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["data"][0]["source_product_id"] == "1001"
+    assert "is_favorited" not in body["data"][0]
+
+
+def test_search_annotate_marks_favorites(client, naver, user):
+    client.get("/api/v1/products/search", params={"query": "이어폰"})
+    saved = client.post(
+        "/api/v1/products/favorites",
+        json={"source": "NAVER", "source_product_id": "1001"},
+        headers={"Authorization": str(user)},
+    )
+    assert saved.status_code == 200
+
+    response = client.get(
+        "/api/v1/products/search",
+        params={"query": "이어폰", "annotate": "true"},
+        headers={"Authorization": str(user)},
+    )
+
+    item = response.json()["data"][0]
+    assert item["is_favorited"] is True
+    assert item["favorite_id"] == saved.json()["data"]["id"]
+    assert item["in_wishlist"] is False
+
+
+def test_save_favorites_after_disk_cache_hit(client, naver, user):
+    # 재시작 후처럼 인메모리 캐시가 비어 있고 디스크 캐시(L2)만 남은 상태
+    client.get("/api/v1/products/search", params={"query": "이어폰"})
+    product_service.search_disk_cache.flush()
+    product_service.search_cache.clear()
+    product_service.search_snapshots.clear()
+
+    response = client.get("/api/v1/products/search", params={"query": "이어폰"})
+    assert response.status_code == 200
+    assert naver.calls == 1
+
+    headers = {"Authorization": str(user)}
+    saved = client.post(
+        "/api/v1/products/favorites",
+        json={"source": "NAVER", "source_product_id": "1001"},
+        headers=headers,
+    )
+    assert saved.status_code == 200
+    bulk = client.post(
+        "/api/v1/products/favorites/bulk",
+        json={"items": [{"source": "NAVER", "source_product_id": "1001"}]},
+        headers=headers,
+    )
+    assert bulk.status_code == 200
+    assert bulk.json()["data"][0]["status"] == "existing"
+
+
+def test_save_favorite_uses_only_catalog_fields(client, user):
+    # JSON 왕복한 스냅샷 (문자열 시각 + 원본 상품 컬럼이 아닌 키)
+    snapshot = {
+        "source": "NAVER",
+        "source_product_id": "2002",
+        "title": "테스트 상품",
+        "price": 10000,
+        "last_fetched_at": "2024-01-01T00:00:00",
+        "is_favorited": False,
+    }
+    product_service.NaverShoppingService.remember_snapshots([snapshot])
+
+    response = client.post(
+        "/api/v1/products/favorites",
+        json={"source": "NAVER", "source_product_id": "2002"},
+        headers={"Authorization": str(user)},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["data"]["last_fetched_at"].startswith("2024-01-01T00:00:00")
+
+
+async def _deep_search(**kwargs):
+    failed_pages = []
+    items = [
+        item
+        async for item in product_service.NaverShoppingService.deep_search(
+            query="이어폰", failed_pages=failed_pages, **kwargs
+        )
+    ]
+    return [item["source_product_id"] for item in items], failed_pages
+
+
+@pytest.mark.anyio
+async def test_deep_search_dedupes_across_pages(naver):
+    # 두 번째 페이지 첫 항목이 첫 페이지 항목과 같은 상품
+    naver.items = [naver_item(str(number)) for number in range(200)]
+    naver.items[100] = naver_item("0")
+
+    product_ids, failed_pages = await _deep_search()
+
+    assert len(product_ids) == len(set(product_ids)) == 199
+    assert failed_pages == []
+
+
+@pytest.mark.anyio
+async def test_deep_search_stops_at_limit_and_upstream_total(naver):
+    naver.items = [naver_item(str(number)) for number in range(1000)]
+    product_ids, _ = await _deep_search(limit=150)
+    assert len(product_ids) == 150
+    assert sorted(naver.starts) == [1, 101]
+
+    # 결과가 120개뿐이면 세 번째 페이지부터는 호출하지 않음
+    naver.items = naver.items[:120]
+    naver.starts.clear()
+    product_ids, _ = await _deep_search(sort="asc")
+    assert len(product_ids) == 120
+    assert sorted(naver.starts) == [1, 101]
+
+
+@pytest.mark.anyio
+async def test_deep_search_reports_failed_pages(naver):
+    naver.items = [naver_item(str(number)) for number in range(300)]
+    naver.page_errors[101] = NaverAPIError("upstream down", status_code=503)
+
+    product_ids, failed_pages = await _deep_search()
+
+    assert failed_pages == [101]
+    assert product_ids[:100] == [str(number) for number in range(100)]
+    assert sorted(product_ids) == sorted(str(n) for n in [*range(100), *range(200, 300)])
+
+
+def test_deep_search_stream_ends_with_summary(client, naver):
+    naver.items = [naver_item(str(number)) for number in range(150)]
+    naver.page_errors[101] = NaverAPIError("upstream down", status_code=503)
+
+    response = client.get("/api/v1/products/search", params={"query": "이어폰", "deep": "true"})
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["type"] for line in lines] == ["item"] * 100 + ["end"]
+    assert lines[-1] == {"type": "end", "returned": 100, "failed_pages": [101]}
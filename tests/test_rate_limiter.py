@@ -0,0 +1,75 @@
+import pytest
+
+from app.core.exceptions import TooManyRequestsException
+from app.domain.product.rate_limiter import (
+    PRIORITY_INTERACTIVE,
+    PRIORITY_PREFETCH,
+    PRIORITY_PRICE_REFRESH,
+    NaverRateLimiter,
+    PriorityPolicy,
+)
+
+
+def _limiter(daily_budget: int = 1000, rate_per_second: float = 0.001, burst: int = 10):
+    # 충전 속도를 거의 0 으로 두어 테스트 중 토큰이 늘지 않도록 함
+    return NaverRateLimiter(daily_budget, rate_per_second, burst)
+
+
+def test_background_priority_keeps_token_floor_for_interactive():
+    limiter = _limiter(burst=10)
+    granted = 0
+    while limiter.try_acquire(PRIORITY_PRICE_REFRESH):
+        granted += 1
+
+    # price_refresh 는 버킷의 절반을 남겨둠
+    assert granted == 5
+    assert limiter.try_acquire(PRIORITY_PREFETCH) is False
+    for _ in range(5):
+        assert limiter.try_acquire(PRIORITY_INTERACTIVE) is True
+    assert limiter.try_acquire(PRIORITY_INTERACTIVE) is False
+
+
+def test_daily_floor_sheds_low_priority_first():
+    limiter = _limiter(daily_budget=10, rate_per_second=1000, burst=100)
+    for _ in range(5):
+        limiter.acquire(PRIORITY_INTERACTIVE)
+
+    with pytest.raises(TooManyRequestsException):
+        limiter.acquire(PRIORITY_PREFETCH)
+    limiter.acquire(PRIORITY_PRICE_REFRESH)
+    for _ in range(4):
+        limiter.acquire(PRIORITY_INTERACTIVE)
+    with pytest.raises(TooManyRequestsException):
+        limiter.acquire(PRIORITY_INTERACTIVE)
+    assert limiter.remaining_daily == 0
+    assert limiter.stats()["shed"][PRIORITY_PREFETCH] == 1
+
+
+def test_acquire_denied_when_wait_exceeds_max_wait():
+    limiter = NaverRateLimiter(
+        daily_budget=1000,
+        rate_per_second=0.001,
+        burst=1,
+        policies={PRIORITY_INTERACTIVE: PriorityPolicy(0.0, 0.0, 0.05)},
+    )
+    limiter.acquire(PRIORITY_INTERACTIVE)
+    with pytest.raises(TooManyRequestsException):
+        limiter.acquire(PRIORITY_INTERACTIVE)
+
+
+@pytest.mark.anyio
+async def test_acquire_async_waits_for_refill():
+    limiter = NaverRateLimiter(daily_budget=1000, rate_per_second=100, burst=1)
+    await limiter.acquire_async(PRIORITY_INTERACTIVE)
+    await limiter.acquire_async(PRIORITY_INTERACTIVE)
+
+    stats = limiter.stats()
+    assert stats["granted"][PRIORITY_INTERACTIVE] == 2
+    assert stats["waited"][PRIORITY_INTERACTIVE] == 1
+
+
+def test_upstream_throttle_empties_bucket():
+    limiter = _limiter(burst=10)
+    limiter.on_upstream_throttled()
+    assert limiter.try_acquire(PRIORITY_INTERACTIVE) is False
+    assert limiter.stats()["upstream_throttled"] == 1
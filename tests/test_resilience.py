@@ -0,0 +1,236 @@
+import asyncio
+
+import pytest
+
+from app.domain.product import resilience
+from app.domain.product.naver_client import NaverShoppingClient
+from app.domain.product.resilience import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    HedgeStats,
+    hedged,
+)
+from benchmarks.naver_stub import NaverStubServer
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(resilience, "time", fake)
+    return fake
+
+
+def _breaker(**kwargs) -> CircuitBreaker:
+    options = dict(
+        name="test",
+        window_size=10,
+        min_calls=4,
+        failure_ratio=0.5,
+        slow_call_seconds=1.0,
+        slow_call_ratio=0.8,
+        open_seconds=30.0,
+        half_open_max_calls=2,
+    )
+    options.update(kwargs)
+    return CircuitBreaker(**options)
+
+
+def _fail(breaker: CircuitBreaker, times: int) -> None:
+    for _ in range(times):
+        breaker.before_call()
+        breaker.record_failure()
+
+
+def test_breaker_opens_on_failure_ratio(clock):
+    breaker = _breaker()
+    for _ in range(2):
+        breaker.before_call()
+        breaker.record_success(0.1)
+    _fail(breaker, 1)
+    assert breaker.state == STATE_CLOSED  # min_calls 미만
+
+    _fail(breaker, 1)
+    assert breaker.state == STATE_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    assert breaker.stats()["rejected"] == 1
+
+
+def test_breaker_opens_on_slow_calls(clock):
+    breaker = _breaker()
+    for _ in range(4):
+        breaker.before_call()
+        breaker.record_success(2.0)
+    assert breaker.state == STATE_OPEN
+
+
+def test_breaker_open_half_open_closed(clock):
+    breaker = _breaker()
+    _fail(breaker, 4)
+    assert breaker.state == STATE_OPEN
+
+    clock.now += 30
+    assert breaker.state == STATE_HALF_OPEN
+    breaker.before_call()
+    breaker.before_call()
+    # 시험 호출 수 제한
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_success(0.1)
+    assert breaker.state == STATE_HALF_OPEN
+    breaker.record_success(0.1)
+    assert breaker.state == STATE_CLOSED
+    assert breaker.stats()["window_calls"] == 0
+
+
+def test_breaker_half_open_failure_reopens(clock):
+    breaker = _breaker()
+    _fail(breaker, 4)
+    clock.now += 30
+    breaker.before_call()
+    breaker.record_failure()
+
+    assert breaker.state == STATE_OPEN
+    assert breaker.stats()["opened_count"] == 2
+    clock.now += 29
+    assert breaker.state == STATE_OPEN
+
+
+def test_breaker_cancelled_call_frees_half_open_slot(clock):
+    breaker = _breaker(half_open_max_calls=1)
+    _fail(breaker, 4)
+    clock.now += 30
+    breaker.before_call()
+    breaker.record_cancelled()
+    breaker.before_call()  # 반환된 슬롯으로 다시 시험 호출
+
+
+@pytest.mark.anyio
+async def test_hedge_not_sent_when_first_call_is_fast():
+    stats = HedgeStats()
+    calls = 0
+
+    async def call():
+        nonlocal calls
+        calls += 1
+        return "first"
+
+    assert await hedged(call, delay=0.05, can_hedge=lambda: True, hedge_stats=stats) == "first"
+    assert calls == 1
+    assert stats.stats() == {"hedged": 0, "hedge_won": 0, "skipped": 0}
+
+
+@pytest.mark.anyio
+async def test_hedge_wins_and_slow_call_is_cancelled():
+    stats = HedgeStats()
+    cancelled = asyncio.Event()
+    calls = 0
+
+    async def call():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return "slow"
+        return "hedge"
+
+    result = await hedged(call, delay=0.01, can_hedge=lambda: True, hedge_stats=stats)
+
+    assert result == "hedge"
+    assert stats.hedged == 1
+    assert stats.hedge_won == 1
+    await asyncio.wait_for(cancelled.wait(), timeout=1.0)
+
+
+@pytest.mark.anyio
+async def test_hedge_skipped_without_budget():
+    stats = HedgeStats()
+
+    async def call():
+        await asyncio.sleep(0.03)
+        return "first"
+
+    assert await hedged(call, delay=0.01, can_hedge=lambda: False, hedge_stats=stats) == "first"
+    assert stats.skipped == 1
+    assert stats.hedged == 0
+
+
+@pytest.mark.anyio
+async def test_hedge_cancelled_call_does_not_break_other_result():
+    calls = 0
+
+    async def call():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(0.03)
+            raise asyncio.CancelledError()
+        await asyncio.sleep(0.06)
+        return "hedge"
+
+    assert await hedged(call, delay=0.01, can_hedge=lambda: True) == "hedge"
+
+
+@pytest.mark.anyio
+async def test_hedge_raises_last_error_when_all_fail():
+    calls = 0
+
+    async def call():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.02)
+        raise ValueError(f"call {calls}")
+
+    with pytest.raises(ValueError):
+        await hedged(call, delay=0.01, can_hedge=lambda: True)
+    assert calls == 2
+
+
+class SlowFirstStub(NaverStubServer):
+    """첫 요청만 느리게 응답하는 스텁 (꼬리 지연 주입)"""
+
+    def _delay(self) -> float:
+        return 2.0 if self.request_count == 1 else 0.01
+
+
+@pytest.mark.anyio
+async def test_hedge_against_stub_server_with_injected_latency():
+    stub = SlowFirstStub(port=0)
+    await stub.start()
+    port = stub._server.sockets[0].getsockname()[1]
+    client = NaverShoppingClient(base_url=f"http://127.0.0.1:{port}/v1/search/shop.json")
+    stats = HedgeStats()
+    try:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        result = await hedged(
+            lambda: client.search(query="이어폰", display=5),
+            delay=0.1,
+            can_hedge=lambda: True,
+            hedge_stats=stats,
+        )
+        elapsed = loop.time() - started
+    finally:
+        await client.aclose()
+        await stub.stop()
+
+    assert len(result["items"]) == 5
+    assert stats.hedge_won == 1
+    assert stub.request_count == 2
+    assert elapsed < 1.0
@@ -0,0 +1,78 @@
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+from app.core.database import engine
+from app.domain.friend.models import Friend
+from app.domain.room.models import Room, RoomParticipant
+from app.domain.user.models import User
+
+
+@contextmanager
+def count_queries():
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def create_rooms(db, owner_id: int, member_id: int, count: int) -> None:
+    rooms = [
+        Room(
+            room_type="WISHLIST_GIFT",
+            title=f"방 {index}",
+            status="OPEN",
+            max_participants=4,
+            owner_user_id=owner_id,
+            gift_owner_user_id=owner_id,
+        )
+        for index in range(count)
+    ]
+    db.add_all(rooms)
+    db.flush()
+    for room in rooms:
+        db.add(RoomParticipant(room_id=room.id, user_id=owner_id, role="OWNER", state="JOINED"))
+        db.add(RoomParticipant(room_id=room.id, user_id=member_id, role="MEMBER", state="JOINED"))
+    db.commit()
+
+
+@pytest.fixture
+def member(db):
+    row = User(email="member@example.com", password_hash="x", nickname="member")
+    db.add(row)
+    db.commit()
+    return row.id
+
+
+@pytest.mark.parametrize(
+    "path", ["/api/v1/rooms/my", "/api/v1/rooms/friends", "/api/v1/rooms/participating"]
+)
+def test_room_list_query_count_does_not_grow_with_rooms(client, db, user, member, path):
+    # user 가 방을 만들고 member 가 모두 참여, member 는 user 를 친구로 등록
+    db.add(Friend(owner_user_id=member, friend_user_id=user))
+    db.commit()
+    viewer = user if path.endswith("/my") else member
+
+    def list_rooms():
+        with count_queries() as statements:
+            response = client.get(path, headers={"Authorization": str(viewer)})
+        assert response.status_code == 200
+        return response.json()["data"], len(statements)
+
+    create_rooms(db, user, member, 1)
+    rooms, one_room_queries = list_rooms()
+    assert len(rooms) == 1
+
+    create_rooms(db, user, member, 499)
+    rooms, many_rooms_queries = list_rooms()
+    assert len(rooms) == 500
+    assert {room["current_participant_count"] for room in rooms} == {2}
+
+    assert many_rooms_queries == one_room_queries
@@ -0,0 +1,126 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.domain.product import parser
+from app.domain.product.naver_client import NaverAPIError
+from app.domain.product.service import NAVER_MAX_DISPLAY, NaverShoppingService, search_cache
+from app.domain.saved_search.models import (
+    DELTA_CHEAPER,
+    DELTA_NEW,
+    SavedSearch,
+    SavedSearchDelta,
+    SavedSearchState,
+)
+from app.domain.saved_search.service import SavedSearchService, diff_snapshot, merge_snapshot
+from tests.conftest import naver_item
+
+
+def _item(product_id: str, price: int):
+    return {"source_product_id": product_id, "price": price}
+
+
+def test_diff_snapshot_reports_new_and_cheaper_only():
+    previous = {"1": 10000, "2": 5000, "3": 3000}
+    items = [_item("1", 9000), _item("2", 5000), _item("3", 4000), _item("4", 100), _item("5", 0)]
+
+    changes = diff_snapshot(previous, items + [_item("4", 50)])
+
+    assert [(kind, item["source_product_id"], before) for kind, item, before in changes] == [
+        (DELTA_CHEAPER, "1", 10000),
+        (DELTA_NEW, "4", None),
+    ]
+
+
+def test_merge_snapshot_keeps_unseen_previous_items_up_to_max():
+    previous = {"1": 10000, "2": 5000, "3": 3000}
+
+    assert merge_snapshot(previous, [_item("1", 9000), _item("9", 0)], max_items=10) == {
+        "1": 9000,
+        "2": 5000,
+        "3": 3000,
+    }
+    assert merge_snapshot(previous, [_item("4", 100), _item("5", 200)], max_items=3) == {
+        "4": 100,
+        "5": 200,
+        "1": 10000,
+    }
+
+
+def test_prune_removes_old_deltas_and_orphan_states(db):
+    now = datetime.utcnow()
+    for days in (1, 40):
+        db.add(
+            SavedSearchDelta(
+                query_key="이어폰",
+                sort="sim",
+                kind=DELTA_NEW,
+                source="NAVER",
+                source_product_id="1001",
+                title="상품",
+                price=1000,
+                created_at=now - timedelta(days=days),
+            )
+        )
+    db.add(SavedSearchState(query_key="이어폰", sort="sim", snapshot=b"{}", checked_at=now))
+    db.commit()
+
+    assert SavedSearchService.prune(db, retention_days=30) == {"deltas": 1, "states": 1}
+    assert db.query(SavedSearchDelta).count() == 1
+    assert db.query(SavedSearchState).count() == 0
+
+
+@pytest.fixture
+def saved_search(db, user):
+    row = SavedSearch(user_id=user, query="이어폰", query_key="이어폰", sort="sim")
+    db.add(row)
+    db.commit()
+    return row
+
+
+def _deltas(db):
+    return {
+        (delta.kind, delta.source_product_id, delta.price, delta.previous_price)
+        for delta in db.query(SavedSearchDelta).all()
+    }
+
+
+@pytest.mark.anyio
+async def test_run_batch_records_new_items_and_price_drops(db, naver, saved_search):
+    naver.items = [naver_item("1001", price=10000), naver_item("1002", price=20000)]
+    first = await SavedSearchService.run_batch(db, interval=0)
+    # 첫 실행은 스냅샷만 남김
+    assert (first["searched"], first["deltas"]) == (1, 0)
+
+    naver.items = [
+        naver_item("1001", price=9000),
+        naver_item("1002", price=21000),
+        naver_item("1003", price=5000),
+    ]
+    second = await SavedSearchService.run_batch(db, interval=0)
+
+    assert naver.calls == 2
+    assert second["deltas"] == 2
+    assert _deltas(db) == {(DELTA_CHEAPER, "1001", 9000, 10000), (DELTA_NEW, "1003", 5000, None)}
+
+
+@pytest.mark.anyio
+async def test_run_batch_ignores_cache_and_keeps_state_on_outage(db, naver, saved_search):
+    naver.items = [naver_item("1001", price=10000)]
+    await SavedSearchService.run_batch(db, interval=0)
+    state = db.query(SavedSearchState).one()
+    checked_at, snapshot = state.checked_at, state.snapshot
+
+    # 캐시에 더 싼 (오래된) 결과가 남아 있어도 사용하지 않음
+    key = NaverShoppingService.search_cache_key("이어폰", NAVER_MAX_DISPLAY, 1, "sim")
+    cached = NaverShoppingService.parse_products({"items": [naver_item("1001", price=5000)]})
+    search_cache.set(key, {"items": cached, "total": 1}, ttl=600)
+    naver.error = NaverAPIError("upstream down", status_code=503)
+
+    result = await SavedSearchService.run_batch(db, interval=0)
+
+    assert (result["searched"], result["failed"], result["deltas"]) == (0, 1, 0)
+    db.refresh(state)
+    assert (state.checked_at, state.snapshot) == (checked_at, snapshot)
+    assert parser.loads(state.snapshot) == {"1001": 10000}
+    assert _deltas(db) == set()
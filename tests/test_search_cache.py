@@ -0,0 +1,188 @@
+import asyncio
+
+import pytest
+
+from app.core.config import settings
+from app.domain.product import cache as cache_module
+from app.domain.product import service as product_service
+from app.domain.product.cache import CACHE_FRESH, CACHE_MISS, CACHE_STALE, TTLCache
+from app.domain.product.prefetch import SKIP_BUDGET, SKIP_CACHED, SKIP_LAST_PAGE
+from app.domain.product.rate_limiter import PRIORITY_PREFETCH, NaverRateLimiter
+from app.domain.product.service import NaverShoppingService, search_cache
+from tests.conftest import naver_item
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(cache_module, "time", fake)
+    return fake
+
+
+def test_fresh_stale_miss_transitions(clock):
+    cache = TTLCache(name="test", ttl=10, stale_ttl=20, max_bytes=1024 * 1024)
+    cache.set("key", "value")
+
+    assert cache.get("key") == ("value", CACHE_FRESH)
+    clock.now += 15
+    assert cache.get("key") == ("value", CACHE_STALE)
+    clock.now += 20
+    assert cache.get("key") == (None, CACHE_MISS)
+    # 만료된 항목도 fallback 용으로 남아 있음
+    assert cache.peek("key") == "value"
+    assert cache.stats()["expirations"] == 1
+
+
+def test_per_key_ttl(clock):
+    cache = TTLCache(name="test", ttl=10, stale_ttl=20, max_bytes=1024 * 1024)
+    cache.set("short", "value", ttl=1, stale_ttl=0)
+    clock.now += 2
+    assert cache.get("short") == (None, CACHE_MISS)
+
+
+def test_lru_eviction_by_bytes(clock):
+    value = "x" * 100
+    size = cache_module.estimate_size("a") + cache_module.estimate_size(value)
+    cache = TTLCache(name="test", ttl=10, max_bytes=size * 2)
+    cache.set("a", value)
+    cache.set("b", value)
+    cache.get("a")  # a 를 최근 사용으로
+    cache.set("c", value)
+
+    assert cache.get("b") == (None, CACHE_MISS)
+    assert cache.get("a")[1] == CACHE_FRESH
+    assert cache.get("c")[1] == CACHE_FRESH
+    assert cache.stats()["evictions"] == 1
+    assert cache.current_bytes <= cache.max_bytes
+
+
+def test_begin_refresh_allows_one_refresh_per_key():
+    cache = TTLCache(name="test", ttl=10, max_bytes=1024)
+    assert cache.begin_refresh("key") is True
+    assert cache.begin_refresh("key") is False
+    cache.end_refresh("key")
+    assert cache.begin_refresh("key") is True
+
+
+@pytest.mark.anyio
+async def test_stale_entry_served_while_refreshed_once(naver):
+    key = NaverShoppingService.search_cache_key("이어폰", 10, 1, "sim")
+    stale_value = {"items": [], "total": 0}
+    search_cache.set(key, stale_value, ttl=0, stale_ttl=60)
+
+    results = await asyncio.gather(
+        *(NaverShoppingService.search_cached(query="이어폰") for _ in range(5))
+    )
+    assert all(result is stale_value for result in results)
+
+    # 백그라운드 갱신 완료 대기
+    for _ in range(100):
+        if not search_cache.stats()["refreshing"]:
+            break
+        await asyncio.sleep(0.01)
+    assert naver.calls == 1
+    refreshed, state = search_cache.get(key)
+    assert state == CACHE_FRESH
+    assert refreshed["items"][0]["source_product_id"] == "1001"
+
+
+@pytest.mark.anyio
+async def test_stale_refresh_uses_prefetch_priority(naver, monkeypatch):
+    limiter = NaverRateLimiter(daily_budget=2, rate_per_second=1000, burst=1000)
+    monkeypatch.setattr(product_service, "naver_rate_limiter", limiter)
+    key = NaverShoppingService.search_cache_key("이어폰", 10, 1, "sim")
+    stale_value = {"items": [], "total": 0}
+    search_cache.set(key, stale_value, ttl=0, stale_ttl=60)
+
+    assert await NaverShoppingService.search_cached(query="이어폰") is stale_value
+    await asyncio.gather(*product_service._background_tasks)
+    assert limiter.granted[PRIORITY_PREFETCH] == 1
+
+    # 잔여 예산이 prefetch 몫 이하이면 갱신하지 않고 stale 값 유지
+    search_cache.set(key, stale_value, ttl=0, stale_ttl=60)
+    assert await NaverShoppingService.search_cached(query="이어폰") is stale_value
+    await asyncio.gather(*product_service._background_tasks)
+    assert naver.calls == 1
+    assert limiter.shed[PRIORITY_PREFETCH] == 1
+    assert search_cache.get(key) == (stale_value, CACHE_STALE)
+
+
+@pytest.fixture
+def prefetch(monkeypatch, naver):
+    """선조회를 켜고 이 테스트에서 늘어난 지표만 반환하는 함수"""
+    monkeypatch.setattr(settings, "SEARCH_PREFETCH_ENABLED", True)
+    naver.items = [naver_item(str(number)) for number in range(25)]
+    before = product_service.search_prefetch.stats()
+
+    def delta():
+        after = product_service.search_prefetch.stats()
+        changed = {
+            name: after[name] - before[name]
+            for name in ("scheduled", "completed", "failed", "hits", "wasted")
+        }
+        changed["skipped"] = {
+            reason: count - before["skipped"][reason]
+            for reason, count in after["skipped"].items()
+            if count != before["skipped"][reason]
+        }
+        return changed
+
+    return delta
+
+
+async def _search_page(start: int, display: int = 10) -> dict:
+    """검색 라우트와 같이 조회 후 다음 페이지 선조회, 백그라운드 작업 완료까지 대기"""
+    result = await NaverShoppingService.search_cached(query="이어폰", display=display, start=start)
+    NaverShoppingService.schedule_prefetch(
+        query="이어폰", display=display, start=start, sort="sim", total=result["total"]
+    )
+    await asyncio.gather(*product_service._background_tasks)
+    return result
+
+
+@pytest.mark.anyio
+async def test_prefetched_next_page_is_served_from_cache(naver, prefetch):
+    await _search_page(1)
+    assert naver.starts == [1, 11]
+
+    second = await _search_page(11)
+
+    assert second["items"][0]["source_product_id"] == "10"
+    # 2페이지는 선조회 결과로 응답하고 3페이지를 선조회
+    assert naver.starts == [1, 11, 21]
+    changed = prefetch()
+    assert (changed["scheduled"], changed["completed"], changed["hits"]) == (2, 2, 1)
+
+
+@pytest.mark.anyio
+async def test_prefetch_skips_last_page_and_cached_page(naver, prefetch):
+    await _search_page(21)
+    assert prefetch()["skipped"] == {SKIP_LAST_PAGE: 1}
+
+    await _search_page(11)
+    assert naver.starts == [21, 11]
+    assert prefetch()["skipped"] == {SKIP_LAST_PAGE: 1, SKIP_CACHED: 1}
+    assert prefetch()["scheduled"] == 0
+
+
+@pytest.mark.anyio
+async def test_prefetch_gives_up_when_budget_is_low(naver, prefetch, monkeypatch):
+    # 사용자 검색 1회 후 잔여 예산 50% -> 선조회 몫(floor) 이하
+    limiter = NaverRateLimiter(daily_budget=2, rate_per_second=1000, burst=1000)
+    monkeypatch.setattr(product_service, "naver_rate_limiter", limiter)
+
+    await _search_page(1)
+
+    assert naver.starts == [1]
+    changed = prefetch()
+    assert (changed["scheduled"], changed["completed"]) == (1, 0)
+    assert changed["skipped"] == {SKIP_BUDGET: 1}
+    assert search_cache.begin_refresh(NaverShoppingService.search_cache_key("이어폰", 10, 11, "sim"))
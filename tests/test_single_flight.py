@@ -0,0 +1,144 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.domain.product.single_flight import SingleFlight
+
+
+def _wait_until(predicate, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+def test_sync_waiters_share_result():
+    flight = SingleFlight(name="test")
+    release = threading.Event()
+    calls = []
+    results = []
+
+    def fn():
+        calls.append(1)
+        release.wait()
+        return "value"
+
+    def worker():
+        results.append(flight.do("key", fn))
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    _wait_until(lambda: flight.shared == 4)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert calls == [1]
+    assert results == ["value"] * 5
+    assert flight.stats()["in_flight"] == 0
+
+
+def test_sync_error_reaches_every_waiter():
+    flight = SingleFlight(name="test")
+    release = threading.Event()
+    error = ValueError("upstream failed")
+    errors = []
+
+    def fn():
+        release.wait()
+        raise error
+
+    def worker():
+        try:
+            flight.do("key", fn)
+        except ValueError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    _wait_until(lambda: flight.shared == 4)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert errors == [error] * 5
+    assert flight.errors == 1
+    # 실패 후 같은 키는 다시 실행됨
+    assert flight.do("key", lambda: "retried") == "retried"
+
+
+@pytest.mark.anyio
+async def test_async_error_reaches_every_waiter():
+    flight = SingleFlight(name="test")
+    release = asyncio.Event()
+    calls = 0
+
+    async def fn():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        raise ValueError("upstream failed")
+
+    tasks = [asyncio.ensure_future(flight.do_async("key", fn)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert calls == 1
+    assert all(isinstance(result, ValueError) for result in results)
+    assert len({id(result) for result in results}) == 1
+    assert flight.errors == 1
+    assert flight.stats()["in_flight"] == 0
+
+
+@pytest.mark.anyio
+async def test_async_cancelled_leader_does_not_strand_waiters():
+    flight = SingleFlight(name="test")
+    release = asyncio.Event()
+    calls = 0
+
+    async def fn():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "value"
+
+    leader = asyncio.ensure_future(flight.do_async("key", fn))
+    await asyncio.sleep(0)
+    waiters = [asyncio.ensure_future(flight.do_async("key", fn)) for _ in range(3)]
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*waiters) == ["value"] * 3
+    assert leader.cancelled()
+    assert calls == 1
+    assert flight.stats()["in_flight"] == 0
+
+
+@pytest.mark.anyio
+async def test_async_all_callers_cancelled_call_still_completes():
+    flight = SingleFlight(name="test")
+    release = asyncio.Event()
+    finished = asyncio.Event()
+
+    async def fn():
+        await release.wait()
+        finished.set()
+        return "value"
+
+    caller = asyncio.ensure_future(flight.do_async("key", fn))
+    await asyncio.sleep(0)
+    caller.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    await asyncio.wait_for(finished.wait(), timeout=1.0)
+    await asyncio.sleep(0)
+    assert flight.stats()["in_flight"] == 0
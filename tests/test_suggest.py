@@ -0,0 +1,76 @@
+from app.domain.product.suggest import (
+    HOT_MIN_RANGE,
+    SUGGEST_PRODUCT,
+    SUGGEST_QUERY,
+    SuggestIndex,
+    to_jamo,
+)
+
+
+def _terms(results):
+    return [term for term, _, _ in results]
+
+
+def test_to_jamo_splits_compound_letters():
+    assert to_jamo("닭") == "ㄷㅏㄹㄱ"
+    assert to_jamo("와") == "ㅇㅗㅏ"
+    assert to_jamo("tv") == "tv"
+
+
+def test_partial_syllable_and_word_start_match():
+    index = SuggestIndex(max_terms=100, merge_threshold=1)
+    index.add_many([("삼성 무선 청소기", 3.0, SUGGEST_QUERY), ("닭가슴살", 1.0, SUGGEST_QUERY)])
+
+    # 입력 중인 마지막 글자(받침 전)도 접두사로 일치
+    assert _terms(index.suggest("삼서")) == ["삼성 무선 청소기"]
+    assert _terms(index.suggest("달")) == ["닭가슴살"]
+    # 단어 시작 위치로도 조회
+    assert _terms(index.suggest("청소")) == ["삼성 무선 청소기"]
+    assert index.suggest("") == []
+
+
+def test_ranked_by_weight_and_query_kind_wins():
+    index = SuggestIndex(max_terms=100, merge_threshold=1)
+    index.add_many(
+        [
+            ("아이폰 케이스", 1.0, SUGGEST_PRODUCT),
+            ("아이폰 15", 5.0, SUGGEST_PRODUCT),
+            ("아이패드", 3.0, SUGGEST_QUERY),
+        ]
+    )
+    index.add("아이폰 케이스", 10.0, SUGGEST_QUERY)
+
+    results = index.suggest("아이", limit=2)
+
+    assert results == [("아이폰 케이스", 11.0, SUGGEST_QUERY), ("아이폰 15", 5.0, SUGGEST_PRODUCT)]
+
+
+def test_pending_terms_are_found_before_merge():
+    index = SuggestIndex(max_terms=100, merge_threshold=1000)
+    index.add("에어팟 프로")
+
+    assert _terms(index.suggest("에어")) == ["에어팟 프로"]
+    assert index.stats()["pending"] > 0
+
+
+def test_max_terms_drops_least_popular():
+    index = SuggestIndex(max_terms=10, merge_threshold=1)
+    index.add_many([(f"상품 {number:02d}", float(number), SUGGEST_QUERY) for number in range(20)])
+
+    stats = index.stats()
+    assert stats["rebuilds"] == 1
+    assert stats["terms"] == 9
+    assert _terms(index.suggest("상품", limit=3)) == ["상품 19", "상품 18", "상품 17"]
+    assert index.suggest("상품 00") == []
+
+
+def test_wide_prefix_served_from_precomputed_top():
+    index = SuggestIndex(max_terms=10000, merge_threshold=1)
+    index.add_many(
+        [(f"노트북 {number}", float(number), SUGGEST_QUERY) for number in range(HOT_MIN_RANGE * 2)]
+    )
+
+    results = index.suggest("노", limit=3)
+
+    assert _terms(results) == [f"노트북 {HOT_MIN_RANGE * 2 - offset}" for offset in (1, 2, 3)]
+    assert index.stats()["hot_hits"] == 1